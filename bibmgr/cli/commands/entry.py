@@ -12,6 +12,9 @@ from bibmgr.operations.commands.update import UpdateCommand, UpdateHandler
 from bibmgr.operations.results import ResultStatus
 from bibmgr.storage.repository import QueryBuilder
 
+# Entry fields shown by the table, compact and keys list formats
+LIST_FIELDS = ("key", "type", "title", "author", "year")
+
 
 def get_repository(ctx):
     """Get the entry repository from context."""
@@ -262,9 +265,19 @@ def list_cmd(ctx: click.Context, **kwargs) -> None:
         if not kwargs.get("show_all"):
             query_builder.limit(kwargs["limit"]).offset(kwargs["offset"])
 
-        # Execute query
-        query_builder.build()
-        entries = repository.find_by(query_builder)
+        # Scan only the listed fields; other formats load the full
+        # entries of the selected page
+        spec = query_builder.build()
+        projected = kwargs["format"] in ("table", "compact", "keys")
+        entries = repository.scan(
+            LIST_FIELDS if projected else ("key",),
+            where=spec["filters"],
+            order_by=spec["order_by"],
+            limit=spec["limit"] or None,
+            offset=spec["offset"] or 0,
+        )
+        if not projected:
+            entries = list(repository.iter_entries(row.key for row in entries))
         total = repository.count()
 
         # Handle empty results
@@ -590,9 +603,9 @@ def _display_entry_rich(console: Console, entry: Entry, metadata=None) -> None:
 
 
 def _display_entries_table(
-    console: Console, entries: list[Entry], total: int, limit: int, offset: int
+    console: Console, entries: list, total: int, limit: int, offset: int
 ) -> None:
-    """Display entries in table format."""
+    """Display entries, or rows of LIST_FIELDS, in table format."""
     table = Table(title=f"Bibliography Entries ({len(entries)} of {total})")
 
     # Add columns
@@ -627,8 +640,8 @@ def _display_entries_table(
         )
 
 
-def _display_entries_compact(console: Console, entries: list[Entry]) -> None:
-    """Display entries in compact format."""
+def _display_entries_compact(console: Console, entries: list) -> None:
+    """Display entries, or rows of LIST_FIELDS, in compact format."""
     for entry in entries:
         author_short = entry.author.split(",")[0] if entry.author else "Unknown"
         year = str(entry.year) if entry.year else "----"
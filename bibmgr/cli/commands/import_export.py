@@ -291,9 +291,17 @@ def import_command(
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["bibtex", "ris", "json", "csv", "markdown"]),
+    type=click.Choice(
+        ["bibtex", "ris", "json", "ndjson", "csv", "markdown", "citation"]
+    ),
     help="Export format (auto-detect from extension by default)",
 )
+@click.option(
+    "--style",
+    type=click.Choice(["apa", "mla", "chicago"]),
+    default="apa",
+    help="Citation style of the citation format",
+)
 @click.option(
     "--keys",
     "-k",
@@ -320,11 +328,29 @@ def import_command(
 )
 @click.option("--reverse", is_flag=True, help="Reverse sort order")
 @click.option("--pretty/--compact", default=True, help="Pretty print output (JSON/XML)")
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    help="Worker processes rendering entries missing from the cache (0: all CPUs)",
+)
+@click.option(
+    "--render-cache",
+    is_flag=True,
+    help="Reuse citations rendered by earlier exports for unchanged entries",
+)
+@click.option(
+    "--resolve-crossrefs",
+    is_flag=True,
+    help="Fill in fields inherited through crossref (BibTeX: order parents last)",
+)
 @click.pass_context
 def export_command(
     ctx,
     destination: str,
     format: str | None,
+    style: str,
     keys: str | None,
     collection: str | None,
     query: str | None,
@@ -335,6 +361,9 @@ def export_command(
     sort: str | None,
     reverse: bool,
     pretty: bool,
+    jobs: int,
+    render_cache: bool,
+    resolve_crossrefs: bool,
 ):
     """Export bibliography entries to file."""
     manager = get_repository_manager(ctx)
@@ -352,6 +381,8 @@ def export_command(
                 ".bibtex": "bibtex",
                 ".ris": "ris",
                 ".json": "json",
+                ".ndjson": "ndjson",
+                ".jsonl": "ndjson",
                 ".csv": "csv",
                 ".md": "markdown",
             }
@@ -360,7 +391,7 @@ def export_command(
     format_enum = ExportFormat(format)
 
     # Collect entries to export
-    entry_keys_list: list[str] = []
+    entry_keys_list: list[str] | None = []
 
     if keys:
         # Specific keys provided
@@ -459,9 +490,8 @@ def export_command(
             entries = repo.find_by(qb)
             entry_keys_list = [e.key for e in entries]
         else:
-            # Export all entries
-            entries = repo.find_all()
-            entry_keys_list = [e.key for e in entries]
+            # Export all entries, streamed from storage by the workflow
+            entry_keys_list = None
 
     # Check if file exists and not appending
     if destination != "-" and not append:
@@ -471,18 +501,29 @@ def export_command(
                 console.print("[yellow]Export cancelled[/yellow]")
                 raise SystemExit(0)
 
+    # Rendered text is cached next to the metadata
+    cache_dir = None
+    metadata_store = get_metadata_store(ctx)
+    if render_cache and metadata_store is not None:
+        cache_dir = Path(metadata_store.data_dir) / "render_cache"
+
     # Build config
     config = ExportWorkflowConfig(
         format=format_enum,
         sort_by=sort,
         sort_reverse=reverse,
         pretty_print=pretty,
+        citation_style=style,
+        render_cache=cache_dir,
+        jobs=jobs,
+        resolve_crossrefs=resolve_crossrefs,
     )
 
     # Execute export
     workflow = ExportWorkflow(manager, event_bus)
 
-    with console.status(f"Exporting {len(entry_keys_list)} entries..."):
+    count = len(entry_keys_list) if entry_keys_list is not None else repo.count()
+    with console.status(f"Exporting {count} entries..."):
         result = workflow.execute(
             destination, entry_keys=entry_keys_list, config=config
         )
@@ -505,6 +546,16 @@ def export_command(
                     f"\n[green]✓[/green] Exported {exported_count} entries to {destination}"
                 )
 
+            # Show how much was served from the render cache
+            steps = result.steps if cache_dir is not None else []
+            for step in steps:
+                if step.data and "render_cache" in step.data:
+                    stats = step.data["render_cache"]
+                    console.print(
+                        f"  Render cache: {stats['hit_rate']:.0%} hits "
+                        f"({stats['hits']} of {stats['hits'] + stats['misses']})"
+                    )
+
             # Show file size
             if Path(destination).exists() and exported_count > 0:
                 size = Path(destination).stat().st_size
@@ -44,8 +44,9 @@ def get_repository_manager(ctx):
 
 
 def get_quality_handler(ctx):
-    """Get quality handler from context."""
-    return QualityHandler()
+    """Get quality handler checking crossrefs against the maintained graph."""
+    manager = get_repository_manager(ctx)
+    return QualityHandler(graph=getattr(manager, "crossrefs", None))
 
 
 def get_event_bus(ctx):
@@ -68,6 +69,18 @@ def get_event_bus(ctx):
     default="table",
     help="Output format",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    help="Worker processes validating large batches (0: all CPUs)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only validate entries changed since the last check",
+)
 @pass_context
 def check(
     ctx,
@@ -76,6 +89,8 @@ def check(
     severity: str | None,
     fix: bool,
     format: str,
+    jobs: int,
+    incremental: bool,
 ):
     """Check entry quality and validate data."""
     repo = get_repository(ctx)
@@ -94,6 +109,18 @@ def check(
                 entries.append(entry)
             else:
                 console.print(f"[yellow]Warning:[/yellow] Entry not found: {key}")
+
+        # Entries inheriting fields from the checked ones are checked too
+        graph = getattr(get_repository_manager(ctx), "crossrefs", None)
+        if graph is not None and entries:
+            checked = {entry.key for entry in entries}
+            children = sorted(graph.affected_by(checked) - checked)
+            if children:
+                entries.extend(repo.iter_entries(children))
+                console.print(
+                    f"[dim]Also checking {len(children)} entries "
+                    f"cross-referencing them[/dim]"
+                )
     else:
         console.print("[red]Error:[/red] Specify entry keys or use --all")
         ctx.exit(1)
@@ -199,8 +226,14 @@ def check(
                 console.print(f"  Info: {counts['info']}")
 
     else:
-        # Batch check
-        command = ValidateBatchCommand(entries=entries)
+        # Batch check; incremental runs reuse the results of unchanged
+        # entries stored next to the metadata
+        cache_path = None
+        if incremental and ctx.metadata_store is not None:
+            cache_path = Path(ctx.metadata_store.data_dir) / "validation.msgpack"
+        command = ValidateBatchCommand(
+            entries=entries, jobs=jobs, cache_path=cache_path
+        )
 
         with Progress(
             SpinnerColumn(),
@@ -221,6 +254,8 @@ def check(
             console.print(f"[green]Passed: {passed}[/green]")
             if failed > 0:
                 console.print(f"[red]Failed: {failed}[/red]")
+            if cached := result.data.get("cached_entries"):
+                console.print(f"[dim]Unchanged since last check: {cached}[/dim]")
 
             # Show severity summary
             if "severity_summary" in result.data:
@@ -265,6 +300,13 @@ def check(
 @click.option(
     "--export-report", type=click.Path(), help="Export duplicate report to file"
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    help="Worker processes computing blocking keys (0: all CPUs)",
+)
 @pass_context
 def dedupe(
     ctx,
@@ -273,6 +315,7 @@ def dedupe(
     interactive: bool,
     by: str,
     export_report: str | None,
+    jobs: int,
 ):
     """Find and merge duplicate entries."""
     manager = get_repository_manager(ctx)
@@ -282,6 +325,7 @@ def dedupe(
     config = DeduplicationConfig(
         min_similarity=threshold,
         dry_run=not auto_merge,
+        jobs=jobs,
     )
 
     # Set mode based on options
@@ -307,6 +307,52 @@ def similar(ctx: click.Context, key: str, limit: int, min_score: float) -> None:
         ctx.exit(1)
 
 
+@click.group()
+def index() -> None:
+    """Manage the search index."""
+    pass
+
+
+@index.command()
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    help="Worker processes building index segments (0: all CPUs)",
+)
+@click.pass_context
+def rebuild(ctx: click.Context, jobs: int) -> None:
+    """Rebuild the search index from storage."""
+    console = ctx.obj.console
+    search_service = get_search_service(ctx)
+
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+        ) as progress:
+            progress.add_task("Rebuilding search index...", total=None)
+            indexed = search_service.index_all(full=True, jobs=jobs)
+
+        stats = search_service.last_build_stats
+        console.print(f"[green]✓[/green] Indexed {indexed} entries")
+        if stats:
+            console.print(
+                f"  {stats.seconds:.2f}s, {stats.docs_per_sec:.0f} docs/sec "
+                f"({stats.jobs} job{'s' if stats.jobs != 1 else ''}, "
+                f"{stats.segments} segment{'s' if stats.segments != 1 else ''})"
+            )
+
+    except Exception as e:
+        if ctx.obj.debug:
+            raise
+        console.print(f"[red]Error rebuilding index:[/red] {e}")
+        ctx.exit(1)
+
+
 # Helper functions
 def _get_sort_order(sort: str) -> SortOrder:
     """Convert string sort option to SortOrder enum."""
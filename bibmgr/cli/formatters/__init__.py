@@ -7,6 +7,7 @@ in different formats including tables, BibTeX, JSON, Markdown, and more.
 from .bibtex import (
     format_entries_bibtex,
     format_entry_bibtex,
+    iter_entries_bibtex,
     parse_bibtex_entry,
 )
 from .citation import (
@@ -20,6 +21,7 @@ from .json import (
     format_entries_json,
     format_entry_json,
     format_search_results_json,
+    iter_entries_json,
 )
 from .markdown import (
     format_collections_markdown,
@@ -52,11 +54,13 @@ __all__ = [
     # BibTeX formatters
     "format_entry_bibtex",
     "format_entries_bibtex",
+    "iter_entries_bibtex",
     "parse_bibtex_entry",
     # JSON formatters
     "format_entry_json",
     "format_entries_json",
     "format_search_results_json",
+    "iter_entries_json",
     # Markdown formatters
     "format_entry_markdown",
     "format_entries_markdown",
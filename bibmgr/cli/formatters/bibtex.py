@@ -1,6 +1,7 @@
 """BibTeX output formatter."""
 
 import re
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from bibmgr.core.models import Entry
@@ -74,7 +75,13 @@ def format_entry_bibtex(entry: Entry) -> str:
 
 def format_entries_bibtex(entries: list[Entry]) -> str:
     """Format multiple entries as BibTeX."""
-    return "\n\n".join(format_entry_bibtex(entry) for entry in entries)
+    return "".join(iter_entries_bibtex(entries))
+
+
+def iter_entries_bibtex(entries: Iterable[Entry]) -> Iterator[str]:
+    """Format entries as BibTeX one chunk per entry, for streaming output."""
+    for i, entry in enumerate(entries):
+        yield ("\n\n" if i else "") + format_entry_bibtex(entry)
 
 
 def parse_bibtex_entry(bibtex: str) -> dict[str, Any]:
@@ -1,9 +1,11 @@
 """JSON output formatter."""
 
 import json
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from bibmgr.core.models import Entry
+from bibmgr.operations.workflows.streaming import iter_json_document
 from bibmgr.search.results import SearchResultCollection
 from bibmgr.storage.metadata import EntryMetadata
 
@@ -77,13 +79,20 @@ def format_entry_json(
 
 def format_entries_json(entries: list[Entry], pretty: bool = True) -> str:
     """Format multiple entries as JSON."""
-    data = {
-        "entries": [_entry_to_dict(entry) for entry in entries],
-        "total": len(entries),
-    }
-    if pretty:
-        return json.dumps(data, indent=2, ensure_ascii=False)
-    return json.dumps(data, ensure_ascii=False)
+    return "".join(iter_entries_json(entries, pretty))
+
+
+def iter_entries_json(entries: Iterable[Entry], pretty: bool = True) -> Iterator[str]:
+    """Format entries as a JSON document in chunks, for streaming output.
+
+    The chunks join to the same text ``json.dumps`` produces for
+    ``{"entries": [...], "total": n}``.
+    """
+    return iter_json_document(
+        (_entry_to_dict(entry) for entry in entries),
+        lambda total: {"total": total},
+        pretty,
+    )
 
 
 def format_search_results_json(
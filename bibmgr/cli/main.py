@@ -23,13 +23,16 @@ from bibmgr.cli.commands import (
 )
 from bibmgr.search import SearchEngine, SearchService
 from bibmgr.storage.backends.filesystem import FileSystemBackend
+from bibmgr.storage.eventrepository import EventAwareRepositoryManager
 from bibmgr.storage.events import EventBus
+from bibmgr.storage.journal import ChangeJournal
 from bibmgr.storage.metadata import MetadataStore
 from bibmgr.storage.repository import (
     CollectionRepository,
     EntryRepository,
     RepositoryManager,
 )
+from bibmgr.storage.snapshot import LibrarySnapshot
 
 
 @dataclass
@@ -178,11 +181,25 @@ def cli(
         storage_path = get_storage_path(data_dir)
         backend = FileSystemBackend(storage_path)
 
-        # Create repositories
-        repo_manager = RepositoryManager(backend)
+        # Create event bus; progress events are rate limited for the
+        # progress bars, which cannot redraw faster than this anyway
+        event_bus = EventBus(progress_interval=0.05)
+
+        # Record every entry change so derived indexes can catch up
+        journal = ChangeJournal(storage_path / "changes.log")
+        journal.attach(event_bus)
+
+        # Create repositories that publish storage events
+        repo_manager = EventAwareRepositoryManager(backend, event_bus)
         entry_repo = repo_manager.entries
         collection_repo = repo_manager.collections
 
+        # Statistics run over a columnar snapshot cached until the
+        # journal records a change
+        repo_manager.snapshot = LibrarySnapshot(
+            entry_repo, journal=journal, cache_path=storage_path / "snapshot.parquet"
+        )
+
         # Create search service with Whoosh backend
         from bibmgr.search.backends.whoosh import WhooshBackend
         from bibmgr.search.indexing import FieldConfiguration
@@ -198,16 +215,24 @@ def cli(
             index_dir=index_dir, field_config=field_config, create_if_missing=True
         )
 
-        # Create search engine
-        search_engine = SearchEngine(search_backend)
-
-        # Create event bus
-        event_bus = EventBus()
+        # Create search engine; content fingerprints let index_all skip
+        # entries that have not changed since they were indexed, and the
+        # spelling vocabulary is learned from the indexed entries
+        search_engine = SearchEngine(
+            search_backend,
+            field_config=field_config,
+            fingerprint_path=index_dir / "fingerprints.json",
+            spelling_path=index_dir / "spelling.msgpack",
+        )
 
-        # Create search service with repository and event bus for automatic indexing
+        # Create search service with repository and event bus, indexing
+        # changes in batches and replaying any the index missed
         search_service = SearchService(
             search_engine, repository=entry_repo, event_bus=event_bus
         )
+        search_service.attach_incremental_indexer(
+            journal=journal, state_path=index_dir / "indexer.json"
+        )
 
         # Create metadata store
         metadata_store = MetadataStore(storage_path)
@@ -332,6 +357,7 @@ cli.add_command(entry.delete)
 cli.add_command(search.search)
 cli.add_command(search.find)
 cli.add_command(search.similar)
+cli.add_command(search.index)
 cli.add_command(collection.collection)
 
 
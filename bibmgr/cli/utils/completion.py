@@ -24,15 +24,9 @@ def get_entry_keys(ctx, args, incomplete: str) -> list[str]:
         if cli_ctx.repository_manager is None:
             return []
 
-        # Get all entry keys
+        # Prefix lookup in the backend's sorted key index
         repo = cli_ctx.repository_manager.get_repository("entry")  # type: ignore
-        entries = repo.find_all()
-
-        # Filter by incomplete string
-        keys = [e.key for e in entries if e.key.startswith(incomplete)]
-
-        # Sort and limit results
-        return sorted(keys)[:50]
+        return repo.keys_with_prefix(incomplete, limit=50)
     except Exception:
         return []
 
@@ -70,6 +70,8 @@ from bibmgr.core.validators import (
     ISSNValidator,
     RequiredFieldValidator,
     URLValidator,
+    ValidationCache,
+    ValidationContext,
     Validator,
     ValidatorRegistry,
     get_validator_registry,
@@ -120,5 +122,7 @@ __all__ = [
     "ConsistencyValidator",
     "DuplicateDetector",
     "ValidatorRegistry",
+    "ValidationCache",
+    "ValidationContext",
     "get_validator_registry",
 ]
@@ -10,11 +10,272 @@ Key functionality:
 - Special handling for title->booktitle inheritance
 - Entry ordering validation
 - Minimum crossref count for parent inclusion
+- Incrementally maintained parent/child graph of inheritable fields
 """
 
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import msgspec
+
 from .fields import EntryType
 from .models import Entry
 
+# Fields a child inherits from its parent when it lacks them
+INHERITABLE_FIELDS = (
+    "editor",
+    "publisher",
+    "year",
+    "series",
+    "volume",
+    "number",
+    "organization",
+    "address",
+    "month",
+)
+
+# Entry fields the graph needs: links, parent type and title, inherited values
+CROSSREF_FIELDS = ("key", "type", "title", "crossref", *INHERITABLE_FIELDS)
+
+# A parent of these types lends its title as the booktitle of these children
+_TITLE_PARENTS = frozenset({EntryType.BOOK, EntryType.PROCEEDINGS})
+_BOOKTITLE_CHILDREN = frozenset(
+    {EntryType.INBOOK, EntryType.INCOLLECTION, EntryType.INPROCEEDINGS}
+)
+
+
+class CrossRefNode(msgspec.Struct, frozen=True):
+    """What the graph keeps of an entry.
+
+    Only the fields that cross-reference checks and inheritance read: the
+    type, the title lent as booktitle, the crossref link and the non-empty
+    inheritable values.
+    """
+
+    type: EntryType
+    title: str | None = None
+    crossref: str | None = None
+    inherited: dict[str, Any] = msgspec.field(default_factory=dict)
+
+    @classmethod
+    def of(cls, entry: Any) -> "CrossRefNode":
+        """Node of an entry, or of a row holding ``CROSSREF_FIELDS``."""
+        inherited = {}
+        for field in INHERITABLE_FIELDS:
+            value = getattr(entry, field, None)
+            if value:
+                inherited[field] = value
+        return cls(
+            type=entry.type,
+            title=entry.title,
+            crossref=entry.crossref,
+            inherited=inherited,
+        )
+
+
+class CrossRefGraph:
+    """Parent/child links between entries with their inheritable fields.
+
+    Keeps a small ``CrossRefNode`` per entry and the parent -> children
+    links of every entry with a ``crossref`` field (including references
+    to missing parents), never the entries themselves. Entries are added,
+    replaced and removed one at a time as storage changes.
+
+    With a ``loader`` the graph is built from it on first use, so keeping
+    an unused graph up to date costs nothing. The loader may yield
+    projected rows holding ``CROSSREF_FIELDS`` instead of full entries.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Any] = (),
+        loader: Callable[[], Iterable[Any]] | None = None,
+    ):
+        """Initialize the graph.
+
+        Args:
+            entries: Entries (or rows of ``CROSSREF_FIELDS``) to build from
+            loader: Called on first use to load all entries instead
+        """
+        self._lock = threading.RLock()
+        self._loader = loader
+        self._nodes: dict[str, CrossRefNode] = {}
+        self._children: dict[str, dict[str, None]] = {}
+        for entry in entries:
+            self.add(entry)
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the entries have been loaded (always true without loader)."""
+        return self._loader is None
+
+    def __contains__(self, key: object) -> bool:
+        self._ensure_loaded()
+        return key in self._nodes
+
+    def __getitem__(self, key: str) -> CrossRefNode:
+        self._ensure_loaded()
+        return self._nodes[key]
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._nodes)
+
+    def get(self, key: str) -> CrossRefNode | None:
+        """Node of the entry with the given key, if present."""
+        self._ensure_loaded()
+        return self._nodes.get(key)
+
+    def add(self, entry: Any) -> set[str]:
+        """Add or replace an entry.
+
+        Returns:
+            Keys whose resolution may have changed: the entry and, if it
+            is a parent, its children
+        """
+        node = CrossRefNode.of(entry)
+        with self._lock:
+            self._unlink(entry.key)
+            self._nodes[entry.key] = node
+            if node.crossref:
+                self._children.setdefault(node.crossref, {})[entry.key] = None
+            return self._affected(entry.key)
+
+    def remove(self, key: str) -> set[str]:
+        """Remove an entry, returning the keys whose resolution may change."""
+        with self._lock:
+            affected = self._affected(key)
+            self._unlink(key)
+            self._nodes.pop(key, None)
+            return affected
+
+    def refresh(self, key: str, entry: Any | None) -> set[str]:
+        """Apply a storage change: replace the entry, or remove it if None."""
+        if entry is None:
+            return self.remove(key)
+        return self.add(entry)
+
+    def clear(self) -> None:
+        """Forget all entries."""
+        with self._lock:
+            self._nodes.clear()
+            self._children.clear()
+
+    def parent_of(self, key: str) -> str | None:
+        """Key referenced by the entry's crossref field."""
+        node = self.get(key)
+        return node.crossref if node is not None else None
+
+    def children_of(self, key: str) -> list[str]:
+        """Keys of the entries cross-referencing ``key``."""
+        self._ensure_loaded()
+        return list(self._children.get(key, ()))
+
+    def count(self, key: str) -> int:
+        """How many entries cross-reference ``key``."""
+        self._ensure_loaded()
+        return len(self._children.get(key, ()))
+
+    def counts(self) -> dict[str, int]:
+        """Cross-reference counts of every referenced key."""
+        self._ensure_loaded()
+        return {key: len(children) for key, children in self._children.items()}
+
+    def affected_by(self, keys: Iterable[str]) -> set[str]:
+        """Changed keys plus the children whose inheritance they feed."""
+        self._ensure_loaded()
+        affected: set[str] = set()
+        for key in keys:
+            affected |= self._affected(key)
+        return affected
+
+    def resolve(self, entry: Entry) -> Entry:
+        """Entry with the fields inherited from its parent filled in.
+
+        Child fields take precedence over inherited parent fields; an
+        entry without (or with a missing or self-referencing) parent is
+        returned unchanged.
+        """
+        parent_key = entry.crossref
+        if not parent_key or parent_key == entry.key:
+            return entry
+        parent = self.get(parent_key)
+        if parent is None:
+            return entry
+
+        updates = {}
+        if (
+            parent.type in _TITLE_PARENTS
+            and entry.type in _BOOKTITLE_CHILDREN
+            and not entry.booktitle
+            and parent.title
+        ):
+            updates["booktitle"] = parent.title
+
+        for field, value in parent.inherited.items():
+            if not getattr(entry, field, None):
+                updates[field] = value
+
+        if updates:
+            return msgspec.structs.replace(entry, **updates)
+        return entry
+
+    def resolve_all(self, entries: Iterable[Entry]) -> list[Entry]:
+        """Resolve a whole export set against the same parents."""
+        return [self.resolve(entry) for entry in entries]
+
+    def export_order(self, keys: Iterable[str]) -> list[str]:
+        """Order keys so that every entry precedes the entries it references.
+
+        BibTeX requires cross-referenced entries to come after the entries
+        citing them. Unrelated entries keep their relative order; cycles
+        are broken at the first key revisited.
+        """
+        self._ensure_loaded()
+        wanted = dict.fromkeys(keys)
+        ordered: list[str] = []
+        emitted: set[str] = set()
+        visiting: set[str] = set()
+
+        def visit(key: str) -> None:
+            if key in emitted or key in visiting:
+                return
+            visiting.add(key)
+            for child in self._children.get(key, ()):
+                if child in wanted:
+                    visit(child)
+            visiting.discard(key)
+            emitted.add(key)
+            ordered.append(key)
+
+        for key in wanted:
+            visit(key)
+        return ordered
+
+    def _affected(self, key: str) -> set[str]:
+        return {key, *self._children.get(key, ())}
+
+    def _unlink(self, key: str) -> None:
+        """Drop the link from an entry to its parent."""
+        node = self._nodes.get(key)
+        if node is not None and node.crossref:
+            siblings = self._children.get(node.crossref)
+            if siblings is not None:
+                siblings.pop(key, None)
+                if not siblings:
+                    del self._children[node.crossref]
+
+    def _ensure_loaded(self) -> None:
+        """Build the graph from the loader on first use."""
+        if self._loader is None:
+            return
+        with self._lock:
+            if self._loader is not None:
+                for entry in self._loader():
+                    self.add(entry)
+                self._loader = None
+
 
 class CrossRefResolver:
     """Resolve cross-references between bibliography entries.
@@ -33,16 +294,8 @@ class CrossRefResolver:
         """
         self.entries = entries
         self.min_crossrefs = min_crossrefs
-        self.crossref_counts: dict[str, int] = {}
-        self._count_crossrefs()
-
-    def _count_crossrefs(self):
-        """Count how many times each entry is cross-referenced."""
-        for entry in self.entries.values():
-            if entry.crossref:
-                self.crossref_counts[entry.crossref] = (
-                    self.crossref_counts.get(entry.crossref, 0) + 1
-                )
+        self.graph = CrossRefGraph(entries.values())
+        self.crossref_counts: dict[str, int] = self.graph.counts()
 
     def should_include_parent(self, parent_key: str) -> bool:
         """Check if parent should be included based on crossref count."""
@@ -60,53 +313,18 @@ class CrossRefResolver:
         Returns:
             Entry with inherited fields from parent, or original if no parent.
         """
-        if not entry.crossref or entry.crossref not in self.entries:
-            return entry
-
-        if entry.crossref == entry.key:
-            return entry
-
-        parent = self.entries[entry.crossref]
-
-        inheritable_fields = {
-            "booktitle",
-            "editor",
-            "publisher",
-            "year",
-            "series",
-            "volume",
-            "number",
-            "organization",
-            "address",
-            "month",
-        }
-
-        updates = {}
-
-        if parent.type in [EntryType.BOOK, EntryType.PROCEEDINGS] and entry.type in [
-            EntryType.INBOOK,
-            EntryType.INCOLLECTION,
-            EntryType.INPROCEEDINGS,
-        ]:
-            if not entry.booktitle and parent.title:
-                updates["booktitle"] = parent.title
+        return self.graph.resolve(entry)
 
-        for field in inheritable_fields:
-            if field == "booktitle":
-                continue
+    def resolve_entries(self, entries: Iterable[Entry]) -> list[Entry]:
+        """Resolve cross-references for many entries in one pass.
 
-            child_value = getattr(entry, field, None)
-            parent_value = getattr(parent, field, None)
-
-            if parent_value and not child_value:
-                updates[field] = parent_value
-
-        if updates:
-            import msgspec
-
-            return msgspec.structs.replace(entry, **updates)
+        Args:
+            entries: Entries to resolve.
 
-        return entry
+        Returns:
+            Resolved entries in the same order.
+        """
+        return self.graph.resolve_all(entries)
 
     def validate_order(self) -> list[tuple[str, str]]:
         """Validate that cross-referenced entries come before their targets.
@@ -1,11 +1,21 @@
 """Duplicate entry detection system."""
 
+import os
 import re
 import unicodedata
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from typing import Any
 
 from .models import Entry, ValidationError
 
+# Rows whose blocking keys one worker computes per task
+BLOCKING_CHUNK_SIZE = 20_000
+
+# (doi, title, author, year) of an entry, the columns blocking looks at
+BlockingRow = tuple[str | None, str | None, str | None, int | None]
+
 
 class DuplicateDetector:
     """Detect duplicate entries."""
@@ -176,21 +186,23 @@ class DuplicateDetector:
 
     def _make_tay_key(self, entry: Entry) -> str:
         """Make normalized title-author-year key."""
+        return self._tay_key(entry.title, entry.author, entry.year)
+
+    def _tay_key(self, title: str | None, author: str | None, year: int | None) -> str:
+        """Normalized title-author-year key of field values."""
         # Normalize title
-        title = self._normalize_text(entry.title or "")
+        title = self._normalize_text(title or "")
 
         # Normalize authors with special handling for initials
-        authors = self._normalize_authors(entry.author or "")
+        authors = self._normalize_authors(author or "")
 
         # Handle year tolerance
-        if self.year_tolerance > 0 and entry.year:
+        if self.year_tolerance > 0 and year:
             # Create a year range key
-            year_base = (
-                entry.year // (self.year_tolerance + 1) * (self.year_tolerance + 1)
-            )
+            year_base = year // (self.year_tolerance + 1) * (self.year_tolerance + 1)
             year_str = f"{year_base}-{year_base + self.year_tolerance}"
         else:
-            year_str = str(entry.year)
+            year_str = str(year)
 
         return f"{title}|{authors}|{year_str}"
 
@@ -252,7 +264,7 @@ class DuplicateDetector:
             else:
                 # Manual search with tolerance
                 other_dups = self._find_tay_matches_with_tolerance(entry)
-                
+
             if other_dups:
                 errors.append(
                     ValidationError(
@@ -449,3 +461,81 @@ class DuplicateDetector:
                     matches.append(entry)
 
         return matches
+
+
+def blocking_row(entry: Entry) -> BlockingRow:
+    """Columns of an entry that duplicate blocking looks at."""
+    return (entry.doi, entry.title, entry.author, entry.year)
+
+
+def blocking_keys(rows: Sequence[BlockingRow]) -> list[tuple[str, str]]:
+    """Normalized DOI and title-author-year keys of blocking rows.
+
+    Runs inside worker processes. An empty string marks a row without
+    that key, as ``DuplicateDetector`` leaves such entries out of its maps.
+    """
+    detector = DuplicateDetector([])
+    keys = []
+    for doi, title, author, year in rows:
+        doi_key = detector._normalize_doi(doi) if doi else ""
+        tay_key = (
+            detector._tay_key(title, author, year) if title and author and year else ""
+        )
+        keys.append((doi_key, tay_key))
+    return keys
+
+
+def find_duplicate_groups(
+    rows: Sequence[BlockingRow],
+    jobs: int = 1,
+    chunk_size: int = BLOCKING_CHUNK_SIZE,
+) -> list[list[int]]:
+    """Positions of duplicate rows, grouped as ``find_duplicates`` does.
+
+    Normalizing titles and authors dominates detection, so computing the
+    blocking keys is sharded over worker processes; grouping rows by key
+    is a single pass here. Only exact years are matched.
+
+    Args:
+        rows: Blocking columns of every entry
+        jobs: Worker processes (0 or less: all CPUs)
+        chunk_size: Smallest number of rows worth a worker
+
+    Returns:
+        Groups of row positions, DOI groups first, each in row order
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    shards = max(1, min(jobs, len(rows) // max(chunk_size, 1)))
+    if shards == 1:
+        keys = blocking_keys(rows)
+    else:
+        size = -(-len(rows) // shards)
+        # Spawned workers stay clear of the event bus and writer threads
+        with ProcessPoolExecutor(
+            max_workers=shards, mp_context=get_context("spawn")
+        ) as pool:
+            futures = [
+                pool.submit(blocking_keys, rows[start : start + size])
+                for start in range(0, len(rows), size)
+            ]
+            keys = [key for future in futures for key in future.result()]
+
+    by_doi: dict[str, list[int]] = {}
+    by_tay: dict[str, list[int]] = {}
+    for position, (doi_key, tay_key) in enumerate(keys):
+        if doi_key:
+            by_doi.setdefault(doi_key, []).append(position)
+        if tay_key:
+            by_tay.setdefault(tay_key, []).append(position)
+
+    groups = []
+    seen: set[frozenset[int]] = set()
+    for blocks in (by_doi, by_tay):
+        for positions in blocks.values():
+            if len(positions) > 1:
+                members = frozenset(positions)
+                if members not in seen:
+                    groups.append(positions)
+                    seen.add(members)
+    return groups
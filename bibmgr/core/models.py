@@ -13,6 +13,7 @@ Key components:
 """
 
 import enum
+import hashlib
 import uuid
 from datetime import datetime
 from typing import Any
@@ -25,6 +26,21 @@ from .fields import EntryType
 _entry_cache: dict[int, dict[str, Any]] = {}
 
 
+def split_names(value: str | None) -> tuple[str, ...]:
+    """Split a BibTeX name list on ' and ', keeping escaped ampersands.
+
+    Returns:
+        Tuple of names in the order they appear.
+    """
+    if not value:
+        return ()
+    import re
+
+    temp = value.replace(r"\&", "\x00")
+    names = re.split(r"\s+and\s+", temp)
+    return tuple(name.replace("\x00", "&").strip() for name in names if name.strip())
+
+
 class Entry(msgspec.Struct, frozen=True, kw_only=True):
     """Immutable bibliography entry conforming to BibTeX standards.
 
@@ -101,16 +117,7 @@ class Entry(msgspec.Struct, frozen=True, kw_only=True):
         if cache_key in _entry_cache and "authors" in _entry_cache[cache_key]:
             return _entry_cache[cache_key]["authors"]
 
-        if not self.author:
-            result = ()
-        else:
-            import re
-
-            temp = self.author.replace(r"\&", "\x00")
-            names = re.split(r"\s+and\s+", temp)
-            result = tuple(
-                name.replace("\x00", "&").strip() for name in names if name.strip()
-            )
+        result = split_names(self.author)
 
         if cache_key not in _entry_cache:
             _entry_cache[cache_key] = {}
@@ -132,16 +139,7 @@ class Entry(msgspec.Struct, frozen=True, kw_only=True):
         if cache_key in _entry_cache and "editors" in _entry_cache[cache_key]:
             return _entry_cache[cache_key]["editors"]
 
-        if not self.editor:
-            result = ()
-        else:
-            import re
-
-            temp = self.editor.replace(r"\&", "\x00")
-            names = re.split(r"\s+and\s+", temp)
-            result = tuple(
-                name.replace("\x00", "&").strip() for name in names if name.strip()
-            )
+        result = split_names(self.editor)
 
         if cache_key not in _entry_cache:
             _entry_cache[cache_key] = {}
@@ -225,6 +223,18 @@ class Entry(msgspec.Struct, frozen=True, kw_only=True):
         data = msgspec.to_builtins(self)
         return {k: v for k, v in data.items() if v is not None}
 
+    def content_hash(self) -> str:
+        """Compute a stable digest of the entry's content.
+
+        Entries with identical fields always hash the same, so the digest
+        can key caches and detect changes without comparing whole entries.
+
+        Returns:
+            Hex-encoded BLAKE2b digest.
+        """
+        encoded = msgspec.json.encode(self, order="deterministic")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Entry":
         """Create Entry from dictionary representation.
@@ -1,12 +1,31 @@
-"""Author name parsing according to BibTeX rules."""
+"""Author name parsing according to BibTeX rules.
+
+Sorting, labels, key generation and citation formatting parse the same
+author strings over and over, so parsed names are kept in a bounded LRU
+keyed by the raw name and shared between callers. Tokens are interned and
+names without braces are split by a compiled pattern instead of the
+character loop that tracks brace depth.
+"""
 
 import re
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
+
+# Distinct raw names (and author lists) kept parsed
+NAME_CACHE_SIZE = 65536
+
+_SEPARATORS = re.compile(r"[ \t\n~]+")
+_AND = re.compile(r"\s+and\s+", re.IGNORECASE)
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedName:
-    """Parsed name components."""
+    """Parsed name components.
+
+    Parsed names come from a shared cache; treat the lists as read-only.
+    """
 
     first: list[str]
     von: list[str]
@@ -142,7 +161,39 @@ class NameParser:
         - 0 commas: "First von Last"
         - 1 comma: "von Last, First"
         - 2 commas: "von Last, Jr, First"
+
+        Results are cached per raw name and shared between callers.
         """
+        return _parse_cached(name)
+
+    @staticmethod
+    def parse_list(authors: str) -> tuple[ParsedName, ...]:
+        """Parse every name of an author field ("A and B and C") at once.
+
+        Names are split on "and" between whitespace, in any case. The whole
+        list is cached by the raw field, so repeated fields cost one lookup.
+        """
+        return _parse_list_cached(authors)
+
+    @staticmethod
+    def parse_many(names: Iterable[str]) -> list[ParsedName]:
+        """Parse a batch of individual names."""
+        return [_parse_cached(name) for name in names]
+
+    @staticmethod
+    def cache_info():
+        """Hit and miss counts of the parsed-name cache."""
+        return _parse_cached.cache_info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all cached names and author lists."""
+        _parse_cached.cache_clear()
+        _parse_list_cached.cache_clear()
+
+    @staticmethod
+    def _parse(name: str) -> ParsedName:
+        """Parse a name without consulting the cache."""
         name = name.strip()
         if not name:
             return ParsedName([], [], [], [])
@@ -163,6 +214,9 @@ class NameParser:
     @staticmethod
     def _tokenize(name: str) -> list[str]:
         """Split name into tokens, preserving braced groups."""
+        if "{" not in name and "}" not in name:
+            return [sys.intern(token) for token in _SEPARATORS.split(name) if token]
+
         tokens = []
         current = []
         brace_level = 0
@@ -190,7 +244,7 @@ class NameParser:
         result = []
         for token in tokens:
             if token and token != "~":
-                result.append(token)
+                result.append(sys.intern(token))
 
         return result
 
@@ -322,6 +376,14 @@ class NameParser:
         )
 
 
+_parse_cached = lru_cache(maxsize=NAME_CACHE_SIZE)(NameParser._parse)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _parse_list_cached(authors: str) -> tuple[ParsedName, ...]:
+    return tuple(_parse_cached(name) for name in _AND.split(authors))
+
+
 class NameFormatter:
     """Format parsed names for output."""
 
@@ -67,12 +67,7 @@ class SortKeyGenerator:
             parts.append("1")
 
         if entry.author:
-            name_parser = NameParser()
-            authors = re.split(r"\s+and\s+", entry.author, flags=re.IGNORECASE)
-
-            for author in authors:
-                parsed = name_parser.parse(author)
-
+            for parsed in NameParser.parse_list(entry.author):
                 for part in parsed.last:
                     purified = TitleProcessor.purify(part)
                     if purified:
@@ -190,13 +185,12 @@ class LabelGenerator:
         base_label = ""
 
         if entry.author:
-            name_parser = NameParser()
-            # Split authors
-            authors = re.split(r"\s+and\s+", entry.author, flags=re.IGNORECASE)
+            # Split and parse authors
+            authors = NameParser.parse_list(entry.author)
 
             if len(authors) == 1:
                 # Single author: first 3 letters of last name
-                parsed = name_parser.parse(authors[0])
+                parsed = authors[0]
                 if parsed.last:
                     # Use the main last name part
                     last_name = " ".join(parsed.last)
@@ -212,8 +206,7 @@ class LabelGenerator:
             elif len(authors) <= 3:
                 # 2-3 authors: first letter of each last name
                 initials = []
-                for author in authors:
-                    parsed = name_parser.parse(author)
+                for parsed in authors:
                     if parsed.last:
                         last_name = " ".join(parsed.last)
                         if last_name:
@@ -223,8 +216,7 @@ class LabelGenerator:
             else:
                 # 4+ authors: first 3 initials + '+'
                 initials = []
-                for author in authors[:3]:
-                    parsed = name_parser.parse(author)
+                for parsed in authors[:3]:
                     if parsed.last:
                         last_name = " ".join(parsed.last)
                         if last_name:
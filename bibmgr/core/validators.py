@@ -13,25 +13,147 @@ Key validators:
 - CrossRefValidator: Validates cross-reference integrity
 """
 
+import os
 import re
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from multiprocessing import get_context
+from operator import attrgetter
+from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+import msgspec
+
+from .crossref import CrossRefGraph
 from .duplicates import DuplicateDetector
 from .fields import EntryType, FieldRequirements
 from .models import Entry, ValidationError
 
+# Patterns are compiled once and shared by every validator call
+_KEY_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_\-:]*$")
+_PAGES_PATTERN = re.compile(
+    r"^(?:\d+"
+    r"|\d+--?\d+"
+    r"|[A-Z]\d+--?[A-Z]\d+"
+    r"|\d+(?:,\s*\d+)+"
+    r"|\d+--?\d+(?:,\s*\d+--?\d+)*)$"
+)
+_DOI_PATTERN = re.compile(r"^10\.\d{4,}/\S+$")
+_ISBN10_PATTERN = re.compile(r"^\d{9}[\dX]$")
+_ISBN13_PATTERN = re.compile(r"^\d{13}$")
+_ISSN_PATTERN = re.compile(r"^\d{7}[\dX]$")
+
+_SPECIAL_YEARS = frozenset(
+    {"in press", "forthcoming", "preprint", "submitted", "accepted", "to appear"}
+)
+_VALID_MONTHS = frozenset(
+    {
+        "jan",
+        "feb",
+        "mar",
+        "apr",
+        "may",
+        "jun",
+        "jul",
+        "aug",
+        "sep",
+        "oct",
+        "nov",
+        "dec",
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+        "7",
+        "8",
+        "9",
+        "10",
+        "11",
+        "12",
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+    }
+)
+
 
 class Validator(ABC):
-    """Base validator interface."""
+    """Base validator interface.
+
+    Validators whose result depends only on a few fields list them in
+    ``fields``; batch validation then reads just those columns, evaluates
+    each distinct combination of values once and skips entries where all
+    of them are unset. Validators with an empty ``fields`` see whole
+    entries, and those reading values unique to each entry (keys, DOIs,
+    pages) set ``dedupe = False`` to skip the lookup of repeated values.
+    Validators with ``local = False`` look at other entries too, so their
+    results cannot be cached per entry or computed in a worker. Bump
+    ``version`` whenever a validator's rules change, so cached results
+    produced by the old rules are discarded.
+    """
+
+    fields: tuple[str, ...] = ()
+    dedupe: bool = True
+    local: bool = True
+    version: int = 1
+
+    def cache_key(self) -> str:
+        """Identify the validator, its rule version and its parameters."""
+        params = ",".join(
+            f"{name}={value!r}" for name, value in sorted(vars(self).items())
+        )
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}@{self.version}({params})"
 
     @abstractmethod
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Validate an entry and return list of errors."""
         pass
 
+    def validate_batch(self, entries: Sequence[Entry]) -> list[list[ValidationError]]:
+        """Validate several entries, returning their errors in order."""
+        if not self.fields:
+            return [self.validate(entry) for entry in entries]
+
+        get_values = attrgetter(*self.fields)
+        unset = None if len(self.fields) == 1 else (None,) * len(self.fields)
+        seen: dict[Any, list[ValidationError]] = {}
+        results: list[list[ValidationError]] = []
+        for entry in entries:
+            values = get_values(entry)
+            if values == unset:
+                results.append([])
+                continue
+            if not self.dedupe:
+                results.append(self.validate(entry))
+                continue
+
+            errors = seen.get(values)
+            if errors is None:
+                errors = seen[values] = self.validate(entry)
+            elif errors and errors[0].entry_key != entry.key:
+                errors = [
+                    msgspec.structs.replace(error, entry_key=entry.key)
+                    for error in errors
+                ]
+            results.append(errors)
+        return results
+
 
 class EntryKeyValidator(Validator):
     """Validate entry keys according to BibTeX rules.
@@ -41,6 +163,9 @@ class EntryKeyValidator(Validator):
     to support DOI-based identifiers.
     """
 
+    fields = ("key",)
+    dedupe = False
+
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Validate entry key format.
 
@@ -63,7 +188,7 @@ class EntryKeyValidator(Validator):
             )
             return errors
 
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9_\-:]*$", entry.key):
+        if not _KEY_PATTERN.match(entry.key):
             errors.append(
                 ValidationError(
                     field="key",
@@ -107,7 +232,8 @@ class RequiredFieldValidator(Validator):
         errors = []
 
         requirements = FieldRequirements.get_requirements(entry.type)
-        required_fields = requirements["required"]
+        # Sorted so that every process reports missing fields in one order
+        required_fields = sorted(requirements["required"])
 
         for field_spec in required_fields:
             if "|" in field_spec:
@@ -143,6 +269,9 @@ class FieldFormatValidator(Validator):
     and page numbering styles.
     """
 
+    fields = ("year", "month", "pages")
+    dedupe = False
+
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Validate formats of various fields.
 
@@ -170,15 +299,7 @@ class FieldFormatValidator(Validator):
         errors = []
 
         if isinstance(entry.year, str):
-            special_values = {
-                "in press",
-                "forthcoming",
-                "preprint",
-                "submitted",
-                "accepted",
-                "to appear",
-            }
-            if entry.year.lower() not in special_values:
+            if entry.year.lower() not in _SPECIAL_YEARS:
                 errors.append(
                     ValidationError(
                         field="year",
@@ -215,46 +336,7 @@ class FieldFormatValidator(Validator):
         """Validate month field format."""
         errors = []
 
-        valid_months = {
-            "jan",
-            "feb",
-            "mar",
-            "apr",
-            "may",
-            "jun",
-            "jul",
-            "aug",
-            "sep",
-            "oct",
-            "nov",
-            "dec",
-            "1",
-            "2",
-            "3",
-            "4",
-            "5",
-            "6",
-            "7",
-            "8",
-            "9",
-            "10",
-            "11",
-            "12",
-            "january",
-            "february",
-            "march",
-            "april",
-            "may",
-            "june",
-            "july",
-            "august",
-            "september",
-            "october",
-            "november",
-            "december",
-        }
-
-        if entry.month and entry.month.lower() not in valid_months:
+        if entry.month and entry.month.lower() not in _VALID_MONTHS:
             errors.append(
                 ValidationError(
                     field="month",
@@ -273,15 +355,7 @@ class FieldFormatValidator(Validator):
         if not entry.pages:
             return errors
 
-        page_patterns = [
-            r"^\d+$",
-            r"^\d+--?\d+$",
-            r"^[A-Z]\d+--?[A-Z]\d+$",
-            r"^\d+(,\s*\d+)+$",
-            r"^\d+--?\d+(,\s*\d+--?\d+)*$",
-        ]
-
-        if not any(re.match(pattern, entry.pages) for pattern in page_patterns):
+        if not _PAGES_PATTERN.match(entry.pages):
             errors.append(
                 ValidationError(
                     field="pages",
@@ -311,6 +385,9 @@ class DOIValidator(Validator):
     code and YYYY is the item identifier.
     """
 
+    fields = ("doi",)
+    dedupe = False
+
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Validate DOI format.
 
@@ -328,7 +405,7 @@ class DOIValidator(Validator):
                 if doi.startswith(prefix):
                     doi = doi[len(prefix) :]
 
-            if not re.match(r"^10\.\d{4,}/\S+$", doi):
+            if not _DOI_PATTERN.match(doi):
                 errors.append(
                     ValidationError(
                         field="doi",
@@ -347,6 +424,8 @@ class ISBNValidator(Validator):
     Supports both ISBN-10 and ISBN-13 formats with checksum validation.
     """
 
+    fields = ("isbn",)
+
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Validate ISBN format and checksum.
 
@@ -395,33 +474,21 @@ class ISBNValidator(Validator):
 
     def _validate_isbn10(self, isbn: str) -> bool:
         """Validate ISBN-10 checksum using modulo 11."""
-        if not re.match(r"^\d{9}[\dX]$", isbn):
+        if not _ISBN10_PATTERN.match(isbn):
             return False
 
-        total = 0
-        for i in range(9):
-            total += int(isbn[i]) * (10 - i)
-
-        check = isbn[9]
-        if check == "X":
-            total += 10
-        else:
-            total += int(check)
-
+        total = sum(int(digit) * (10 - i) for i, digit in enumerate(isbn[:9]))
+        total += 10 if isbn[9] == "X" else int(isbn[9])
         return total % 11 == 0
 
     def _validate_isbn13(self, isbn: str) -> bool:
         """Validate ISBN-13 checksum using modulo 10."""
-        if not re.match(r"^\d{13}$", isbn):
+        if not _ISBN13_PATTERN.match(isbn):
             return False
 
-        total = 0
-        for i in range(12):
-            if i % 2 == 0:
-                total += int(isbn[i])
-            else:
-                total += int(isbn[i]) * 3
-
+        total = sum(
+            int(digit) * (3 if i % 2 else 1) for i, digit in enumerate(isbn[:12])
+        )
         check = (10 - (total % 10)) % 10
         return int(isbn[12]) == check
 
@@ -433,6 +500,8 @@ class ISSNValidator(Validator):
     checksum in the last position.
     """
 
+    fields = ("issn",)
+
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Validate ISSN format and checksum.
 
@@ -447,7 +516,7 @@ class ISSNValidator(Validator):
         if entry.issn:
             issn = entry.issn.replace("-", "").upper()
 
-            if not re.match(r"^\d{7}[\dX]$", issn):
+            if not _ISSN_PATTERN.match(issn):
                 errors.append(
                     ValidationError(
                         field="issn",
@@ -470,10 +539,7 @@ class ISSNValidator(Validator):
 
     def _validate_checksum(self, issn: str) -> bool:
         """Validate ISSN checksum using modulo 11."""
-        total = 0
-        for i in range(7):
-            total += int(issn[i]) * (8 - i)
-
+        total = sum(int(digit) * (8 - i) for i, digit in enumerate(issn[:7]))
         remainder = total % 11
         if remainder == 0:
             check = "0"
@@ -488,6 +554,8 @@ class ISSNValidator(Validator):
 class URLValidator(Validator):
     """Validate URL format and structure."""
 
+    fields = ("url",)
+
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Validate URL format.
 
@@ -550,6 +618,8 @@ class AuthorFormatValidator(Validator):
     'et al.' should be replaced with 'and others'.
     """
 
+    fields = ("author", "editor")
+
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Validate author and editor fields.
 
@@ -622,6 +692,9 @@ class AuthorFormatValidator(Validator):
 class AbstractLengthValidator(Validator):
     """Validate abstract length constraints."""
 
+    fields = ("abstract",)
+    dedupe = False
+
     def __init__(self, max_length: int = 5000):
         self.max_length = max_length
 
@@ -657,7 +730,10 @@ class CrossReferenceValidator(Validator):
     should only cross-reference @book entries.
     """
 
-    def __init__(self, all_entries: dict[str, Entry]):
+    fields = ("type", "crossref")
+    local = False
+
+    def __init__(self, all_entries: "dict[str, Entry] | CrossRefGraph"):
         self.all_entries = all_entries
 
     def validate(self, entry: Entry) -> list[ValidationError]:
@@ -731,6 +807,18 @@ class ConsistencyValidator(Validator):
     primarily used with book-type entries.
     """
 
+    fields = (
+        "type",
+        "volume",
+        "number",
+        "journal",
+        "booktitle",
+        "pages",
+        "isbn",
+        "issn",
+    )
+    dedupe = False
+
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Check field consistency.
 
@@ -800,14 +888,21 @@ class ValidatorRegistry:
     validate individual entries or entire bibliographies.
     """
 
-    def __init__(self, entries: list[Entry] | None = None):
+    def __init__(
+        self, entries: list[Entry] | None = None, graph: CrossRefGraph | None = None
+    ):
         """Initialize with optional entry list for cross-validation.
 
         Args:
             entries: Optional list of all entries for cross-validation.
+            graph: Maintained cross-reference graph to check crossrefs
+                against instead of one built from ``entries``.
         """
         self.entries = entries or []
         self.entries_dict = {e.key: e for e in self.entries}
+        self.crossrefs = graph
+        if graph is None and self.entries:
+            self.crossrefs = CrossRefGraph(self.entries)
 
         self.validators = [
             EntryKeyValidator(),
@@ -822,8 +917,8 @@ class ValidatorRegistry:
             ConsistencyValidator(),
         ]
 
-        if self.entries:
-            self.validators.append(CrossReferenceValidator(self.entries_dict))
+        if self.crossrefs is not None:
+            self.validators.append(CrossReferenceValidator(self.crossrefs))
 
     def validate(self, entry: Entry) -> list[ValidationError]:
         """Run all validators on a single entry.
@@ -842,19 +937,113 @@ class ValidatorRegistry:
 
         return all_errors
 
-    def validate_all(self) -> dict[str, list[ValidationError]]:
+    def revalidate(
+        self, keys: Iterable[str], load: Callable[[list[str]], Iterable[Entry]]
+    ) -> dict[str, list[ValidationError]]:
+        """Validate changed entries and the children inheriting from them.
+
+        Needs a cross-reference graph, which only knows the links; the
+        affected entries themselves are read through ``load``. Keys that
+        ``load`` no longer finds are reported with no errors so callers
+        can drop their previous results.
+
+        Args:
+            keys: Keys of the entries that changed.
+            load: Reads the entries of the given keys, skipping missing ones.
+
+        Returns:
+            Dictionary mapping every affected key to its validation errors.
+        """
+        if self.crossrefs is None:
+            raise ValueError("revalidate needs a cross-reference graph")
+
+        affected = sorted(self.crossrefs.affected_by(keys))
+        present = list(load(affected))
+        results: dict[str, list[ValidationError]] = {key: [] for key in affected}
+        for entry, errors in zip(present, self.validate_entries(present), strict=True):
+            results[entry.key] = errors
+        return results
+
+    def validate_entries(
+        self,
+        entries: Sequence[Entry],
+        jobs: int = 1,
+        cache: "ValidationCache | None" = None,
+        chunk_size: int = 25000,
+    ) -> list[list[ValidationError]]:
+        """Validate several entries in batch mode.
+
+        Entry-local validators run column-wise over the batch, optionally
+        in parallel chunks; their results are reused from ``cache`` for
+        entries whose content did not change. Validators that look at
+        other entries always run in this process.
+
+        Args:
+            entries: Entries to validate
+            jobs: Worker processes for the local validators (0: all CPUs)
+            cache: Persisted results keyed by entry content hash
+            chunk_size: Smallest number of entries worth a worker
+
+        Returns:
+            Errors of each entry, in the order of ``entries``
+        """
+        local = [v for v in self.validators if v.local]
+        shared = [v for v in self.validators if not v.local]
+
+        results: list[list[ValidationError] | None] = [None] * len(entries)
+        hashes: list[str] = []
+        if cache is not None:
+            hashes = [entry.content_hash() for entry in entries]
+            for i, digest in enumerate(hashes):
+                cached = cache.get(digest)
+                if cached is not None:
+                    results[i] = list(cached)
+
+        pending = [i for i, errors in enumerate(results) if errors is None]
+        computed = _validate_parallel(
+            local, [entries[i] for i in pending], jobs, chunk_size
+        )
+        for i, errors in zip(pending, computed, strict=True):
+            results[i] = errors
+            if cache is not None:
+                cache.put(hashes[i], errors)
+
+        for validator in shared:
+            for errors, extra in zip(
+                results, validator.validate_batch(entries), strict=True
+            ):
+                errors.extend(extra)
+
+        return results
+
+    def validate_all(
+        self, jobs: int = 1, cache: "ValidationCache | None" = None
+    ) -> dict[str, list[ValidationError]]:
         """Validate all entries and check for duplicates.
 
+        With a cache only entries changed since the previous run are
+        validated again; results of entries that are gone are dropped and
+        the cache is saved.
+
+        Args:
+            jobs: Worker processes for the entry-local validators
+            cache: Persisted results keyed by entry content hash
+
         Returns:
             Dictionary mapping entry keys to their validation errors.
         """
         results = {}
 
-        for entry in self.entries:
-            errors = self.validate(entry)
+        for entry, errors in zip(
+            self.entries, self.validate_entries(self.entries, jobs, cache), strict=True
+        ):
             if errors:
                 results[entry.key] = errors
 
+        if cache is not None:
+            cache.retain(entry.content_hash() for entry in self.entries)
+            cache.save()
+
         if self.entries:
             detector = DuplicateDetector(self.entries)
             for entry in self.entries:
@@ -867,21 +1056,219 @@ class ValidatorRegistry:
         return results
 
 
+def validate_chunk(
+    validators: list[Validator], entries: Sequence[Entry]
+) -> list[list[ValidationError]]:
+    """Run validators column-wise over a chunk of entries.
+
+    Runs inside a worker process for parallel batch validation.
+    """
+    results: list[list[ValidationError]] = [[] for _ in entries]
+    for validator in validators:
+        for errors, found in zip(
+            results, validator.validate_batch(entries), strict=True
+        ):
+            errors.extend(found)
+    return results
+
+
+def _validate_parallel(
+    validators: list[Validator],
+    entries: list[Entry],
+    jobs: int,
+    chunk_size: int,
+) -> list[list[ValidationError]]:
+    """Validate entries, spreading large batches over worker processes."""
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    chunks = max(1, min(jobs, len(entries) // max(chunk_size, 1)))
+    if chunks == 1:
+        return validate_chunk(validators, entries)
+
+    size, extra = divmod(len(entries), chunks)
+    bounds = []
+    start = 0
+    for i in range(chunks):
+        end = start + size + (1 if i < extra else 0)
+        bounds.append((start, end))
+        start = end
+
+    # Spawned workers stay clear of the event bus and writer threads
+    with ProcessPoolExecutor(
+        max_workers=chunks, mp_context=get_context("spawn")
+    ) as pool:
+        futures = [
+            pool.submit(validate_chunk, validators, entries[start:end])
+            for start, end in bounds
+        ]
+        results: list[list[ValidationError]] = []
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
+class _CacheState(msgspec.Struct):
+    """On-disk representation of the validation cache."""
+
+    version: int
+    signature: str
+    results: dict[str, list[ValidationError]]
+
+
+class ValidationCache:
+    """Results of entry-local validators keyed by entry content hash.
+
+    Results are only reused while the validators, with their versions and
+    parameters, and the current year (which bounds plausible publication
+    years) match those of the run that produced them.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self, path: Path | None = None, validators: Sequence[Validator] | None = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: File persisting the results between runs
+            validators: Validators whose results are cached (default: the
+                standard registry's)
+        """
+        if validators is None:
+            validators = ValidatorRegistry().validators
+        self.path = Path(path) if path else None
+        self.signature = ",".join(
+            [str(datetime.now().year)] + [v.cache_key() for v in validators if v.local]
+        )
+        self.results: dict[str, list[ValidationError]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def get(self, content_hash: str) -> list[ValidationError] | None:
+        """Cached errors of an entry, or None if it was not validated."""
+        errors = self.results.get(content_hash)
+        if errors is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return errors
+
+    def put(self, content_hash: str, errors: list[ValidationError]) -> None:
+        """Remember the errors of an entry."""
+        self.results[content_hash] = list(errors)
+        self._dirty = True
+
+    def retain(self, content_hashes) -> None:
+        """Drop results of entries that no longer exist."""
+        live = set(content_hashes)
+        stale = [digest for digest in self.results if digest not in live]
+        for digest in stale:
+            del self.results[digest]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the results atomically if they changed."""
+        if not self.path or not self._dirty:
+            return
+
+        state = _CacheState(
+            version=self.FORMAT_VERSION,
+            signature=self.signature,
+            results=self.results,
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with open(temp_fd, "wb") as f:
+                f.write(msgspec.msgpack.encode(state))
+            Path(temp_path).replace(self.path)
+        except Exception:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self._dirty = False
+
+    def _load(self) -> None:
+        """Load results written by the same validators."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            state = msgspec.msgpack.decode(self.path.read_bytes(), type=_CacheState)
+        except (OSError, msgspec.DecodeError):
+            return
+        if state.version == self.FORMAT_VERSION and state.signature == self.signature:
+            self.results = state.results
+
+
+class ValidationContext:
+    """Validation results shared by the stages of one write path.
+
+    A create or import validates an entry in the handler and again when
+    the repository saves it. Passing one context through both lets the
+    first stage record the result under the entry's content hash and
+    every later stage reuse it, or skip validation it was told is done.
+    Results are only meaningful for the registry they were produced by.
+    """
+
+    def __init__(self, registry: ValidatorRegistry | None = None):
+        """Initialize the context.
+
+        Args:
+            registry: Registry validating entries (default: the global one)
+        """
+        self.registry = registry or get_validator_registry()
+        self.results: dict[str, list[ValidationError]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def validate(self, entry: Entry) -> list[ValidationError]:
+        """Errors of an entry, validating it only the first time it is seen."""
+        digest = entry.content_hash()
+        errors = self.results.get(digest)
+        if errors is None:
+            self.misses += 1
+            errors = self.registry.validate(entry)
+            self.results[digest] = errors
+        else:
+            self.hits += 1
+        return list(errors)
+
+    def mark_validated(
+        self, entry: Entry, errors: Sequence[ValidationError] = ()
+    ) -> None:
+        """Record that an entry was already validated with these errors."""
+        self.results[entry.content_hash()] = list(errors)
+
+    def is_validated(self, entry: Entry) -> bool:
+        """Whether a result for this exact entry content is recorded."""
+        return entry.content_hash() in self.results
+
+
 _global_registry: ValidatorRegistry | None = None
 
 
-def get_validator_registry(entries: list[Entry] | None = None) -> ValidatorRegistry:
+def get_validator_registry(
+    entries: list[Entry] | None = None, graph: CrossRefGraph | None = None
+) -> ValidatorRegistry:
     """Get or create the global validator registry.
 
     Args:
         entries: Optional list of entries for cross-validation.
+        graph: Maintained cross-reference graph to validate against instead
+            of one built from ``entries``.
 
     Returns:
         The global ValidatorRegistry instance.
     """
     global _global_registry
 
-    if entries is not None or _global_registry is None:
-        _global_registry = ValidatorRegistry(entries)
+    if entries is not None or graph is not None or _global_registry is None:
+        _global_registry = ValidatorRegistry(entries, graph=graph)
 
     return _global_registry
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Any
 
 from bibmgr.core.models import Entry
+from bibmgr.core.validators import ValidationContext
 from bibmgr.storage.events import Event, EventBus, EventType
 from bibmgr.storage.repository import EntryRepository
 
@@ -36,8 +37,16 @@ class CreateHandler:
         self.naming_policy = naming_policy
         self.preconditions = CreatePreconditions()
 
-    def execute(self, command: CreateCommand) -> OperationResult:
-        """Execute create command."""
+    def execute(
+        self, command: CreateCommand, context: ValidationContext | None = None
+    ) -> OperationResult:
+        """Execute create command.
+
+        Args:
+            command: Entry to create and options
+            context: Validation results shared with the caller and the save;
+                a new one for this command when None
+        """
         if not command.force:
             violations = self.preconditions.check(command)
             if violations:
@@ -70,7 +79,9 @@ class CreateHandler:
                 suggestions={"alternative_key": new_key} if new_key else None,
             )
 
-        validation_errors = command.entry.validate()
+        if context is None:
+            context = self.repository.validation_context()
+        validation_errors = context.validate(command.entry)
         if validation_errors and not command.force:
             return OperationResult(
                 status=ResultStatus.VALIDATION_FAILED,
@@ -88,7 +99,9 @@ class CreateHandler:
             )
 
         try:
-            self.repository.save(command.entry, skip_validation=command.force)
+            self.repository.save(
+                command.entry, skip_validation=command.force, context=context
+            )
 
             event = Event(
                 type=EventType.ENTRY_CREATED,
@@ -141,77 +154,87 @@ class BulkCreateHandler:
         results = []
 
         if atomic and not dry_run:
-            if hasattr(self.repository, "__class__") and hasattr(
-                self.repository.__class__, "__module__"
-            ):
-                temp_results = []
-                saved_entries = []
-
-                try:
-                    for entry in entries:
-                        command = CreateCommand(entry=entry, dry_run=False)
-                        result = self.create_handler.execute(command)
-
-                        if result.status != ResultStatus.SUCCESS:
-                            for saved_key in saved_entries:
-                                try:
-                                    self.repository.delete(saved_key)
-                                except Exception:
-                                    pass
-
-                            return [
-                                OperationResult(
-                                    status=ResultStatus.TRANSACTION_FAILED,
-                                    entity_id=e.key,
-                                    message=f"Atomic operation failed due to: {entry.key}",
-                                )
-                                for e in entries
-                            ]
-
-                        saved_entries.append(entry.key)
-                        temp_results.append(result)
-
-                    results.extend(temp_results)
-
-                    event = Event(
-                        type=EventType.BULK_CREATED,
-                        timestamp=datetime.now(),
-                        data={
-                            "entries": entries,
-                            "count": len(entries),
-                        },
-                    )
-                    self.event_bus.publish(event)
-
-                except Exception as e:
-                    return [
-                        OperationResult(
-                            status=ResultStatus.TRANSACTION_FAILED,
-                            entity_id=entry.key,
-                            message=f"Transaction failed: {str(e)}",
-                        )
-                        for entry in entries
-                    ]
-
-        else:
-            for i, entry in enumerate(entries):
-                progress_event = Event(
-                    type=EventType.PROGRESS,
-                    timestamp=datetime.now(),
-                    data={
-                        "operation": "bulk_create",
-                        "current": i + 1,
-                        "total": len(entries),
-                        "entity_id": entry.key,
-                    },
+            return self._execute_atomic(entries)
+
+        for i, entry in enumerate(entries):
+            progress_event = Event(
+                type=EventType.PROGRESS,
+                timestamp=datetime.now(),
+                data={
+                    "operation": "bulk_create",
+                    "current": i + 1,
+                    "total": len(entries),
+                    "entity_id": entry.key,
+                },
+            )
+            self.event_bus.publish(progress_event)
+
+            command = CreateCommand(entry=entry, dry_run=dry_run)
+            result = self.create_handler.execute(command)
+            results.append(result)
+
+            if stop_on_error and result.status != ResultStatus.SUCCESS:
+                break
+
+        return results
+
+    def _execute_atomic(self, entries: list[Entry]) -> list[OperationResult]:
+        """Check every entry, then write them all in one transaction."""
+        context = self.repository.validation_context()
+        seen: set[str] = set()
+        for entry in entries:
+            check = self.create_handler.execute(
+                CreateCommand(entry=entry, dry_run=True), context
+            )
+            if check.status != ResultStatus.DRY_RUN or entry.key in seen:
+                return self._fail_all(
+                    entries, f"Atomic operation failed due to: {entry.key}"
                 )
-                self.event_bus.publish(progress_event)
+            seen.add(entry.key)
+
+        try:
+            self.repository.save_many(entries, context=context)
+        except Exception as e:
+            return self._fail_all(entries, f"Transaction failed: {str(e)}")
 
-                command = CreateCommand(entry=entry, dry_run=dry_run)
-                result = self.create_handler.execute(command)
-                results.append(result)
+        results = []
+        for entry in entries:
+            self.event_bus.publish(
+                Event(
+                    type=EventType.ENTRY_CREATED,
+                    timestamp=datetime.now(),
+                    data={"entry": entry, "entry_key": entry.key, "metadata": None},
+                )
+            )
+            results.append(
+                OperationResult(
+                    status=ResultStatus.SUCCESS,
+                    entity_id=entry.key,
+                    message="Entry created successfully",
+                    data={"entry": entry},
+                )
+            )
 
-                if stop_on_error and result.status != ResultStatus.SUCCESS:
-                    break
+        event = Event(
+            type=EventType.BULK_CREATED,
+            timestamp=datetime.now(),
+            data={
+                "entries": entries,
+                "count": len(entries),
+            },
+        )
+        self.event_bus.publish(event)
 
         return results
+
+    @staticmethod
+    def _fail_all(entries: list[Entry], message: str) -> list[OperationResult]:
+        """Report every entry of a failed atomic batch."""
+        return [
+            OperationResult(
+                status=ResultStatus.TRANSACTION_FAILED,
+                entity_id=entry.key,
+                message=message,
+            )
+            for entry in entries
+        ]
@@ -1,9 +1,12 @@
 """Merge command for handling duplicates."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 from bibmgr.core.duplicates import DuplicateDetector
+from bibmgr.core.models import Entry
+from bibmgr.core.validators import ValidationContext
 from bibmgr.storage.events import EventBus, EventType
 from bibmgr.storage.repository import EntryRepository
 
@@ -58,79 +61,11 @@ class MergeHandler:
                 )
             source_entries.append(entry)
 
-        if len(source_entries) < 2:
-            return OperationResult(
-                status=ResultStatus.VALIDATION_FAILED,
-                message="At least 2 entries required for merge",
-            )
-
-        if command.target_key:
-            target_entry = self.repository.find(command.target_key)
-            if target_entry and target_entry.key not in command.source_keys:
-                return OperationResult(
-                    status=ResultStatus.CONFLICT,
-                    entity_id=command.target_key,
-                    message="Target key already exists",
-                )
-        else:
-            if self.merge_policy:
-                command.target_key = self.merge_policy.select_target_key(source_entries)
-            else:
-                command.target_key = source_entries[0].key
-
         try:
-            strategy = MergeStrategy.SMART
-            if hasattr(MergeStrategy, command.strategy):
-                strategy = MergeStrategy[command.strategy]
-
-            if strategy == MergeStrategy.CUSTOM and command.custom_rules:
-                from ..policies.merge import FieldMergeRule, MergePolicy
-
-                custom_policy = MergePolicy()
-
-                if (
-                    "prefer_field" in command.custom_rules
-                    and "prefer_value" in command.custom_rules
-                ):
-                    field = command.custom_rules["prefer_field"]
-                    prefer = command.custom_rules["prefer_value"]
-
-                    if prefer == "newest" and field == "year":
-
-                        def newest_year_merger(values):
-                            return max(v for v in values if v is not None)
-
-                        custom_policy.field_rules[field] = FieldMergeRule(
-                            field, MergeStrategy.CUSTOM, newest_year_merger
-                        )
-
-                merged_entry = custom_policy.merge_entries(
-                    entries=source_entries,
-                    target_key=command.target_key,
-                    strategy=MergeStrategy.SMART,
-                )
-            else:
-                merged_entry = self.merge_policy.merge_entries(
-                    entries=source_entries,
-                    target_key=command.target_key,
-                    strategy=strategy,
-                )
-
-            validation_errors = merged_entry.validate()
-            if validation_errors:
-                if self.merge_policy:
-                    merged_entry = self.merge_policy.fix_validation_errors(
-                        merged_entry, validation_errors
-                    )
-                    validation_errors = merged_entry.validate()
-
-                if validation_errors:
-                    return OperationResult(
-                        status=ResultStatus.VALIDATION_FAILED,
-                        entity_id=command.target_key,
-                        message="Merged entry validation failed",
-                        validation_errors=validation_errors,
-                    )
+            context = self.repository.validation_context()
+            planned = self.plan(command, source_entries, context)
+            if planned.status != ResultStatus.SUCCESS or planned.data is None:
+                return planned
 
             if hasattr(self.repository, "transaction"):
                 ctx_manager = self.repository.transaction()  # type: ignore
@@ -140,31 +75,16 @@ class MergeHandler:
                 ctx_manager = nullcontext()
 
             with ctx_manager:
-                self.repository.save(merged_entry)
+                merged_entry = planned.data["merged_entry"]
+                self.repository.save(merged_entry, context=context)
 
                 deleted_keys = []
                 if command.delete_sources:
-                    for entry in source_entries:
-                        if entry.key != merged_entry.key:
-                            self.repository.delete(entry.key)
-                            deleted_keys.append(entry.key)
-
-                from datetime import datetime
+                    deleted_keys = self.repository.delete_many(
+                        planned.data["deleted_keys"]
+                    )
 
-                from bibmgr.storage.events import Event
-
-                event = Event(
-                    type=EventType.ENTRIES_MERGED,
-                    timestamp=datetime.now(),
-                    data={
-                        "source_entries": source_entries,
-                        "source_keys": command.source_keys,
-                        "merged_entry": merged_entry,
-                        "target_key": command.target_key,
-                        "strategy": command.strategy,
-                    },
-                )
-                self.event_bus.publish(event)
+                self._publish_merged(command, source_entries, merged_entry)
 
                 return OperationResult(
                     status=ResultStatus.SUCCESS,
@@ -184,6 +104,225 @@ class MergeHandler:
                 errors=[str(e)],
             )
 
+    def execute_batch(
+        self, groups: Iterable[tuple[MergeCommand, list[Entry]]]
+    ) -> list[OperationResult]:
+        """Merge groups of already loaded entries in one transaction.
+
+        Groups are planned in order against the entries as earlier merges
+        of the batch left them, so overlapping groups behave as if merged
+        one after another: a group whose source an earlier merge deleted
+        is reported as not found. All writes are then committed together
+        and the merge events published once the batch is stored.
+
+        Args:
+            groups: Merge commands with their source entries as loaded
+        """
+        context = self.repository.validation_context()
+        current: dict[str, Entry | None] = {}
+        planned: list[tuple[MergeCommand, list[Entry], OperationResult]] = []
+        results: list[OperationResult] = []
+
+        for command, loaded in groups:
+            violations = self.preconditions.check(command)
+            if violations:
+                results.append(
+                    OperationResult(
+                        status=ResultStatus.VALIDATION_FAILED,
+                        message="Precondition validation failed",
+                        errors=violations,
+                    )
+                )
+                continue
+
+            source_entries: list[Entry] = []
+            missing = None
+            for entry in loaded:
+                latest = current.get(entry.key, entry)
+                if latest is None:
+                    missing = entry.key
+                    break
+                source_entries.append(latest)
+            if missing is not None:
+                results.append(
+                    OperationResult(
+                        status=ResultStatus.NOT_FOUND,
+                        entity_id=missing,
+                        message=f"Source entry not found: {missing}",
+                    )
+                )
+                continue
+
+            try:
+                result = self.plan(command, source_entries, context)
+            except Exception as e:
+                result = OperationResult(
+                    status=ResultStatus.ERROR,
+                    message="Failed to merge entries",
+                    errors=[str(e)],
+                )
+            results.append(result)
+            if result.status != ResultStatus.SUCCESS or result.data is None:
+                continue
+
+            if not command.delete_sources:
+                result.data["deleted_keys"] = []
+            for key in result.data["deleted_keys"]:
+                current[key] = None
+            merged_entry = result.data["merged_entry"]
+            current[merged_entry.key] = merged_entry
+            planned.append((command, source_entries, result))
+
+        if not planned:
+            return results
+
+        saves = [entry for entry in current.values() if entry is not None]
+        deletes = [key for key, entry in current.items() if entry is None]
+        try:
+            with self.repository.transaction():
+                self.repository.delete_many(deletes)
+                self.repository.save_many(saves, context=context)
+        except Exception as e:
+            failed = OperationResult(
+                status=ResultStatus.TRANSACTION_FAILED,
+                message=f"Transaction failed: {str(e)}",
+            )
+            return [
+                failed if result.status == ResultStatus.SUCCESS else result
+                for result in results
+            ]
+
+        for command, source_entries, result in planned:
+            assert result.data is not None
+            self._publish_merged(command, source_entries, result.data["merged_entry"])
+        return results
+
+    def plan(
+        self,
+        command: MergeCommand,
+        source_entries: list[Entry],
+        context: ValidationContext | None = None,
+    ) -> OperationResult:
+        """Merge loaded source entries without writing anything.
+
+        Returns:
+            SUCCESS with ``merged_entry`` and the ``deleted_keys`` the merge
+            would remove, or the reason the merge cannot happen
+        """
+        if len(source_entries) < 2:
+            return OperationResult(
+                status=ResultStatus.VALIDATION_FAILED,
+                message="At least 2 entries required for merge",
+            )
+
+        if command.target_key:
+            target_entry = self.repository.find(command.target_key)
+            if target_entry and target_entry.key not in command.source_keys:
+                return OperationResult(
+                    status=ResultStatus.CONFLICT,
+                    entity_id=command.target_key,
+                    message="Target key already exists",
+                )
+        else:
+            if self.merge_policy:
+                command.target_key = self.merge_policy.select_target_key(source_entries)
+            else:
+                command.target_key = source_entries[0].key
+
+        context = context or self.repository.validation_context()
+        merged_entry = self._merge(command, source_entries)
+
+        validation_errors = context.validate(merged_entry)
+        if validation_errors:
+            if self.merge_policy:
+                merged_entry = self.merge_policy.fix_validation_errors(
+                    merged_entry, validation_errors
+                )
+                validation_errors = context.validate(merged_entry)
+
+            if validation_errors:
+                return OperationResult(
+                    status=ResultStatus.VALIDATION_FAILED,
+                    entity_id=command.target_key,
+                    message="Merged entry validation failed",
+                    validation_errors=validation_errors,
+                )
+
+        return OperationResult(
+            status=ResultStatus.SUCCESS,
+            entity_id=merged_entry.key,
+            message=f"Merged {len(source_entries)} entries",
+            data={
+                "merged_entry": merged_entry,
+                "source_keys": command.source_keys,
+                "deleted_keys": [
+                    entry.key
+                    for entry in source_entries
+                    if entry.key != merged_entry.key
+                ],
+            },
+        )
+
+    def _merge(self, command: MergeCommand, source_entries: list[Entry]) -> Entry:
+        """Merge entries with the strategy of the command."""
+        strategy = MergeStrategy.SMART
+        if hasattr(MergeStrategy, command.strategy):
+            strategy = MergeStrategy[command.strategy]
+
+        if strategy == MergeStrategy.CUSTOM and command.custom_rules:
+            from ..policies.merge import FieldMergeRule, MergePolicy
+
+            custom_policy = MergePolicy()
+
+            if (
+                "prefer_field" in command.custom_rules
+                and "prefer_value" in command.custom_rules
+            ):
+                field = command.custom_rules["prefer_field"]
+                prefer = command.custom_rules["prefer_value"]
+
+                if prefer == "newest" and field == "year":
+
+                    def newest_year_merger(values):
+                        return max(v for v in values if v is not None)
+
+                    custom_policy.field_rules[field] = FieldMergeRule(
+                        field, MergeStrategy.CUSTOM, newest_year_merger
+                    )
+
+            return custom_policy.merge_entries(
+                entries=source_entries,
+                target_key=command.target_key,
+                strategy=MergeStrategy.SMART,
+            )
+
+        return self.merge_policy.merge_entries(
+            entries=source_entries,
+            target_key=command.target_key,
+            strategy=strategy,
+        )
+
+    def _publish_merged(
+        self, command: MergeCommand, source_entries: list[Entry], merged_entry: Entry
+    ) -> None:
+        """Publish the event of one merge."""
+        from datetime import datetime
+
+        from bibmgr.storage.events import Event
+
+        event = Event(
+            type=EventType.ENTRIES_MERGED,
+            timestamp=datetime.now(),
+            data={
+                "source_entries": source_entries,
+                "source_keys": command.source_keys,
+                "merged_entry": merged_entry,
+                "target_key": command.target_key,
+                "strategy": command.strategy,
+            },
+        )
+        self.event_bus.publish(event)
+
 
 class AutoMergeHandler:
     """Automatically detect and merge duplicates."""
@@ -212,21 +351,17 @@ class AutoMergeHandler:
 
         duplicate_groups = self.duplicate_detector.find_duplicates()
 
-        results = []
-        for group in duplicate_groups:
-            if dry_run:
-                results.append(
-                    OperationResult(
-                        status=ResultStatus.DRY_RUN,
-                        message=f"Would merge {len(group)} entries",
-                        data={"entries": [e.key for e in group]},
-                    )
+        if dry_run:
+            return [
+                OperationResult(
+                    status=ResultStatus.DRY_RUN,
+                    message=f"Would merge {len(group)} entries",
+                    data={"entries": [e.key for e in group]},
                 )
-            else:
-                command = MergeCommand(
-                    source_keys=[e.key for e in group], strategy=strategy
-                )
-                result = self.merge_handler.execute(command)
-                results.append(result)
+                for group in duplicate_groups
+            ]
 
-        return results
+        return self.merge_handler.execute_batch(
+            (MergeCommand(source_keys=[e.key for e in group], strategy=strategy), group)
+            for group in duplicate_groups
+        )
@@ -40,15 +40,9 @@ class KeyNamingPolicy:
         if not repository:
             return f"{base_key}_alt"
 
-        for suffix in "abcdefghijklmnopqrstuvwxyz":
-            candidate = f"{base_key}{suffix}"
-            if not repository.exists(candidate):
-                return candidate
-
-        for i in range(2, 100):
-            candidate = f"{base_key}{i}"
-            if not repository.exists(candidate):
-                return candidate
+        candidate = repository.next_free_key(base_key)
+        if candidate:
+            return candidate
 
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         return f"{base_key}_{timestamp}"
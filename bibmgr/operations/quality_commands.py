@@ -1,6 +1,7 @@
 """Commands for quality check operations."""
 
 from dataclasses import dataclass
+from pathlib import Path
 
 from ..core.models import Entry
 
@@ -18,6 +19,8 @@ class ValidateBatchCommand:
 
     entries: list[Entry]
     stop_on_error: bool = False
+    jobs: int = 1
+    cache_path: Path | None = None
 
 
 @dataclass
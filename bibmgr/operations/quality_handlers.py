@@ -4,17 +4,23 @@ import json
 from datetime import datetime
 from typing import Any
 
+from ..core.crossref import CrossRefGraph
 from ..core.models import Entry, ValidationError
-from ..core.validators import ValidatorRegistry
+from ..core.validators import ValidationCache, ValidatorRegistry
 from .results import OperationResult, ResultStatus
 
 
 class QualityHandler:
     """Handler for quality check operations."""
 
-    def __init__(self):
-        """Initialize quality handler."""
-        self.validator_registry = ValidatorRegistry()
+    def __init__(self, graph: CrossRefGraph | None = None):
+        """Initialize quality handler.
+
+        Args:
+            graph: Maintained cross-reference graph that crossrefs are
+                checked against
+        """
+        self.validator_registry = ValidatorRegistry(graph=graph)
 
     def execute(self, command: Any) -> OperationResult:
         """Execute a quality command.
@@ -119,8 +125,26 @@ class QualityHandler:
         entries_with_warnings = 0
         all_issues = []
 
-        for entry in entries:
-            issues = self.validator_registry.validate(entry)
+        # Without early stopping all entries are validated in one batch,
+        # reusing cached results of entries that did not change
+        cache = None
+        batch_issues = None
+        if not stop_on_error:
+            if command.cache_path is not None:
+                cache = ValidationCache(
+                    command.cache_path, self.validator_registry.validators
+                )
+            batch_issues = self.validator_registry.validate_entries(
+                entries, jobs=command.jobs, cache=cache
+            )
+            if cache is not None:
+                cache.save()
+
+        for position, entry in enumerate(entries):
+            if batch_issues is not None:
+                issues = batch_issues[position]
+            else:
+                issues = self.validator_registry.validate(entry)
 
             if issues:
                 all_issues.extend(issues)
@@ -163,6 +187,7 @@ class QualityHandler:
                 "entries_with_errors": entries_with_errors,
                 "entries_with_warnings": entries_with_warnings,
                 "all_issues": all_issues,
+                "cached_entries": cache.hits if cache is not None else 0,
             },
         )
 
@@ -9,6 +9,7 @@ from .deduplicate import (
 from .export import ExportFormat, ExportWorkflow, ExportWorkflowConfig
 from .import_workflow import ImportFormat, ImportWorkflow, ImportWorkflowConfig
 from .migrate import MigrationConfig, MigrationWorkflow
+from .rendering import EntryRenderer, RenderCache
 
 __all__ = [
     # Import
@@ -19,6 +20,8 @@ __all__ = [
     "ExportFormat",
     "ExportWorkflow",
     "ExportWorkflowConfig",
+    "EntryRenderer",
+    "RenderCache",
     # Deduplication
     "DeduplicationMode",
     "DeduplicationRule",
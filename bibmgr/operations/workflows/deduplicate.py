@@ -1,17 +1,25 @@
-"""Deduplication workflow for finding and merging duplicates."""
+"""Deduplication workflow for finding and merging duplicates.
 
+The library is read once into compact blocking rows (DOI, title, author and
+year of each entry); computing their normalized blocking keys is sharded
+over worker processes for large libraries. Only the members of duplicate
+groups are loaded back as entries, and all merges of a run are written in
+a single transaction.
+"""
+
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
-from bibmgr.core.duplicates import DuplicateDetector
+from bibmgr.core.duplicates import BlockingRow, blocking_row, find_duplicate_groups
 from bibmgr.core.models import Entry
 from bibmgr.storage.events import Event, EventBus, EventType
 from bibmgr.storage.repository import RepositoryManager
 
 from ..commands import MergeCommand, MergeHandler
 from ..policies import MergeStrategy
-from ..results import StepResult, WorkflowResult
+from ..results import OperationResult, StepResult, WorkflowResult
 
 
 class MatchType(Enum):
@@ -62,6 +70,7 @@ class DeduplicationConfig:
     merge_strategy: MergeStrategy = MergeStrategy.SMART
     dry_run: bool = False
     batch_size: int = 100
+    jobs: int = 1
 
 
 class DeduplicationWorkflow:
@@ -85,14 +94,14 @@ class DeduplicationWorkflow:
             },
         )
 
-        index_result = self._build_index()
+        index_result, keys, rows = self._build_index(config)
         result.add_step(index_result)
 
         if not index_result.success:
             result.complete()
             return result
 
-        detect_result = self._detect_duplicates(config)
+        detect_result = self._detect_duplicates(config, keys, rows)
         result.add_step(detect_result)
 
         if not detect_result.success:
@@ -151,33 +160,61 @@ class DeduplicationWorkflow:
 
         return result
 
-    def _build_index(self) -> StepResult:
-        """Build index for duplicate detection."""
+    def _build_index(
+        self, config: DeduplicationConfig
+    ) -> tuple[StepResult, list[str], list[BlockingRow]]:
+        """Read the library once into blocking rows."""
+        keys: list[str] = []
+        rows: list[BlockingRow] = []
         try:
-            entries = self.manager.entries.find_all()
-
-            return StepResult(
-                step="build_index",
-                success=True,
-                message=f"Indexed {len(entries)} entries",
-                data={"entry_count": len(entries)},
+            total = len(self.manager.entries.keys())
+            for entry in self.manager.entries.iter_entries():
+                keys.append(entry.key)
+                rows.append(blocking_row(entry))
+                if len(keys) % max(config.batch_size, 1) == 0:
+                    self._publish_progress("load", len(keys), total)
+            self._publish_progress("load", len(keys), total)
+
+            return (
+                StepResult(
+                    step="build_index",
+                    success=True,
+                    message=f"Indexed {len(keys)} entries",
+                    data={"entry_count": len(keys)},
+                ),
+                keys,
+                rows,
             )
 
         except Exception as e:
-            return StepResult(
-                step="build_index",
-                success=False,
-                message="Failed to build index",
-                errors=[str(e)],
+            return (
+                StepResult(
+                    step="build_index",
+                    success=False,
+                    message="Failed to build index",
+                    errors=[str(e)],
+                ),
+                [],
+                [],
             )
 
-    def _detect_duplicates(self, config: DeduplicationConfig) -> StepResult:
+    def _detect_duplicates(
+        self, config: DeduplicationConfig, keys: list[str], rows: list[BlockingRow]
+    ) -> StepResult:
         """Detect duplicate groups."""
         try:
-            entries = self.manager.entries.find_all()
-            detector = DuplicateDetector(entries)
-
-            duplicate_lists = detector.find_duplicates()
+            positions = find_duplicate_groups(rows, jobs=config.jobs)
+            self._publish_progress("detect", len(rows), len(rows))
+
+            members = sorted({i for group in positions for i in group})
+            loaded = {
+                entry.key: entry
+                for entry in self.manager.entries.iter_entries(keys[i] for i in members)
+            }
+            duplicate_lists = [
+                [loaded[keys[i]] for i in group if keys[i] in loaded]
+                for group in positions
+            ]
 
             groups = []
             for dup_list in duplicate_lists:
@@ -238,21 +275,11 @@ class DeduplicationWorkflow:
     def _merge_all_duplicates(
         self, groups: list[DuplicateGroup], config: DeduplicationConfig
     ) -> list[StepResult]:
-        """Merge all duplicate groups automatically."""
-        results = []
+        """Merge all duplicate groups automatically, in one transaction."""
+        results: list[StepResult | None] = []
+        batch: list[tuple[int, DuplicateGroup]] = []
 
         for i, group in enumerate(groups):
-            event = Event(
-                type=EventType.PROGRESS,
-                timestamp=datetime.now(),
-                data={
-                    "operation": "merge_duplicates",
-                    "current": i + 1,
-                    "total": len(groups),
-                },
-            )
-            self.event_bus.publish(event)
-
             if group.confidence < config.min_similarity:
                 results.append(
                     StepResult(
@@ -264,11 +291,6 @@ class DeduplicationWorkflow:
                 )
                 continue
 
-            command = MergeCommand(
-                source_keys=[e.key for e in group.entries],
-                strategy=config.merge_strategy.value,
-            )
-
             if config.dry_run:
                 results.append(
                     StepResult(
@@ -279,24 +301,29 @@ class DeduplicationWorkflow:
                     )
                 )
             else:
-                merge_result = self.merge_handler.execute(command)
-                results.append(
-                    StepResult(
-                        step="merge_group",
-                        success=merge_result.status.is_success(),
-                        entity_id=merge_result.entity_id,
-                        message=merge_result.message,
-                        errors=merge_result.errors,
-                    )
-                )
+                batch.append((len(results), group))
+                results.append(None)
+
+        merge_results = self._merge_batch(
+            [(group, config.merge_strategy) for _, group in batch]
+        )
+        for (position, _), merge_result in zip(batch, merge_results, strict=True):
+            results[position] = StepResult(
+                step="merge_group",
+                success=merge_result.status.is_success(),
+                entity_id=merge_result.entity_id,
+                message=merge_result.message,
+                errors=merge_result.errors,
+            )
 
-        return results
+        return [r for r in results if r is not None]
 
     def _process_with_rules(
         self, groups: list[DuplicateGroup], config: DeduplicationConfig
     ) -> list[StepResult]:
-        """Process duplicates using configured rules."""
-        results = []
+        """Process duplicates using configured rules, merging in one transaction."""
+        results: list[StepResult | None] = []
+        batch: list[tuple[int, DuplicateGroup, DeduplicationRule]] = []
 
         for group in groups:
             rule = self._find_matching_rule(group, config.rules)
@@ -313,21 +340,8 @@ class DeduplicationWorkflow:
                 continue
 
             if rule.action == "merge":
-                command = MergeCommand(
-                    source_keys=[e.key for e in group.entries],
-                    strategy=rule.merge_strategy.value,
-                )
-
-                merge_result = self.merge_handler.execute(command)
-                results.append(
-                    StepResult(
-                        step="apply_rule",
-                        success=merge_result.status.is_success(),
-                        entity_id=merge_result.entity_id,
-                        message=f"Merged by rule: {merge_result.message}",
-                        errors=merge_result.errors,
-                    )
-                )
+                batch.append((len(results), group, rule))
+                results.append(None)
 
             elif rule.action == "ask":
                 results.append(
@@ -342,7 +356,51 @@ class DeduplicationWorkflow:
                     )
                 )
 
-        return results
+        merge_results = self._merge_batch(
+            [(group, rule.merge_strategy) for _, group, rule in batch]
+        )
+        for (position, _, _), merge_result in zip(batch, merge_results, strict=True):
+            results[position] = StepResult(
+                step="apply_rule",
+                success=merge_result.status.is_success(),
+                entity_id=merge_result.entity_id,
+                message=f"Merged by rule: {merge_result.message}",
+                errors=merge_result.errors,
+            )
+
+        return [r for r in results if r is not None]
+
+    def _merge_batch(
+        self, groups: list[tuple[DuplicateGroup, MergeStrategy]]
+    ) -> list[OperationResult]:
+        """Merge groups through one batched write, reporting progress."""
+        if not groups:
+            return []
+
+        def commands() -> Iterator[tuple[MergeCommand, list[Entry]]]:
+            for i, (group, strategy) in enumerate(groups):
+                self._publish_progress("merge", i + 1, len(groups))
+                command = MergeCommand(
+                    source_keys=[e.key for e in group.entries],
+                    strategy=strategy.value,
+                )
+                yield command, group.entries
+
+        return self.merge_handler.execute_batch(commands())
+
+    def _publish_progress(self, stage: str, current: int, total: int) -> None:
+        """Publish the progress of one stage of the run."""
+        event = Event(
+            type=EventType.PROGRESS,
+            timestamp=datetime.now(),
+            data={
+                "operation": "deduplicate",
+                "stage": stage,
+                "current": current,
+                "total": total,
+            },
+        )
+        self.event_bus.publish(event)
 
     def _find_matching_rule(
         self, group: DuplicateGroup, rules: list[DeduplicationRule] | None
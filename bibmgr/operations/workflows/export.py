@@ -1,16 +1,45 @@
-"""Export workflow for exporting entries to various formats."""
-
+"""Export workflow for exporting entries to various formats.
+
+Entries stream from storage to the output file one at a time: the workflow
+collects only their keys, validation is a separate pass that remembers the
+invalid keys, and each writer consumes an iterator of entries with buffered
+writes. Sorting by the key orders the keys alone; any other sort field goes
+through an external merge sort. Citations go through the rendering cache
+when the configuration names one.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import partial
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
+from bibmgr.core.crossref import CrossRefGraph
 from bibmgr.core.models import Entry
 from bibmgr.storage.events import Event, EventBus, EventType
 from bibmgr.storage.query import Condition, Operator, Query
 from bibmgr.storage.repository import RepositoryManager
 
 from ..results import StepResult, WorkflowResult
+from .rendering import CACHED_FORMATS, EntryRenderer, RenderCache
+from .streaming import (
+    SORT_RUN_SIZE,
+    WRITE_BUFFER_SIZE,
+    external_sort,
+    iter_json_document,
+    sort_key,
+)
+
+# Rows handed to the CSV writer at once
+CSV_CHUNK_SIZE = 1000
+
+# Entry fields left out of JSON exports
+JSON_EXCLUDED_FIELDS = frozenset({"added", "modified", "tags"})
 
 
 class ExportFormat(Enum):
@@ -19,8 +48,10 @@ class ExportFormat(Enum):
     BIBTEX = "bibtex"
     RIS = "ris"
     JSON = "json"
+    NDJSON = "ndjson"
     CSV = "csv"
     MARKDOWN = "markdown"
+    CITATION = "citation"
 
 
 @dataclass
@@ -36,6 +67,11 @@ class ExportWorkflowConfig:
     pretty_print: bool = True
     encoding: str = "utf-8"
     dry_run: bool = False
+    resolve_crossrefs: bool = False
+    sort_run_size: int = SORT_RUN_SIZE
+    citation_style: str = "apa"
+    render_cache: Path | None = None
+    jobs: int = 1
 
 
 class ExportWorkflow:
@@ -73,11 +109,11 @@ class ExportWorkflow:
             result.complete()
             return result
 
-        entries: list[Entry] = (
-            collect_result.data.get("entries", []) if collect_result.data else []
+        keys: list[str] = (
+            collect_result.data.get("keys", []) if collect_result.data else []
         )
 
-        if not entries:
+        if not keys:
             result.add_step(
                 StepResult(step="export", success=True, message="No entries to export")
             )
@@ -85,22 +121,18 @@ class ExportWorkflow:
             return result
 
         if config.validate:
-            validate_result = self._validate_entries(entries)
+            validate_result = self._validate_entries(keys)
             result.add_step(validate_result)
 
             if not validate_result.success and not validate_result.warnings:
                 result.complete()
                 return result
 
-            if validate_result.warnings:
-                invalid_keys = set()
-                for warning in validate_result.warnings:
-                    key = warning.split(":")[0]
-                    invalid_keys.add(key)
+            invalid_keys = (validate_result.data or {}).get("invalid_keys", set())
+            if invalid_keys:
+                keys = [key for key in keys if key not in invalid_keys]
 
-                entries = [e for e in entries if e.key not in invalid_keys]
-
-                if not entries:
+                if not keys:
                     result.add_step(
                         StepResult(
                             step="export",
@@ -111,31 +143,36 @@ class ExportWorkflow:
                     result.complete()
                     return result
 
-        if config.sort_by:
-            entries = self._sort_entries(entries, config.sort_by, config.sort_reverse)
-
         if config.dry_run:
             result.add_step(
                 StepResult(
                     step="export",
                     success=True,
-                    message=f"Would export {len(entries)} entries to {config.format.value}",
-                    data={"count": len(entries), "format": config.format.value},
+                    message=f"Would export {len(keys)} entries to {config.format.value}",
+                    data={"count": len(keys), "format": config.format.value},
                 )
             )
             result.complete()
             return result
 
+        entries = self._stream_entries(keys, config)
+
         if config.format == ExportFormat.BIBTEX:
             export_result = self._export_bibtex(entries, destination, config)
         elif config.format == ExportFormat.RIS:
             export_result = self._export_ris(entries, destination, config)
         elif config.format == ExportFormat.JSON:
             export_result = self._export_json(entries, destination, config)
+        elif config.format == ExportFormat.NDJSON:
+            export_result = self._export_ndjson(entries, destination, config)
         elif config.format == ExportFormat.CSV:
             export_result = self._export_csv(entries, destination, config)
         elif config.format == ExportFormat.MARKDOWN:
-            export_result = self._export_markdown(entries, destination, config)
+            export_result = self._export_markdown(
+                entries, destination, config, len(keys)
+            )
+        elif config.format == ExportFormat.CITATION:
+            export_result = self._export_citations(entries, destination, config)
         else:
             export_result = StepResult(
                 step="export",
@@ -155,7 +192,7 @@ class ExportWorkflow:
                     "workflow": "export",
                     "destination": str(destination),
                     "format": config.format.value,
-                    "entry_count": len(entries),
+                    "entry_count": export_result.data["count"],
                 },
             )
             self.event_bus.publish(event)
@@ -168,15 +205,14 @@ class ExportWorkflow:
         entry_keys: list[str] | None,
         collection_name: str | None,
     ) -> StepResult:
-        """Collect entries to export based on criteria."""
+        """Collect the keys of the entries to export based on criteria."""
         try:
-            entries = []
+            keys = []
 
             if entry_keys:
                 for key in entry_keys:
-                    entry = self.manager.entries.find(key)
-                    if entry:
-                        entries.append(entry)
+                    if self.manager.entries.exists(key):
+                        keys.append(key)
                     else:
                         return StepResult(
                             step="collect",
@@ -195,22 +231,23 @@ class ExportWorkflow:
 
                 collection = collections[0]
                 for key in collection.entry_keys or []:
-                    entry = self.manager.entries.find(key)
-                    if entry:
-                        entries.append(entry)
+                    if self.manager.entries.exists(key):
+                        keys.append(key)
 
             elif query:
                 parsed_query = self._parse_query(query)
-                entries = list(self.manager.entries.search(parsed_query))
+                keys = [
+                    entry.key for entry in self.manager.entries.search(parsed_query)
+                ]
 
             else:
-                entries = self.manager.entries.find_all()
+                keys = self.manager.entries.keys()
 
             return StepResult(
                 step="collect",
                 success=True,
-                message=f"Collected {len(entries)} entries",
-                data={"entries": entries},
+                message=f"Collected {len(keys)} entries",
+                data={"keys": keys},
             )
 
         except Exception as e:
@@ -221,227 +258,253 @@ class ExportWorkflow:
                 errors=[str(e)],
             )
 
-    def _validate_entries(self, entries: list[Entry]) -> StepResult:
-        """Validate entries before export."""
+    def _validate_entries(self, keys: list[str]) -> StepResult:
+        """Validate entries before export, streaming them from storage."""
         warnings = []
-        invalid_count = 0
+        invalid_keys = set()
 
-        for entry in entries:
+        for entry in self.manager.entries.iter_entries(keys):
             errors = entry.validate()
             if errors:
-                invalid_count += 1
-                warnings.append(f"{entry.key}: {', '.join(e.message for e in errors)}")
+                invalid_keys.add(entry.key)
+                if len(warnings) < 10:
+                    warnings.append(
+                        f"{entry.key}: {', '.join(e.message for e in errors)}"
+                    )
 
-        if invalid_count > 0:
+        if invalid_keys:
             return StepResult(
                 step="validate",
                 success=True,
-                message=f"Found {invalid_count} entries with validation errors",
-                warnings=warnings[:10],
+                message=f"Found {len(invalid_keys)} entries with validation errors",
+                warnings=warnings,
+                data={"invalid_keys": invalid_keys},
             )
 
         return StepResult(step="validate", success=True, message="All entries valid")
 
-    def _sort_entries(
-        self, entries: list[Entry], sort_by: str, reverse: bool
-    ) -> list[Entry]:
-        """Sort entries by specified field."""
-
-        def get_sort_key(entry):
-            value = getattr(entry, sort_by, None)
-            if value is None:
-                return ""
-            elif isinstance(value, list):
-                return value[0] if value else ""
-            else:
-                return str(value).lower()
+    def _stream_entries(
+        self, keys: list[str], config: ExportWorkflowConfig
+    ) -> Iterator[Entry]:
+        """Entries to export, in export order, read lazily from storage."""
+        if config.sort_by == "key":
+            keys = sorted(keys, key=str.lower, reverse=config.sort_reverse)
+
+        entries = self.manager.entries.iter_entries(keys)
+        if config.sort_by and config.sort_by != "key":
+            entries = external_sort(
+                entries,
+                partial(sort_key, field=config.sort_by),
+                reverse=config.sort_reverse,
+                run_size=config.sort_run_size,
+            )
 
-        return sorted(entries, key=get_sort_key, reverse=reverse)
+        if config.resolve_crossrefs:
+            entries = self._resolve_crossrefs(entries, config)
+        return entries
+
+    def _resolve_crossrefs(
+        self, entries: Iterable[Entry], config: ExportWorkflowConfig
+    ) -> Iterator[Entry]:
+        """Fill in inherited fields of the exported entries.
+
+        BibTeX resolves crossrefs itself, so its entries are only ordered
+        with citing entries ahead of the entries they reference; that takes
+        the full key order, after which the entries are read again.
+        """
+        graph = self.manager.crossrefs
+        if graph is None:
+            graph = CrossRefGraph(self.manager.entries.iter_entries())
+
+        if config.format != ExportFormat.BIBTEX:
+            return map(graph.resolve, entries)
+
+        order = graph.export_order(entry.key for entry in entries)
+        return self.manager.entries.iter_entries(order)
+
+    def _metadata_dict(self, key: str) -> dict[str, Any]:
+        """Exported metadata of one entry."""
+        metadata = self.manager.metadata_store.get_metadata(key)
+        return {
+            "tags": list(metadata.tags),
+            "rating": metadata.rating,
+            "read_status": metadata.read_status,
+            "read_date": metadata.read_date.isoformat() if metadata.read_date else None,
+            "importance": metadata.importance,
+            "notes_count": metadata.notes_count,
+        }
+
+    def _has_metadata(self, config: ExportWorkflowConfig) -> bool:
+        return bool(
+            config.include_metadata
+            and hasattr(self.manager, "metadata_store")
+            and self.manager.metadata_store
+        )
 
     def _export_bibtex(
         self,
-        entries: list[Entry],
+        entries: Iterable[Entry],
         destination: Path | str,
         config: ExportWorkflowConfig,
     ) -> StepResult:
         """Export entries as BibTeX."""
+        return self._export_rendered(entries, destination, config, "bibtex", "BibTeX")
+
+    def _export_ris(
+        self,
+        entries: Iterable[Entry],
+        destination: Path | str,
+        config: ExportWorkflowConfig,
+    ) -> StepResult:
+        """Export entries as RIS."""
+        return self._export_rendered(entries, destination, config, "ris", "RIS")
+
+    def _export_rendered(
+        self,
+        entries: Iterable[Entry],
+        destination: Path | str,
+        config: ExportWorkflowConfig,
+        format: str,
+        label: str,
+        header: str = "",
+        style: str = "",
+    ) -> StepResult:
+        """Write the rendered text of each entry, reusing cached renderings."""
+        cache = None
+        if config.render_cache and format in CACHED_FORMATS:
+            cache = RenderCache(config.render_cache)
         try:
             path = Path(destination)
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(path, "w", encoding=config.encoding) as f:
-                for entry in entries:
-                    f.write(f"@{entry.type.value}{{{entry.key},\n")
-
-                    entry_dict = entry.to_dict()
-                    for field, value in entry_dict.items():
-                        if field in ["key", "type", "added", "modified"]:
-                            continue
-                        if value is not None:
-                            if isinstance(value, list):
-                                value = " and ".join(str(v) for v in value)
-                            f.write(f"  {field} = {{{value}}},\n")
+            renderer = EntryRenderer(format, style, cache=cache, jobs=config.jobs)
+            count = 0
+            with open(
+                path, "w", encoding=config.encoding, buffering=WRITE_BUFFER_SIZE
+            ) as f:
+                f.write(header)
+                for text in renderer.render(entries):
+                    f.write(text)
+                    count += 1
 
-                    f.write("}\n\n")
+            data: dict[str, Any] = {"path": str(path), "count": count}
+            message = f"Exported {count} entries to {label}"
+            if cache is not None:
+                data["render_cache"] = cache.stats()
+                message += f" ({cache.hit_rate:.0%} from render cache)"
 
-            return StepResult(
-                step="export",
-                success=True,
-                message=f"Exported {len(entries)} entries to BibTeX",
-                data={"path": str(path), "count": len(entries)},
-            )
+            return StepResult(step="export", success=True, message=message, data=data)
 
         except Exception as e:
             return StepResult(
                 step="export",
                 success=False,
-                message="Failed to export BibTeX",
+                message=f"Failed to export {label}",
                 errors=[str(e)],
             )
+        finally:
+            if cache is not None:
+                cache.close()
 
-    def _export_ris(
+    def _export_json(
         self,
-        entries: list[Entry],
+        entries: Iterable[Entry],
         destination: Path | str,
         config: ExportWorkflowConfig,
     ) -> StepResult:
-        """Export entries as RIS."""
+        """Export entries as JSON.
+
+        The document is written incrementally but keeps the layout of
+        ``json.dump``: an ``entries`` array followed by the ``total`` and,
+        when requested, the ``metadata`` of every exported entry.
+        """
         try:
             path = Path(destination)
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            type_map = {
-                "article": "JOUR",
-                "book": "BOOK",
-                "inproceedings": "CPAPER",
-                "incollection": "CHAP",
-                "phdthesis": "THES",
-                "mastersthesis": "THES",
-                "techreport": "RPRT",
-                "misc": "GEN",
-            }
-
-            with open(path, "w", encoding=config.encoding) as f:
-                for entry in entries:
-                    ris_type = type_map.get(entry.type.value, "GEN")
-                    f.write(f"TY  - {ris_type}\n")
-
-                    if entry.author:
-                        for author in entry.author.split(" and "):
-                            f.write(f"AU  - {author.strip()}\n")
+            exported: list[str] = []
 
-                    if entry.title:
-                        f.write(f"TI  - {entry.title}\n")
-
-                    if entry.year:
-                        f.write(f"PY  - {entry.year}\n")
-
-                    if entry.journal:
-                        f.write(f"JO  - {entry.journal}\n")
-
-                    if entry.doi:
-                        f.write(f"DO  - {entry.doi}\n")
+            def items() -> Iterator[dict[str, Any]]:
+                for entry in entries:
+                    exported.append(entry.key)
+                    yield _export_dict(entry)
 
-                    if entry.abstract:
-                        f.write(f"AB  - {entry.abstract}\n")
+            # Always use structured format for JSON exports
+            def tail(total: int) -> dict[str, Any]:
+                data: dict[str, Any] = {"total": total}
+                if self._has_metadata(config):
+                    data["metadata"] = {
+                        key: self._metadata_dict(key) for key in exported
+                    }
+                return data
 
-                    f.write("ER  - \n\n")
+            with open(
+                path, "w", encoding=config.encoding, buffering=WRITE_BUFFER_SIZE
+            ) as f:
+                f.writelines(iter_json_document(items(), tail, config.pretty_print))
 
             return StepResult(
                 step="export",
                 success=True,
-                message=f"Exported {len(entries)} entries to RIS",
-                data={"path": str(path), "count": len(entries)},
+                message=f"Exported {len(exported)} entries to JSON",
+                data={"path": str(path), "count": len(exported)},
             )
 
         except Exception as e:
             return StepResult(
                 step="export",
                 success=False,
-                message="Failed to export RIS",
+                message="Failed to export JSON",
                 errors=[str(e)],
             )
 
-    def _export_json(
+    def _export_ndjson(
         self,
-        entries: list[Entry],
+        entries: Iterable[Entry],
         destination: Path | str,
         config: ExportWorkflowConfig,
     ) -> StepResult:
-        """Export entries as JSON."""
+        """Export entries as newline-delimited JSON, one entry per line."""
         try:
-            import json
-
             path = Path(destination)
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Export entries without internal fields
-            entries_data = []
-            for entry in entries:
-                entry_dict = entry.to_dict()
-                # Remove internal fields that shouldn't be exported
-                export_dict = {
-                    k: v
-                    for k, v in entry_dict.items()
-                    if k not in ["added", "modified", "tags"]
-                }
-                entries_data.append(export_dict)
-
-            # Always use structured format for JSON exports
-            data = {"entries": entries_data, "total": len(entries)}
-
-            if (
-                config.include_metadata
-                and hasattr(self.manager, "metadata_store")
-                and self.manager.metadata_store
-            ):
-                metadata_dict = {}
+            include_metadata = self._has_metadata(config)
+            count = 0
+            with open(
+                path, "w", encoding=config.encoding, buffering=WRITE_BUFFER_SIZE
+            ) as f:
                 for entry in entries:
-                    metadata = self.manager.metadata_store.get_metadata(entry.key)
-                    metadata_dict[entry.key] = {
-                        "tags": list(metadata.tags),
-                        "rating": metadata.rating,
-                        "read_status": metadata.read_status,
-                        "read_date": metadata.read_date.isoformat()
-                        if metadata.read_date
-                        else None,
-                        "importance": metadata.importance,
-                        "notes_count": metadata.notes_count,
-                    }
-
-                data["metadata"] = metadata_dict
-
-            with open(path, "w", encoding=config.encoding) as f:
-                if config.pretty_print:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(data, f, ensure_ascii=False)
+                    item = _export_dict(entry)
+                    if include_metadata:
+                        item["metadata"] = self._metadata_dict(entry.key)
+                    f.write(json.dumps(item, ensure_ascii=False))
+                    f.write("\n")
+                    count += 1
 
             return StepResult(
                 step="export",
                 success=True,
-                message=f"Exported {len(entries)} entries to JSON",
-                data={"path": str(path), "count": len(entries)},
+                message=f"Exported {count} entries to NDJSON",
+                data={"path": str(path), "count": count},
             )
 
         except Exception as e:
             return StepResult(
                 step="export",
                 success=False,
-                message="Failed to export JSON",
+                message="Failed to export NDJSON",
                 errors=[str(e)],
             )
 
     def _export_csv(
         self,
-        entries: list[Entry],
+        entries: Iterable[Entry],
         destination: Path | str,
         config: ExportWorkflowConfig,
     ) -> StepResult:
-        """Export entries as CSV."""
+        """Export entries as CSV, writing rows in chunks."""
         try:
-            import csv
-
             path = Path(destination)
             path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -459,28 +522,40 @@ class ExportWorkflow:
                 "abstract",
             ]
 
-            with open(path, "w", newline="", encoding=config.encoding) as f:
+            def to_row(entry: Entry) -> dict[str, str]:
+                row = {}
+                for field in fields:
+                    value = getattr(entry, field, None)
+                    if value is not None:
+                        if isinstance(value, list):
+                            row[field] = "; ".join(str(v) for v in value)
+                        else:
+                            row[field] = str(value)
+                    else:
+                        row[field] = ""
+                return row
+
+            count = 0
+            rows = map(to_row, entries)
+            with open(
+                path,
+                "w",
+                newline="",
+                encoding=config.encoding,
+                buffering=WRITE_BUFFER_SIZE,
+            ) as f:
                 writer = csv.DictWriter(f, fieldnames=fields)
                 writer.writeheader()
 
-                for entry in entries:
-                    row = {}
-                    for field in fields:
-                        value = getattr(entry, field, None)
-                        if value is not None:
-                            if isinstance(value, list):
-                                row[field] = "; ".join(str(v) for v in value)
-                            else:
-                                row[field] = str(value)
-                        else:
-                            row[field] = ""
-                    writer.writerow(row)
+                while chunk := list(islice(rows, CSV_CHUNK_SIZE)):
+                    writer.writerows(chunk)
+                    count += len(chunk)
 
             return StepResult(
                 step="export",
                 success=True,
-                message=f"Exported {len(entries)} entries to CSV",
-                data={"path": str(path), "count": len(entries)},
+                message=f"Exported {count} entries to CSV",
+                data={"path": str(path), "count": count},
             )
 
         except Exception as e:
@@ -493,69 +568,32 @@ class ExportWorkflow:
 
     def _export_markdown(
         self,
-        entries: list[Entry],
+        entries: Iterable[Entry],
         destination: Path | str,
         config: ExportWorkflowConfig,
+        total: int,
     ) -> StepResult:
         """Export entries as Markdown."""
-        try:
-            path = Path(destination)
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(path, "w", encoding=config.encoding) as f:
-                f.write("# Bibliography Export\n\n")
-                f.write(f"Generated with {len(entries)} entries\n\n")
-
-                for entry in entries:
-                    f.write(f"## {entry.key}\n\n")
-
-                    f.write(f"**Type:** {entry.type.value}\n\n")
-
-                    if entry.author:
-                        f.write(f"**Authors:** {entry.author}\n\n")
-
-                    if entry.title:
-                        f.write(f"**Title:** {entry.title}\n\n")
-
-                    if entry.year:
-                        f.write(f"**Year:** {entry.year}\n\n")
-
-                    if entry.journal:
-                        f.write(f"**Journal:** {entry.journal}\n\n")
-                    elif entry.booktitle:
-                        f.write(f"**Book Title:** {entry.booktitle}\n\n")
-
-                    if entry.publisher:
-                        f.write(f"**Publisher:** {entry.publisher}\n\n")
-
-                    if entry.doi:
-                        f.write(
-                            f"**DOI:** [{entry.doi}](https://doi.org/{entry.doi})\n\n"
-                        )
-
-                    if entry.url:
-                        f.write(f"**URL:** [{entry.url}]({entry.url})\n\n")
-
-                    if entry.abstract:
-                        f.write("**Abstract:**\n\n")
-                        f.write(f"> {entry.abstract}\n\n")
-
-                    f.write("---\n\n")
-
-            return StepResult(
-                step="export",
-                success=True,
-                message=f"Exported {len(entries)} entries to Markdown",
-                data={"path": str(path), "count": len(entries)},
-            )
+        header = f"# Bibliography Export\n\nGenerated with {total} entries\n\n"
+        return self._export_rendered(
+            entries, destination, config, "markdown", "Markdown", header
+        )
 
-        except Exception as e:
-            return StepResult(
-                step="export",
-                success=False,
-                message="Failed to export Markdown",
-                errors=[str(e)],
-            )
+    def _export_citations(
+        self,
+        entries: Iterable[Entry],
+        destination: Path | str,
+        config: ExportWorkflowConfig,
+    ) -> StepResult:
+        """Export entries as formatted citations, one per line."""
+        return self._export_rendered(
+            entries,
+            destination,
+            config,
+            "citation",
+            "citations",
+            style=config.citation_style,
+        )
 
     def _parse_query(self, query_string: str) -> Query:
         """Parse a simple query string into a Query object."""
@@ -594,3 +632,8 @@ class ExportWorkflow:
                 ],
                 Operator.OR,
             )
+
+
+def _export_dict(entry: Entry) -> dict[str, Any]:
+    """Entry fields written to JSON exports, without internal fields."""
+    return {k: v for k, v in entry.to_dict().items() if k not in JSON_EXCLUDED_FIELDS}
@@ -7,6 +7,7 @@ from pathlib import Path
 
 from bibmgr.core.duplicates import DuplicateDetector
 from bibmgr.core.models import Entry
+from bibmgr.core.validators import ValidationContext
 from bibmgr.storage.events import Event, EventBus, EventType
 from bibmgr.storage.importers import BibtexImporter, JsonImporter, RisImporter
 from bibmgr.storage.repository import RepositoryManager
@@ -88,6 +89,41 @@ class ImportWorkflow:
             parse_result.data.get("entries", []) if parse_result.data else []
         )
 
+        # Batch subscribers (indexing, smart collections) see the whole
+        # import as one coalesced burst instead of one call per entry.
+        with self.event_bus.batching():
+            self._import_entries(entries, config, result)
+
+        if config.tags or config.collection:
+            post_result = self._post_process(result.successful_entities, config)
+            result.add_step(post_result)
+
+        result.complete()
+
+        event = Event(
+            type=EventType.WORKFLOW_COMPLETED,
+            timestamp=datetime.now(),
+            data={
+                "workflow": "import",
+                "source": str(source),
+                "format": format.value,
+                "result": result,
+            },
+        )
+        self.event_bus.publish(event)
+
+        return result
+
+    def _import_entries(
+        self,
+        entries: list[Entry],
+        config: ImportWorkflowConfig,
+        result: WorkflowResult,
+    ) -> None:
+        """Create, merge or update each parsed entry."""
+        # Shared by the create handler and the save, so each entry is
+        # validated once
+        context = self.manager.entries.validation_context()
         for i, entry in enumerate(entries):
             event = Event(
                 type=EventType.PROGRESS,
@@ -146,33 +182,13 @@ class ImportWorkflow:
                             {**entry.to_dict(), "key": resolution.new_key}
                         )
 
-            create_result = self._create_entry(entry, config)
+            create_result = self._create_entry(entry, config, context)
             result.add_step(create_result)
 
             # If continue_on_error is False, stop on any failure
             if not config.continue_on_error and not create_result.success:
                 break
 
-        if config.tags or config.collection:
-            post_result = self._post_process(result.successful_entities, config)
-            result.add_step(post_result)
-
-        result.complete()
-
-        event = Event(
-            type=EventType.WORKFLOW_COMPLETED,
-            timestamp=datetime.now(),
-            data={
-                "workflow": "import",
-                "source": str(source),
-                "format": format.value,
-                "result": result,
-            },
-        )
-        self.event_bus.publish(event)
-
-        return result
-
     def _detect_format(self, source: Path | str) -> ImportFormat:
         """Auto-detect file format."""
         path = Path(source)
@@ -269,13 +285,18 @@ class ImportWorkflow:
             data={"duplicate": None},
         )
 
-    def _create_entry(self, entry: Entry, config: ImportWorkflowConfig) -> StepResult:
+    def _create_entry(
+        self,
+        entry: Entry,
+        config: ImportWorkflowConfig,
+        context: ValidationContext | None = None,
+    ) -> StepResult:
         """Create new entry."""
         command = CreateCommand(
             entry=entry, force=not config.validate, dry_run=config.dry_run
         )
 
-        result = self.create_handler.execute(command)
+        result = self.create_handler.execute(command, context)
 
         return StepResult(
             step="create",
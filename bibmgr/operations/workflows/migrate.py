@@ -9,6 +9,7 @@ from typing import Any
 from bibmgr.core.models import Entry
 from bibmgr.storage.backends import FileSystemBackend, SQLiteBackend
 from bibmgr.storage.events import Event, EventBus, EventType
+from bibmgr.storage.migrations import BatchMigrator
 from bibmgr.storage.repository import RepositoryManager
 
 from ..results import StepResult, WorkflowResult
@@ -42,6 +43,8 @@ class MigrationConfig:
     test_mode: bool = False
     backup_dir: Path | None = None
     cleanup_source: bool = False
+    checkpoint_path: Path | None = None
+    readers: int = 1
 
 
 class MigrationWorkflow:
@@ -89,7 +92,9 @@ class MigrationWorkflow:
             },
         )
 
-        validate_result = self._validate_backends(source_manager, target_manager)
+        validate_result = self._validate_backends(
+            source_manager, target_manager, config
+        )
         result.add_step(validate_result)
 
         if not validate_result.success:
@@ -165,18 +170,23 @@ class MigrationWorkflow:
         return info
 
     def _validate_backends(
-        self, source_manager: RepositoryManager, target_manager: RepositoryManager
+        self,
+        source_manager: RepositoryManager,
+        target_manager: RepositoryManager,
+        config: MigrationConfig,
     ) -> StepResult:
         """Validate source and target backends."""
         try:
-            if not source_manager.entries.find_all():
+            if not source_manager.entries.keys():
                 return StepResult(
                     step="validate",
                     success=False,
                     message="Source has no entries to migrate",
                 )
 
-            if target_manager.entries.find_all():
+            # A checkpointed run resumes into the target it already filled
+            resuming = config.checkpoint_path and config.checkpoint_path.exists()
+            if not resuming and target_manager.entries.keys():
                 return StepResult(
                     step="validate",
                     success=False,
@@ -205,18 +215,19 @@ class MigrationWorkflow:
     ) -> StepResult:
         """Count items to migrate."""
         try:
+            keys = source_manager.entries.keys()
             counts = {
-                "entries": len(source_manager.entries.find_all()),
+                "entries": len(keys),
                 "metadata": 0,
                 "collections": 0,
                 "notes": 0,
             }
 
             if config.migrate_metadata:
-                for entry in source_manager.entries.find_all():
+                for key in keys:
                     try:
                         source_manager.metadata_store.get_metadata(
-                            entry.key
+                            key
                         ) if source_manager.metadata_store else None
                         counts["metadata"] += 1
                     except Exception:
@@ -246,50 +257,63 @@ class MigrationWorkflow:
         target_manager: RepositoryManager,
         config: MigrationConfig,
     ) -> StepResult:
-        """Migrate bibliography entries."""
+        """Stream bibliography entries to the target in checkpointed batches."""
         try:
-            entries = source_manager.entries.find_all()
-            migrated = 0
-            failed = 0
             warnings = []
-
-            for i in range(0, len(entries), config.batch_size):
-                batch = entries[i : i + config.batch_size]
-
+            context = target_manager.entries.validation_context()
+
+            def prepare(key: str, data: dict[str, Any]) -> dict[str, Any]:
+                entry = source_manager.entries._convert_to_entry(data)
+                errors = context.validate(entry)
+                messages = ", ".join(e.message for e in errors)
+                if any(e.severity == "error" for e in errors):
+                    raise ValueError(messages)
+                if errors and config.validate_entries:
+                    warnings.append(f"{entry.key}: {messages}")
+                return entry.to_dict()
+
+            def progress(current: int, total: int) -> None:
                 event = Event(
                     type=EventType.PROGRESS,
                     timestamp=datetime.now(),
                     data={
                         "operation": "migrate_entries",
-                        "current": i,
-                        "total": len(entries),
+                        "current": current,
+                        "total": total,
                     },
                 )
                 self.event_bus.publish(event)
 
-                for entry in batch:
-                    if config.validate_entries:
-                        errors = entry.validate()
-                        if errors:
-                            warnings.append(
-                                f"{entry.key}: {', '.join(e.message for e in errors)}"
-                            )
+            migrator = BatchMigrator(
+                source_manager.entries.backend,  # type: ignore[arg-type]
+                target_manager.entries.backend,  # type: ignore[arg-type]
+                batch_size=config.batch_size,
+                checkpoint_path=config.checkpoint_path,
+                readers=config.readers,
+            )
+            stats = migrator.run(
+                source_manager.entries.keys(),
+                prepare,
+                progress=progress,
+                dry_run=config.dry_run,
+            )
+            warnings.extend(stats.errors)
 
-                    if not config.dry_run:
-                        try:
-                            target_manager.entries.save(entry)
-                            migrated += 1
-                        except Exception as e:
-                            failed += 1
-                            warnings.append(f"{entry.key}: {str(e)}")
-                    else:
-                        migrated += 1
+            message = f"Migrated {stats.migrated_entries} entries"
+            if stats.failed_entries:
+                message += f", {stats.failed_entries} failed"
+            if stats.resumed_from:
+                message += f" (resumed after {stats.resumed_from})"
 
             return StepResult(
                 step="migrate_entries",
-                success=failed == 0,
-                message=f"Migrated {migrated} entries"
-                + (f", {failed} failed" if failed else ""),
+                success=stats.failed_entries == 0 and stats.mismatched_batches == 0,
+                message=message,
+                data={
+                    "migrated": stats.migrated_entries,
+                    "failed": stats.failed_entries,
+                    "mismatched_batches": stats.mismatched_batches,
+                },
                 warnings=warnings[:10] if warnings else None,
             )
 
@@ -311,10 +335,10 @@ class MigrationWorkflow:
         try:
             migrated = 0
 
-            for entry in source_manager.entries.find_all():
+            for key in source_manager.entries.keys():
                 try:
                     if source_manager.metadata_store:
-                        metadata = source_manager.metadata_store.get_metadata(entry.key)
+                        metadata = source_manager.metadata_store.get_metadata(key)
                         if not config.dry_run and target_manager.metadata_store:
                             target_manager.metadata_store.save_metadata(metadata)
                     migrated += 1
@@ -375,13 +399,13 @@ class MigrationWorkflow:
         try:
             migrated = 0
 
-            for entry in source_manager.entries.find_all():
+            for key in source_manager.entries.keys():
                 try:
                     if source_manager.metadata_store:
-                        notes = source_manager.metadata_store.get_notes(entry.key)
+                        notes = source_manager.metadata_store.get_notes(key)
                         for note in notes:
                             if not config.dry_run and target_manager.metadata_store:
-                                target_manager.metadata_store.add_note(entry.key, note)
+                                target_manager.metadata_store.add_note(key, note)
                         migrated += 1
                 except Exception:
                     pass
@@ -409,7 +433,7 @@ class MigrationWorkflow:
         """Verify migration was successful."""
         try:
             actual_counts = {
-                "entries": len(target_manager.entries.find_all()),
+                "entries": len(target_manager.entries.keys()),
                 "collections": len(target_manager.collections.find_all()),
             }
 
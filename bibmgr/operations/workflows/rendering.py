@@ -0,0 +1,266 @@
+"""Cached, optionally parallel rendering of entries to text.
+
+The text of an entry in BibTeX, RIS, Markdown or a citation style depends
+only on the entry's content. Citations parse author names and apply title
+case for every entry, so their text is kept in a diskcache store keyed by
+the entry's content hash, the format and the style, and re-exporting an
+unchanged library emits every citation straight from the cache. The other
+layouts are plain string formatting, cheaper than a cache lookup, and are
+always rendered. Entries are rendered in batches, on a process pool when a
+cold export asks for several jobs.
+"""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+from pathlib import Path
+
+import diskcache
+
+from bibmgr.core.models import Entry
+
+from ..formatters import CitationFormatter
+
+# Bump when the output of any renderer changes
+RENDER_FORMAT_VERSION = 1
+
+# Entries rendered per batch and worker
+RENDER_BATCH_SIZE = 1000
+
+# Formats whose renderers cost more than reading their text from the cache
+CACHED_FORMATS = frozenset({"citation"})
+
+RIS_TYPES = {
+    "article": "JOUR",
+    "book": "BOOK",
+    "inproceedings": "CPAPER",
+    "incollection": "CHAP",
+    "phdthesis": "THES",
+    "mastersthesis": "THES",
+    "techreport": "RPRT",
+    "misc": "GEN",
+}
+
+
+def render_bibtex(entry: Entry, style: str = "") -> str:
+    """BibTeX block of an entry as written by exports."""
+    parts = [f"@{entry.type.value}{{{entry.key},\n"]
+    for field, value in entry.to_dict().items():
+        if field in ["key", "type", "added", "modified"]:
+            continue
+        if value is not None:
+            if isinstance(value, list):
+                value = " and ".join(str(v) for v in value)
+            parts.append(f"  {field} = {{{value}}},\n")
+    parts.append("}\n\n")
+    return "".join(parts)
+
+
+def render_ris(entry: Entry, style: str = "") -> str:
+    """RIS record of an entry."""
+    parts = [f"TY  - {RIS_TYPES.get(entry.type.value, 'GEN')}\n"]
+    if entry.author:
+        for author in entry.author.split(" and "):
+            parts.append(f"AU  - {author.strip()}\n")
+    if entry.title:
+        parts.append(f"TI  - {entry.title}\n")
+    if entry.year:
+        parts.append(f"PY  - {entry.year}\n")
+    if entry.journal:
+        parts.append(f"JO  - {entry.journal}\n")
+    if entry.doi:
+        parts.append(f"DO  - {entry.doi}\n")
+    if entry.abstract:
+        parts.append(f"AB  - {entry.abstract}\n")
+    parts.append("ER  - \n\n")
+    return "".join(parts)
+
+
+def render_markdown(entry: Entry, style: str = "") -> str:
+    """Markdown section of an entry."""
+    parts = [f"## {entry.key}\n\n", f"**Type:** {entry.type.value}\n\n"]
+    if entry.author:
+        parts.append(f"**Authors:** {entry.author}\n\n")
+    if entry.title:
+        parts.append(f"**Title:** {entry.title}\n\n")
+    if entry.year:
+        parts.append(f"**Year:** {entry.year}\n\n")
+    if entry.journal:
+        parts.append(f"**Journal:** {entry.journal}\n\n")
+    elif entry.booktitle:
+        parts.append(f"**Book Title:** {entry.booktitle}\n\n")
+    if entry.publisher:
+        parts.append(f"**Publisher:** {entry.publisher}\n\n")
+    if entry.doi:
+        parts.append(f"**DOI:** [{entry.doi}](https://doi.org/{entry.doi})\n\n")
+    if entry.url:
+        parts.append(f"**URL:** [{entry.url}]({entry.url})\n\n")
+    if entry.abstract:
+        parts.append("**Abstract:**\n\n")
+        parts.append(f"> {entry.abstract}\n\n")
+    parts.append("---\n\n")
+    return "".join(parts)
+
+
+def render_citation(entry: Entry, style: str = "apa") -> str:
+    """Citation of an entry in a CitationFormatter style, one per line."""
+    return CitationFormatter(style or "apa").format(entry) + "\n"
+
+
+RENDERERS: dict[str, Callable[[Entry, str], str]] = {
+    "bibtex": render_bibtex,
+    "ris": render_ris,
+    "markdown": render_markdown,
+    "citation": render_citation,
+}
+
+
+def render_chunk(format: str, style: str, entries: list[Entry]) -> list[str]:
+    """Render a chunk of entries; runs inside a worker process."""
+    renderer = RENDERERS[format]
+    return [renderer(entry, style) for entry in entries]
+
+
+class RenderCache:
+    """Rendered entry text persisted in a diskcache directory."""
+
+    def __init__(self, directory: Path, size_limit: int = 1 << 30):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory of the diskcache store
+            size_limit: Bytes kept before least recently stored text is evicted
+        """
+        self.directory = Path(directory)
+        self.store = diskcache.Cache(str(self.directory), size_limit=size_limit)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(content_hash: str, format: str, style: str) -> str:
+        return f"{RENDER_FORMAT_VERSION}:{format}:{style}:{content_hash}"
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_many(self, keys: list[str]) -> list[str | None]:
+        """Cached text for each key, None where missing."""
+        texts = [self.store.get(key) for key in keys]
+        found = sum(text is not None for text in texts)
+        self.hits += found
+        self.misses += len(texts) - found
+        return texts
+
+    def set_many(self, items: Iterable[tuple[str, str]]) -> None:
+        """Store rendered text in one transaction."""
+        with self.store.transact():
+            for key, text in items:
+                self.store.set(key, text)
+
+    def stats(self) -> dict[str, int | float]:
+        """Lookups of this run."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+    def close(self) -> None:
+        self.store.close()
+
+    def __enter__(self) -> "RenderCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class EntryRenderer:
+    """Render a stream of entries in one format, reusing cached text."""
+
+    def __init__(
+        self,
+        format: str,
+        style: str = "",
+        cache: RenderCache | None = None,
+        jobs: int = 1,
+        batch_size: int = RENDER_BATCH_SIZE,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            format: Key of ``RENDERERS``
+            style: Style passed to the renderer (citation style)
+            cache: Cache of previously rendered text, used for
+                ``CACHED_FORMATS`` only
+            jobs: Worker processes for rendering misses (0 or less: all CPUs)
+            batch_size: Entries rendered per batch and worker
+        """
+        if format not in RENDERERS:
+            raise ValueError(f"Unsupported render format: {format}")
+        self.format = format
+        self.style = style
+        self.cache = cache if format in CACHED_FORMATS else None
+        self.jobs = jobs if jobs > 0 else os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.rendered = 0
+        self._pool: ProcessPoolExecutor | None = None
+
+    def render(self, entries: Iterable[Entry]) -> Iterator[str]:
+        """Yield the text of each entry, in order."""
+        iterator = iter(entries)
+        try:
+            while batch := list(islice(iterator, self.batch_size * self.jobs)):
+                yield from self._render_batch(batch)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+    def _render_batch(self, batch: list[Entry]) -> list[str | None]:
+        """Render one batch, looking up and storing cached text."""
+        keys: list[str] = []
+        if self.cache is None:
+            texts: list[str | None] = [None] * len(batch)
+        else:
+            keys = [
+                RenderCache.key(entry.content_hash(), self.format, self.style)
+                for entry in batch
+            ]
+            texts = self.cache.get_many(keys)
+
+        missing = [i for i, text in enumerate(texts) if text is None]
+        if not missing:
+            return texts
+
+        todo = [batch[i] for i in missing]
+        if self.jobs > 1 and len(todo) > self.batch_size:
+            if self._pool is None:
+                # Started on the first cold batch, so warm exports never spawn;
+                # spawned workers stay clear of the event bus and writer threads
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.jobs, mp_context=get_context("spawn")
+                )
+            chunks = [
+                todo[start : start + self.batch_size]
+                for start in range(0, len(todo), self.batch_size)
+            ]
+            futures = [
+                self._pool.submit(render_chunk, self.format, self.style, chunk)
+                for chunk in chunks
+            ]
+            rendered = [text for future in futures for text in future.result()]
+        else:
+            rendered = render_chunk(self.format, self.style, todo)
+
+        for i, text in zip(missing, rendered, strict=True):
+            texts[i] = text
+        self.rendered += len(rendered)
+        if self.cache is not None:
+            self.cache.set_many((keys[i], texts[i]) for i in missing)
+        return texts
@@ -0,0 +1,148 @@
+"""Bounded-memory helpers for streaming exports.
+
+Entries are read from storage one at a time and handed to the writers as
+an iterator. Sorting by any field other than the key cannot be done on the
+fly, so it runs as an external merge sort: sorted runs of at most
+``run_size`` entries are spilled to temporary files as length-prefixed
+msgpack records and merged lazily, keeping one entry per run in memory.
+JSON documents are produced in chunks as well, one array item at a time.
+"""
+
+import heapq
+import json
+import struct
+import tempfile
+import textwrap
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import msgspec
+
+from bibmgr.core.models import Entry
+
+# Entries held in memory per sorted run
+SORT_RUN_SIZE = 10_000
+
+# Buffer size of export files and sort runs
+WRITE_BUFFER_SIZE = 1 << 20
+
+_LENGTH = struct.Struct("<I")
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(tuple[str, Entry])
+
+
+def sort_key(entry: Entry, field: str) -> str:
+    """Case-insensitive sort key of an entry field; missing values sort first."""
+    value = getattr(entry, field, None)
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return str(value[0]).lower() if value else ""
+    return str(value).lower()
+
+
+def iter_json_document(
+    items: Iterable[Any],
+    tail: Callable[[int], dict[str, Any]],
+    pretty: bool = True,
+    name: str = "entries",
+) -> Iterator[str]:
+    """Encode a JSON object holding one large array, in chunks.
+
+    The chunks join to the same text ``json.dumps`` produces for
+    ``{name: [*items], **tail(len(items))}``, so only one item is encoded
+    at a time.
+
+    Args:
+        items: JSON-serializable array items
+        tail: Builds the keys following the array from the item count
+        pretty: Indent like ``json.dumps(..., indent=2)``
+        name: Key of the array
+
+    Yields:
+        Consecutive pieces of the document
+    """
+    indent = 2 if pretty else None
+    separator = ",\n    " if pretty else ", "
+
+    head = json.dumps({name: []}, indent=indent, ensure_ascii=False)
+    yield head[: head.rindex("[") + 1]
+    total = 0
+    for item in items:
+        text = json.dumps(item, indent=indent, ensure_ascii=False)
+        if pretty:
+            text = textwrap.indent(text, "    ")[4:]
+        yield (separator if total else separator.lstrip(", ")) + text
+        total += 1
+    if total and pretty:
+        yield "\n  "
+    rest = json.dumps(tail(total), indent=indent, ensure_ascii=False)
+    if rest == "{}":
+        yield "]\n}" if pretty else "]}"
+    else:
+        yield "]," + ("" if pretty else " ") + rest[1:]
+
+
+def external_sort(
+    entries: Iterable[Entry],
+    key: Callable[[Entry], str],
+    reverse: bool = False,
+    run_size: int = SORT_RUN_SIZE,
+    tmp_dir: Path | None = None,
+) -> Iterator[Entry]:
+    """Sort entries by key without holding them all in memory.
+
+    The sort is stable in both directions, like ``sorted``. Inputs that fit
+    in a single run are sorted in memory without touching the disk.
+
+    Args:
+        entries: Entries to sort, consumed once
+        key: Sort key of an entry
+        reverse: Sort in descending order
+        run_size: Entries per sorted run spilled to disk
+        tmp_dir: Directory for the run files (system default when None)
+    """
+    with tempfile.TemporaryDirectory(prefix="bibmgr-sort-", dir=tmp_dir) as directory:
+        runs: list[Path] = []
+        buffer: list[tuple[str, Entry]] = []
+        for entry in entries:
+            buffer.append((key(entry), entry))
+            if len(buffer) >= run_size:
+                runs.append(
+                    _spill(buffer, Path(directory) / f"run{len(runs)}", reverse)
+                )
+                buffer = []
+
+        buffer.sort(key=lambda item: item[0], reverse=reverse)
+        if not runs:
+            for _, entry in buffer:
+                yield entry
+            return
+
+        # Earlier runs win ties, which keeps the merge stable
+        sources = [_read_run(path) for path in runs]
+        sources.append(iter(buffer))
+        for _, entry in heapq.merge(
+            *sources, key=lambda item: item[0], reverse=reverse
+        ):
+            yield entry
+
+
+def _spill(buffer: list[tuple[str, Entry]], path: Path, reverse: bool) -> Path:
+    """Write one sorted run."""
+    buffer.sort(key=lambda item: item[0], reverse=reverse)
+    with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        for item in buffer:
+            data = _encoder.encode(item)
+            f.write(_LENGTH.pack(len(data)))
+            f.write(data)
+    return path
+
+
+def _read_run(path: Path) -> Iterator[tuple[str, Entry]]:
+    """Read the records of a run back in order."""
+    with open(path, "rb", buffering=WRITE_BUFFER_SIZE) as f:
+        while header := f.read(_LENGTH.size):
+            (length,) = _LENGTH.unpack(header)
+            yield _decoder.decode(f.read(length))
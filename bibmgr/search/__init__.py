@@ -44,6 +44,7 @@ from .highlighting import (
     Highlighter,
     SnippetGenerator,
 )
+from .incremental import IncrementalIndexer, IndexUpdate
 from .indexing import (
     AnalyzerManager,
     AuthorAnalyzer,
@@ -57,6 +58,7 @@ from .indexing import (
     SpellChecker,
     StandardAnalyzer,
     StemmingAnalyzer,
+    SymSpellCorrector,
     TextAnalyzer,
 )
 from .query import (
@@ -102,6 +104,8 @@ __all__ = [
     "SearchService",
     "create_default_engine",
     "create_memory_engine",
+    "IncrementalIndexer",
+    "IndexUpdate",
     # Query parsing
     "QueryParser",
     "QueryExpander",
@@ -143,6 +147,7 @@ __all__ = [
     "AuthorAnalyzer",
     "AnalyzerManager",
     "SpellChecker",
+    "SymSpellCorrector",
     # Backends
     "SearchBackend",
     "SearchQuery",
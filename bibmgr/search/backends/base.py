@@ -1,7 +1,9 @@
 """Base search backend interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 
@@ -161,6 +163,45 @@ class SearchBackend(ABC):
         """
         raise NotImplementedError("Backend doesn't support more-like-this")
 
+    def explain(self, query: SearchQuery) -> str:
+        """Describe how a query is executed.
+
+        Args:
+            query: Search query to explain
+
+        Returns:
+            Human-readable plan, with per-step timings where available
+
+        Raises:
+            NotImplementedError: If backend doesn't expose query plans
+        """
+        raise NotImplementedError("Backend doesn't support query plans")
+
+    def segment_builder(
+        self, workdir: Path
+    ) -> Callable[[list[dict[str, Any]]], Any] | None:
+        """Get a function that turns documents into an index segment.
+
+        Used by parallel index builds: the function is pickled into worker
+        processes and its return values are passed to ``merge_segments``.
+
+        Args:
+            workdir: Scratch directory that lives until the merge finishes
+
+        Returns:
+            Picklable segment builder, or None to ship documents back as-is
+        """
+        return None
+
+    def merge_segments(self, segments: list[Any]) -> None:
+        """Merge segments built by worker processes into the index.
+
+        Args:
+            segments: Results of ``segment_builder`` (or document lists)
+        """
+        for segment in segments:
+            self.index_batch(segment)
+
 
 class SearchError(Exception):
     """Base exception for search-related errors."""
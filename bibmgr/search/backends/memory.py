@@ -1,10 +1,15 @@
 """In-memory search backend for testing and lightweight scenarios."""
 
+import heapq
 import re
 import sys
 from collections import defaultdict
+from collections.abc import Callable, Iterable
+from operator import itemgetter
+from pathlib import Path
 from typing import Any
 
+from ..query.planner import PlanCache, PlanNode
 from .base import BackendResult, SearchBackend, SearchMatch, SearchQuery
 
 
@@ -17,6 +22,7 @@ class MemoryBackend(SearchBackend):
         self.field_values: dict[str, dict[Any, set[str]]] = defaultdict(
             lambda: defaultdict(set)
         )
+        self.plans = PlanCache()
 
     def index(self, entry_key: str, fields: dict[str, Any]) -> None:
         """Index a single document in memory."""
@@ -35,6 +41,29 @@ class MemoryBackend(SearchBackend):
             if "key" in doc:
                 self.index(doc["key"], doc)
 
+    def segment_builder(
+        self, workdir: Path
+    ) -> Callable[[list[dict[str, Any]]], Any] | None:
+        """Build memory-backend shards in worker processes."""
+        return build_memory_shard
+
+    def merge_segments(self, segments: list[Any]) -> None:
+        """Merge shards built by ``build_memory_shard`` into this index."""
+        for shard in segments:
+            for entry_key, doc in shard["documents"].items():
+                if entry_key in self.documents:
+                    old_doc = self.documents[entry_key]
+                    self._remove_document_terms(entry_key, old_doc)
+                    self._remove_field_values(entry_key, old_doc)
+                self.documents[entry_key] = doc
+
+            for term, keys in shard["terms"].items():
+                self.term_index[term].update(keys)
+
+            for field, values in shard["field_values"].items():
+                for value, keys in values.items():
+                    self.field_values[field][value].update(keys)
+
     def search(self, query: SearchQuery) -> BackendResult:
         """Execute search query using in-memory indexes."""
         import time
@@ -51,10 +80,10 @@ class MemoryBackend(SearchBackend):
         if query.filters:
             matches = self._apply_filters(matches, query.filters)
 
-        matches.sort(key=lambda x: x[1], reverse=True)
-
+        # Only the requested page is ordered; the rest is merely counted
         total = len(matches)
-        paginated = matches[query.offset : query.offset + query.limit]
+        top = heapq.nlargest(query.offset + query.limit, matches, key=itemgetter(1))
+        paginated = top[query.offset :]
 
         results = []
         for entry_key, score in paginated:
@@ -124,6 +153,42 @@ class MemoryBackend(SearchBackend):
 
         return suggestions[:limit]
 
+    def explain(self, query: SearchQuery) -> str:
+        """Execute a query's plan and describe it with per-node timings."""
+        parsed = query.query
+        if isinstance(parsed, str):
+            from ..query.parser import QueryParser
+
+            parsed = QueryParser().parse(parsed)
+
+        plan = self.plans.get(parsed, tuple(query.fields))
+        profile = []
+        plan.execute(self, profile=profile)
+        return plan.explain(profile[0])
+
+    def estimate_node(self, node: PlanNode) -> int:
+        """Upper bound on the documents a plan leaf can match."""
+        if node.op == "term":
+            return min(
+                len(self.term_index.get(term.lower(), ())) for term in node.terms
+            )
+        return len(self.documents)
+
+    def evaluate_node(
+        self, node: PlanNode, candidates: set[str] | None
+    ) -> dict[str, float]:
+        """Score the documents a plan leaf matches among the candidates."""
+        fields = list(node.fields)
+        if node.op == "term":
+            return dict(self._search_terms(list(node.terms), fields, candidates))
+        if node.op == "phrase":
+            return dict(self._search_phrase(node.query.phrase, fields, candidates))
+        if node.op == "wildcard":
+            return dict(self._search_wildcard(node.query.pattern, fields, candidates))
+        if node.op == "range":
+            return dict(self._search_range(node.query, candidates))
+        return {}
+
     def _search_text_query(
         self, query_text: str, fields: list[str]
     ) -> list[tuple[str, float]]:
@@ -164,28 +229,27 @@ class MemoryBackend(SearchBackend):
         return self._search_terms(terms, fields)
 
     def _search_terms(
-        self, terms: list[str], fields: list[str]
+        self,
+        terms: list[str],
+        fields: list[str],
+        candidates: set[str] | None = None,
     ) -> list[tuple[str, float]]:
         """Search for terms in specified fields (AND logic by default)."""
         if not terms:
             return []
 
-        doc_sets = []
-        for term in terms:
-            term_lower = term.lower()
-            matching_docs = set()
-
-            if term_lower in self.term_index:
-                matching_docs.update(self.term_index[term_lower])
-
-            doc_sets.append(matching_docs)
+        # Intersect from the shortest posting list; each step probes the
+        # smaller side, so the cost is bounded by the rarest term
+        doc_sets = [self.term_index.get(term.lower(), set()) for term in terms]
+        if candidates is not None:
+            doc_sets.append(candidates)
+        doc_sets.sort(key=len)
 
-        if not doc_sets:
-            return []
-
-        common_docs = doc_sets[0]
+        common_docs = set(doc_sets[0])
         for doc_set in doc_sets[1:]:
-            common_docs = common_docs.intersection(doc_set)
+            if not common_docs:
+                break
+            common_docs.intersection_update(doc_set)
 
         doc_scores = {}
         for doc_key in common_docs:
@@ -198,12 +262,14 @@ class MemoryBackend(SearchBackend):
 
         return [(key, score) for key, score in doc_scores.items()]
 
-    def _search_phrase(self, phrase: str, fields: list[str]) -> list[tuple[str, float]]:
+    def _search_phrase(
+        self, phrase: str, fields: list[str], keys: Iterable[str] | None = None
+    ) -> list[tuple[str, float]]:
         """Search for exact phrase."""
         matches = []
         phrase_lower = phrase.lower()
 
-        for doc_key, doc in self.documents.items():
+        for doc_key, doc in self._scan(keys):
             score = 0.0
 
             for field in fields or doc.keys():
@@ -219,7 +285,7 @@ class MemoryBackend(SearchBackend):
         return matches
 
     def _search_wildcard(
-        self, pattern: str, fields: list[str]
+        self, pattern: str, fields: list[str], keys: Iterable[str] | None = None
     ) -> list[tuple[str, float]]:
         """Search using wildcard patterns."""
         regex_pattern = pattern.replace("*", ".*").replace("?", ".")
@@ -227,7 +293,7 @@ class MemoryBackend(SearchBackend):
 
         matches = []
 
-        for doc_key, doc in self.documents.items():
+        for doc_key, doc in self._scan(keys):
             score = 0.0
 
             for field in fields or doc.keys():
@@ -516,142 +582,77 @@ class MemoryBackend(SearchBackend):
     def _search_parsed_query(
         self, parsed_query: Any, fields: list[str]
     ) -> list[tuple[str, float]]:
-        """Search using pre-parsed query object."""
-        from ..query.parser import (
-            BooleanOperator,
-            BooleanQuery,
-            FieldQuery,
-            FuzzyQuery,
-            PhraseQuery,
-            RangeQuery,
-            TermQuery,
-            WildcardQuery,
-        )
-
-        if isinstance(parsed_query, TermQuery):
-            terms = parsed_query.term.split()
-            return self._search_terms(terms, fields)
-
-        elif isinstance(parsed_query, PhraseQuery):
-            return self._search_phrase(parsed_query.phrase, fields)
-
-        elif isinstance(parsed_query, FieldQuery):
-            return self._search_parsed_query(parsed_query.query, [parsed_query.field])
-
-        elif isinstance(parsed_query, BooleanQuery):
-            if parsed_query.operator == BooleanOperator.AND:
-                if not parsed_query.queries:
-                    return []
-
-                result_sets = []
-                for subq in parsed_query.queries:
-                    subq_matches = self._search_parsed_query(subq, fields)
-                    result_dict = {doc_key: score for doc_key, score in subq_matches}
-                    result_sets.append(result_dict)
-
-                if not result_sets:
-                    return []
-
-                common_keys = set(result_sets[0].keys())
-                for result_dict in result_sets[1:]:
-                    common_keys = common_keys.intersection(set(result_dict.keys()))
-
-                final_results = []
-                for doc_key in common_keys:
-                    total_score = sum(
-                        result_dict.get(doc_key, 0) for result_dict in result_sets
-                    )
-                    final_results.append((doc_key, total_score))
-
-                return final_results
-
-            elif parsed_query.operator == BooleanOperator.OR:
-                doc_scores = defaultdict(float)
-                for subq in parsed_query.queries:
-                    subq_matches = self._search_parsed_query(subq, fields)
-                    for doc_key, score in subq_matches:
-                        doc_scores[doc_key] += score
-                return [(key, score) for key, score in doc_scores.items()]
-
-            elif parsed_query.operator == BooleanOperator.NOT:
-                if len(parsed_query.queries) >= 2:
-                    pos_matches = dict(
-                        self._search_parsed_query(parsed_query.queries[0], fields)
-                    )
-                    neg_matches = self._search_parsed_query(
-                        parsed_query.queries[1], fields
-                    )
-                    neg_keys = set(key for key, _ in neg_matches)
-                    return [(k, v) for k, v in pos_matches.items() if k not in neg_keys]
-                else:
-                    return []
+        """Search using pre-parsed query object through its compiled plan."""
+        plan = self.plans.get(parsed_query, tuple(fields))
+        return list(plan.execute(self).items())
 
-        elif isinstance(parsed_query, WildcardQuery):
-            return self._search_wildcard(parsed_query.pattern, fields)
+    def _search_range(
+        self, query: Any, keys: Iterable[str] | None = None
+    ) -> list[tuple[str, float]]:
+        """Match documents whose field value falls within a RangeQuery."""
+        matches = []
+        field_name = query.field
+        start_value = query.start
+        end_value = query.end
+        include_start = query.include_start
+        include_end = query.include_end
 
-        elif isinstance(parsed_query, FuzzyQuery):
-            return self._search_terms([parsed_query.term], fields)
+        for doc_key, doc in self._scan(keys):
+            if field_name in doc and doc[field_name] is not None:
+                field_value = doc[field_name]
 
-        elif isinstance(parsed_query, RangeQuery):
-            matches = []
-            field_name = parsed_query.field
-            start_value = parsed_query.start
-            end_value = parsed_query.end
-            include_start = parsed_query.include_start
-            include_end = parsed_query.include_end
+                # Convert to comparable type
+                try:
+                    if isinstance(field_value, int | float):
+                        doc_value = field_value
+                    else:
+                        doc_value = float(field_value)
 
-            for doc_key, doc in self.documents.items():
-                if field_name in doc and doc[field_name] is not None:
-                    field_value = doc[field_name]
+                    # Check if value is in range
+                    in_range = True
 
-                    # Convert to comparable type
-                    try:
-                        if isinstance(field_value, int | float):
-                            doc_value = field_value
-                        else:
-                            doc_value = float(field_value)
-
-                        # Check if value is in range
-                        in_range = True
+                    if start_value is not None:
+                        try:
+                            start_numeric = (
+                                float(start_value)
+                                if not isinstance(start_value, int | float)
+                                else start_value
+                            )
+                            if include_start:
+                                in_range = in_range and doc_value >= start_numeric
+                            else:
+                                in_range = in_range and doc_value > start_numeric
+                        except (ValueError, TypeError):
+                            in_range = False
 
-                        if start_value is not None:
-                            try:
-                                start_numeric = (
-                                    float(start_value)
-                                    if not isinstance(start_value, int | float)
-                                    else start_value
-                                )
-                                if include_start:
-                                    in_range = in_range and doc_value >= start_numeric
-                                else:
-                                    in_range = in_range and doc_value > start_numeric
-                            except (ValueError, TypeError):
-                                in_range = False
-
-                        if end_value is not None:
-                            try:
-                                end_numeric = (
-                                    float(end_value)
-                                    if not isinstance(end_value, int | float)
-                                    else end_value
-                                )
-                                if include_end:
-                                    in_range = in_range and doc_value <= end_numeric
-                                else:
-                                    in_range = in_range and doc_value < end_numeric
-                            except (ValueError, TypeError):
-                                in_range = False
+                    if end_value is not None:
+                        try:
+                            end_numeric = (
+                                float(end_value)
+                                if not isinstance(end_value, int | float)
+                                else end_value
+                            )
+                            if include_end:
+                                in_range = in_range and doc_value <= end_numeric
+                            else:
+                                in_range = in_range and doc_value < end_numeric
+                        except (ValueError, TypeError):
+                            in_range = False
 
-                        if in_range:
-                            score = 1.0
-                            matches.append((doc_key, score))
+                    if in_range:
+                        score = 1.0
+                        matches.append((doc_key, score))
 
-                    except (ValueError, TypeError):
-                        continue
+                except (ValueError, TypeError):
+                    continue
 
-            return matches
+        return matches
 
-        return []
+    def _scan(self, keys: Iterable[str] | None) -> Iterable[tuple[str, dict]]:
+        """Documents to scan: all of them, or only the given keys."""
+        if keys is None:
+            return self.documents.items()
+        return ((key, self.documents[key]) for key in keys if key in self.documents)
 
     def _compute_facets(
         self, doc_keys: list[str], facet_fields: list[str]
@@ -763,3 +764,16 @@ class MemoryBackend(SearchBackend):
         size += sys.getsizeof(self.field_values)
 
         return size
+
+
+def build_memory_shard(documents: list[dict[str, Any]]) -> dict[str, Any]:
+    """Index documents into a standalone shard of plain, picklable dicts."""
+    shard = MemoryBackend()
+    shard.index_batch(documents)
+    return {
+        "documents": shard.documents,
+        "terms": dict(shard.term_index),
+        "field_values": {
+            field: dict(values) for field, values in shard.field_values.items()
+        },
+    }
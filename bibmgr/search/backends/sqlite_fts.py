@@ -0,0 +1,528 @@
+"""SQLite FTS5 search backend.
+
+Searches the ``entries_fts`` table that ``SQLiteBackend`` keeps in sync with
+stored entries through triggers, so a SQLite deployment needs no second
+index: indexing calls are no-ops and queries run against the storage
+database itself. Parsed queries are translated to FTS5 MATCH expressions;
+parts FTS5 cannot express (ranges, non-text fields) become SQL predicates
+over the stored JSON.
+"""
+
+import fnmatch
+import re
+import time
+from dataclasses import dataclass, field
+from sqlite3 import Connection
+from typing import Any
+
+from ...storage.backends.sqlite import FTS_COLUMNS, SQLiteBackend
+from ..indexing.fields import FieldConfiguration, FieldType
+from ..indexing.spelling import edit_distance
+from ..query.parser import (
+    BooleanOperator,
+    BooleanQuery,
+    FieldQuery,
+    FuzzyQuery,
+    ParsedQuery,
+    PhraseQuery,
+    QueryParser,
+    RangeQuery,
+    TermQuery,
+    WildcardQuery,
+)
+from .base import BackendResult, QueryError, SearchBackend, SearchMatch, SearchQuery
+
+# Most vocabulary terms a wildcard or fuzzy term is expanded to
+MAX_EXPANSIONS = 64
+
+# Long text columns highlighted with snippet() instead of highlight()
+SNIPPET_COLUMNS = ("abstract", "note")
+
+# Field names that stand for all text columns rather than one
+ALL_FIELDS = ("all", "content", "search_text")
+
+_TERMS_TABLE = "temp.entries_fts_terms"
+_COLUMN_TERMS_TABLE = "temp.entries_fts_column_terms"
+
+
+@dataclass
+class _Clause:
+    """Compiled query fragment: an FTS5 MATCH expression AND an SQL predicate.
+
+    Either part may be missing; a clause with neither matches everything.
+    """
+
+    match: str | None = None
+    sql: str | None = None
+    params: list[Any] = field(default_factory=list)
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """Search backend over the FTS5 table of a SQLite storage backend."""
+
+    def __init__(
+        self, storage: SQLiteBackend, field_config: FieldConfiguration | None = None
+    ):
+        """Initialize the backend.
+
+        Args:
+            storage: SQLite storage whose ``entries_fts`` table is searched
+            field_config: Field configuration providing bm25 column weights
+        """
+        self.storage = storage
+        self.field_config = field_config or FieldConfiguration()
+        self.columns = list(FTS_COLUMNS)
+        self.query_parser = QueryParser()
+
+        # Vocabulary tables are TEMP, so each pooled connection needs them
+        self.storage.add_connection_script(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {_TERMS_TABLE}
+                USING fts5vocab(main, entries_fts, 'row');
+            CREATE VIRTUAL TABLE IF NOT EXISTS {_COLUMN_TERMS_TABLE}
+                USING fts5vocab(main, entries_fts, 'col');
+        """)
+
+    def index(self, entry_key: str, fields: dict[str, Any]) -> None:
+        """No-op: storage triggers keep ``entries_fts`` current."""
+
+    def index_batch(self, documents: list[dict[str, Any]]) -> None:
+        """No-op: storage triggers keep ``entries_fts`` current."""
+
+    def delete(self, entry_key: str) -> bool:
+        """No-op: rows leave ``entries_fts`` when the entry is deleted."""
+        return False
+
+    def clear(self) -> None:
+        """No-op: the index is cleared together with storage."""
+
+    def commit(self) -> None:
+        """No-op: storage commits its own writes."""
+
+    def search(self, query: SearchQuery) -> BackendResult:
+        """Execute search query against the FTS5 table."""
+        start_time = time.time()
+
+        parsed = query.query
+        if isinstance(parsed, str):
+            parsed = self.query_parser.parse(parsed)
+
+        with self.storage.reader() as connection:
+            clause = self._restrict(self._compile(parsed, connection), query.fields)
+            from_sql, where_sql, params = self._where(clause, query.filters)
+
+            if clause.match:
+                rank = f"bm25(entries_fts, {self._bm25_weights()})"
+                order = "rank, e.key"
+            else:
+                rank = "0.0"
+                order = "e.key"
+
+            highlight_columns = (
+                self._highlight_columns(query.fields)
+                if query.highlight and clause.match
+                else []
+            )
+            highlight_sql = "".join(
+                f", {self._highlight_expression(column)} AS hl_{column}"
+                for column in highlight_columns
+            )
+
+            rows = connection.execute(
+                f"SELECT e.key AS key, {rank} AS rank{highlight_sql} "
+                f"FROM {from_sql} WHERE {where_sql} "
+                f"ORDER BY {order} LIMIT ? OFFSET ?",
+                [*params, query.limit, query.offset],
+            ).fetchall()
+
+            total = connection.execute(
+                f"SELECT COUNT(*) FROM {from_sql} WHERE {where_sql}", params
+            ).fetchone()[0]
+
+            matches = []
+            for row in rows:
+                match = SearchMatch(entry_key=row["key"], score=-float(row["rank"]))
+                highlights = {
+                    column: [row[f"hl_{column}"]]
+                    for column in highlight_columns
+                    if row[f"hl_{column}"] and "<mark>" in row[f"hl_{column}"]
+                }
+                if highlights:
+                    match.highlights = highlights
+                matches.append(match)
+
+            facets = None
+            if query.facet_fields:
+                facets = self._compute_facets(
+                    connection, query.facet_fields, from_sql, where_sql, params
+                )
+
+        return BackendResult(
+            results=matches,
+            total=total,
+            facets=facets,
+            took_ms=int((time.time() - start_time) * 1000),
+        )
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get index statistics."""
+        with self.storage.reader() as connection:
+            total = connection.execute("SELECT COUNT(*) FROM entries_fts").fetchone()[0]
+            page_count = connection.execute("PRAGMA page_count").fetchone()[0]
+            page_size = connection.execute("PRAGMA page_size").fetchone()[0]
+
+        return {
+            "total_documents": total,
+            "index_size_mb": round(page_count * page_size / (1024 * 1024), 2),
+            "index_path": str(self.storage.db_path),
+            "fields": ["key", *self.columns],
+        }
+
+    def suggest(self, prefix: str, field: str, limit: int) -> list[str]:
+        """Suggest indexed terms starting with ``prefix``."""
+        prefix = prefix.lower().strip()
+        if not prefix:
+            return []
+
+        with self.storage.reader() as connection:
+            if field in self.columns:
+                rows = connection.execute(
+                    f"SELECT term FROM {_COLUMN_TERMS_TABLE} "
+                    "WHERE term >= ? AND term < ? AND col = ? "
+                    "ORDER BY doc DESC, term LIMIT ?",
+                    (prefix, prefix + "\uffff", field, limit),
+                )
+            else:
+                rows = connection.execute(
+                    f"SELECT term FROM {_TERMS_TABLE} "
+                    "WHERE term >= ? AND term < ? "
+                    "ORDER BY doc DESC, term LIMIT ?",
+                    (prefix, prefix + "\uffff", limit),
+                )
+            return [row["term"] for row in rows]
+
+    def _compile(self, query: ParsedQuery, connection: Connection) -> _Clause:
+        """Translate a parsed query into a clause."""
+        if isinstance(query, TermQuery):
+            if not query.term.strip():
+                return _Clause()
+            return _Clause(match=_quote(query.term))
+
+        if isinstance(query, PhraseQuery):
+            words = query.phrase.split()
+            if not words:
+                return _Clause()
+            if query.slop > 0 and len(words) > 1:
+                phrases = " ".join(_quote(word) for word in words)
+                return _Clause(match=f"NEAR({phrases}, {query.slop})")
+            return _Clause(match=_quote(query.phrase))
+
+        if isinstance(query, WildcardQuery):
+            return self._compile_wildcard(query.pattern, connection)
+
+        if isinstance(query, FuzzyQuery):
+            return self._compile_fuzzy(query, connection)
+
+        if isinstance(query, FieldQuery):
+            return self._compile_field(query, connection)
+
+        if isinstance(query, RangeQuery):
+            return self._compile_range(query)
+
+        if isinstance(query, BooleanQuery):
+            return self._compile_boolean(query, connection)
+
+        raise QueryError(f"Unsupported query type: {type(query).__name__}")
+
+    def _compile_wildcard(self, pattern: str, connection: Connection) -> _Clause:
+        """Compile a wildcard term, as an FTS5 prefix query where possible."""
+        pattern = pattern.lower()
+        literal = re.split(r"[*?]", pattern, maxsplit=1)[0]
+
+        if pattern == literal + "*" and literal:
+            return _Clause(match=f"{_quote(literal)}*")
+
+        terms = self._expand_terms(
+            connection, literal, lambda term: fnmatch.fnmatchcase(term, pattern)
+        )
+        return _any_term(terms)
+
+    def _compile_fuzzy(self, query: FuzzyQuery, connection: Connection) -> _Clause:
+        """Compile a fuzzy term into the vocabulary terms within reach."""
+        term = query.term.lower()
+        max_edits = query.max_edits
+
+        def within_reach(candidate: str) -> bool:
+            return edit_distance(term, candidate, max_edits) <= max_edits
+
+        terms = self._expand_terms(
+            connection, term[: query.prefix_length], within_reach
+        )
+        return _any_term(terms)
+
+    def _compile_field(self, query: FieldQuery, connection: Connection) -> _Clause:
+        """Compile a field query as a column filter or an SQL predicate."""
+        column = query.field.lower()
+        if column in self.columns:
+            inner = self._compile(query.query, connection)
+            if inner.match:
+                inner.match = f"{column} : ({inner.match})"
+            return inner
+
+        if column in ALL_FIELDS:
+            return self._compile(query.query, connection)
+
+        expression, params = _field_expression(column)
+        sql, sql_params = self._field_predicate(expression, params, query.query)
+        return _Clause(sql=sql, params=sql_params)
+
+    def _restrict(self, clause: _Clause, fields: list[str]) -> _Clause:
+        """Limit the MATCH expression to the text columns among ``fields``.
+
+        Fields that are not FTS columns cannot match text, so a query
+        restricted only to such fields matches nothing.
+        """
+        names = {name.lower() for name in fields or ()}
+        if not names or not clause.match or names & set(ALL_FIELDS):
+            return clause
+
+        columns = [column for column in self.columns if column in names]
+        if not columns:
+            return _Clause(sql="0")
+        clause.match = f"{{{' '.join(columns)}}} : ({clause.match})"
+        return clause
+
+    def _field_predicate(
+        self, expression: str, params: list[Any], query: ParsedQuery
+    ) -> tuple[str, list[Any]]:
+        """Build an SQL predicate matching ``query`` against a stored field."""
+        text = f"CAST({expression} AS TEXT) LIKE ?"
+
+        if isinstance(query, TermQuery | FuzzyQuery):
+            return text, [*params, f"%{query.term}%"]
+
+        if isinstance(query, PhraseQuery):
+            return text, [*params, f"%{query.phrase}%"]
+
+        if isinstance(query, WildcardQuery):
+            like = query.pattern.replace("*", "%").replace("?", "_")
+            return text, [*params, f"%{like}%"]
+
+        if isinstance(query, BooleanQuery) and query.queries:
+            parts = [
+                self._field_predicate(expression, params, sub) for sub in query.queries
+            ]
+            sqls = [f"({sql})" for sql, _ in parts]
+            values = [value for _, sub_params in parts for value in sub_params]
+            if query.operator == BooleanOperator.NOT:
+                if len(sqls) == 1:
+                    return f"NOT {sqls[0]}", values
+                return f"{sqls[0]} AND NOT {sqls[1]}", values
+            return f" {query.operator.value} ".join(sqls), values
+
+        raise QueryError(f"Unsupported query on a stored field: {query.to_string()}")
+
+    def _compile_range(self, query: RangeQuery) -> _Clause:
+        """Compile a range query into comparisons on a stored field."""
+        expression, params = _field_expression(query.field.lower())
+        conditions = []
+        values = []
+
+        if query.start is not None:
+            conditions.append(f"{expression} {'>=' if query.include_start else '>'} ?")
+            values.extend([*params, query.start])
+        if query.end is not None:
+            conditions.append(f"{expression} {'<=' if query.include_end else '<'} ?")
+            values.extend([*params, query.end])
+
+        if not conditions:
+            return _Clause(sql=f"{expression} IS NOT NULL", params=params)
+        return _Clause(sql=" AND ".join(conditions), params=values)
+
+    def _compile_boolean(self, query: BooleanQuery, connection: Connection) -> _Clause:
+        """Compile AND/OR/NOT, keeping as much as possible inside FTS5."""
+        clauses = [self._compile(sub, connection) for sub in query.queries]
+        if not clauses:
+            return _Clause()
+
+        if query.operator == BooleanOperator.AND:
+            return _conjoin(clauses)
+
+        if query.operator == BooleanOperator.OR:
+            if all(clause.match and not clause.sql for clause in clauses):
+                return _Clause(
+                    match=" OR ".join(f"({clause.match})" for clause in clauses)
+                )
+            parts = [_as_sql(clause) for clause in clauses]
+            return _Clause(
+                sql=" OR ".join(f"({sql})" for sql, _ in parts),
+                params=[param for _, params in parts for param in params],
+            )
+
+        # NOT: FTS5 only has binary NOT, so a lone NOT becomes an SQL filter
+        if len(clauses) == 1:
+            sql, params = _as_sql(clauses[0])
+            return _Clause(sql=f"NOT ({sql})", params=params)
+
+        positive, negative = clauses[0], clauses[1]
+        if positive.match and negative.match and not negative.sql:
+            return _Clause(
+                match=f"({positive.match}) NOT ({negative.match})",
+                sql=positive.sql,
+                params=positive.params,
+            )
+        sql, params = _as_sql(negative)
+        conditions = [f"NOT ({sql})"]
+        if positive.sql:
+            conditions.insert(0, f"({positive.sql})")
+        return _Clause(
+            match=positive.match,
+            sql=" AND ".join(conditions),
+            params=positive.params + params,
+        )
+
+    def _expand_terms(self, connection: Connection, prefix: str, accept) -> list[str]:
+        """Find vocabulary terms starting with ``prefix`` accepted by ``accept``."""
+        if prefix:
+            rows = connection.execute(
+                f"SELECT term FROM {_TERMS_TABLE} WHERE term >= ? AND term < ? "
+                "ORDER BY doc DESC",
+                (prefix, prefix + "\uffff"),
+            )
+        else:
+            rows = connection.execute(
+                f"SELECT term FROM {_TERMS_TABLE} ORDER BY doc DESC"
+            )
+
+        terms = []
+        for row in rows:
+            if accept(row["term"]):
+                terms.append(row["term"])
+                if len(terms) >= MAX_EXPANSIONS:
+                    break
+        return terms
+
+    def _where(
+        self, clause: _Clause, filters: dict[str, Any]
+    ) -> tuple[str, str, list[Any]]:
+        """Build the FROM and WHERE parts shared by result, count and facets."""
+        conditions = []
+        params: list[Any] = []
+
+        if clause.match:
+            from_sql = "entries_fts JOIN entries e ON e.key = entries_fts.key"
+            conditions.append("entries_fts MATCH ?")
+            params.append(clause.match)
+        else:
+            from_sql = "entries e"
+
+        if clause.sql:
+            conditions.append(f"({clause.sql})")
+            params.extend(clause.params)
+
+        for name, value in (filters or {}).items():
+            expression, expression_params = _field_expression(name.lower())
+            if isinstance(value, list | tuple | set):
+                placeholders = ", ".join("?" for _ in value)
+                conditions.append(f"{expression} IN ({placeholders})")
+                params.extend([*expression_params, *value])
+            else:
+                conditions.append(f"{expression} = ?")
+                params.extend([*expression_params, value])
+
+        return from_sql, " AND ".join(conditions) or "1", params
+
+    def _compute_facets(
+        self,
+        connection: Connection,
+        facet_fields: list[str],
+        from_sql: str,
+        where_sql: str,
+        params: list,
+    ) -> dict[str, list[tuple[str, int]]]:
+        """Count field values over all matching entries with GROUP BY."""
+        facets = {}
+        for name in facet_fields:
+            path = "$.type" if name in ("entry_type", "type") else f"$.{name}"
+            rows = connection.execute(
+                f"SELECT j.value AS value, COUNT(*) AS count "
+                f"FROM {from_sql}, json_each(e.data, ?) j "
+                f"WHERE {where_sql} AND j.value IS NOT NULL "
+                "GROUP BY j.value ORDER BY count DESC, value LIMIT 10",
+                [path, *params],
+            ).fetchall()
+            if rows:
+                facets[name] = [(str(row["value"]), row["count"]) for row in rows]
+        return facets
+
+    def _highlight_columns(self, fields: list[str]) -> list[str]:
+        """Text columns to highlight, limited to ``fields`` when given."""
+        columns = []
+        for column in self.columns:
+            if fields and column not in fields:
+                continue
+            field_def = self.field_config.get_field(column)
+            if field_def and field_def.field_type == FieldType.TEXT:
+                columns.append(column)
+        return columns
+
+    def _highlight_expression(self, column: str) -> str:
+        """SQL producing the highlighted text of an FTS column."""
+        index = self.columns.index(column) + 1
+        if column in SNIPPET_COLUMNS:
+            return f"snippet(entries_fts, {index}, '<mark>', '</mark>', '...', 32)"
+        return f"highlight(entries_fts, {index}, '<mark>', '</mark>')"
+
+    def _bm25_weights(self) -> str:
+        """bm25() column weights from the field boosts (key is unindexed)."""
+        weights = ["0.0"]
+        for column in self.columns:
+            field_def = self.field_config.get_field(column)
+            weights.append(str(float(field_def.boost if field_def else 1.0)))
+        return ", ".join(weights)
+
+
+def _quote(text: str) -> str:
+    """Quote text as an FTS5 string, neutralizing query syntax."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _any_term(terms: list[str]) -> _Clause:
+    """Clause matching any of ``terms``, or nothing when empty."""
+    if not terms:
+        return _Clause(sql="0")
+    return _Clause(match=" OR ".join(_quote(term) for term in terms))
+
+
+def _as_sql(clause: _Clause) -> tuple[str, list[Any]]:
+    """Express a clause purely as an SQL predicate on ``e.key``."""
+    conditions = []
+    params: list[Any] = []
+    if clause.match:
+        conditions.append(
+            "e.key IN (SELECT key FROM entries_fts WHERE entries_fts MATCH ?)"
+        )
+        params.append(clause.match)
+    if clause.sql:
+        conditions.append(f"({clause.sql})")
+        params.extend(clause.params)
+    return " AND ".join(conditions) or "1", params
+
+
+def _conjoin(clauses: list[_Clause]) -> _Clause:
+    """AND clauses together, merging their MATCH and SQL parts."""
+    matches = [f"({clause.match})" for clause in clauses if clause.match]
+    sqls = [f"({clause.sql})" for clause in clauses if clause.sql]
+    return _Clause(
+        match=" AND ".join(matches) or None,
+        sql=" AND ".join(sqls) or None,
+        params=[param for clause in clauses for param in clause.params],
+    )
+
+
+def _field_expression(name: str) -> tuple[str, list[Any]]:
+    """SQL expression (and its parameters) reading a stored entry field."""
+    if name in ("type", "entry_type"):
+        return "e.type", []
+    if name == "key":
+        return "e.key", []
+    return "json_extract(e.data, ?)", [f"$.{name}"]
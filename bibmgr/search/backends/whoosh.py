@@ -1,6 +1,9 @@
 """Whoosh search backend implementation."""
 
+import tempfile
 import threading
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -191,6 +194,37 @@ class WhooshBackend(SearchBackend):
                         prepared_doc = self._prepare_document(entry_key, doc)
                         writer.update_document(**prepared_doc)
 
+    def segment_builder(
+        self, workdir: Path
+    ) -> Callable[[list[dict[str, Any]]], Any] | None:
+        """Have each worker write its own Whoosh segment under ``workdir``."""
+        if not self._schema_created:
+            self._initialize_index()
+
+        return partial(write_segment, self.schema, str(workdir))
+
+    def merge_segments(self, segments: list[Any]) -> None:
+        """Merge worker segments into the index.
+
+        Documents already in the index under the same key are replaced.
+        The merge is left pending until ``commit``.
+        """
+        if not self._index:
+            raise RuntimeError("Index not initialized")
+
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._index.writer()
+
+            writer = self._writer
+            for segment_dir in segments:
+                segment_index = open_dir(segment_dir)
+                with segment_index.reader() as reader:
+                    for stored in reader.all_stored_fields():
+                        writer.delete_by_term("key", stored["key"])
+                    writer.add_reader(reader)
+                segment_index.close()
+
     def search(self, query: SearchQuery) -> BackendResult:
         """Execute search query."""
         if not self._index:
@@ -316,78 +350,7 @@ class WhooshBackend(SearchBackend):
         self, entry_key: str, fields: dict[str, Any]
     ) -> dict[str, Any]:
         """Prepare document for Whoosh indexing."""
-        doc: dict[str, Any] = {"key": entry_key}
-        content_parts = []
-
-        schema = getattr(self._index, "schema", {})
-        for field_name, value in fields.items():
-            if field_name in schema and value is not None:
-                # Convert values to appropriate types
-                field_def = schema[field_name]
-
-                if isinstance(field_def, whoosh_fields.DATETIME):
-                    if isinstance(value, str):
-                        try:
-                            from datetime import datetime
-
-                            doc[field_name] = datetime.fromisoformat(
-                                value.replace("Z", "+00:00")
-                            )
-                        except ValueError:
-                            continue
-                    else:
-                        doc[field_name] = value
-
-                elif isinstance(field_def, whoosh_fields.NUMERIC):
-                    try:
-                        doc[field_name] = (
-                            float(value) if "." in str(value) else int(value)
-                        )
-                        if field_name == "year" and value:
-                            content_parts.append(str(value))
-                    except (ValueError, TypeError):
-                        continue
-
-                elif isinstance(field_def, whoosh_fields.BOOLEAN):
-                    doc[field_name] = bool(value)
-
-                else:
-                    if isinstance(field_def, whoosh_fields.KEYWORD) and isinstance(
-                        value, list
-                    ):
-                        doc[field_name] = ",".join(str(v) for v in value)
-                    else:
-                        doc[field_name] = str(value) if value is not None else ""
-
-                    if (
-                        isinstance(
-                            field_def, whoosh_fields.TEXT | whoosh_fields.KEYWORD
-                        )
-                        and value
-                        and field_name not in ["key", "entry_type"]
-                    ):
-                        if field_name in doc:
-                            content_parts.append(doc[field_name])
-                        else:
-                            content_parts.append(str(value))
-
-        if content_parts:
-            doc["content"] = " ".join(content_parts)
-            doc["content_analyzed"] = doc["content"]
-        else:
-            doc["content"] = ""
-            doc["content_analyzed"] = ""
-
-        schema = getattr(self._index, "schema", None)
-        if schema:
-            names_method = getattr(schema, "names", lambda: [])
-            for field_name in names_method():
-                if field_name not in doc:
-                    field_def = schema[field_name] if field_name in schema else None
-                    if field_def and isinstance(field_def, whoosh_fields.TEXT):
-                        doc[field_name] = ""
-
-        return doc
+        return prepare_document(getattr(self._index, "schema", None), entry_key, fields)
 
     def _convert_query(self, parsed_query: Any) -> Query:
         """Convert parsed query to Whoosh Query object."""
@@ -624,6 +587,93 @@ class WhooshBackend(SearchBackend):
         self.close()
 
 
+def prepare_document(
+    schema: whoosh_fields.Schema | None, entry_key: str, fields: dict[str, Any]
+) -> dict[str, Any]:
+    """Convert an indexed document into Whoosh field values for ``schema``."""
+    doc: dict[str, Any] = {"key": entry_key}
+    content_parts = []
+
+    for field_name, value in fields.items():
+        if schema and field_name in schema and value is not None:
+            # Convert values to appropriate types
+            field_def = schema[field_name]
+
+            if isinstance(field_def, whoosh_fields.DATETIME):
+                if isinstance(value, str):
+                    try:
+                        from datetime import datetime
+
+                        doc[field_name] = datetime.fromisoformat(
+                            value.replace("Z", "+00:00")
+                        )
+                    except ValueError:
+                        continue
+                else:
+                    doc[field_name] = value
+
+            elif isinstance(field_def, whoosh_fields.NUMERIC):
+                try:
+                    doc[field_name] = float(value) if "." in str(value) else int(value)
+                    if field_name == "year" and value:
+                        content_parts.append(str(value))
+                except (ValueError, TypeError):
+                    continue
+
+            elif isinstance(field_def, whoosh_fields.BOOLEAN):
+                doc[field_name] = bool(value)
+
+            else:
+                if isinstance(field_def, whoosh_fields.KEYWORD) and isinstance(
+                    value, list
+                ):
+                    doc[field_name] = ",".join(str(v) for v in value)
+                else:
+                    doc[field_name] = str(value) if value is not None else ""
+
+                if (
+                    isinstance(field_def, whoosh_fields.TEXT | whoosh_fields.KEYWORD)
+                    and value
+                    and field_name not in ["key", "entry_type"]
+                ):
+                    if field_name in doc:
+                        content_parts.append(doc[field_name])
+                    else:
+                        content_parts.append(str(value))
+
+    if content_parts:
+        doc["content"] = " ".join(content_parts)
+        doc["content_analyzed"] = doc["content"]
+    else:
+        doc["content"] = ""
+        doc["content_analyzed"] = ""
+
+    if schema:
+        names_method = getattr(schema, "names", lambda: [])
+        for field_name in names_method():
+            if field_name not in doc:
+                field_def = schema[field_name] if field_name in schema else None
+                if field_def and isinstance(field_def, whoosh_fields.TEXT):
+                    doc[field_name] = ""
+
+    return doc
+
+
+def write_segment(
+    schema: whoosh_fields.Schema, workdir: str, documents: list[dict[str, Any]]
+) -> str:
+    """Write documents to a standalone Whoosh index and return its path."""
+    segment_dir = tempfile.mkdtemp(prefix="segment-", dir=workdir)
+    segment_index = create_in(segment_dir, schema)
+    with segment_index.writer() as writer:
+        for doc in documents:
+            entry_key = doc.get("key")
+            if entry_key:
+                writer.add_document(**prepare_document(schema, entry_key, doc))
+    segment_index.close()
+    return segment_dir
+
+
 def create_whoosh_backend(
     index_dir: Path | None = None, field_config: FieldConfiguration | None = None
 ) -> WhooshBackend:
@@ -1,6 +1,8 @@
 """Search engine implementation for bibliography entries."""
 
+import inspect
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +11,9 @@ from .backends.base import SearchBackend, SearchQuery
 from .backends.memory import MemoryBackend
 from .highlighting import Highlighter
 from .indexing import EntryIndexer, FieldConfiguration
+from .indexing.fingerprints import FingerprintStore, IndexDiff
+from .indexing.parallel import IndexBuildStats, ParallelIndexBuilder
+from .indexing.spelling import SymSpellCorrector
 from .query import QueryExpander, QueryParser
 from .results import (
     ResultsBuilder,
@@ -19,6 +24,15 @@ from .results import (
 )
 
 
+def _accepts_keyword(function: Callable, name: str) -> bool:
+    """Whether a callable can be passed the keyword argument ``name``."""
+    parameters = inspect.signature(function).parameters.values()
+    return any(
+        parameter.name == name or parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
+
+
 class SearchEngine:
     """Search engine for bibliography entries.
 
@@ -34,6 +48,8 @@ class SearchEngine:
         enable_query_expansion: bool = True,
         ranker: Any = None,
         repository: Any = None,
+        fingerprint_path: Path | None = None,
+        spelling_path: Path | None = None,
     ):
         """Initialize search engine.
 
@@ -44,12 +60,22 @@ class SearchEngine:
             enable_query_expansion: Whether to enable query expansion
             ranker: Ranking algorithm to use (default: BM25Ranker)
             repository: Entry repository for retrieving full entry data
+            fingerprint_path: File persisting content fingerprints of
+                indexed entries (default: kept in memory only)
+            spelling_path: File persisting the spelling corrector built
+                from the indexed vocabulary (default: kept in memory only)
         """
         self.backend = backend or MemoryBackend()
         self.field_config = field_config or FieldConfiguration()
         self.indexer = EntryIndexer(self.field_config)
+        self.fingerprints = FingerprintStore(fingerprint_path, self.field_config)
         self.query_parser = QueryParser()
-        self.query_expander = QueryExpander() if enable_query_expansion else None
+        self.spell_checker = SymSpellCorrector(spelling_path)
+        self.query_expander = (
+            QueryExpander(spell_checker=self.spell_checker)
+            if enable_query_expansion
+            else None
+        )
         self.highlighter = Highlighter() if enable_highlighting else None
         self.repository = repository
 
@@ -71,6 +97,8 @@ class SearchEngine:
         """
         doc = self.indexer.index_entry(entry)
         self.backend.index(entry.key, doc)
+        self.fingerprints.update({entry.key: entry.content_hash()})
+        self.update_vocabulary([entry])
         self._index_size += 1
 
     def index_entries(self, entries: list[BibEntry]) -> None:
@@ -79,15 +107,38 @@ class SearchEngine:
         Args:
             entries: List of bibliography entries to index
         """
-        documents = []
-        for entry in entries:
-            doc = self.indexer.index_entry(entry)
+        documents = self.indexer.index_entries(entries)
+        for entry, doc in zip(entries, documents, strict=True):
             doc["key"] = entry.key
-            documents.append(doc)
 
         self.backend.index_batch(documents)
+        self.fingerprints.update({entry.key: entry.content_hash() for entry in entries})
+        self.update_vocabulary(entries)
         self._index_size += len(entries)
 
+    def index_entries_parallel(
+        self,
+        entries: list[BibEntry],
+        jobs: int,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> IndexBuildStats:
+        """Index entries through per-worker segments built in a process pool.
+
+        Args:
+            entries: List of bibliography entries to index
+            jobs: Number of worker processes (0 or less: all CPUs)
+            progress: Called with (documents done, total) as workers finish
+
+        Returns:
+            Build statistics including throughput
+        """
+        builder = ParallelIndexBuilder(self.backend, self.field_config, jobs)
+        stats = builder.build(entries, progress=progress)
+        self.fingerprints.update({entry.key: entry.content_hash() for entry in entries})
+        self.update_vocabulary(entries)
+        self._index_size += len(entries)
+        return stats
+
     def remove_entry(self, entry_key: str) -> bool:
         """Remove an entry from the search index.
 
@@ -98,6 +149,9 @@ class SearchEngine:
             True if entry was removed, False if not found
         """
         success = self.backend.delete(entry_key)
+        self.fingerprints.remove(entry_key)
+        if corrector := self._vocabulary_corrector():
+            corrector.remove_document(entry_key)
         if success:
             self._index_size = max(0, self._index_size - 1)
         return success
@@ -105,8 +159,60 @@ class SearchEngine:
     def clear_index(self) -> None:
         """Clear all entries from the search index."""
         self.backend.clear()
+        self.fingerprints.clear()
+        if corrector := self._vocabulary_corrector():
+            corrector.clear()
         self._index_size = 0
 
+    def update_vocabulary(self, entries: list[BibEntry]) -> None:
+        """Feed the searchable text of entries to the spelling corrector.
+
+        Args:
+            entries: Entries whose vocabulary replaces what they had before
+        """
+        corrector = self._vocabulary_corrector()
+        if corrector is None:
+            return
+
+        fields = self.field_config.get_searchable_fields()
+        for entry in entries:
+            parts = []
+            for field in fields:
+                value = getattr(entry, field, None)
+                if isinstance(value, tuple | list):
+                    parts.extend(str(item) for item in value)
+                elif value:
+                    parts.append(str(value))
+            corrector.update_document(entry.key, " ".join(parts))
+
+    def missing_vocabulary(self, entries: list[BibEntry]) -> list[BibEntry]:
+        """Entries the spelling corrector has not seen, e.g. after its file was lost."""
+        corrector = self._vocabulary_corrector()
+        if corrector is None:
+            return []
+        return [entry for entry in entries if entry.key not in corrector.documents]
+
+    def _vocabulary_corrector(self) -> Any:
+        """The query expander's spell checker if it learns from the index."""
+        checker = getattr(self.query_expander, "spell_checker", None)
+        if checker is not None and hasattr(checker, "update_document"):
+            return checker
+        return None
+
+    def diff_entries(self, entries: list[BibEntry]) -> IndexDiff:
+        """Compare entries against the fingerprints of indexed documents.
+
+        Args:
+            entries: Current entries from storage
+
+        Returns:
+            Keys to add, update and remove, or a full rebuild when the
+            field configuration changed since the index was built
+        """
+        return self.fingerprints.diff(
+            {entry.key: entry.content_hash() for entry in entries}
+        )
+
     def search(
         self,
         query: str,
@@ -184,7 +290,17 @@ class SearchEngine:
                     query_time_ms=backend_result.took_ms or 0,
                 )
 
-                ranked_matches = self.ranker.rank(ranked_matches, query_terms, context)
+                # The backend already skipped ``offset`` matches, so only
+                # the page itself needs to be selected; rankers written
+                # before ``limit`` existed sort everything they are given
+                if _accepts_keyword(self.ranker.rank, "limit"):
+                    ranked_matches = self.ranker.rank(
+                        ranked_matches, query_terms, context, limit=limit
+                    )
+                else:
+                    ranked_matches = self.ranker.rank(
+                        ranked_matches, query_terms, context
+                    )
                 total_before_pagination = backend_result.total
             else:
                 total_before_pagination = backend_result.total
@@ -298,6 +414,29 @@ class SearchEngine:
             f"more_like:{entry_key}", limit, self.backend.__class__.__name__
         )
 
+    def explain(
+        self,
+        query: str,
+        fields: list[str] | None = None,
+        expand_query: bool = True,
+    ) -> str:
+        """Describe the backend's plan for a query, with per-step timings.
+
+        Args:
+            query: Search query string
+            fields: Specific fields to search
+            expand_query: Whether to apply query expansion first
+
+        Returns:
+            Human-readable query plan
+        """
+        parsed_query = self.query_parser.parse(query.strip())
+        if expand_query and self.query_expander:
+            parsed_query = self.query_expander.expand_query(parsed_query)
+        return self.backend.explain(
+            SearchQuery(query=parsed_query, fields=fields or [])
+        )
+
     def validate_query(self, query: str) -> list[str]:
         """Validate a query string and return any issues.
 
@@ -340,6 +479,9 @@ class SearchEngine:
     def commit(self) -> None:
         """Commit any pending changes to the search index."""
         self.backend.commit()
+        self.fingerprints.save()
+        if corrector := self._vocabulary_corrector():
+            corrector.save()
 
     def _get_facet_fields(self) -> list[str]:
         """Get list of fields suitable for faceting."""
@@ -477,6 +619,8 @@ class SearchEngineBuilder:
         self.spell_checker = None
         self.ranker = None
         self.repository = None
+        self.fingerprint_path: Path | None = None
+        self.spelling_path: Path | None = None
 
     def with_backend(self, backend: SearchBackend) -> "SearchEngineBuilder":
         """Set the search backend."""
@@ -505,7 +649,20 @@ class SearchEngineBuilder:
         return self
 
     def with_spell_checker(self, spell_checker) -> "SearchEngineBuilder":
-        """Set custom spell checker."""
+        """Set custom spell checker.
+
+        Accepts a spell checker instance or the name of a built-in one:
+        "symspell" (learned from the indexed entries, the default) or
+        "enchant" (general-purpose dictionary, needs pyenchant).
+        """
+        if spell_checker == "enchant":
+            from .indexing.analyzers import SpellChecker
+
+            spell_checker = SpellChecker()
+        elif spell_checker == "symspell":
+            spell_checker = None
+        elif isinstance(spell_checker, str):
+            raise ValueError(f"Unknown spell checker: {spell_checker}")
         self.spell_checker = spell_checker
         return self
 
@@ -519,6 +676,16 @@ class SearchEngineBuilder:
         self.repository = repository
         return self
 
+    def with_fingerprint_path(self, path: Path) -> "SearchEngineBuilder":
+        """Persist content fingerprints of indexed entries at path."""
+        self.fingerprint_path = path
+        return self
+
+    def with_spelling_path(self, path: Path) -> "SearchEngineBuilder":
+        """Persist the spelling corrector learned from the index at path."""
+        self.spelling_path = path
+        return self
+
     def build(self) -> SearchEngine:
         """Build the SearchEngine instance."""
         engine = SearchEngine(
@@ -528,15 +695,22 @@ class SearchEngineBuilder:
             enable_query_expansion=self.enable_query_expansion,
             ranker=self.ranker,
             repository=self.repository,
+            fingerprint_path=self.fingerprint_path,
+            spelling_path=self.spelling_path,
         )
 
         if self.enable_query_expansion and (
-            self.synonym_expander or self.spell_checker
+            self.synonym_expander or self.spell_checker is not None
         ):
             from .query import QueryExpander
 
             engine.query_expander = QueryExpander(
-                spell_checker=self.spell_checker, synonym_expander=self.synonym_expander
+                spell_checker=(
+                    self.spell_checker
+                    if self.spell_checker is not None
+                    else engine.spell_checker
+                ),
+                synonym_expander=self.synonym_expander,
             )
 
         return engine
@@ -578,6 +752,14 @@ class SearchServiceBuilder:
         self._engine_builder = self._engine_builder.with_backend(backend)
         return self
 
+    def with_sqlite_fts(self, storage):
+        """Configure with the FTS5 index of a SQLite storage backend."""
+        from .backends.sqlite_fts import SQLiteFTSBackend
+
+        backend = SQLiteFTSBackend(storage)
+        self._engine_builder = self._engine_builder.with_backend(backend)
+        return self
+
     def with_memory(self):
         """Configure with memory backend."""
         from .backends.memory import MemoryBackend
@@ -717,6 +899,9 @@ class SearchService:
         self.event_bus = event_bus
         self.backend = self.engine.backend  # Expose backend for tests
         self.config: dict = {}  # Configuration dict for builder
+        self.indexer = None  # Set by attach_incremental_indexer
+        self.last_index_report: IndexDiff | None = None
+        self.last_build_stats: IndexBuildStats | None = None
 
         # Subscribe to events if event bus is provided
         if self._event_bus:
@@ -807,49 +992,102 @@ class SearchService:
         }
         return engine_stats
 
-    def index_all(self, batch_size: int | None = None) -> int:
-        """Index all entries from repository."""
+    def index_all(
+        self, batch_size: int | None = None, full: bool = False, jobs: int = 1
+    ) -> int:
+        """Bring the index up to date with the repository.
+
+        Only entries whose content fingerprint differs from the indexed one
+        are re-indexed, and entries gone from storage are removed. The
+        whole index is rebuilt when ``full`` is set or when the field
+        configuration changed since it was built. The diff is kept in
+        ``last_index_report`` and the throughput in ``last_build_stats``.
+
+        Args:
+            batch_size: Index in batches of this size, publishing progress
+            full: Rebuild every document regardless of fingerprints
+            jobs: Worker processes building index segments in parallel
+                (1: index in this process, 0 or less: all CPUs)
+
+        Returns:
+            Number of entries (re)indexed
+        """
         if not self._repository:
             return 0
 
         entries = self._repository.find_all()
-
-        if batch_size and len(entries) > batch_size:
-            total_indexed = 0
-            for i in range(0, len(entries), batch_size):
-                batch = entries[i : i + batch_size]
+        diff = self.engine.diff_entries(entries)
+        if full and not diff.full_rebuild:
+            diff = IndexDiff(added=[e.key for e in entries], full_rebuild=True)
+        self.last_index_report = diff
+
+        if diff.full_rebuild:
+            self.clear_all()
+            to_index = entries
+        else:
+            for key in diff.removed:
+                self.remove_entry(key)
+            wanted = set(diff.to_index)
+            to_index = [entry for entry in entries if entry.key in wanted]
+
+        start = time.perf_counter()
+        stats = None
+        total_indexed = 0
+        if jobs != 1 and len(to_index) > 1:
+            for entry in to_index:
+                self._entry_cache[entry.key] = entry
+            stats = self.engine.index_entries_parallel(
+                to_index, jobs, progress=self._publish_index_progress
+            )
+            self.engine.commit()
+            total_indexed = len(to_index)
+        elif batch_size and len(to_index) > batch_size:
+            for i in range(0, len(to_index), batch_size):
+                batch = to_index[i : i + batch_size]
                 self.add_entries(batch)
                 total_indexed += len(batch)
-
-                if self._event_bus:
-                    from datetime import datetime
-
-                    from ..storage.events import Event, EventType
-
-                    progress_event = Event(
-                        type=EventType.INDEX_PROGRESS,
-                        timestamp=datetime.now(),
-                        data={"indexed": total_indexed, "total": len(entries)},
-                    )
-                    self._event_bus.publish(progress_event)
-            return total_indexed
+                self._publish_index_progress(total_indexed, len(to_index))
         else:
-            self.add_entries(entries)
-            total_indexed = len(entries)
+            self.add_entries(to_index)
+            total_indexed = len(to_index)
+            self._publish_index_progress(total_indexed, len(to_index))
 
-            if self._event_bus:
-                from datetime import datetime
-
-                from ..storage.events import Event, EventType
-
-                progress_event = Event(
-                    type=EventType.INDEX_PROGRESS,
-                    timestamp=datetime.now(),
-                    data={"indexed": total_indexed, "total": len(entries)},
-                )
-                self._event_bus.publish(progress_event)
-
-            return total_indexed
+        if stats is None:
+            stats = IndexBuildStats(
+                documents=total_indexed, segments=1 if total_indexed else 0
+            )
+        # Include the final commit, which merges segments on disk
+        stats.seconds = time.perf_counter() - start
+        self.last_build_stats = stats
+
+        # Unchanged entries still feed a spelling vocabulary that was lost
+        missing = self.engine.missing_vocabulary(entries)
+        if missing:
+            self.engine.update_vocabulary(missing)
+            self.engine.commit()
+
+        return total_indexed
+
+    def _publish_index_progress(self, indexed: int, total: int) -> None:
+        """Publish an INDEX_PROGRESS event if an event bus is configured."""
+        if not self._event_bus:
+            return
+
+        from datetime import datetime
+
+        from ..storage.events import Event, EventType
+
+        report = self.last_index_report
+        progress_event = Event(
+            type=EventType.INDEX_PROGRESS,
+            timestamp=datetime.now(),
+            data={
+                "indexed": indexed,
+                "total": total,
+                "changes": report.to_dict() if report else {},
+            },
+        )
+        self._event_bus.publish(progress_event)
 
     def index_entry(self, entry: BibEntry) -> None:
         """Index a single entry."""
@@ -871,6 +1109,41 @@ class SearchService:
         """Get statistics (alias for get_search_statistics)."""
         return self.get_search_statistics()
 
+    def attach_incremental_indexer(
+        self,
+        journal=None,
+        state_path: Path | None = None,
+        **kwargs,
+    ):
+        """Replace per-event indexing with a batched incremental indexer.
+
+        Args:
+            journal: ChangeJournal used for the persisted high-water mark
+            state_path: File recording the last indexed storage generation
+            **kwargs: Extra IncrementalIndexer options (max_batch, max_delay)
+
+        Returns:
+            The attached IncrementalIndexer, already caught up with the journal
+        """
+        from .incremental import IncrementalIndexer
+
+        if not self._event_bus or not self._repository:
+            raise ValueError("Incremental indexing needs a repository and event bus")
+
+        self._unsubscribe_from_events()
+        indexer = IncrementalIndexer(
+            self.engine,
+            self._repository,
+            self._event_bus,
+            journal=journal,
+            state_path=state_path,
+            **kwargs,
+        )
+        indexer.attach()
+        indexer.catch_up()
+        self.indexer = indexer
+        return indexer
+
     def _subscribe_to_events(self) -> None:
         """Subscribe to relevant events for automatic indexing."""
         from ..storage.events import EventType
@@ -889,6 +1162,22 @@ class SearchService:
                 EventType.STORAGE_CLEARED, self._handle_storage_cleared
             )
 
+    def _unsubscribe_from_events(self) -> None:
+        """Remove the per-event indexing handlers."""
+        from ..storage.events import EventType
+
+        handlers = {
+            EventType.ENTRY_CREATED: self._handle_entry_created,
+            EventType.ENTRY_UPDATED: self._handle_entry_updated,
+            EventType.ENTRY_DELETED: self._handle_entry_deleted,
+            EventType.STORAGE_CLEARED: self._handle_storage_cleared,
+        }
+        for event_type, handler in handlers.items():
+            try:
+                self._event_bus.unsubscribe(event_type, handler)
+            except ValueError:
+                pass
+
     def _handle_entry_created(self, event) -> None:
         """Handle entry created event."""
         if "entry" in event.data:
@@ -897,11 +1186,13 @@ class SearchService:
 
     def _handle_entry_updated(self, event) -> None:
         """Handle entry updated event."""
-        if "entry_key" in event.data:
-            entry_key = event.data["entry_key"]
-            self.delete_entry(entry_key)
-            if "new_entry" in event.data:
-                self.index_entry(event.data["new_entry"])
+        # Repositories send the saved entry as "entry", command handlers
+        # send it as "new_entry"
+        entry = event.data.get("new_entry") or event.data.get("entry")
+        if entry is not None:
+            self.index_entry(entry)
+        elif "entry_key" in event.data:
+            self.delete_entry(event.data["entry_key"])
 
     def _handle_entry_deleted(self, event) -> None:
         """Handle entry deleted event."""
@@ -10,12 +10,15 @@ from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..core.models import Entry as BibEntry
 from .backends.base import SearchMatch
 from .results import FacetValue
 
+if TYPE_CHECKING:
+    from ..storage.snapshot import LibrarySnapshot
+
 
 class FacetType(Enum):
     """Types of facets supported."""
@@ -127,12 +130,35 @@ class FacetExtractor:
         return values
 
 
+# Facet fields that can be counted over the library snapshot columns
+SNAPSHOT_COLUMNS = {
+    "entry_type": "type",
+    "year": "year",
+    "author": "authors",
+    "keywords": "keywords",
+    "journal": "journal",
+    "tags": "tags",
+}
+
+
 class FacetAggregator:
     """Aggregates facet values and counts."""
 
-    def __init__(self, config: FacetConfiguration | None = None):
-        """Initialize aggregator with configuration."""
+    def __init__(
+        self,
+        config: FacetConfiguration | None = None,
+        snapshot: "LibrarySnapshot | None" = None,
+    ):
+        """Initialize aggregator with configuration.
+
+        Args:
+            config: Facet configuration
+            snapshot: Library snapshot; when given, facets on its columns
+                are counted with vectorized expressions over the matched
+                keys instead of walking the matched entries
+        """
         self.config = config or FacetConfiguration()
+        self.snapshot = snapshot
 
     def aggregate_facet(self, matches: list[SearchMatch], field_name: str) -> "Facet":
         """Aggregate facet values from search matches.
@@ -144,13 +170,32 @@ class FacetAggregator:
         Returns:
             Facet with aggregated values and counts
         """
-        # Extract entries from matches
-        entries = [m.entry for m in matches if m.entry]
-
         # Get field settings
         settings = self.config.get_field_settings(field_name)
         facet_type = self.config.get_facet_type(field_name)
 
+        column = SNAPSHOT_COLUMNS.get(field_name)
+        if self.snapshot is not None and column is not None:
+            keys = [m.entry_key for m in matches]
+            if facet_type == FacetType.TERMS:
+                return self._terms_facet_from_counts(
+                    field_name,
+                    self.snapshot.value_counts(
+                        column, keys=keys, min_count=settings.get("min_count", 1)
+                    ),
+                    settings,
+                )
+            if facet_type == FacetType.RANGE:
+                values = [
+                    value
+                    for value, count in self.snapshot.value_counts(column, keys=keys)
+                    for _ in range(count)
+                ]
+                return self._create_range_facet(field_name, values, settings)
+
+        # Extract entries from matches
+        entries = [m.entry for m in matches if m.entry]
+
         # Extract values
         extractor = FacetExtractor()
         values = extractor.extract_field_values(entries, field_name)
@@ -177,6 +222,14 @@ class FacetAggregator:
         # Sort by count descending, then by value
         sorted_items = sorted(filtered_counts.items(), key=lambda x: (-x[1], str(x[0])))
 
+        return self._terms_facet_from_counts(field_name, sorted_items, settings)
+
+    def _terms_facet_from_counts(
+        self, field_name: str, sorted_items: list[tuple[Any, int]], settings: dict
+    ) -> "TermsFacet":
+        """Create terms facet from (value, count) pairs, most frequent first."""
+        min_count = settings.get("min_count", 1)
+
         # Apply size limit
         size = settings.get("size", 10)
         limited_items = sorted_items[:size]
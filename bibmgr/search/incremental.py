@@ -0,0 +1,219 @@
+"""Incremental search indexing driven by storage events.
+
+The indexer listens for entry, bulk-import and merge events, collects the
+affected keys and applies them to the search backend in batches. With a
+``ChangeJournal`` it also records the last storage generation it indexed,
+so a restarted process only replays the changes it missed.
+"""
+
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..storage.events import Event, EventBus, EventType
+from ..storage.journal import JOURNALED_EVENTS, ChangeJournal
+
+# Name under which the indexer acknowledges journal records
+JOURNAL_CONSUMER = "search-index"
+
+
+@dataclass
+class IndexUpdate:
+    """Summary of one incremental index flush."""
+
+    indexed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    cleared: bool = False
+    generation: int = 0
+    took_ms: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of documents touched."""
+        return len(self.indexed) + len(self.removed)
+
+
+class IncrementalIndexer:
+    """Keep a search engine in sync with storage through events."""
+
+    def __init__(
+        self,
+        engine: Any,
+        repository: Any,
+        event_bus: EventBus,
+        journal: ChangeJournal | None = None,
+        state_path: Path | None = None,
+        max_batch: int = 500,
+        max_delay: float = 0.25,
+    ):
+        """Initialize the indexer.
+
+        Args:
+            engine: SearchEngine to update
+            repository: Entry repository used to load changed entries
+            event_bus: Bus publishing storage events
+            journal: Change journal providing storage generations
+            state_path: File storing the last indexed generation
+            max_batch: Largest batch handed to the backend at once
+            max_delay: Seconds to wait for an event burst to finish
+        """
+        self.engine = engine
+        self.repository = repository
+        self.event_bus = event_bus
+        self.journal = journal
+        self.state_path = Path(state_path) if state_path else None
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+
+        self._pending: set[str] = set()
+        self._clear_pending = False
+        self._lock = threading.RLock()
+        self._attached = False
+        self._indexed_generation = self._load_state()
+        if journal is not None:
+            # Hold back compaction until this indexer has caught up
+            journal.acknowledge(JOURNAL_CONSUMER, self._indexed_generation)
+
+    @property
+    def indexed_generation(self) -> int:
+        """Last storage generation reflected in the index."""
+        return self._indexed_generation
+
+    @property
+    def pending_count(self) -> int:
+        """Number of keys waiting to be indexed."""
+        return len(self._pending)
+
+    def attach(self) -> None:
+        """Start listening for storage events."""
+        if self._attached:
+            return
+        self.event_bus.subscribe_batch(
+            JOURNALED_EVENTS,
+            self._handle_events,
+            max_batch=self.max_batch,
+            max_delay=self.max_delay,
+            coalesce=False,
+        )
+        self._attached = True
+
+    def detach(self) -> None:
+        """Stop listening and apply anything still pending."""
+        if self._attached:
+            self.event_bus.unsubscribe_batch(self._handle_events)
+            self._attached = False
+        self.flush()
+
+    def mark_dirty(self, keys: list[str] | set[str]) -> None:
+        """Queue keys for reindexing."""
+        with self._lock:
+            self._pending.update(keys)
+
+    def mark_cleared(self) -> None:
+        """Queue a full clear of the index."""
+        with self._lock:
+            self._pending.clear()
+            self._clear_pending = True
+
+    def catch_up(self) -> IndexUpdate:
+        """Replay journal changes newer than the last indexed generation."""
+        if self.journal is None:
+            return self.flush()
+
+        if self.journal.generation == self._indexed_generation and not self._pending:
+            return IndexUpdate(generation=self._indexed_generation)
+
+        changes = self.journal.changes_since(self._indexed_generation)
+        if not changes.complete or self._indexed_generation > self.journal.generation:
+            # Records we missed were compacted away, or the journal was
+            # replaced: only a full rebuild is known to be correct
+            with self._lock:
+                self._indexed_generation = 0
+            self.mark_cleared()
+            self.mark_dirty(self.repository.keys())
+            return self.flush(generation=self.journal.generation)
+        if changes.cleared:
+            self.mark_cleared()
+        self.mark_dirty(changes.keys)
+        return self.flush(generation=changes.generation)
+
+    def flush(self, generation: int | None = None) -> IndexUpdate:
+        """Apply pending changes to the search backend.
+
+        Keys whose entries no longer exist in the repository are removed
+        from the index; all others are (re)indexed through ``index_batch``.
+        """
+        start = time.time()
+
+        with self._lock:
+            keys = sorted(self._pending)
+            cleared = self._clear_pending
+            self._pending.clear()
+            self._clear_pending = False
+
+            if generation is None and self.journal is not None:
+                generation = self.journal.generation
+
+            update = IndexUpdate(cleared=cleared)
+
+            if cleared:
+                self.engine.clear_index()
+
+            batch = []
+            for key in keys:
+                entry = self.repository.find(key)
+                if entry is None:
+                    if not cleared and self.engine.remove_entry(key):
+                        update.removed.append(key)
+                    continue
+                batch.append(entry)
+                if len(batch) >= self.max_batch:
+                    self.engine.index_entries(batch)
+                    update.indexed.extend(e.key for e in batch)
+                    batch = []
+            if batch:
+                self.engine.index_entries(batch)
+                update.indexed.extend(e.key for e in batch)
+
+            if update.total or cleared:
+                self.engine.commit()
+
+            if generation is not None and generation > self._indexed_generation:
+                self._indexed_generation = generation
+                self._save_state()
+                if self.journal is not None:
+                    self.journal.acknowledge(JOURNAL_CONSUMER, generation)
+            update.generation = self._indexed_generation
+
+        update.took_ms = int((time.time() - start) * 1000)
+        return update
+
+    def _handle_events(self, events: list[Event]) -> None:
+        """Queue keys from a burst of events and flush them."""
+        for event in events:
+            if event.type == EventType.STORAGE_CLEARED:
+                self.mark_cleared()
+            else:
+                self.mark_dirty(event.affected_keys)
+        self.flush()
+
+    def _load_state(self) -> int:
+        """Load the persisted high-water mark."""
+        if not self.state_path or not self.state_path.exists():
+            return 0
+        try:
+            return int(json.loads(self.state_path.read_text())["generation"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+    def _save_state(self) -> None:
+        """Persist the high-water mark atomically."""
+        if not self.state_path:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.state_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps({"generation": self._indexed_generation}))
+        temp_path.replace(self.state_path)
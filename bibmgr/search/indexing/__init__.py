@@ -11,12 +11,18 @@ from .analyzers import (
     TextAnalyzer,
 )
 from .fields import FieldConfiguration, FieldDefinition, FieldType
+from .fingerprints import FingerprintStore, IndexDiff, config_fingerprint
 from .indexer import EntryIndexer, IndexingPipeline
+from .parallel import IndexBuildStats, ParallelIndexBuilder
+from .spelling import SymSpellCorrector
 
 __all__ = [
     "FieldConfiguration",
     "FieldDefinition",
     "FieldType",
+    "FingerprintStore",
+    "IndexDiff",
+    "config_fingerprint",
     "TextAnalyzer",
     "SimpleAnalyzer",
     "StandardAnalyzer",
@@ -25,6 +31,9 @@ __all__ = [
     "AuthorAnalyzer",
     "AnalyzerManager",
     "SpellChecker",
+    "SymSpellCorrector",
     "EntryIndexer",
     "IndexingPipeline",
+    "IndexBuildStats",
+    "ParallelIndexBuilder",
 ]
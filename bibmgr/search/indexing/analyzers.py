@@ -8,18 +8,32 @@ import re
 import unicodedata
 from abc import ABC, abstractmethod
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 
 from whoosh.lang.porter import stem as porter_stem
 from whoosh.lang.stopwords import stoplists
 
-try:
-    import enchant
+# Punctuation treated as word separators before tokenizing
+_SEPARATORS = str.maketrans(
+    {char: " " for char in "-_,;.:!?&/\\(){}[]\"'`~@#$%^*+=|<>"}
+)
+_WORD_PATTERN = re.compile(r"\w+")
+_CAMEL_LOWER_UPPER = re.compile(r"([a-z])([A-Z])")
+_CAMEL_ACRONYM = re.compile(r"([A-Z]+)([A-Z][a-z])")
 
-    ENCHANT_AVAILABLE = True
-except ImportError:
-    enchant = None  # type: ignore
-    ENCHANT_AVAILABLE = False
+
+@lru_cache(maxsize=65536)
+def _porter_stem(word: str) -> str:
+    """Porter stem of a word, memoized across analyzers."""
+    return porter_stem(word)
+
+
+@lru_cache(maxsize=4096)
+def _is_combining(char: str) -> bool:
+    """Whether a decomposed character is a combining accent."""
+    return unicodedata.category(char) == "Mn"
 
 
 @dataclass
@@ -106,13 +120,13 @@ class TextProcessor:
         tokens = self._tokenize(text)
 
         # Process tokens
+        min_length = config.min_token_length
+        max_length = config.max_token_length
+        stopwords = config.stopwords if config.remove_stopwords else None
         processed_tokens = []
         for token in tokens:
             # Length filtering
-            if (
-                len(token) < config.min_token_length
-                or len(token) > config.max_token_length
-            ):
+            if len(token) < min_length or len(token) > max_length:
                 continue
 
             # Lowercase
@@ -120,9 +134,8 @@ class TextProcessor:
                 token = token.lower()
 
             # Stop word removal
-            if config.remove_stopwords and config.stopwords:
-                if token.lower() in config.stopwords:
-                    continue
+            if stopwords and token.lower() in stopwords:
+                continue
 
             # Stemming
             if config.stem:
@@ -132,6 +145,27 @@ class TextProcessor:
 
         return " ".join(processed_tokens)
 
+    def process_many(
+        self, texts: Iterable[str], config_name: str | None = None
+    ) -> list[str]:
+        """Process a column of texts, analyzing each distinct value once.
+
+        Args:
+            texts: Input texts
+            config_name: Optional config name to use instead of instance config
+
+        Returns:
+            Processed texts in input order
+        """
+        processed: dict[str, str] = {}
+        results = []
+        for text in texts:
+            result = processed.get(text)
+            if result is None:
+                result = processed[text] = self.process(text, config_name)
+            results.append(result)
+        return results
+
     def tokenize(self, text: str) -> list[str]:
         """Just tokenize text without any processing.
 
@@ -193,27 +227,24 @@ class TextProcessor:
 
         Splits on common punctuation and word boundaries.
         """
-        # Replace common word separators with spaces
-        text = re.sub(r'[-_,;.:!?&/\\(){}[\]"\'`~@#$%^*+=|<>]', " ", text)
-
-        # Extract words (letters and numbers)
-        tokens = re.findall(r"\w+", text)
-
-        return tokens
+        # Replace common word separators with spaces, then extract words
+        return _WORD_PATTERN.findall(text.translate(_SEPARATORS))
 
     def _remove_accents(self, text: str) -> str:
         """Remove diacritical marks from text."""
+        if text.isascii():
+            return text
         # Normalize to NFD (decomposed form)
         nfd = unicodedata.normalize("NFD", text)
         # Filter out combining characters (accents)
-        return "".join(char for char in nfd if unicodedata.category(char) != "Mn")
+        return "".join(char for char in nfd if not _is_combining(char))
 
     def _split_camelcase(self, text: str) -> str:
         """Split CamelCase words into separate words."""
         # Insert space before uppercase letters that follow lowercase
-        result = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
+        result = _CAMEL_LOWER_UPPER.sub(r"\1 \2", text)
         # Insert space before uppercase letters followed by lowercase
-        result = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1 \2", result)
+        result = _CAMEL_ACRONYM.sub(r"\1 \2", result)
         return result
 
     def _stem(self, word: str) -> str:
@@ -224,7 +255,7 @@ class TextProcessor:
         if len(word) <= 3:
             return word
 
-        stemmed = porter_stem(word)
+        stemmed = _porter_stem(word)
 
         # Ensure we don't over-stem (keep at least 2 characters)
         if len(stemmed) >= 2:
@@ -372,6 +403,17 @@ class TextAnalyzer(ABC):
         """
         pass
 
+    def analyze_many(self, texts: Iterable[str]) -> list[list[str]]:
+        """Analyze a column of texts.
+
+        Args:
+            texts: Input texts to analyze
+
+        Returns:
+            Token lists in input order
+        """
+        return [self.analyze(text) for text in texts]
+
 
 class SimpleAnalyzer(TextAnalyzer):
     """Basic analyzer with tokenization and lowercasing."""
@@ -492,10 +534,20 @@ class AuthorAnalyzer(TextAnalyzer):
 
 
 class AnalyzerManager:
-    """Manages analyzers for different field types."""
+    """Manages analyzers for different field types.
 
-    def __init__(self):
-        """Initialize with default analyzers."""
+    Analyzed tokens are cached per (analyzer, text): journal names, venues,
+    authors and keywords repeat across a library and are analyzed once.
+    """
+
+    def __init__(self, cache_size: int = 16384):
+        """Initialize with default analyzers.
+
+        Args:
+            cache_size: Maximum number of cached (analyzer, text) results
+        """
+        # Use Python's built-in LRU cache
+        self._analyze_cached = lru_cache(maxsize=cache_size)(self._analyze_impl)
         self.analyzers = {
             "simple": SimpleAnalyzer(),
             "standard": StandardAnalyzer(),
@@ -547,14 +599,53 @@ class AnalyzerManager:
         Returns:
             List of tokens
         """
-        analyzer = self.get_analyzer(field)
-        return analyzer.analyze(text)
+        return list(self._analyze_cached(self._analyzer_name(field), text))
+
+    def analyze_many(self, field: str, texts: Iterable[str]) -> list[list[str]]:
+        """Analyze a column of values of one field.
+
+        Distinct values are analyzed once and through the token cache.
+
+        Args:
+            field: Field name
+            texts: Texts to analyze
+
+        Returns:
+            Token lists in input order
+        """
+        name = self._analyzer_name(field)
+        analyzed: dict[str, tuple[str, ...]] = {}
+        results = []
+        for text in texts:
+            tokens = analyzed.get(text)
+            if tokens is None:
+                tokens = analyzed[text] = self._analyze_cached(name, text)
+            results.append(list(tokens))
+        return results
+
+    def cache_info(self):
+        """Hit and miss counts of the token cache."""
+        return self._analyze_cached.cache_info()
+
+    def clear_cache(self) -> None:
+        """Drop cached tokens, e.g. after replacing an analyzer."""
+        self._analyze_cached.cache_clear()
+
+    def _analyzer_name(self, field: str) -> str:
+        """Name of the analyzer registered for a field."""
+        name = self.field_analyzers.get(field, "standard")
+        return name if name in self.analyzers else "standard"
+
+    def _analyze_impl(self, analyzer_name: str, text: str) -> tuple[str, ...]:
+        """Run an analyzer; results are shared through the cache."""
+        return tuple(self.analyzers[analyzer_name].analyze(text))
 
 
 class SpellChecker:
     """Spell checker using PyEnchant library.
 
     Provides spell checking and correction suggestions for search queries.
+    The enchant dictionary is loaded on first use rather than at startup.
     Falls back gracefully if enchant is not available.
     """
 
@@ -566,22 +657,39 @@ class SpellChecker:
             custom_words: List of custom words to add to dictionary
         """
         self.language = language
-        self.dict = None
-
-        if ENCHANT_AVAILABLE and enchant:
-            try:
-                self.dict = enchant.Dict(language)
-
-                # Add custom words if provided
-                if custom_words:
-                    for word in custom_words:
-                        self.add_word(word)
-
-                # Add common CS/academic terms
-                self._add_default_terms()
-            except Exception:
-                # Language not available, fall back to None
-                self.dict = None
+        self.custom_words = list(custom_words or [])
+        self._dict = None
+        self._loaded = False
+
+    @property
+    def dict(self):
+        """Enchant dictionary, loaded on first access (None if unavailable)."""
+        if not self._loaded:
+            self._loaded = True
+            self._dict = self._load_dictionary()
+        return self._dict
+
+    @dict.setter
+    def dict(self, value) -> None:
+        self._dict = value
+        self._loaded = True
+
+    def _load_dictionary(self):
+        """Load the enchant dictionary with custom and default terms."""
+        try:
+            import enchant
+
+            dictionary = enchant.Dict(self.language)
+        except Exception:
+            # enchant or the language is not available
+            return None
+
+        for word in self.custom_words:
+            if word:
+                dictionary.add(word)
+        self._dict = dictionary
+        self._add_default_terms()
+        return dictionary
 
     def _add_default_terms(self):
         """Add common CS and academic terms to dictionary."""
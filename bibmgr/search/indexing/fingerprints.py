@@ -0,0 +1,202 @@
+"""Per-entry content fingerprints for change-detecting reindexing.
+
+The indexed document is a pure function of the entry and the field
+configuration, so fingerprinting the entry content (``Entry.content_hash``)
+together with a fingerprint of the configuration tells us whether a stored
+document is still current without re-running the indexing pipeline.
+
+Fingerprints live in a JSON snapshot plus an append-only log of the
+changes made since, so committing a few documents does not rewrite the
+fingerprints of the whole library.
+"""
+
+import hashlib
+import json
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .fields import FieldConfiguration
+
+# Bump when EntryIndexer output changes shape so old indexes get rebuilt
+INDEX_SCHEMA_VERSION = 1
+
+# Fold the change log into the snapshot once it has at least this many
+# records and more records than the snapshot has entries
+LOG_COMPACT_MIN = 1000
+
+
+def config_fingerprint(field_config: FieldConfiguration) -> str:
+    """Fingerprint the field configuration and indexer schema version."""
+    payload = json.dumps(
+        {"schema": INDEX_SCHEMA_VERSION, "config": field_config.to_dict()},
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class IndexDiff:
+    """Differences between stored fingerprints and current storage."""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    full_rebuild: bool = False
+
+    @property
+    def to_index(self) -> list[str]:
+        """Keys whose documents must be (re)built."""
+        return self.added + self.changed
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything needs to be written to the index."""
+        return bool(self.added or self.changed or self.removed or self.full_rebuild)
+
+    def to_dict(self) -> dict[str, int | bool]:
+        """Summarize the diff as counts."""
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "removed": len(self.removed),
+            "unchanged": self.unchanged,
+            "full_rebuild": self.full_rebuild,
+        }
+
+
+class FingerprintStore:
+    """Fingerprints of the documents currently in a search index.
+
+    Stored as JSON next to the index, with later changes appended to a
+    ``.log`` file beside it. If the stored configuration fingerprint
+    differs from the current one the store starts out stale, signalling
+    that the whole index must be rebuilt.
+    """
+
+    def __init__(self, path: Path | None, field_config: FieldConfiguration):
+        self.path = Path(path) if path else None
+        self.log_path = self.path.with_name(self.path.name + ".log") if path else None
+        self.config_hash = config_fingerprint(field_config)
+        self.fingerprints: dict[str, str] = {}
+        self.stale = False
+        self._changes: dict[str, str | None] = {}
+        self._rewrite = False
+        self._log_records = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def diff(self, current: dict[str, str]) -> IndexDiff:
+        """Compare current entry fingerprints against the stored ones."""
+        if self.stale:
+            return IndexDiff(added=sorted(current), full_rebuild=True)
+
+        result = IndexDiff()
+        for key, fingerprint in current.items():
+            stored = self.fingerprints.get(key)
+            if stored is None:
+                result.added.append(key)
+            elif stored != fingerprint:
+                result.changed.append(key)
+            else:
+                result.unchanged += 1
+        result.removed = [key for key in self.fingerprints if key not in current]
+        return result
+
+    def update(self, fingerprints: dict[str, str]) -> None:
+        """Record fingerprints of freshly indexed documents."""
+        for key, fingerprint in fingerprints.items():
+            if self.fingerprints.get(key) != fingerprint:
+                self.fingerprints[key] = fingerprint
+                self._changes[key] = fingerprint
+
+    def remove(self, key: str) -> None:
+        """Forget the fingerprint of a removed document."""
+        if self.fingerprints.pop(key, None) is not None:
+            self._changes[key] = None
+
+    def clear(self) -> None:
+        """Forget everything; the index is empty and current again."""
+        self.fingerprints.clear()
+        self.stale = False
+        self._changes.clear()
+        self._rewrite = True
+
+    def save(self) -> None:
+        """Persist changes since the last save.
+
+        Changes are appended to the log; the snapshot is rewritten only
+        after a clear or once the log outgrows it.
+        """
+        if not self.path or not (self._changes or self._rewrite):
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        records = self._log_records + len(self._changes)
+        if (
+            self._rewrite
+            or not self.path.exists()
+            or records > max(LOG_COMPACT_MIN, len(self.fingerprints))
+        ):
+            self._write_snapshot()
+        else:
+            with open(self.log_path, "a") as f:
+                f.writelines(
+                    json.dumps({"k": key, "f": fingerprint}) + "\n"
+                    for key, fingerprint in self._changes.items()
+                )
+            self._log_records = records
+        self._changes.clear()
+
+    def _write_snapshot(self) -> None:
+        """Replace the snapshot atomically and start a new change log."""
+        # Dropping the log first means a crash loses changes, which only
+        # makes documents look out of date, instead of replaying old
+        # changes onto a newer snapshot
+        self.log_path.unlink(missing_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with open(temp_fd, "w") as f:
+                json.dump({"config": self.config_hash, "entries": self.fingerprints}, f)
+            Path(temp_path).replace(self.path)
+        except Exception:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self._rewrite = False
+        self._log_records = 0
+
+    def _load(self) -> None:
+        """Load fingerprints, marking the store stale on config mismatch."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            self.stale = True
+            return
+
+        if data.get("config") != self.config_hash:
+            self.stale = True
+            return
+        self.fingerprints = dict(data.get("entries", {}))
+        self._replay_log()
+
+    def _replay_log(self) -> None:
+        """Apply logged changes on top of the snapshot, skipping torn lines."""
+        if not self.log_path.exists():
+            return
+        with open(self.log_path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    key, fingerprint = record["k"], record["f"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+                if fingerprint is None:
+                    self.fingerprints.pop(key, None)
+                else:
+                    self.fingerprints[key] = fingerprint
+                self._log_records += 1
@@ -33,6 +33,69 @@ class EntryIndexer:
         Args:
             entry: Bibliography entry to index
 
+        Returns:
+            Dictionary representing the indexed document
+        """
+        return self._build_document(entry, self._extract_entry_fields(entry))
+
+    def index_entries(self, entries: list[BibEntry]) -> list[dict[str, Any]]:
+        """Convert multiple bibliography entries into indexed documents.
+
+        Analyzed fields are processed a column at a time, so values shared
+        by many entries (journals, authors, keywords) are analyzed once.
+
+        Args:
+            entries: List of bibliography entries to index
+
+        Returns:
+            List of indexed documents
+        """
+        entry_fields = [self._extract_entry_fields(entry) for entry in entries]
+
+        columns: dict[str, tuple[list[int], list[str]]] = {}
+        for i, fields in enumerate(entry_fields):
+            for field_name, field_value in fields.items():
+                if self._is_analyzed(field_name):
+                    rows, texts = columns.setdefault(field_name, ([], []))
+                    rows.append(i)
+                    texts.append(str(field_value))
+
+        analyzed: list[dict[str, list[str]]] = [{} for _ in entries]
+        for field_name, (rows, texts) in columns.items():
+            tokens = self.analyzer_manager.analyze_many(field_name, texts)
+            for row, field_tokens in zip(rows, tokens, strict=True):
+                analyzed[row][field_name] = field_tokens
+
+        return [
+            self._build_document(entry, fields, tokens)
+            for entry, fields, tokens in zip(
+                entries, entry_fields, analyzed, strict=True
+            )
+        ]
+
+    def _is_analyzed(self, field_name: str) -> bool:
+        """Whether a field is indexed with an analyzed copy."""
+        field_def = self.field_config.get_field(field_name)
+        return bool(
+            field_def
+            and field_def.indexed
+            and field_def.analyzed
+            and self.field_config.should_process(field_name)
+        )
+
+    def _build_document(
+        self,
+        entry: BibEntry,
+        entry_fields: dict[str, Any],
+        analyzed: dict[str, list[str]] | None = None,
+    ) -> dict[str, Any]:
+        """Build the indexed document from an entry's extracted fields.
+
+        Args:
+            entry: Bibliography entry
+            entry_fields: Fields extracted from the entry
+            analyzed: Tokens already analyzed per field, if any
+
         Returns:
             Dictionary representing the indexed document
         """
@@ -43,8 +106,6 @@ class EntryIndexer:
             else str(entry.type).lower(),
         }
 
-        entry_fields = self._extract_entry_fields(entry)
-
         search_text_parts = []
         for field_name, field_value in entry_fields.items():
             field_def = self.field_config.get_field(field_name)
@@ -71,9 +132,12 @@ class EntryIndexer:
                 and field_def.analyzed
                 and self.field_config.should_process(field_name)
             ):
-                analyzed_tokens = self.analyzer_manager.analyze_field(
-                    field_name, str(field_value)
-                )
+                if analyzed is not None and field_name in analyzed:
+                    analyzed_tokens = analyzed[field_name]
+                else:
+                    analyzed_tokens = self.analyzer_manager.analyze_field(
+                        field_name, str(field_value)
+                    )
 
                 if analyzed_tokens:
                     doc[f"{field_name}_analyzed"] = " ".join(analyzed_tokens)
@@ -87,17 +151,6 @@ class EntryIndexer:
 
         return doc
 
-    def index_entries(self, entries: list[BibEntry]) -> list[dict[str, Any]]:
-        """Convert multiple bibliography entries into indexed documents.
-
-        Args:
-            entries: List of bibliography entries to index
-
-        Returns:
-            List of indexed documents
-        """
-        return [self.index_entry(entry) for entry in entries]
-
     def _extract_entry_fields(self, entry: BibEntry) -> dict[str, Any]:
         """Extract all fields from an entry.
 
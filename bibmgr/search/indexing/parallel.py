@@ -0,0 +1,152 @@
+"""Parallel index builds with per-worker segments.
+
+Turning entries into search documents (author parsing, derived fields,
+analyzers) is CPU bound and independent per entry, so a bulk build shards
+the entries across a process pool. Each worker turns its shard into a
+backend segment - a Whoosh segment on disk or a memory-backend shard - and
+the parent merges the segments into the live index once all workers finish.
+"""
+
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from ...core.models import Entry as BibEntry
+from .fields import FieldConfiguration
+from .indexer import EntryIndexer
+
+
+@dataclass
+class IndexBuildStats:
+    """Throughput of one index build."""
+
+    documents: int = 0
+    jobs: int = 1
+    segments: int = 0
+    seconds: float = 0.0
+
+    @property
+    def docs_per_sec(self) -> float:
+        """Documents indexed per second."""
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Summarize the build."""
+        return {
+            "documents": self.documents,
+            "jobs": self.jobs,
+            "segments": self.segments,
+            "seconds": round(self.seconds, 3),
+            "docs_per_sec": round(self.docs_per_sec, 1),
+        }
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Map a requested job count to a worker count (0 or less: all CPUs)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def shard_entries(entries: list[BibEntry], count: int) -> list[list[BibEntry]]:
+    """Split entries into at most ``count`` contiguous, similarly sized shards."""
+    if not entries:
+        return []
+    count = max(1, min(count, len(entries)))
+    size, extra = divmod(len(entries), count)
+
+    shards = []
+    start = 0
+    for i in range(count):
+        end = start + size + (1 if i < extra else 0)
+        shards.append(entries[start:end])
+        start = end
+    return shards
+
+
+def build_segment(
+    field_config: FieldConfiguration,
+    segment_builder: Callable[[list[dict[str, Any]]], Any] | None,
+    entries: list[BibEntry],
+) -> Any:
+    """Build documents for a shard of entries and turn them into a segment.
+
+    Runs inside a worker process; without a segment builder the documents
+    themselves are handed back to the parent.
+    """
+    documents = EntryIndexer(field_config).index_entries(entries)
+    if segment_builder is None:
+        return documents
+    return segment_builder(documents)
+
+
+class ParallelIndexBuilder:
+    """Build a search index from many entries using a process pool."""
+
+    def __init__(self, backend: Any, field_config: FieldConfiguration, jobs: int):
+        """Initialize the builder.
+
+        Args:
+            backend: Search backend receiving the merged segments
+            field_config: Field configuration used by the workers' indexers
+            jobs: Number of worker processes (0 or less: all CPUs)
+        """
+        self.backend = backend
+        self.field_config = field_config
+        self.jobs = resolve_jobs(jobs)
+
+    def build(
+        self,
+        entries: list[BibEntry],
+        progress: Callable[[int, int], None] | None = None,
+    ) -> IndexBuildStats:
+        """Index entries through per-worker segments.
+
+        Args:
+            entries: Entries to index
+            progress: Called with (documents done, total) as shards finish
+
+        Returns:
+            Build statistics
+        """
+        start = time.perf_counter()
+        shards = shard_entries(entries, self.jobs)
+        if not shards:
+            return IndexBuildStats(jobs=self.jobs)
+
+        with tempfile.TemporaryDirectory(prefix="bibmgr-segments-") as workdir:
+            segment_builder = self.backend.segment_builder(Path(workdir))
+            segments: list[Any] = [None] * len(shards)
+            done = 0
+
+            # Spawned workers stay clear of the event bus and writer threads
+            with ProcessPoolExecutor(
+                max_workers=len(shards), mp_context=get_context("spawn")
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        build_segment, self.field_config, segment_builder, shard
+                    ): i
+                    for i, shard in enumerate(shards)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    segments[i] = future.result()
+                    done += len(shards[i])
+                    if progress:
+                        progress(done, len(entries))
+
+            self.backend.merge_segments(segments)
+
+        return IndexBuildStats(
+            documents=len(entries),
+            jobs=self.jobs,
+            segments=len(segments),
+            seconds=time.perf_counter() - start,
+        )
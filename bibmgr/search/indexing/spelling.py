@@ -0,0 +1,377 @@
+"""Corpus-driven spelling correction with a symmetric-delete index.
+
+The corrector learns its vocabulary from the indexed entries, so author
+names, acronyms and domain terms are correct by definition and corrections
+are weighted by how often a term occurs in the library. Lookups follow the
+SymSpell approach: every vocabulary term is stored under all strings
+obtained by deleting up to ``max_edit_distance`` characters from its
+prefix, and a query word generates the same deletes, so candidates come
+from a handful of dictionary probes instead of a scan of the vocabulary.
+
+The state is persisted as a msgpack snapshot plus a JSON-lines log of the
+documents changed since, and is only read on first use.
+"""
+
+import json
+import re
+import tempfile
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+
+import msgspec
+
+# Bump when the on-disk layout changes
+SPELLING_FORMAT_VERSION = 1
+
+# Fold the change log into the snapshot once it has at least this many
+# records and more records than there are documents
+LOG_COMPACT_MIN = 1000
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein (optimal string alignment) distance.
+
+    Gives up early and returns ``limit + 1`` once the distance is known to
+    exceed ``limit``.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous_previous: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + cost,
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphabetic words."""
+    return _WORD_PATTERN.findall(text.lower())
+
+
+class _State(msgspec.Struct):
+    """On-disk representation of the corrector."""
+
+    version: int
+    max_edit_distance: int
+    prefix_length: int
+    terms: dict[str, int]
+    documents: dict[str, dict[str, int]]
+    deletes: dict[str, list[str]]
+
+
+class SymSpellCorrector:
+    """Spelling corrector over the vocabulary of the search index.
+
+    Implements the ``check``/``suggest``/``add_word``/``correct_query``
+    interface of ``SpellChecker`` so it can be used by ``QueryExpander``.
+    Documents are added and removed incrementally as the index changes.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_edit_distance: int = 2,
+        prefix_length: int = 7,
+        min_word_length: int = 3,
+    ):
+        """Initialize the corrector.
+
+        Args:
+            path: File persisting the vocabulary and delete index
+            max_edit_distance: Largest edit distance of a correction
+            prefix_length: Characters of each term used for deletes
+            min_word_length: Shorter words are never corrected
+        """
+        self.path = Path(path) if path else None
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.min_word_length = min_word_length
+
+        self._terms: Counter[str] = Counter()
+        self._documents: dict[str, dict[str, int]] = {}
+        self._deletes: dict[str, list[str]] = {}
+        self._changes: list[dict] = []
+        self._rewrite = False
+        self._log_records = 0
+        # Reading the state is deferred until the corrector is first used
+        self._loaded = False
+
+    @property
+    def log_path(self) -> Path | None:
+        """File logging changes made since the snapshot was written."""
+        return self.path.with_name(self.path.name + ".log") if self.path else None
+
+    @property
+    def terms(self) -> Counter[str]:
+        """Occurrences of each vocabulary term."""
+        self._ensure_loaded()
+        return self._terms
+
+    @property
+    def documents(self) -> dict[str, dict[str, int]]:
+        """Term counts contributed by each indexed document."""
+        self._ensure_loaded()
+        return self._documents
+
+    @property
+    def deletes(self) -> dict[str, list[str]]:
+        """Terms reachable from each delete string."""
+        self._ensure_loaded()
+        return self._deletes
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def check(self, word: str) -> bool:
+        """Check whether a word occurs in the indexed vocabulary.
+
+        Words too short to correct are always accepted.
+        """
+        word = word.lower()
+        return len(word) < self.min_word_length or word in self.terms
+
+    def suggest(self, word: str, max_suggestions: int = 5) -> list[str]:
+        """Suggest vocabulary terms for a misspelled word.
+
+        Known words get no suggestions. Candidates are ordered by edit
+        distance, then by how often they occur in the library.
+        """
+        word = word.lower()
+        if self.check(word) or not word.isalpha():
+            return []
+
+        max_distance = self.max_edit_distance
+        prefix = word[: self.prefix_length]
+        candidates: set[str] = set()
+        for key in self._deletes_of(prefix):
+            candidates.update(self.deletes.get(key, ()))
+
+        scored = []
+        for candidate in candidates:
+            distance = edit_distance(word, candidate, max_distance)
+            if distance <= max_distance:
+                scored.append((distance, -self.terms[candidate], candidate))
+
+        scored.sort()
+        return [candidate for _, _, candidate in scored[:max_suggestions]]
+
+    def add_word(self, word: str) -> None:
+        """Add a word to the vocabulary outside of any document."""
+        for term in tokenize(word):
+            self._add_term(term, 1)
+            self._changes.append({"op": "word", "term": term})
+
+    def correct_query(self, query: str) -> tuple[str, list[str]]:
+        """Correct spelling in a query string.
+
+        Returns:
+            Tuple of (corrected query, list of corrections made)
+        """
+        corrected_words = []
+        corrections = []
+        for word in query.split():
+            suggestions = [] if ":" in word else self.suggest(word, 1)
+            if suggestions:
+                corrected_words.append(suggestions[0])
+                corrections.append(f"{word} -> {suggestions[0]}")
+            else:
+                corrected_words.append(word)
+        return " ".join(corrected_words), corrections
+
+    def update_document(self, key: str, text: str) -> None:
+        """Replace the vocabulary contributed by one indexed document."""
+        counts = Counter(
+            word for word in tokenize(text) if len(word) >= self.min_word_length
+        )
+        self._set_document(key, dict(counts))
+        self._changes.append({"op": "doc", "key": key, "counts": dict(counts)})
+
+    def update_documents(self, texts: Iterable[tuple[str, str]]) -> None:
+        """Replace the vocabulary of several documents."""
+        for key, text in texts:
+            self.update_document(key, text)
+
+    def remove_document(self, key: str) -> None:
+        """Forget the vocabulary contributed by a removed document."""
+        if self._drop_document(key):
+            self._changes.append({"op": "remove", "key": key})
+
+    def clear(self) -> None:
+        """Forget the whole vocabulary."""
+        # Nothing persisted survives a clear, so there is nothing to load
+        self._loaded = True
+        self._terms.clear()
+        self._documents.clear()
+        self._deletes.clear()
+        self._changes.clear()
+        self._rewrite = True
+
+    def save(self) -> None:
+        """Persist changes since the last save.
+
+        Changed documents are appended to the log; the snapshot is
+        rewritten only after a clear or once the log outgrows it.
+        """
+        if not self.path or not (self._changes or self._rewrite):
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        records = self._log_records + len(self._changes)
+        if (
+            self._rewrite
+            or not self.path.exists()
+            or records > max(LOG_COMPACT_MIN, len(self._documents))
+        ):
+            self._write_snapshot()
+        else:
+            with open(self.log_path, "a") as f:
+                f.writelines(json.dumps(change) + "\n" for change in self._changes)
+            self._log_records = records
+        self._changes.clear()
+
+    def _write_snapshot(self) -> None:
+        """Replace the snapshot atomically and start a new change log."""
+        # Dropping the log first means a crash loses changes, which the
+        # engine refills as missing vocabulary, instead of replaying old
+        # changes onto a newer snapshot
+        self.log_path.unlink(missing_ok=True)
+        state = _State(
+            version=SPELLING_FORMAT_VERSION,
+            max_edit_distance=self.max_edit_distance,
+            prefix_length=self.prefix_length,
+            terms=dict(self._terms),
+            documents=self._documents,
+            deletes=self._deletes,
+        )
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with open(temp_fd, "wb") as f:
+                f.write(msgspec.msgpack.encode(state))
+            Path(temp_path).replace(self.path)
+        except Exception:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self._rewrite = False
+        self._log_records = 0
+
+    def _set_document(self, key: str, counts: dict[str, int]) -> None:
+        """Replace the term counts of one document."""
+        self._drop_document(key)
+        for term, count in counts.items():
+            self._add_term(term, count)
+        self.documents[key] = counts
+
+    def _drop_document(self, key: str) -> bool:
+        """Remove a document's term counts, returning whether it was known."""
+        counts = self.documents.pop(key, None)
+        if counts is None:
+            return False
+        for term, count in counts.items():
+            remaining = self._terms[term] - count
+            if remaining > 0:
+                self._terms[term] = remaining
+            else:
+                self._remove_term(term)
+        return True
+
+    def _add_term(self, term: str, count: int) -> None:
+        """Count occurrences of a term, indexing its deletes if new."""
+        if term not in self.terms:
+            for key in self._deletes_of(term[: self.prefix_length]):
+                self._deletes.setdefault(key, []).append(term)
+        self._terms[term] += count
+
+    def _remove_term(self, term: str) -> None:
+        """Drop a term and its entries in the delete index."""
+        del self._terms[term]
+        for key in self._deletes_of(term[: self.prefix_length]):
+            bucket = self._deletes.get(key)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(term)
+            except ValueError:
+                continue
+            if not bucket:
+                del self._deletes[key]
+
+    def _deletes_of(self, word: str) -> set[str]:
+        """The word and all strings within ``max_edit_distance`` deletes."""
+        results = {word}
+        frontier = {word}
+        for _ in range(self.max_edit_distance):
+            next_frontier = set()
+            for item in frontier:
+                if len(item) <= 1:
+                    continue
+                for i in range(len(item)):
+                    next_frontier.add(item[:i] + item[i + 1 :])
+            next_frontier -= results
+            results |= next_frontier
+            frontier = next_frontier
+        return results
+
+    def _ensure_loaded(self) -> None:
+        """Read the persisted state on first use."""
+        if not self._loaded:
+            self._loaded = True
+            self._load()
+
+    def _load(self) -> None:
+        """Load persisted state written with the same settings."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            state = msgspec.msgpack.decode(self.path.read_bytes(), type=_State)
+        except (OSError, msgspec.DecodeError):
+            self._rewrite = True
+            return
+
+        if (
+            state.version != SPELLING_FORMAT_VERSION
+            or state.max_edit_distance != self.max_edit_distance
+            or state.prefix_length != self.prefix_length
+        ):
+            # The log holds changes relative to the discarded snapshot
+            self._rewrite = True
+            return
+
+        self._terms = Counter(state.terms)
+        self._documents = state.documents
+        self._deletes = state.deletes
+        self._replay_log()
+
+    def _replay_log(self) -> None:
+        """Apply logged changes on top of the snapshot, skipping torn lines."""
+        if not self.log_path.exists():
+            return
+        with open(self.log_path) as f:
+            for line in f:
+                try:
+                    change = json.loads(line)
+                    op = change["op"]
+                    if op == "doc":
+                        self._set_document(change["key"], change["counts"])
+                    elif op == "remove":
+                        self._drop_document(change["key"])
+                    elif op == "word":
+                        self._add_term(change["term"], 1)
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    continue
+                self._log_records += 1
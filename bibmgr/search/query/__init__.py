@@ -12,6 +12,7 @@ from .parser import (
     TermQuery,
     WildcardQuery,
 )
+from .planner import PlanCache, QueryPlan
 
 __all__ = [
     "QueryParser",
@@ -25,4 +26,6 @@ __all__ = [
     "RangeQuery",
     "QueryExpander",
     "QuerySuggestion",
+    "QueryPlan",
+    "PlanCache",
 ]
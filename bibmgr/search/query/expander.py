@@ -52,7 +52,9 @@ class QueryExpander:
             spell_checker: Optional custom spell checker
             synonym_expander: Optional custom synonym expander
         """
-        self.spell_checker = spell_checker or SpellChecker()
+        self.spell_checker = (
+            spell_checker if spell_checker is not None else SpellChecker()
+        )
         self.synonym_expander = synonym_expander or SynonymExpander()
 
         # Common field expansions for better recall
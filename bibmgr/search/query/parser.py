@@ -2,6 +2,8 @@
 
 import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 
@@ -26,9 +28,13 @@ class BooleanOperator(Enum):
     NOT = "NOT"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedQuery(ABC):
-    """Base class for parsed query objects."""
+    """Base class for parsed query objects.
+
+    Queries are immutable, so parsed and compiled queries can be cached
+    and shared between searches.
+    """
 
     @property
     @abstractmethod
@@ -47,7 +53,7 @@ class ParsedQuery(ABC):
         pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class TermQuery(ParsedQuery):
     """Simple term query."""
 
@@ -67,7 +73,7 @@ class TermQuery(ParsedQuery):
         return [self.term]
 
 
-@dataclass
+@dataclass(frozen=True)
 class PhraseQuery(ParsedQuery):
     """Exact phrase query."""
 
@@ -91,7 +97,7 @@ class PhraseQuery(ParsedQuery):
         return self.phrase.split()
 
 
-@dataclass
+@dataclass(frozen=True)
 class FieldQuery(ParsedQuery):
     """Field-specific query."""
 
@@ -109,14 +115,17 @@ class FieldQuery(ParsedQuery):
         return self.query.get_terms()
 
 
-@dataclass
+@dataclass(frozen=True)
 class BooleanQuery(ParsedQuery):
     """Boolean combination of queries."""
 
     operator: BooleanOperator
-    queries: list[ParsedQuery]
+    queries: Sequence[ParsedQuery]
     minimum_should_match: int | None = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "queries", tuple(self.queries))
+
     @property
     def query_type(self) -> QueryType:
         return QueryType.BOOLEAN
@@ -143,7 +152,7 @@ class BooleanQuery(ParsedQuery):
         return terms
 
 
-@dataclass
+@dataclass(frozen=True)
 class WildcardQuery(ParsedQuery):
     """Wildcard pattern query."""
 
@@ -164,7 +173,7 @@ class WildcardQuery(ParsedQuery):
         return [part for part in parts if part]
 
 
-@dataclass
+@dataclass(frozen=True)
 class FuzzyQuery(ParsedQuery):
     """Fuzzy/approximate match query."""
 
@@ -189,7 +198,7 @@ class FuzzyQuery(ParsedQuery):
         return [self.term]
 
 
-@dataclass
+@dataclass(frozen=True)
 class RangeQuery(ParsedQuery):
     """Range query for numeric or date fields."""
 
@@ -226,9 +235,15 @@ class RangeQuery(ParsedQuery):
 
 
 class QueryParser:
-    """Parser for search query strings."""
+    """Parser for search query strings.
+
+    Parsed queries are cached by query string, so repeated searches skip
+    the regex passes; queries are immutable, so sharing them is safe.
+    """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 256):
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, ParsedQuery] = OrderedDict()
         self.field_pattern = re.compile(r"(\w+):")
         self.phrase_pattern = re.compile(r'"([^"]*)"(?:~(\d+))?(?:\^([\d.]+))?')
         self.fuzzy_pattern = re.compile(r"(\w+)~(\d+)?(?:\^([\d.]+))?")
@@ -253,6 +268,20 @@ class QueryParser:
 
         query_string = query_string.strip()
 
+        cached = self._cache.get(query_string)
+        if cached is not None:
+            self._cache.move_to_end(query_string)
+            return cached
+
+        parsed = self._parse_uncached(query_string)
+        if self.cache_size > 0:
+            self._cache[query_string] = parsed
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return parsed
+
+    def _parse_uncached(self, query_string: str) -> ParsedQuery:
+        """Run the parsing passes over a stripped query string."""
         boolean_query = self._parse_boolean_query(query_string)
         if boolean_query:
             return boolean_query
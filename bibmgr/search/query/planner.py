@@ -0,0 +1,341 @@
+"""Compiled query plans with cost-based evaluation order.
+
+A parsed query is compiled once into a tree of plan nodes: field
+restrictions are pushed down to the leaves, nested AND/OR groups are
+flattened and empty terms are dropped. At execution time the backend
+estimates the size of every leaf, AND children run smallest first with the
+candidates narrowed after each step, NOT evaluates its negative side only
+over the documents the positive side matched, and empty branches
+short-circuit the rest of their group.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from .parser import (
+    BooleanOperator,
+    BooleanQuery,
+    FieldQuery,
+    FuzzyQuery,
+    ParsedQuery,
+    PhraseQuery,
+    RangeQuery,
+    TermQuery,
+    WildcardQuery,
+)
+
+# Leaf operators evaluated by the backend
+LEAF_OPS = frozenset({"term", "phrase", "wildcard", "range"})
+
+
+@dataclass(frozen=True)
+class PlanNode:
+    """One step of a compiled query plan."""
+
+    op: str  # "term", "phrase", "wildcard", "range", "and", "or", "not", "empty"
+    query: ParsedQuery | None = None
+    fields: tuple[str, ...] = ()
+    terms: tuple[str, ...] = ()
+    children: tuple["PlanNode", ...] = ()
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.op in LEAF_OPS
+
+    def describe(self) -> str:
+        """One-line description of the node."""
+        if self.op in ("and", "or", "not"):
+            return self.op.upper()
+        if self.op == "empty":
+            return "EMPTY"
+        text = self.query.to_string() if self.query is not None else ""
+        if self.fields:
+            return f"{self.op.upper()} {text} in {','.join(self.fields)}"
+        return f"{self.op.upper()} {text}"
+
+
+@dataclass
+class NodeProfile:
+    """Estimated and actual cost of one executed plan node."""
+
+    node: PlanNode
+    estimate: int
+    matches: int = 0
+    seconds: float = 0.0
+    skipped: bool = False
+    children: list["NodeProfile"] = field(default_factory=list)
+
+
+class PlanEvaluator(Protocol):
+    """Backend side of plan execution."""
+
+    def estimate_node(self, node: PlanNode) -> int:
+        """Upper bound on the documents a leaf can match (0: none)."""
+        ...
+
+    def evaluate_node(
+        self, node: PlanNode, candidates: set[str] | None
+    ) -> dict[str, float]:
+        """Scores of the documents a leaf matches, limited to candidates."""
+        ...
+
+
+class QueryPlan:
+    """Executable plan for one parsed query."""
+
+    def __init__(self, root: PlanNode):
+        self.root = root
+
+    @classmethod
+    def compile(
+        cls, query: ParsedQuery | None, fields: tuple[str, ...] = ()
+    ) -> "QueryPlan":
+        """Compile a parsed query searched in the given fields."""
+        return cls(_compile(query, tuple(fields)))
+
+    def execute(
+        self,
+        evaluator: PlanEvaluator,
+        candidates: set[str] | None = None,
+        profile: list[NodeProfile] | None = None,
+    ) -> dict[str, float]:
+        """Run the plan.
+
+        Args:
+            evaluator: Backend estimating and evaluating leaves
+            candidates: Restrict matches to these documents
+            profile: Receives the profile of the root node when given
+
+        Returns:
+            Mapping of matching document keys to scores
+        """
+        return _run(self.root, evaluator, candidates, profile)
+
+    def explain(self, profile: NodeProfile | None = None) -> str:
+        """Render the plan, with estimates and timings when profiled."""
+        lines: list[str] = []
+        if profile is None:
+            _describe_node(self.root, 0, lines)
+        else:
+            _describe_profile(profile, 0, lines)
+        return "\n".join(lines)
+
+
+class PlanCache:
+    """Bounded LRU of compiled plans keyed by query and fields.
+
+    Queries and plan nodes are immutable, so one plan can serve every
+    search for an equal query.
+    """
+
+    def __init__(self, size: int = 256):
+        self.size = size
+        self._plans: OrderedDict[tuple[ParsedQuery, tuple[str, ...]], QueryPlan] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query: ParsedQuery, fields: tuple[str, ...] = ()) -> QueryPlan:
+        """Get the plan for a query, compiling it on first use."""
+        key = (query, tuple(fields))
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            self.hits += 1
+            return plan
+
+        self.misses += 1
+        plan = QueryPlan.compile(query, tuple(fields))
+        self._plans[key] = plan
+        if len(self._plans) > self.size:
+            self._plans.popitem(last=False)
+        return plan
+
+    def clear(self) -> None:
+        """Drop all compiled plans."""
+        self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+
+def _compile(query: ParsedQuery | None, fields: tuple[str, ...]) -> PlanNode:
+    """Compile a query node with the fields in effect."""
+    if isinstance(query, TermQuery):
+        terms = tuple(query.term.split())
+        if not terms:
+            return PlanNode("empty", query)
+        return PlanNode("term", query, fields, terms)
+
+    if isinstance(query, FuzzyQuery):
+        # Matched on the exact term; fuzziness is left to query expansion
+        return PlanNode("term", query, fields, (query.term,))
+
+    if isinstance(query, PhraseQuery):
+        return PlanNode("phrase", query, fields)
+
+    if isinstance(query, WildcardQuery):
+        return PlanNode("wildcard", query, fields)
+
+    if isinstance(query, RangeQuery):
+        return PlanNode("range", query, fields)
+
+    if isinstance(query, FieldQuery):
+        return _compile(query.query, (query.field,))
+
+    if isinstance(query, BooleanQuery):
+        if query.operator == BooleanOperator.NOT:
+            if len(query.queries) < 2:
+                return PlanNode("empty", query)
+            positive, negative = query.queries[0], query.queries[1]
+            return PlanNode(
+                "not",
+                query,
+                fields,
+                children=(_compile(positive, fields), _compile(negative, fields)),
+            )
+
+        op = "and" if query.operator == BooleanOperator.AND else "or"
+        children: list[PlanNode] = []
+        for subquery in query.queries:
+            child = _compile(subquery, fields)
+            if child.op == op:
+                children.extend(child.children)
+            elif child.op == "empty" and op == "or":
+                continue
+            else:
+                children.append(child)
+
+        if op == "and" and any(child.op == "empty" for child in children):
+            return PlanNode("empty", query)
+        if not children:
+            return PlanNode("empty", query)
+        if len(children) == 1:
+            return children[0]
+        return PlanNode(op, query, fields, children=tuple(children))
+
+    return PlanNode("empty", query)
+
+
+def _estimate(node: PlanNode, evaluator: PlanEvaluator) -> int:
+    """Upper bound on the documents a node can match."""
+    if node.is_leaf:
+        return evaluator.estimate_node(node)
+    if node.op == "and":
+        return min(_estimate(child, evaluator) for child in node.children)
+    if node.op == "or":
+        return sum(_estimate(child, evaluator) for child in node.children)
+    if node.op == "not":
+        return _estimate(node.children[0], evaluator)
+    return 0
+
+
+def _run(
+    node: PlanNode,
+    evaluator: PlanEvaluator,
+    candidates: set[str] | None,
+    profile: list[NodeProfile] | None,
+    estimate: int | None = None,
+) -> dict[str, float]:
+    """Execute a node, recording its profile when requested."""
+    record = None
+    if profile is not None:
+        if estimate is None:
+            estimate = _estimate(node, evaluator)
+        record = NodeProfile(node, estimate)
+        profile.append(record)
+        start = time.perf_counter()
+    children_profile = record.children if record is not None else None
+
+    if node.is_leaf:
+        results = evaluator.evaluate_node(node, candidates)
+    elif node.op == "and":
+        results = _run_and(node, evaluator, candidates, children_profile)
+    elif node.op == "or":
+        results = {}
+        for child in node.children:
+            for key, score in _run(
+                child, evaluator, candidates, children_profile
+            ).items():
+                results[key] = results.get(key, 0.0) + score
+    elif node.op == "not":
+        results = _run(node.children[0], evaluator, candidates, children_profile)
+        if results:
+            excluded = _run(node.children[1], evaluator, set(results), children_profile)
+            results = {k: v for k, v in results.items() if k not in excluded}
+        elif children_profile is not None:
+            _skip(node.children[1], evaluator, children_profile)
+    else:
+        results = {}
+
+    if record is not None:
+        record.matches = len(results)
+        record.seconds = time.perf_counter() - start
+    return results
+
+
+def _run_and(
+    node: PlanNode,
+    evaluator: PlanEvaluator,
+    candidates: set[str] | None,
+    profile: list[NodeProfile] | None,
+) -> dict[str, float]:
+    """Intersect children from the smallest estimate up."""
+    ordered = sorted(
+        (
+            (_estimate(child, evaluator), i, child)
+            for i, child in enumerate(node.children)
+        ),
+        key=lambda item: (item[0], item[1]),
+    )
+
+    results: dict[str, float] | None = None
+    for position, (estimate, _, child) in enumerate(ordered):
+        if estimate == 0 or (results is not None and not results):
+            if profile is not None:
+                for _, _, rest in ordered[position:]:
+                    _skip(rest, evaluator, profile)
+            return {}
+
+        matches = _run(
+            child,
+            evaluator,
+            candidates if results is None else set(results),
+            profile,
+            estimate,
+        )
+        if results is None:
+            results = matches
+        else:
+            results = {
+                key: score + matches[key]
+                for key, score in results.items()
+                if key in matches
+            }
+
+    return results or {}
+
+
+def _skip(node: PlanNode, evaluator: PlanEvaluator, profile: list[NodeProfile]):
+    """Record a node that was not executed."""
+    profile.append(NodeProfile(node, _estimate(node, evaluator), skipped=True))
+
+
+def _describe_node(node: PlanNode, depth: int, lines: list[str]) -> None:
+    lines.append("  " * depth + node.describe())
+    for child in node.children:
+        _describe_node(child, depth + 1, lines)
+
+
+def _describe_profile(record: NodeProfile, depth: int, lines: list[str]) -> None:
+    line = f"{'  ' * depth}{record.node.describe()}  (est={record.estimate}"
+    if record.skipped:
+        line += ", skipped)"
+    else:
+        line += f", matches={record.matches}, {record.seconds * 1000:.3f}ms)"
+    lines.append(line)
+    for child in record.children:
+        _describe_profile(child, depth + 1, lines)
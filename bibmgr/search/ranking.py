@@ -4,13 +4,51 @@ This module provides various ranking algorithms including BM25, TF-IDF,
 and custom scoring functions to order search results by relevance.
 """
 
+import heapq
 import math
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any, TypeVar
 
 from .backends.base import SearchMatch
 
+T = TypeVar("T")
+
+
+def select_top(
+    items: Iterable[T],
+    limit: int | None,
+    key: Callable[[T], Any],
+    reverse: bool = True,
+) -> list[T]:
+    """Select the first ``limit`` items in sorted order without a full sort.
+
+    Uses a bounded heap, so selecting k of n items costs O(n log k).
+    Ties keep their input order, exactly as a stable sort would.
+
+    Args:
+        items: Items to select from
+        limit: Number of items to keep (None: all of them, sorted)
+        key: Sort key
+        reverse: Largest keys first (default) or smallest first
+
+    Returns:
+        Selected items in sorted order
+    """
+    if limit is None:
+        return sorted(items, key=key, reverse=reverse)
+    if limit <= 0:
+        return []
+    if reverse:
+        return heapq.nlargest(limit, items, key=key)
+    return heapq.nsmallest(limit, items, key=key)
+
+
+def _match_score(match: SearchMatch) -> float:
+    return match.score
+
 
 @dataclass
 class FieldWeights:
@@ -78,6 +116,7 @@ class RankingAlgorithm(ABC):
         matches: list[SearchMatch],
         query_terms: list[str],
         context: ScoringContext,
+        limit: int | None = None,
     ) -> list[SearchMatch]:
         """Rank matches by relevance.
 
@@ -85,6 +124,7 @@ class RankingAlgorithm(ABC):
             matches: List of matches to rank
             query_terms: List of query terms
             context: Scoring context
+            limit: Return only the best ``limit`` matches
 
         Returns:
             List of matches sorted by relevance (highest first)
@@ -253,6 +293,7 @@ class BM25Ranker(RankingAlgorithm):
         matches: list[SearchMatch],
         query_terms: list[str],
         context: ScoringContext,
+        limit: int | None = None,
     ) -> list[SearchMatch]:
         """Rank matches using BM25."""
         # Score each match
@@ -260,7 +301,7 @@ class BM25Ranker(RankingAlgorithm):
             match.score = self.score(match, query_terms, context)
 
         # Sort by score descending
-        return sorted(matches, key=lambda m: m.score, reverse=True)
+        return select_top(matches, limit, _match_score)
 
 
 class TFIDFRanker(RankingAlgorithm):
@@ -319,12 +360,13 @@ class TFIDFRanker(RankingAlgorithm):
         matches: list[SearchMatch],
         query_terms: list[str],
         context: ScoringContext,
+        limit: int | None = None,
     ) -> list[SearchMatch]:
         """Rank matches using TF-IDF."""
         for match in matches:
             match.score = self.score(match, query_terms, context)
 
-        return sorted(matches, key=lambda m: m.score, reverse=True)
+        return select_top(matches, limit, _match_score)
 
 
 class BoostingRanker(RankingAlgorithm):
@@ -353,12 +395,13 @@ class BoostingRanker(RankingAlgorithm):
         matches: list[SearchMatch],
         query_terms: list[str],
         context: ScoringContext,
+        limit: int | None = None,
     ) -> list[SearchMatch]:
         """Rank with boosting."""
         for match in matches:
             match.score = self.score(match, query_terms, context)
 
-        return sorted(matches, key=lambda m: m.score, reverse=True)
+        return select_top(matches, limit, _match_score)
 
 
 class RecencyRanker(RankingAlgorithm):
@@ -418,12 +461,13 @@ class RecencyRanker(RankingAlgorithm):
         matches: list[SearchMatch],
         query_terms: list[str],
         context: ScoringContext,
+        limit: int | None = None,
     ) -> list[SearchMatch]:
         """Rank with recency adjustment."""
         for match in matches:
             match.score = self.score(match, query_terms, context)
 
-        return sorted(matches, key=lambda m: m.score, reverse=True)
+        return select_top(matches, limit, _match_score)
 
 
 class CompoundRanker(RankingAlgorithm):
@@ -469,9 +513,10 @@ class CompoundRanker(RankingAlgorithm):
         matches: list[SearchMatch],
         query_terms: list[str],
         context: ScoringContext,
+        limit: int | None = None,
     ) -> list[SearchMatch]:
         """Rank using weighted combination."""
         for match in matches:
             match.score = self.score(match, query_terms, context)
 
-        return sorted(matches, key=lambda m: m.score, reverse=True)
+        return select_top(matches, limit, _match_score)
@@ -6,6 +6,7 @@ from typing import Any
 
 from ..core.models import Entry as BibEntry
 from .backends.base import SearchMatch
+from .ranking import select_top
 
 
 class SortOrder(Enum):
@@ -50,8 +51,7 @@ class Facet:
 
     def get_top_values(self, limit: int = 10) -> list[FacetValue]:
         """Get top N facet values by count."""
-        sorted_values = sorted(self.values, key=lambda x: x.count, reverse=True)
-        return sorted_values[:limit]
+        return select_top(self.values, limit, key=lambda x: x.count)
 
 
 @dataclass
@@ -201,26 +201,31 @@ class SearchResultCollection:
             sort_order=self.sort_order,
         )
 
-    def sort_by(self, sort_order: SortOrder) -> "SearchResultCollection":
-        """Sort results by specified order."""
-        sorted_matches = self.matches.copy()
-
-        if sort_order == SortOrder.RELEVANCE:
-            sorted_matches.sort(key=lambda x: x.score, reverse=True)
-        elif sort_order == SortOrder.DATE_DESC:
-            sorted_matches.sort(key=lambda x: self._get_sort_key_date(x), reverse=True)
-        elif sort_order == SortOrder.DATE_ASC:
-            sorted_matches.sort(key=lambda x: self._get_sort_key_date(x))
-        elif sort_order == SortOrder.TITLE_ASC:
-            sorted_matches.sort(key=lambda x: self._get_sort_key_title(x))
-        elif sort_order == SortOrder.TITLE_DESC:
-            sorted_matches.sort(key=lambda x: self._get_sort_key_title(x), reverse=True)
-        elif sort_order == SortOrder.AUTHOR_ASC:
-            sorted_matches.sort(key=lambda x: self._get_sort_key_author(x))
-        elif sort_order == SortOrder.AUTHOR_DESC:
-            sorted_matches.sort(
-                key=lambda x: self._get_sort_key_author(x), reverse=True
-            )
+    def sort_by(
+        self, sort_order: SortOrder, limit: int | None = None
+    ) -> "SearchResultCollection":
+        """Sort results by specified order.
+
+        Args:
+            sort_order: Order to sort by
+            limit: Keep only the first ``limit`` matches, selected without
+                sorting the rest (total is unchanged)
+        """
+        sort_keys = {
+            SortOrder.RELEVANCE: (lambda x: x.score, True),
+            SortOrder.DATE_DESC: (self._get_sort_key_date, True),
+            SortOrder.DATE_ASC: (self._get_sort_key_date, False),
+            SortOrder.TITLE_ASC: (self._get_sort_key_title, False),
+            SortOrder.TITLE_DESC: (self._get_sort_key_title, True),
+            SortOrder.AUTHOR_ASC: (self._get_sort_key_author, False),
+            SortOrder.AUTHOR_DESC: (self._get_sort_key_author, True),
+        }
+
+        if sort_order in sort_keys:
+            key, reverse = sort_keys[sort_order]
+            sorted_matches = select_top(self.matches, limit, key, reverse)
+        else:
+            sorted_matches = self.matches[:limit]
 
         return SearchResultCollection(
             matches=sorted_matches,
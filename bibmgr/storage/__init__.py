@@ -28,7 +28,14 @@ from bibmgr.storage.eventrepository import (
 )
 
 # Event system
-from bibmgr.storage.events import Event, EventBus, EventPublisher, EventType
+from bibmgr.storage.events import (
+    Event,
+    EventBus,
+    EventBusMetrics,
+    EventPublisher,
+    EventType,
+    coalesce_events,
+)
 
 # Import/Export
 from bibmgr.storage.importers.bibtex import BibtexImporter
@@ -44,6 +51,9 @@ from bibmgr.storage.indexing import (
     WhooshIndexBackend,
 )
 
+# Change journal
+from bibmgr.storage.journal import ChangeJournal, JournalChanges
+
 # Metadata management
 from bibmgr.storage.metadata import EntryMetadata, MetadataStore, Note
 
@@ -71,6 +81,9 @@ from bibmgr.storage.repository import (
     StorageBackend,
 )
 
+# Columnar snapshot
+from bibmgr.storage.snapshot import LibrarySnapshot
+
 __all__ = [
     # Backends
     "BaseBackend",
@@ -93,7 +106,14 @@ __all__ = [
     "EventType",
     "Event",
     "EventBus",
+    "EventBusMetrics",
     "EventPublisher",
+    "coalesce_events",
+    # Journal
+    "ChangeJournal",
+    "JournalChanges",
+    # Snapshot
+    "LibrarySnapshot",
     # Metadata
     "Note",
     "EntryMetadata",
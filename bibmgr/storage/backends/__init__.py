@@ -7,10 +7,11 @@ Provides unified interface for different storage mechanisms:
 - **MemoryBackend**: In-memory storage for testing
 - **CachedBackend**: LRU cache wrapper for performance
 
-All backends support CRUD operations and optional transactions.
+All backends support CRUD operations, sorted prefix lookups of keys and
+optional transactions.
 """
 
-from .base import BaseBackend, CachedBackend
+from .base import BaseBackend, CachedBackend, SortedKeyIndex
 from .filesystem import FileSystemBackend
 from .memory import MemoryBackend
 from .sqlite import SQLiteBackend
@@ -21,4 +22,5 @@ __all__ = [
     "FileSystemBackend",
     "MemoryBackend",
     "SQLiteBackend",
+    "SortedKeyIndex",
 ]
@@ -1,10 +1,107 @@
 """Base storage backend interface."""
 
+import string
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from bisect import bisect_left
+from collections.abc import Container, Iterable, Iterator
 from contextlib import contextmanager
 from typing import Any
 
+# Suffixes tried in order when a key is taken: a-z, then 2-99
+KEY_SUFFIXES = (*string.ascii_lowercase, *(str(i) for i in range(2, 100)))
+
+
+def first_free_key(base: str, taken: Container[str]) -> str | None:
+    """First of ``base`` plus a suffix that is not taken, None if all are."""
+    for suffix in KEY_SUFFIXES:
+        candidate = f"{base}{suffix}"
+        if candidate not in taken:
+            return candidate
+    return None
+
+
+class SortedKeyIndex:
+    """Keys kept in sorted order for bisect-based prefix ranges.
+
+    Adds and removals are buffered and merged into the sorted list on the
+    next ordered read, so loading keys one at a time costs one sort
+    instead of a list insertion per key.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self._keys = sorted(set(keys))
+        self._added: set[str] = set()
+        self._removed: set[str] = set()
+
+    def __len__(self) -> int:
+        self._merge()
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        self._merge()
+        return iter(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        if key in self._added:
+            return True
+        return key not in self._removed and self._in_sorted(key)
+
+    def add(self, key: str) -> None:
+        """Insert a key, keeping the order."""
+        if key in self._removed:
+            self._removed.discard(key)
+        elif not self._in_sorted(key):
+            self._added.add(key)
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Insert several keys."""
+        for key in keys:
+            self.add(key)
+
+    def discard(self, key: str) -> None:
+        """Remove a key if present."""
+        if key in self._added:
+            self._added.discard(key)
+        elif self._in_sorted(key):
+            self._removed.add(key)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._added.clear()
+        self._removed.clear()
+
+    def with_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Sorted keys starting with prefix, at most limit of them."""
+        self._merge()
+        keys = self._keys
+        result = []
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and keys[i].startswith(prefix):
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(keys[i])
+            i += 1
+        return result
+
+    def _in_sorted(self, key: str) -> bool:
+        """Whether the sorted list holds key, ignoring buffered changes."""
+        i = bisect_left(self._keys, key)
+        return i < len(self._keys) and self._keys[i] == key
+
+    def _merge(self) -> None:
+        """Apply buffered adds and removals to the sorted list."""
+        if self._removed:
+            removed = self._removed
+            self._keys = [key for key in self._keys if key not in removed]
+            self._removed = set()
+        if self._added:
+            # Two sorted runs: the sort merges them in linear time
+            self._keys.extend(sorted(self._added))
+            self._keys.sort()
+            self._added = set()
+
 
 class BaseBackend(ABC):
     """Abstract base class for storage backends."""
@@ -49,6 +146,38 @@ class BaseBackend(ABC):
         """Close backend connections."""
         pass
 
+    def keys_with_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Sorted keys starting with prefix, at most limit of them.
+
+        Backends that keep their keys ordered override this with a range
+        lookup; the default sorts ``keys()``.
+        """
+        return SortedKeyIndex(self.keys()).with_prefix(prefix, limit)
+
+    def next_free_key(self, base: str) -> str | None:
+        """First unused key of base followed by a-z, then 2-99."""
+        return first_free_key(base, set(self.keys_with_prefix(base)))
+
+    def read_many(self, keys: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Read several keys; missing keys are left out."""
+        records = {}
+        for key in keys:
+            data = self.read(key)
+            if data is not None:
+                records[key] = data
+        return records
+
+    def write_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Write several keys in one transaction."""
+        with self.begin_transaction():
+            for key, data in items:
+                self.write(key, data)
+
+    def delete_many(self, keys: Iterable[str]) -> list[str]:
+        """Delete several keys in one transaction and return those deleted."""
+        with self.begin_transaction():
+            return [key for key in keys if self.delete(key)]
+
     def supports_transactions(self) -> bool:
         """Check if backend supports transactions."""
         return False
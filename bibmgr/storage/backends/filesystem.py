@@ -2,33 +2,95 @@
 
 import fcntl
 import json
+import os
 import shutil
 import tempfile
 import threading
+import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
-from .base import CachedBackend
+from ..codec import (
+    decode_entry,
+    decode_projection,
+    encode_entry,
+    project,
+    projection_type,
+    upgrade_entry,
+)
+from .base import CachedBackend, SortedKeyIndex
+from .packed import PackedSegment
+
+BATCH_LOG = "records.jsonl"
+PACK_FILE = "entries.pack"
+# Keys written or deleted since the pack was built, one JSON string a line
+PACK_LOG = "entries.pack.log"
+
+# Full scans rewrite the pack once more than this share of it has changed
+PACK_OVERLAY_RATIO = 0.1
+
+# Applied batch logs kept before a checkpoint syncs their files and drops them
+CHECKPOINT_BATCHES = 64
 
 
 class FileSystemBackend(CachedBackend):
-    """Simple file-based storage using JSON files."""
+    """Simple file-based storage using JSON files.
+
+    ``index.json`` maps every stored key to its file and is the source of
+    truth for which keys exist; a sorted copy of its keys answers key
+    listings and prefix lookups without touching the entry files.
+
+    Writes inside a transaction are staged in memory. On commit they are
+    written as one write-ahead log into ``batches/<id>.tmp``, synced once
+    and committed by renaming the directory to ``batches/<id>``; only then
+    are the entry files and the index updated, without further syncs.
+    Committed logs stay until a checkpoint, run on startup, on ``close()``
+    or once ``CHECKPOINT_BATCHES`` logs have piled up, syncs every file
+    they touched and removes them; a log is replayed on startup if the
+    process died before that, and an uncommitted one is discarded. Logs
+    awaiting a checkpoint never share keys, so they replay in any order.
+
+    Bulk reads go through ``entries.pack``, a memory-mapped segment of all
+    records re-encoded by ``storage.codec``. Every write and delete appends
+    its key to ``entries.pack.log``; those keys form an overlay read from
+    the entry files instead of the pack. A full scan rewrites the pack only
+    once the overlay outgrows ``PACK_OVERLAY_RATIO`` of it. Entry files
+    edited by hand, outside the backend, are found by their modification
+    time being later than the pack build and read from the file as well.
+    """
 
     def __init__(self, data_dir: Path, cache_size: int = 1000):
         super().__init__(cache_size)
         self.data_dir = Path(data_dir)
         self.entries_dir = self.data_dir / "entries"
         self.index_file = self.data_dir / "index.json"
+        self.batches_dir = self.data_dir / "batches"
+        self.pack_file = self.data_dir / PACK_FILE
+        self.pack_log = self.data_dir / PACK_LOG
+        self._segment: PackedSegment | None = None
+        # Keys changed since the mapped pack was built, read from the log
+        # up to byte _overlay_end
+        self._overlay: set[str] = set()
+        self._overlay_end = 0
         self._index: dict[str, str] = {}
+        self._sorted_keys = SortedKeyIndex()
         self._index_lock = threading.RLock()  # Allow re-entrant locking
+        # Staged changes of the open transaction: key -> (filename, data),
+        # data None for deletes
+        self._batch: dict[str, tuple[str, dict[str, Any] | None]] | None = None
+        # Applied batch logs awaiting a checkpoint, with the keys they touched
+        self._unsynced: dict[Path, set[str]] = {}
         self.initialize()
 
     def initialize(self) -> None:
-        """Create directory structure and load index."""
+        """Create directory structure, load index and recover batches."""
         self.entries_dir.mkdir(parents=True, exist_ok=True)
         self._load_index()
         if not self.index_file.exists():
             self._save_index()
+        self._recover_batches()
 
     def _load_index(self) -> None:
         """Load the index mapping keys to filenames."""
@@ -38,6 +100,8 @@ class FileSystemBackend(CachedBackend):
                     self._index = json.load(f)
             except (OSError, json.JSONDecodeError):
                 self._index = {}
+        # Saved with sort_keys, so this is a linear pass
+        self._sorted_keys = SortedKeyIndex(self._index)
 
     def _save_index(self) -> None:
         """Save the index atomically."""
@@ -51,6 +115,139 @@ class FileSystemBackend(CachedBackend):
             Path(temp_path).unlink(missing_ok=True)
             raise
 
+    def supports_transactions(self) -> bool:
+        """Filesystem backend supports transactions through batches."""
+        return True
+
+    @contextmanager
+    def begin_transaction(self) -> Iterator[None]:
+        """Stage writes and deletes, then commit them as one batch.
+
+        Other threads wait until the transaction ends; nested transactions
+        join the outer one.
+        """
+        with self._index_lock:
+            if self._batch is not None:
+                yield
+                return
+
+            self._batch = {}
+            try:
+                yield
+                batch, self._batch = self._batch, None
+                self._commit_batch(batch)
+            except BaseException:
+                self._batch = None
+                self._load_index()
+                raise
+            finally:
+                self._read_cache.cache_clear()
+
+    def _commit_batch(
+        self, batch: dict[str, tuple[str, dict[str, Any] | None]]
+    ) -> None:
+        """Log, commit and apply staged changes."""
+        if not batch:
+            return
+
+        # A later log must not be replayed before an earlier one with the
+        # same keys, so those are made durable and retired first
+        self._checkpoint(batch)
+
+        self.batches_dir.mkdir(exist_ok=True)
+        name = uuid.uuid4().hex
+        staging = self.batches_dir / f"{name}.tmp"
+        staging.mkdir()
+        with open(staging / BATCH_LOG, "w") as f:
+            for key, (filename, data) in batch.items():
+                f.write(json.dumps([key, filename, data], sort_keys=True) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        # The rename is the commit point
+        committed = self.batches_dir / name
+        staging.rename(committed)
+        _fsync_directory(self.batches_dir)
+
+        self._apply_batch(committed)
+        if len(self._unsynced) >= CHECKPOINT_BATCHES:
+            self._checkpoint()
+
+    def _apply_batch(self, path: Path) -> None:
+        """Apply a committed batch to the entry files and the index.
+
+        Nothing is synced here: the log already is, and stays until a
+        checkpoint has synced what it touched.
+        """
+        with open(path / BATCH_LOG) as f:
+            records = [json.loads(line) for line in f if line.strip()]
+
+        for key, filename, data in records:
+            if data is None:
+                (self.entries_dir / filename).unlink(missing_ok=True)
+                self._index.pop(key, None)
+                self._sorted_keys.discard(key)
+            else:
+                self._write_file(self.entries_dir / filename, data)
+                self._index[key] = filename
+                self._sorted_keys.add(key)
+        self._save_index()
+        keys = [key for key, _, _ in records]
+        self._log_changes(keys)
+        self._unsynced[path] = set(keys)
+
+    def _checkpoint(self, keys: Iterable[str] | None = None) -> None:
+        """Sync the files touched by applied batch logs, then remove the logs.
+
+        Args:
+            keys: Only checkpoint if a pending log touched one of these keys
+                (default: always)
+        """
+        with self._index_lock:
+            if not self._unsynced:
+                return
+            touched = set().union(*self._unsynced.values())
+            if keys is not None and touched.isdisjoint(keys):
+                return
+
+            for key in touched:
+                if filename := self._index.get(key):
+                    _fsync_file(self.entries_dir / filename)
+            _fsync_file(self.index_file)
+            _fsync_file(self.pack_log)
+            # The renames and unlinks must be durable before the logs go;
+            # replaying a log whose changes already landed is harmless
+            _fsync_directory(self.entries_dir)
+            _fsync_directory(self.data_dir)
+            for path in self._unsynced:
+                shutil.rmtree(path, ignore_errors=True)
+            self._unsynced.clear()
+
+    def _recover_batches(self) -> None:
+        """Replay batches committed before a crash, drop uncommitted ones."""
+        if not self.batches_dir.exists():
+            return
+
+        with self._index_lock:
+            for path in sorted(self.batches_dir.iterdir()):
+                if path.suffix == ".tmp":
+                    shutil.rmtree(path, ignore_errors=True)
+                elif (path / BATCH_LOG).exists():
+                    self._apply_batch(path)
+            self._checkpoint()
+            self._read_cache.cache_clear()
+
+    def _write_file(self, path: Path, data: dict[str, Any]) -> None:
+        """Write a JSON file atomically."""
+        temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with open(temp_fd, "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            Path(temp_path).rename(path)
+        except Exception:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
     def _key_to_filename(self, key: str) -> str:
         """Convert key to safe filename."""
         safe_key = "".join(c if c.isalnum() or c in "-_" else "_" for c in key)
@@ -59,15 +256,16 @@ class FileSystemBackend(CachedBackend):
     def _get_path(self, key: str) -> Path:
         """Get file path for key."""
         with self._index_lock:
-            if key not in self._index:
-                self._index[key] = self._key_to_filename(key)
-            return self.entries_dir / self._index[key]
+            filename = self._index.get(key) or self._key_to_filename(key)
+            return self.entries_dir / filename
 
     def _read_impl(self, key: str) -> dict[str, Any] | None:
         """Read data from file."""
         with self._index_lock:
             if key not in self._index:
                 return None
+            if self._batch is not None and key in self._batch:
+                return self._batch[key][1]
 
         path = self._get_path(key)
         if not path.exists():
@@ -84,23 +282,27 @@ class FileSystemBackend(CachedBackend):
             return None
 
     def _write_impl(self, key: str, data: dict[str, Any]) -> None:
-        """Write data to file atomically."""
+        """Write data to file atomically, or stage it in a transaction."""
+        with self._index_lock:
+            if self._batch is not None:
+                # A JSON round trip snapshots the data and rejects what
+                # could not be written at commit
+                staged = json.loads(json.dumps(data))
+                filename = self._get_path(key).name
+                self._batch[key] = (filename, staged)
+                self._index[key] = filename
+                self._sorted_keys.add(key)
+                return
+
+        self._checkpoint([key])
         path = self._get_path(key)
+        self._write_file(path, data)
 
-        temp_fd, temp_path = tempfile.mkstemp(dir=self.entries_dir, suffix=".tmp")
-        try:
-            with open(temp_fd, "w") as f:
-                json.dump(data, f, indent=2, sort_keys=True)
-
-            Path(temp_path).rename(path)
-
-            with self._index_lock:
-                self._index[key] = path.name
-                self._save_index()
-
-        except Exception:
-            Path(temp_path).unlink(missing_ok=True)
-            raise
+        with self._index_lock:
+            self._index[key] = path.name
+            self._sorted_keys.add(key)
+            self._save_index()
+            self._log_changes([key])
 
     def _delete_impl(self, key: str) -> bool:
         """Delete file."""
@@ -109,32 +311,213 @@ class FileSystemBackend(CachedBackend):
                 return False
 
             path = self._get_path(key)
+            if self._batch is not None:
+                self._batch[key] = (path.name, None)
+                del self._index[key]
+                self._sorted_keys.discard(key)
+                return True
+
+            self._checkpoint([key])
             try:
                 path.unlink()
                 del self._index[key]
+                self._sorted_keys.discard(key)
                 self._save_index()
+                self._log_changes([key])
                 return True
             except OSError:
                 return False
 
+    def read_entries(
+        self, keys: Iterable[str] | None = None, fields: Iterable[str] | None = None
+    ) -> Iterator[Any]:
+        """Yield stored entries, skipping missing or invalid records.
+
+        Records are decoded from the mapped pack unless they changed since
+        it was built, through the backend or in their file; a full scan rewrites a pack with too many changes
+        first. Inside a transaction the staged records are read instead.
+
+        Args:
+            keys: Keys to read in this order (all stored keys when None)
+            fields: Decode only these fields into rows of
+                ``codec.projection_type`` instead of full entries
+        """
+        projection = None if fields is None else tuple(fields)
+        if projection is not None:
+            projection_type(projection)
+        segment, overlay = self._current_segment(rebuild=keys is None)
+        for key in self.keys() if keys is None else keys:
+            data = None
+            if (
+                segment is not None
+                and key not in overlay
+                and not self._edited_since(key, segment)
+            ):
+                data = segment.get(key)
+            try:
+                row = self._decode(key, data, projection)
+            except ValueError:
+                continue
+            if row is not None:
+                yield row
+
+    def _decode(
+        self, key: str, data: memoryview | None, projection: tuple[str, ...] | None
+    ) -> Any:
+        """Entry or row of a packed record, or of the key read from its file."""
+        if data is not None:
+            if projection is None:
+                return decode_entry(data)
+            return decode_projection(data, projection)
+
+        record = self.read(key)
+        if record is None:
+            return None
+        entry = upgrade_entry(record)
+        return entry if projection is None else project(entry, projection)
+
+    def pack(self) -> None:
+        """Rebuild the pack from the entry files and start an empty log."""
+        with self._index_lock:
+            if self._batch is not None:
+                return
+            # A fresh log first: writes racing the rebuild land in it, and
+            # its modification time dates the files the pack was built from
+            _write_empty(self.pack_log)
+            stat = self.pack_log.stat()
+            source = (stat.st_ino, stat.st_mtime_ns)
+            PackedSegment.write(self.pack_file, self._pack_records(), source)
+            self._segment = None
+
+    def _pack_records(self) -> Iterator[tuple[str, bytes]]:
+        """Records of all keys in order, entries in the current encoding."""
+        for key in self._sorted_keys:
+            try:
+                data = self._get_path(key).read_bytes()
+            except OSError:
+                continue
+            try:
+                yield key, encode_entry(decode_entry(data))
+            except ValueError:
+                # Collections and other records are kept as written
+                yield key, data
+
+    def _log_changes(self, keys: list[str]) -> None:
+        """Add keys to the pack overlay; nothing to do without a pack."""
+        if not keys or not self.pack_log.exists():
+            return
+        with open(self.pack_log, "a") as f:
+            f.write("".join(json.dumps(key) + "\n" for key in keys))
+
+    def _current_segment(self, rebuild: bool) -> tuple[PackedSegment | None, set[str]]:
+        """The mapped pack and the keys changed since it was built.
+
+        The segment is None when there is no usable pack. With ``rebuild``
+        a missing pack, or one whose overlay grew too large, is rewritten.
+        Replaced segments are dropped rather than closed, so readers still
+        iterating over them keep a valid mapping.
+        """
+        with self._index_lock:
+            if self._batch is not None:
+                return None, set()
+            segment = self._segment
+            if segment is None or not self._is_mapped(segment):
+                segment = self._segment = self._open_pack()
+                self._overlay = set()
+                self._overlay_end = 0
+            overlay = self._read_overlay(segment)
+            if rebuild and (
+                overlay is None or len(overlay) > len(segment) * PACK_OVERLAY_RATIO
+            ):
+                self.pack()
+                segment = self._segment = self._open_pack()
+                self._overlay = set()
+                self._overlay_end = 0
+                overlay = self._read_overlay(segment)
+            if overlay is None:
+                return None, set()
+            return segment, set(overlay)
+
+    def _read_overlay(self, segment: PackedSegment | None) -> set[str] | None:
+        """Keys logged since the segment was built, None if it is stale.
+
+        Only the log written after the last call is read.
+        """
+        # Packs of older versions were tagged with the state of index.json
+        # or with the log inode alone
+        if segment is None or len(segment.source) != 2:
+            return None
+        inode, _ = segment.source
+        try:
+            with open(self.pack_log, "rb") as f:
+                if os.fstat(f.fileno()).st_ino != inode:
+                    return None
+                f.seek(self._overlay_end)
+                data = f.read()
+        except OSError:
+            return None
+        # A line still being appended is read on the next call
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                self._overlay.add(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        self._overlay_end += len(complete)
+        return self._overlay
+
+    def _edited_since(self, key: str, segment: PackedSegment) -> bool:
+        """Whether the file of key was modified after the segment was built."""
+        try:
+            return self._get_path(key).stat().st_mtime_ns > segment.source[1]
+        except OSError:
+            return True
+
+    def _is_mapped(self, segment: PackedSegment) -> bool:
+        """Whether the segment is the current pack file."""
+        try:
+            return self.pack_file.stat().st_ino == segment.inode
+        except OSError:
+            return False
+
+    def _open_pack(self) -> PackedSegment | None:
+        try:
+            return PackedSegment(self.pack_file)
+        except (OSError, ValueError):
+            return None
+
     def exists(self, key: str) -> bool:
         """Check if key exists."""
         with self._index_lock:
+            if self._batch is not None and key in self._batch:
+                return key in self._index
             return key in self._index and self._get_path(key).exists()
 
     def keys(self) -> list[str]:
-        """Get all keys."""
-        valid_keys = []
+        """Get all keys, in sorted order."""
         with self._index_lock:
-            index_keys = list(self._index.keys())
+            return list(self._sorted_keys)
 
-        for key in index_keys:
-            if self._get_path(key).exists():
-                valid_keys.append(key)
-        return valid_keys
+    def keys_with_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Sorted keys starting with prefix, from the in-memory index."""
+        with self._index_lock:
+            return self._sorted_keys.with_prefix(prefix, limit)
 
     def clear(self) -> None:
         """Remove all entries."""
+        with self._index_lock:
+            if self._batch is not None:
+                for key in list(self._index):
+                    self._delete_impl(key)
+                self._read_cache.cache_clear()
+                return
+
+            # Replaying pending logs after the clear would bring entries back
+            for path in self._unsynced:
+                shutil.rmtree(path, ignore_errors=True)
+            self._unsynced.clear()
+
+        self.pack_log.unlink(missing_ok=True)
         for path in self.entries_dir.glob("*.json"):
             try:
                 path.unlink()
@@ -143,13 +526,18 @@ class FileSystemBackend(CachedBackend):
 
         with self._index_lock:
             self._index.clear()
+            self._sorted_keys.clear()
             self._save_index()
 
         self._read_cache.cache_clear()
 
     def close(self) -> None:
-        """No resources to close for filesystem backend."""
-        pass
+        """Checkpoint pending batch logs and unmap the pack."""
+        with self._index_lock:
+            self._checkpoint()
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
 
     def backup(self, backup_dir: Path) -> None:
         """Create a backup of the storage."""
@@ -169,5 +557,36 @@ class FileSystemBackend(CachedBackend):
 
         shutil.copytree(backup_data, self.data_dir)
 
-        self._load_index()
+        with self._index_lock:
+            self._unsynced.clear()
+            self._load_index()
+            self._recover_batches()
         self._read_cache.cache_clear()
+
+
+def _write_empty(path: Path) -> None:
+    """Atomically replace a file with a new, empty one."""
+    temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(temp_fd)
+    os.replace(temp_path, path)
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush a file's data to disk; missing files are skipped."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(path: Path) -> None:
+    """Make renames inside a directory durable."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -60,12 +60,15 @@ class MemoryBackend(BaseBackend):
 
     @contextmanager
     def begin_transaction(self):
-        """Begin a transaction."""
+        """Begin a transaction; nested ones join the outer transaction."""
         if self._in_transaction:
-            raise RuntimeError("Already in a transaction")
+            yield
+            return
 
         self._in_transaction = True
-        self._transaction_data = deepcopy(self._data)
+        # Values are replaced, never mutated in place, so a shallow copy
+        # isolates the transaction
+        self._transaction_data = dict(self._data)
 
         try:
             yield
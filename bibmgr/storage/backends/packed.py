@@ -0,0 +1,144 @@
+"""Memory-mapped segment of packed records.
+
+A segment is one read-only file holding many records back to back::
+
+    [record 0][record 1]...[footer][footer length: u64][MAGIC]
+
+The msgpack footer lists the sorted keys, the offset of every record and a
+source token telling the writer which state of the store the segment was
+built from. Readers map the file and hand out ``memoryview`` slices of it,
+so records are decoded in place without being read into Python strings,
+and processes mapping the same segment share its pages in the page cache.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from collections.abc import Iterable
+from pathlib import Path
+
+import msgspec
+
+MAGIC = b"BIBPACK1"
+
+_TRAILER = struct.Struct("<Q8s")
+
+
+class SegmentFooter(msgspec.Struct, frozen=True):
+    """Index of a segment: keys, record offsets and its source token."""
+
+    source: tuple[int, ...]
+    keys: list[str]
+    # One more offset than keys; record i spans offsets[i]:offsets[i + 1]
+    offsets: list[int]
+
+
+class PackedSegment:
+    """Read-only, memory-mapped view of a segment file."""
+
+    def __init__(self, path: Path):
+        """Map a segment.
+
+        Raises:
+            ValueError: If the file is not a complete segment
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size < _TRAILER.size:
+                raise ValueError(f"Not a packed segment: {self.path}")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.inode = stat.st_ino
+        self._view = memoryview(self._mmap)
+
+        try:
+            length, magic = _TRAILER.unpack(self._view[-_TRAILER.size :])
+            end = len(self._view) - _TRAILER.size
+            if magic != MAGIC or length > end:
+                raise ValueError(f"Not a packed segment: {self.path}")
+            footer = msgspec.msgpack.decode(
+                self._view[end - length : end], type=SegmentFooter
+            )
+        except (ValueError, msgspec.MsgspecError) as e:
+            self.close()
+            raise ValueError(f"Not a packed segment: {self.path}") from e
+
+        self.source = footer.source
+        self._keys = footer.keys
+        self._offsets = footer.offsets
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return self._position(key) is not None
+
+    def keys(self) -> list[str]:
+        """Sorted keys of the segment."""
+        return list(self._keys)
+
+    def get(self, key: str) -> memoryview | None:
+        """Record of a key as a slice of the mapping, None if absent.
+
+        The slice is only valid until the segment is closed; decode it
+        rather than keep it.
+        """
+        i = self._position(key)
+        if i is None:
+            return None
+        return self._view[self._offsets[i] : self._offsets[i + 1]]
+
+    def _position(self, key: object) -> int | None:
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return i
+        return None
+
+    def close(self) -> None:
+        """Unmap the file, unless slices handed out are still alive."""
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Unmapped once the remaining slices are collected
+            pass
+
+    def __enter__(self) -> "PackedSegment":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def write(
+        path: Path, records: Iterable[tuple[str, bytes]], source: tuple[int, ...]
+    ) -> None:
+        """Write records as a segment, atomically replacing ``path``.
+
+        Records are streamed to disk and must come in ascending key order.
+        Mappings of the replaced file stay valid until they are closed.
+
+        Raises:
+            ValueError: If the records are not in ascending key order
+        """
+        path = Path(path)
+        keys: list[str] = []
+        offsets = [0]
+        temp_fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with open(temp_fd, "wb") as f:
+                for key, data in records:
+                    if keys and key <= keys[-1]:
+                        raise ValueError("Segment records must be in key order")
+                    f.write(data)
+                    keys.append(key)
+                    offsets.append(offsets[-1] + len(data))
+                footer = msgspec.msgpack.encode(SegmentFooter(source, keys, offsets))
+                f.write(footer)
+                f.write(_TRAILER.pack(len(footer), MAGIC))
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
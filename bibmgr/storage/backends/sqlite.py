@@ -1,36 +1,208 @@
-"""SQLite storage backend for better performance and queries."""
+"""SQLite storage backend for better performance and queries.
 
-import json
+Writes go through a single writer connection serialized by a lock. Reads
+borrow one of a small pool of read-only connections, so concurrent readers
+run in parallel against the WAL snapshot instead of queueing behind the
+writer. Reads made inside a transaction use the writer connection and see
+its uncommitted changes.
+
+Entries saved through the repository are stored as version-tagged JSON
+records of ``storage.codec`` and decoded straight into ``Entry`` objects.
+"""
+
+import queue
 import sqlite3
 import threading
-from collections.abc import Iterator
+import time
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
+
+import msgspec
 
+from bibmgr.core.models import Entry
+
+from ..codec import (
+    SCHEMA_FIELD,
+    decode_entry,
+    encode_entry,
+    project,
+    projection_type,
+)
 from .base import BaseBackend
 
+# Entry fields mirrored into the entries_fts full-text table
+FTS_COLUMNS = (
+    "title",
+    "author",
+    "editor",
+    "abstract",
+    "keywords",
+    "journal",
+    "booktitle",
+    "note",
+)
+
+# Keys bound per IN (...) query, below SQLite's host parameter limit
+SQL_VARIABLE_CHUNK = 500
+
+# SQL of QueryBuilder filter operators on one extracted field
+FILTER_SQL = {
+    "=": "{field} = ?",
+    "!=": "{field} IS NOT ?",
+    ">": "{field} > ?",
+    "<": "{field} < ?",
+    ">=": "{field} >= ?",
+    "<=": "{field} <= ?",
+    "contains": "instr({field}, ?) > 0",
+}
+
+# Read-only connections opened at most
+READER_POOL_SIZE = 4
+
+# Compiled statements each connection keeps for reuse
+STATEMENT_CACHE_SIZE = 256
+
+# Seconds a connection waits on a locked database before failing
+BUSY_TIMEOUT = 30.0
+
+# Pragmas of every connection: 64 MiB page cache, 256 MiB memory map
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+)
+
 
 class SQLiteBackend(BaseBackend):
     """SQLite-based storage with full-text search support."""
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, readers: int = READER_POOL_SIZE):
+        """Initialize the backend.
+
+        Args:
+            db_path: Database file (``:memory:`` reads through the writer)
+            readers: Read-only connections opened at most
+        """
         self.db_path = Path(db_path)
         self._lock = threading.RLock()
         self._transaction_active = threading.local()
-        self.conn: sqlite3.Connection | None = sqlite3.connect(
-            str(self.db_path), check_same_thread=False
-        )
-        self.connection.row_factory = sqlite3.Row
+        self.conn: sqlite3.Connection | None = self._connect(str(self.db_path))
+
+        self._pool_size = max(readers, 0) if str(db_path) != ":memory:" else 0
+        self._idle: queue.LifoQueue[tuple[sqlite3.Connection, int]] = queue.LifoQueue()
+        self._readers: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._setup_scripts: list[str] = []
+        self._metrics = {
+            "writer_acquisitions": 0,
+            "writer_wait_seconds": 0.0,
+            "writer_max_wait_seconds": 0.0,
+            "reader_acquisitions": 0,
+            "reader_wait_seconds": 0.0,
+            "reader_max_wait_seconds": 0.0,
+        }
         self.initialize()
 
     @property
     def connection(self) -> sqlite3.Connection:
-        """Get the connection, ensuring it exists."""
+        """Get the writer connection, ensuring it exists."""
         if self.conn is None:
             raise RuntimeError("Database connection not initialized")
         return self.conn
 
+    @staticmethod
+    def _connect(database: str, uri: bool = False) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            database,
+            uri=uri,
+            timeout=BUSY_TIMEOUT,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        connection.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            connection.execute(pragma)
+        return connection
+
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        """The writer connection, held under the write lock."""
+        start = time.perf_counter()
+        with self._lock:
+            self._record_wait("writer", time.perf_counter() - start)
+            yield self.connection
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """A connection to read with, returned to the pool afterwards.
+
+        Inside a transaction of the calling thread this is the writer
+        connection, so reads see the transaction's own writes.
+        """
+        if self._pool_size == 0 or getattr(self._transaction_active, "active", False):
+            with self._writer() as connection:
+                yield connection
+            return
+
+        start = time.perf_counter()
+        connection, applied = self._acquire_reader()
+        with self._pool_lock:
+            self._record_wait("reader", time.perf_counter() - start)
+        try:
+            for script in self._setup_scripts[applied:]:
+                connection.executescript(script)
+            applied = len(self._setup_scripts)
+            yield connection
+        finally:
+            if self.conn is not None:
+                self._idle.put((connection, applied))
+
+    def _acquire_reader(self) -> tuple[sqlite3.Connection, int]:
+        """Take an idle reader, opening one while the pool has room."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            if self.conn is None:
+                raise RuntimeError("Database connection not initialized")
+            if len(self._readers) < self._pool_size:
+                path = quote(str(self.db_path.resolve()))
+                connection = self._connect(f"file:{path}?mode=ro", uri=True)
+                self._readers.append(connection)
+                return connection, 0
+        return self._idle.get()
+
+    def _record_wait(self, role: str, waited: float) -> None:
+        """Count one acquisition; callers hold the matching lock."""
+        self._metrics[f"{role}_acquisitions"] += 1
+        self._metrics[f"{role}_wait_seconds"] += waited
+        if waited > self._metrics[f"{role}_max_wait_seconds"]:
+            self._metrics[f"{role}_max_wait_seconds"] = waited
+
+    def add_connection_script(self, script: str) -> None:
+        """Run a script on every connection, present and future.
+
+        For per-connection state such as TEMP tables.
+        """
+        with self._writer() as connection:
+            connection.executescript(script)
+            self._setup_scripts.append(script)
+
+    def connection_statistics(self) -> dict[str, Any]:
+        """Pool size and lock wait times since the backend was opened."""
+        return {
+            "readers_open": len(self._readers),
+            "reader_pool_size": self._pool_size,
+            **self._metrics,
+        }
+
     def initialize(self) -> None:
         """Create database schema."""
         self.connection.execute("PRAGMA journal_mode=WAL")
@@ -47,63 +219,98 @@ class SQLiteBackend(BaseBackend):
             CREATE INDEX IF NOT EXISTS idx_entries_type ON entries(type);
             CREATE INDEX IF NOT EXISTS idx_entries_created ON entries(created_at);
             CREATE INDEX IF NOT EXISTS idx_entries_updated ON entries(updated_at);
-            CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+            CREATE TRIGGER IF NOT EXISTS entries_update_timestamp
+            AFTER UPDATE ON entries
+            BEGIN
+                UPDATE entries SET updated_at = CURRENT_TIMESTAMP WHERE key = NEW.key;
+            END;
+        """)
+        self._ensure_fts_schema()
+
+        self.connection.commit()
+
+    def _ensure_fts_schema(self) -> None:
+        """Create the entries_fts table and its triggers.
+
+        Databases created with a different set of FTS columns get the
+        table recreated and repopulated from ``entries``.
+        """
+        columns = [
+            row["name"]
+            for row in self.connection.execute("PRAGMA table_info(entries_fts)")
+        ]
+        if columns == ["key", *FTS_COLUMNS]:
+            return
+
+        extracted = ", ".join(
+            f"json_extract(NEW.data, '$.{column}')" for column in FTS_COLUMNS
+        )
+        backfilled = extracted.replace("NEW.data", "data")
+        assignments = ", ".join(
+            f"{column} = json_extract(NEW.data, '$.{column}')" for column in FTS_COLUMNS
+        )
+        column_list = ", ".join(FTS_COLUMNS)
+
+        self.connection.executescript(f"""
+            DROP TRIGGER IF EXISTS entries_ai;
+            DROP TRIGGER IF EXISTS entries_au;
+            DROP TRIGGER IF EXISTS entries_ad;
+            DROP TABLE IF EXISTS entries_fts;
+
+            CREATE VIRTUAL TABLE entries_fts USING fts5(
                 key UNINDEXED,
-                title,
-                author,
-                abstract,
-                keywords
+                {column_list}
             );
-            CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
-                INSERT INTO entries_fts(key, title, author, abstract, keywords)
-                SELECT
-                    NEW.key,
-                    json_extract(NEW.data, '$.title'),
-                    json_extract(NEW.data, '$.author'),
-                    json_extract(NEW.data, '$.abstract'),
-                    json_extract(NEW.data, '$.keywords')
-                ;
+            CREATE TRIGGER entries_ai AFTER INSERT ON entries BEGIN
+                INSERT INTO entries_fts(key, {column_list})
+                SELECT NEW.key, {extracted};
             END;
 
-            CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE ON entries BEGIN
-                UPDATE entries_fts SET
-                    title = json_extract(NEW.data, '$.title'),
-                    author = json_extract(NEW.data, '$.author'),
-                    abstract = json_extract(NEW.data, '$.abstract'),
-                    keywords = json_extract(NEW.data, '$.keywords')
+            CREATE TRIGGER entries_au AFTER UPDATE OF data ON entries BEGIN
+                UPDATE entries_fts SET {assignments}
                 WHERE key = NEW.key;
             END;
 
-            CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+            CREATE TRIGGER entries_ad AFTER DELETE ON entries BEGIN
                 DELETE FROM entries_fts WHERE key = OLD.key;
             END;
-            CREATE TRIGGER IF NOT EXISTS entries_update_timestamp
-            AFTER UPDATE ON entries
-            BEGIN
-                UPDATE entries SET updated_at = CURRENT_TIMESTAMP WHERE key = NEW.key;
-            END;
-        """)
 
-        self.connection.commit()
+            INSERT INTO entries_fts(key, {column_list})
+            SELECT key, {backfilled} FROM entries;
+        """)
 
     def read(self, key: str) -> dict[str, Any] | None:
         """Read entry from database."""
-        with self._lock:
-            cursor = self.connection.execute(
+        with self.reader() as connection:
+            row = connection.execute(
                 "SELECT data FROM entries WHERE key = ?", (key,)
-            )
-            row = cursor.fetchone()
+            ).fetchone()
 
             if row:
-                return json.loads(row["data"])
+                return _decode_record(row["data"])
             return None
 
+    def read_entry(self, key: str) -> Entry | None:
+        """Read an entry, decoding its record without an intermediate dict.
+
+        Raises:
+            ValueError: If the stored record is not a valid entry
+        """
+        with self.reader() as connection:
+            row = connection.execute(
+                "SELECT CAST(data AS BLOB) FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row:
+            return decode_entry(row[0])
+        return None
+
     def write(self, key: str, data: dict[str, Any]) -> None:
         """Write entry to database."""
-        with self._lock:
-            json_data = json.dumps(data, sort_keys=True)
+        with self._writer() as connection:
+            json_data = _encode_record(data)
 
-            self.connection.execute(
+            connection.execute(
                 """
                 INSERT INTO entries (key, type, data) VALUES (?, ?, ?)
                 ON CONFLICT(key) DO UPDATE SET
@@ -114,44 +321,122 @@ class SQLiteBackend(BaseBackend):
             )
 
             if not getattr(self._transaction_active, "active", False):
-                self.connection.commit()
+                connection.commit()
+
+    def read_many(self, keys: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Read several entries with one query per chunk of keys."""
+        keys = list(keys)
+        records = {}
+        with self.reader() as connection:
+            for start in range(0, len(keys), SQL_VARIABLE_CHUNK):
+                chunk = keys[start : start + SQL_VARIABLE_CHUNK]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = connection.execute(
+                    f"SELECT key, data FROM entries WHERE key IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor:
+                    records[row["key"]] = _decode_record(row["data"])
+        return records
+
+    def write_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Write several entries with one statement in one transaction."""
+        rows = [
+            (key, data.get("type", "misc"), _encode_record(data)) for key, data in items
+        ]
+        self._upsert(rows)
+
+    def write_entries(self, entries: Iterable[Entry]) -> None:
+        """Write entries as version-tagged records in one transaction."""
+        rows = [
+            (entry.key, entry.type.value, encode_entry(entry).decode())
+            for entry in entries
+        ]
+        self._upsert(rows)
+
+    def _upsert(self, rows: list[tuple[str, str, str]]) -> None:
+        """Insert or replace rows of key, type and data in one transaction."""
+        with self.begin_transaction():
+            self.connection.executemany(
+                """
+                INSERT INTO entries (key, type, data) VALUES (?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    type = excluded.type,
+                    data = excluded.data
+            """,
+                rows,
+            )
+
+    def delete_many(self, keys: Iterable[str]) -> list[str]:
+        """Delete several entries in one transaction and return those deleted."""
+        deleted = []
+        with self.begin_transaction():
+            for key in keys:
+                cursor = self.connection.execute(
+                    "DELETE FROM entries WHERE key = ?", (key,)
+                )
+                if cursor.rowcount > 0:
+                    deleted.append(key)
+        return deleted
 
     def delete(self, key: str) -> bool:
         """Delete entry from database."""
-        with self._lock:
-            cursor = self.connection.execute(
-                "DELETE FROM entries WHERE key = ?", (key,)
-            )
+        with self._writer() as connection:
+            cursor = connection.execute("DELETE FROM entries WHERE key = ?", (key,))
             if not getattr(self._transaction_active, "active", False):
-                self.connection.commit()
+                connection.commit()
             return cursor.rowcount > 0
 
     def exists(self, key: str) -> bool:
         """Check if entry exists."""
-        with self._lock:
-            cursor = self.connection.execute(
+        with self.reader() as connection:
+            row = connection.execute(
                 "SELECT 1 FROM entries WHERE key = ? LIMIT 1", (key,)
-            )
-            return cursor.fetchone() is not None
+            ).fetchone()
+            return row is not None
 
     def keys(self) -> list[str]:
         """Get all keys."""
-        with self._lock:
-            cursor = self.connection.execute("SELECT key FROM entries ORDER BY key")
+        with self.reader() as connection:
+            cursor = connection.execute("SELECT key FROM entries ORDER BY key")
             return [row["key"] for row in cursor]
 
+    def keys_with_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Sorted keys starting with prefix, as a range scan of the key index."""
+        conditions = ["key >= ?"]
+        params: list[Any] = [prefix]
+        if prefix and prefix[-1] != chr(0x10FFFF):
+            # Keys compare as UTF-8 bytes, which orders like code points
+            conditions.append("key < ?")
+            params.append(prefix[:-1] + chr(ord(prefix[-1]) + 1))
+        params.append(-1 if limit is None else limit)
+
+        with self.reader() as connection:
+            cursor = connection.execute(
+                f"SELECT key FROM entries WHERE {' AND '.join(conditions)} "
+                "ORDER BY key LIMIT ?",
+                params,
+            )
+            return [row["key"] for row in cursor if row["key"].startswith(prefix)]
+
     def clear(self) -> None:
         """Clear all entries."""
-        with self._lock:
-            self.connection.execute("DELETE FROM entries")
+        with self._writer() as connection:
+            connection.execute("DELETE FROM entries")
             if not getattr(self._transaction_active, "active", False):
-                self.connection.commit()
+                connection.commit()
 
     def close(self) -> None:
-        """Close database connection."""
-        if self.conn:
-            self.connection.close()
-            self.conn = None
+        """Close the writer and all reader connections."""
+        with self._pool_lock:
+            for connection in self._readers:
+                connection.close()
+            self._readers.clear()
+            while not self._idle.empty():
+                self._idle.get_nowait()
+            if self.conn:
+                self.connection.close()
+                self.conn = None
 
     def supports_transactions(self) -> bool:
         """SQLite supports transactions."""
@@ -160,36 +445,37 @@ class SQLiteBackend(BaseBackend):
     @contextmanager
     def begin_transaction(self) -> Iterator[None]:
         """Transaction context manager."""
-        with self._lock:
+        with self._writer() as connection:
+            outer = getattr(self._transaction_active, "active", False)
             self._transaction_active.active = True
-            in_transaction = self.connection.in_transaction
+            in_transaction = connection.in_transaction
 
             if not in_transaction:
-                self.connection.execute("BEGIN")
+                connection.execute("BEGIN")
 
             try:
                 yield
                 if not in_transaction:
-                    self.connection.commit()
+                    connection.commit()
             except Exception:
                 if not in_transaction:
-                    self.connection.rollback()
+                    connection.rollback()
                 raise
             finally:
-                self._transaction_active.active = False
+                self._transaction_active.active = outer
 
     def search(self, query: str) -> list[str]:
         """Full-text search across entries."""
-        cursor = self.connection.execute(
-            """
-            SELECT key FROM entries_fts
-            WHERE entries_fts MATCH ?
-            ORDER BY rank
-        """,
-            (query,),
-        )
-
-        return [row["key"] for row in cursor]
+        with self.reader() as connection:
+            cursor = connection.execute(
+                """
+                SELECT key FROM entries_fts
+                WHERE entries_fts MATCH ?
+                ORDER BY rank
+            """,
+                (query,),
+            )
+            return [row["key"] for row in cursor]
 
     def query_entries(self, filters: dict[str, Any]) -> list[str]:
         """Query entries with filters."""
@@ -209,34 +495,134 @@ class SQLiteBackend(BaseBackend):
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-        cursor = self.connection.execute(
-            f"SELECT key FROM entries WHERE {where_clause} ORDER BY key", params
+        with self.reader() as connection:
+            cursor = connection.execute(
+                f"SELECT key FROM entries WHERE {where_clause} ORDER BY key", params
+            )
+            return [row["key"] for row in cursor]
+
+    def scan(
+        self,
+        fields: tuple[str, ...],
+        where: Iterable[tuple[str, str, Any]] = (),
+        order_by: Iterable[tuple[str, bool]] = (),
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Any]:
+        """Projected rows of entries, evaluated in one query.
+
+        Only the requested fields are extracted from each record, into one
+        JSON object per row that is decoded straight into the row struct.
+        Records in an older schema are filtered and sorted on their stored
+        values, and their rows decoded from the full entry.
+
+        Raises:
+            ValueError: If a field is not an entry field
+        """
+        where = list(where)
+        order_by = list(order_by)
+        projection_type((*fields, *(f for f, _, _ in where), *(f for f, _ in order_by)))
+        members = ", ".join(
+            f"'{name}', {'key' if name == 'key' else f'data -> {_path(name)}'}"
+            for name in fields
         )
+        conditions = ["key NOT LIKE 'collection:%'"]
+        params: list[Any] = []
+        for field, op, value in where:
+            column = _scalar(field)
+            if op == "in":
+                values = [_bindable(v) for v in value]
+                conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+            elif op == "=" and value is None:
+                conditions.append(f"{column} IS NULL")
+            else:
+                conditions.append(FILTER_SQL[op].format(field=column))
+                params.append(_bindable(value))
+        ordering = [
+            f"{_scalar(field)} {'ASC' if ascending else 'DESC'}"
+            for field, ascending in order_by
+        ]
+        params.extend([-1 if limit is None else limit, offset])
+
+        with self.reader() as connection:
+            cursor = connection.execute(
+                f"SELECT key, json_object({members}) FROM entries "
+                f"WHERE {' AND '.join(conditions)} "
+                f"ORDER BY {', '.join([*ordering, 'key'])} LIMIT ? OFFSET ?",
+                params,
+            )
+            rows = cursor.fetchall()
 
-        return [row["key"] for row in cursor]
+        decoder = _row_decoder(fields)
+        result = []
+        for key, row in rows:
+            try:
+                result.append(decoder.decode(row))
+            except msgspec.ValidationError:
+                entry = self.read_entry(key)
+                if entry is not None:
+                    result.append(project(entry, fields))
+        return result
 
     def get_statistics(self) -> dict[str, Any]:
         """Get database statistics."""
         stats = {}
 
-        cursor = self.connection.execute("SELECT COUNT(*) as count FROM entries")
-        stats["total_entries"] = cursor.fetchone()["count"]
-
-        cursor = self.connection.execute("""
-            SELECT type, COUNT(*) as count
-            FROM entries
-            GROUP BY type
-            ORDER BY count DESC
-        """)
-        stats["by_type"] = {row["type"]: row["count"] for row in cursor}
-
-        cursor = self.connection.execute("""
-            SELECT json_extract(data, '$.year') as year, COUNT(*) as count
-            FROM entries
-            WHERE year IS NOT NULL
-            GROUP BY year
-            ORDER BY year DESC
-        """)
-        stats["by_year"] = {row["year"]: row["count"] for row in cursor}
+        with self.reader() as connection:
+            cursor = connection.execute("SELECT COUNT(*) as count FROM entries")
+            stats["total_entries"] = cursor.fetchone()["count"]
+
+            cursor = connection.execute("""
+                SELECT type, COUNT(*) as count
+                FROM entries
+                GROUP BY type
+                ORDER BY count DESC
+            """)
+            stats["by_type"] = {row["type"]: row["count"] for row in cursor}
+
+            cursor = connection.execute("""
+                SELECT json_extract(data, '$.year') as year, COUNT(*) as count
+                FROM entries
+                WHERE year IS NOT NULL
+                GROUP BY year
+                ORDER BY year DESC
+            """)
+            stats["by_year"] = {row["year"]: row["count"] for row in cursor}
 
         return stats
+
+
+def _encode_record(data: dict[str, Any]) -> str:
+    """JSON text of a plain record."""
+    return msgspec.json.encode(data, order="sorted").decode()
+
+
+def _decode_record(data: str) -> dict[str, Any]:
+    """Plain record of stored JSON text, shaped like ``Entry.to_dict``.
+
+    Tagged records hold every field of the entry, unset ones as null.
+    """
+    record = msgspec.json.decode(data)
+    if record.pop(SCHEMA_FIELD, None) is not None:
+        return {k: v for k, v in record.items() if v is not None}
+    return record
+
+
+def _path(field: str) -> str:
+    """JSON path literal of an entry field; names are checked by the codec."""
+    return f"'$.{field}'"
+
+
+def _scalar(field: str) -> str:
+    """SQL value of an entry field for comparisons and ordering."""
+    return "key" if field == "key" else f"json_extract(data, {_path(field)})"
+
+
+def _bindable(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+@lru_cache(maxsize=64)
+def _row_decoder(fields: tuple[str, ...]) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(projection_type(fields))
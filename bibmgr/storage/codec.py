@@ -0,0 +1,148 @@
+"""Encoding of stored entries.
+
+Entries are stored as compact JSON written straight from the ``Entry``
+struct by msgspec, with the schema version as the first member::
+
+    {"_schema":1,"key":"smith2020",...}
+
+Records of the current version are decoded into an ``Entry`` by a typed
+decoder without building an intermediate dict. Anything else is a legacy
+record: a plain dict, as written before the version tag existed, or one
+tagged with an older version. Legacy records are decoded to a dict and
+brought up to date by the upgrade steps before conversion.
+
+Projections decode only some fields of a record into a small struct; the
+decoder skips the other members without building Python objects for them.
+"""
+
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import msgspec
+
+from bibmgr.core.models import Entry
+
+# Bump, and append a step to UPGRADES, when stored records change shape
+SCHEMA_VERSION = 1
+
+# Member of a stored record holding its schema version
+SCHEMA_FIELD = "_schema"
+
+_PREFIX = f'{{"{SCHEMA_FIELD}":{SCHEMA_VERSION},'.encode()
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(Entry)
+
+
+def encode_entry(entry: Entry) -> bytes:
+    """Stored record of an entry, tagged with the current schema version."""
+    # An Entry always has a key, so its object is never empty
+    return _PREFIX + _encoder.encode(entry)[1:]
+
+
+def decode_entry(data: bytes | memoryview | str) -> Entry:
+    """Entry of a stored record, upgrading legacy records.
+
+    Raises:
+        ValueError: If the record is not a valid entry
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    try:
+        if data[: len(_PREFIX)] == _PREFIX:
+            return _decoder.decode(data)
+        record = msgspec.json.decode(data)
+    except msgspec.MsgspecError as e:
+        raise ValueError(f"Failed to decode entry data: {e}") from e
+    if not isinstance(record, dict):
+        raise ValueError("Failed to decode entry data: not an object")
+    return upgrade_entry(record)
+
+
+@lru_cache(maxsize=64)
+def projection_type(fields: tuple[str, ...]) -> type[msgspec.Struct]:
+    """Struct holding the given entry fields, each None when unset.
+
+    Raises:
+        ValueError: If a field is not a field of ``Entry``
+    """
+    types = {field.name: field.type for field in msgspec.structs.fields(Entry)}
+    unknown = [name for name in fields if name not in types]
+    if unknown:
+        raise ValueError(f"Unknown entry fields: {', '.join(unknown)}")
+    return msgspec.defstruct(
+        "EntryRow",
+        [(name, types[name] | None, None) for name in fields],
+        frozen=True,
+        kw_only=True,
+    )
+
+
+@lru_cache(maxsize=64)
+def _projection_decoder(fields: tuple[str, ...]) -> msgspec.json.Decoder:
+    return msgspec.json.Decoder(projection_type(fields))
+
+
+def decode_projection(data: bytes | memoryview, fields: tuple[str, ...]) -> Any:
+    """Row of the given fields of a stored record.
+
+    Current records are decoded straight from the buffer, so a memoryview
+    into a mapped file is never copied. Legacy records are upgraded to a
+    full entry first.
+
+    Raises:
+        ValueError: If the record is not a valid entry
+    """
+    if data[: len(_PREFIX)] == _PREFIX:
+        try:
+            return _projection_decoder(fields).decode(data)
+        except msgspec.MsgspecError as e:
+            raise ValueError(f"Failed to decode entry data: {e}") from e
+    return project(decode_entry(bytes(data)), fields)
+
+
+def project(entry: Entry, fields: tuple[str, ...]) -> Any:
+    """Row of the given fields of a decoded entry."""
+    return projection_type(fields)(**{name: getattr(entry, name) for name in fields})
+
+
+def upgrade_entry(data: dict[str, Any]) -> Entry:
+    """Entry of a record in any schema version up to the current one.
+
+    Raises:
+        ValueError: If the record is newer than this version or invalid
+    """
+    data = dict(data)
+    version = data.pop(SCHEMA_FIELD, 0)
+    if not isinstance(version, int) or version > SCHEMA_VERSION:
+        raise ValueError(f"Unsupported entry schema version: {version}")
+
+    for upgrade in UPGRADES[version:]:
+        data = upgrade(data)
+
+    try:
+        return msgspec.convert(data, Entry)
+    except msgspec.MsgspecError as e:
+        raise ValueError(f"Failed to convert entry data: {e}") from e
+
+
+def _upgrade_untagged(data: dict[str, Any]) -> dict[str, Any]:
+    """Version 0 to 1: normalize records written as plain dicts."""
+    if "type" in data and isinstance(data["type"], str):
+        data["type"] = data["type"].lower()
+
+    if "year" in data and isinstance(data["year"], str):
+        try:
+            data["year"] = int(data["year"])
+        except ValueError:
+            del data["year"]
+
+    if "keywords" in data and isinstance(data["keywords"], str):
+        keywords = data["keywords"].split(",")
+        data["keywords"] = tuple(kw.strip() for kw in keywords if kw.strip())
+
+    return data
+
+
+# Step i upgrades a record of version i to version i + 1
+UPGRADES: list[Callable[[dict[str, Any]], dict[str, Any]]] = [_upgrade_untagged]
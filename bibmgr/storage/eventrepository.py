@@ -1,7 +1,20 @@
-"""Event-aware repository implementation that publishes events on changes."""
-
-from bibmgr.core.models import Collection, Entry
-from bibmgr.storage.events import EventBus, EventPublisher, EventType
+"""Event-aware repository implementation that publishes events on changes.
+
+Entry events raised inside a transaction are held back until the
+outermost transaction commits and dropped if it rolls back, so listeners
+such as the search indexer and the change journal never see a change
+that did not happen.
+"""
+
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+from bibmgr.core.crossref import CROSSREF_FIELDS, CrossRefGraph
+from bibmgr.core.models import Collection, Entry, ValidationError
+from bibmgr.core.validators import ValidationContext, ValidatorRegistry
+from bibmgr.storage.events import Event, EventBus, EventPublisher, EventType
 from bibmgr.storage.repository import (
     CollectionRepository,
     EntryRepository,
@@ -9,6 +22,17 @@ from bibmgr.storage.repository import (
     StorageBackend,
 )
 
+# Events after which the cross-reference graph reloads the affected entries
+CROSSREF_EVENTS = (
+    EventType.ENTRY_CREATED,
+    EventType.ENTRY_UPDATED,
+    EventType.ENTRY_DELETED,
+    EventType.ENTRIES_IMPORTED,
+    EventType.ENTRIES_MERGED,
+    EventType.BULK_CREATED,
+    EventType.STORAGE_CLEARED,
+)
+
 
 class EventAwareEntryRepository(EntryRepository, EventPublisher):
     """Entry repository that publishes events on changes."""
@@ -16,13 +40,51 @@ class EventAwareEntryRepository(EntryRepository, EventPublisher):
     def __init__(self, backend: StorageBackend, event_bus: EventBus):
         EntryRepository.__init__(self, backend)
         EventPublisher.__init__(self, event_bus)
-
-    def save(self, entry: Entry, skip_validation: bool = False) -> None:
+        # Events of the transactions open on each thread, outermost first
+        self._pending = threading.local()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Backend transaction whose events are published after it commits."""
+        pending: list[Event] | None = getattr(self._pending, "events", None)
+        outermost = pending is None
+        if outermost:
+            pending = self._pending.events = []
+        mark = len(pending)
+        try:
+            with super().transaction():
+                yield
+        except BaseException:
+            del pending[mark:]
+            raise
+        finally:
+            if outermost:
+                self._pending.events = None
+
+        if outermost:
+            for event in pending:
+                self.event_bus.publish(event)
+
+    def _publish_event(self, event_type: EventType, **data) -> None:
+        """Publish an event, or hold it until the open transaction commits."""
+        event = Event(type=event_type, timestamp=datetime.now(), data=data)
+        pending = getattr(self._pending, "events", None)
+        if pending is None:
+            self.event_bus.publish(event)
+        else:
+            pending.append(event)
+
+    def save(
+        self,
+        entry: Entry,
+        skip_validation: bool = False,
+        context: ValidationContext | None = None,
+    ) -> None:
         """Save entry and publish event."""
         is_new = not self.exists(entry.key)
 
         # Save the entry
-        super().save(entry, skip_validation)
+        super().save(entry, skip_validation, context)
 
         # Publish appropriate event
         if is_new:
@@ -34,6 +96,38 @@ class EventAwareEntryRepository(EntryRepository, EventPublisher):
                 EventType.ENTRY_UPDATED, entry_key=entry.key, entry=entry
             )
 
+    def save_many(
+        self,
+        entries: Iterable[Entry],
+        skip_validation: bool = False,
+        context: ValidationContext | None = None,
+    ) -> None:
+        """Save entries in one transaction and publish an event for each."""
+        entries = list(entries)
+        existing = {entry.key for entry in entries if self.exists(entry.key)}
+
+        super().save_many(entries, skip_validation, context)
+
+        for entry in entries:
+            event_type = (
+                EventType.ENTRY_UPDATED
+                if entry.key in existing
+                else EventType.ENTRY_CREATED
+            )
+            self._publish_event(event_type, entry_key=entry.key, entry=entry)
+
+    def delete_many(self, keys: Iterable[str]) -> list[str]:
+        """Delete entries in one transaction and publish an event for each."""
+        entries = {key: self.find(key) for key in keys}
+
+        deleted = super().delete_many(entries)
+
+        for key in deleted:
+            self._publish_event(
+                EventType.ENTRY_DELETED, entry_key=key, entry=entries[key]
+            )
+        return deleted
+
     def delete(self, key: str) -> bool:
         """Delete entry and publish event."""
         # Get entry before deletion for event
@@ -106,6 +200,25 @@ class EventAwareRepositoryManager(RepositoryManager, EventPublisher):
         self.entries = EventAwareEntryRepository(backend, self.event_bus)
         self.collections = EventAwareCollectionRepository(backend, self.event_bus)
 
+        # Cross-reference graph, loaded on first use from a projection of
+        # the linking fields and kept current by the entry events
+        self.crossrefs = CrossRefGraph(
+            loader=lambda: self.entries.scan(CROSSREF_FIELDS)
+        )
+
+        # Validation against the graph; when a parent changes, its children
+        # are validated again and their issues kept here
+        self.validator_registry = ValidatorRegistry(graph=self.crossrefs)
+        self.validation_issues: dict[str, list[ValidationError]] = {}
+        for event_type in CROSSREF_EVENTS:
+            self.event_bus.subscribe(event_type, self._refresh_crossrefs)
+
+    @contextmanager
+    def transaction(self):
+        """Transaction whose entry events are published after it commits."""
+        with self.entries.transaction(), super().transaction() as manager:
+            yield manager
+
     def import_entries(
         self, entries: list[Entry], skip_validation: bool = False
     ) -> dict[str, bool]:
@@ -134,3 +247,50 @@ class EventAwareRepositoryManager(RepositoryManager, EventPublisher):
         """Rebuild any indices and publish event."""
         # This would trigger index rebuilding in search/indexing backends
         self._publish_event(EventType.INDEX_REBUILT)
+
+    def revalidate(self, keys: Iterable[str]) -> dict[str, list[ValidationError]]:
+        """Validate entries and the children inheriting from them.
+
+        Issues found are recorded in ``validation_issues``; entries that
+        now validate cleanly, or are gone, are dropped from it.
+
+        Args:
+            keys: Keys of the entries that changed
+
+        Returns:
+            Errors of every affected entry by key
+        """
+        results = self.validator_registry.revalidate(keys, self.entries.iter_entries)
+        for key, errors in results.items():
+            if errors:
+                self.validation_issues[key] = errors
+            else:
+                self.validation_issues.pop(key, None)
+        return results
+
+    def _refresh_crossrefs(self, event: Event) -> None:
+        """Apply an entry change to the cross-reference graph once loaded.
+
+        A change to an entry that others cross-reference revalidates those
+        children, since the fields they inherit changed with it.
+        """
+        if not self.crossrefs.loaded:
+            return
+        if event.type == EventType.STORAGE_CLEARED:
+            self.crossrefs.clear()
+            self.validation_issues.clear()
+            return
+
+        entry = event.data.get("entry")
+        changed = set(event.affected_keys)
+        affected: set[str] = set()
+        for key in changed:
+            if event.type == EventType.ENTRY_DELETED:
+                affected |= self.crossrefs.remove(key)
+            elif entry is not None and entry.key == key:
+                affected |= self.crossrefs.add(entry)
+            else:
+                affected |= self.crossrefs.refresh(key, self.entries.find(key))
+
+        if affected - changed:
+            self.revalidate(changed)
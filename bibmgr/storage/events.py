@@ -1,7 +1,12 @@
 """Event system for tracking changes to entries and metadata."""
 
-from collections.abc import Callable
-from dataclasses import dataclass
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 from typing import Any
@@ -44,6 +49,11 @@ class EventType(Enum):
     PROGRESS_UPDATE = auto()
 
 
+PROGRESS_EVENT_TYPES = frozenset(
+    {EventType.PROGRESS, EventType.PROGRESS_UPDATE, EventType.INDEX_PROGRESS}
+)
+
+
 @dataclass
 class Event:
     """An event that occurred in the system."""
@@ -62,50 +72,301 @@ class Event:
         """Get entry if included in event data."""
         return self.data.get("entry")
 
+    @property
+    def affected_keys(self) -> list[str]:
+        """Get keys of every entry this event touches.
 
-class EventBus:
-    """Simple event bus for publishing and subscribing to events."""
+        Understands the payloads used by repositories and command handlers:
+        single entries, bulk ``entry_keys`` and merge source/target keys.
+        """
+        keys: list[str] = []
+
+        def add(key: Any) -> None:
+            if isinstance(key, str) and key and key not in keys:
+                keys.append(key)
+
+        add(self.data.get("entry_key"))
+        add(self.data.get("target_key"))
+        for name in ("entry", "new_entry", "merged_entry"):
+            entry = self.data.get(name)
+            if entry is not None:
+                add(getattr(entry, "key", None))
+        for name in ("entry_keys", "source_keys"):
+            for key in self.data.get(name) or ():
+                add(key)
+
+        return keys
+
+
+@dataclass
+class EventBusMetrics:
+    """Counters describing event bus throughput and latency."""
+
+    published: int = 0
+    delivered: int = 0
+    coalesced: int = 0
+    handler_errors: int = 0
+    publish_latency_total: float = 0.0
+    publish_latency_max: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+    @property
+    def avg_publish_latency(self) -> float:
+        """Average time spent inside publish() in seconds."""
+        if not self.published:
+            return 0.0
+        return self.publish_latency_total / self.published
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to a plain dictionary."""
+        return {
+            "published": self.published,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "handler_errors": self.handler_errors,
+            "avg_publish_latency_ms": self.avg_publish_latency * 1000,
+            "max_publish_latency_ms": self.publish_latency_max * 1000,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+        }
+
+
+def coalesce_events(events: list[Event]) -> list[Event]:
+    """Collapse bursts of related events into summary events.
+
+    Runs of ``ENTRY_CREATED`` events become a single ``ENTRIES_IMPORTED``
+    event, and runs of progress events for the same operation keep only
+    the most recent one. Relative order of everything else is preserved.
+    """
+    coalesced: list[Event] = []
+
+    for event in events:
+        previous = coalesced[-1] if coalesced else None
+
+        if event.type == EventType.ENTRY_CREATED and previous is not None:
+            if previous.type == EventType.ENTRY_CREATED:
+                coalesced[-1] = Event(
+                    type=EventType.ENTRIES_IMPORTED,
+                    timestamp=event.timestamp,
+                    data={
+                        "entry_keys": [previous.entry_key, event.entry_key],
+                        "entries": [previous.entry, event.entry],
+                        "count": 2,
+                        "coalesced": True,
+                    },
+                )
+                continue
+            if previous.type == EventType.ENTRIES_IMPORTED and previous.data.get(
+                "coalesced"
+            ):
+                previous.data["entry_keys"].append(event.entry_key)
+                previous.data["entries"].append(event.entry)
+                previous.data["count"] += 1
+                continue
+
+        if (
+            event.type in PROGRESS_EVENT_TYPES
+            and previous is not None
+            and previous.type == event.type
+            and previous.data.get("operation") == event.data.get("operation")
+        ):
+            coalesced[-1] = event
+            continue
+
+        coalesced.append(event)
+
+    return coalesced
+
+
+@dataclass
+class _BatchSubscription:
+    """A subscriber that receives events in lists rather than one by one."""
+
+    event_types: frozenset[EventType]
+    handler: Callable[[list[Event]], None]
+    max_batch: int = 100
+    max_delay: float = 0.05
+    coalesce: bool = True
+    pending: list[Event] = field(default_factory=list)
+    first_pending_at: float = 0.0
+
+
+class _FlushRequest:
+    """Queue marker asking the dispatcher to drain batches and signal back."""
 
     def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class EventBus:
+    """Event bus for publishing and subscribing to events.
+
+    By default handlers run synchronously inside ``publish``. With
+    ``async_dispatch=True`` events are queued and delivered by a background
+    dispatcher thread, so publishers only pay for an enqueue. Batch
+    subscribers (see ``subscribe_batch``) receive coalesced lists of events,
+    and progress events can be rate limited with ``progress_interval``.
+    """
+
+    def __init__(
+        self,
+        history_limit: int = 1000,
+        async_dispatch: bool = False,
+        progress_interval: float = 0.0,
+    ):
         self._subscribers: dict[EventType, list[Callable[[Event], None]]] = {}
-        self._history: list[Event] = []
-        self._history_limit = 1000
+        self._batch_subscribers: list[_BatchSubscription] = []
+        self._history: deque[Event] = deque(maxlen=history_limit)
+        self._lock = threading.RLock()
+        self._batch_lock = threading.RLock()
+        self._batching_depth = 0
+        self._last_progress: dict[tuple[EventType, Any], float] = {}
+        self.progress_interval = progress_interval
+        self.metrics = EventBusMetrics()
+
+        self.async_dispatch = async_dispatch
+        self._queue: queue.Queue | None = None
+        self._dispatcher: threading.Thread | None = None
+        if async_dispatch:
+            self._start_dispatcher()
+
+    @property
+    def _history_limit(self) -> int:
+        """Maximum number of events kept in history."""
+        return self._history.maxlen or 0
+
+    @_history_limit.setter
+    def _history_limit(self, limit: int) -> None:
+        self._history = deque(self._history, maxlen=limit)
 
     def subscribe(
         self, event_type: EventType, handler: Callable[[Event], None]
     ) -> None:
         """Subscribe to events of a specific type."""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(handler)
+        with self._lock:
+            if event_type not in self._subscribers:
+                self._subscribers[event_type] = []
+            self._subscribers[event_type].append(handler)
 
     def unsubscribe(
         self, event_type: EventType, handler: Callable[[Event], None]
     ) -> None:
         """Unsubscribe from events."""
-        if event_type in self._subscribers:
-            self._subscribers[event_type].remove(handler)
+        with self._lock:
+            if event_type in self._subscribers:
+                self._subscribers[event_type].remove(handler)
+
+    def subscribe_batch(
+        self,
+        event_types: EventType | Iterable[EventType],
+        handler: Callable[[list[Event]], None],
+        max_batch: int = 100,
+        max_delay: float = 0.05,
+        coalesce: bool = True,
+    ) -> None:
+        """Subscribe a handler that receives lists of events.
+
+        Args:
+            event_types: Event type or types to receive
+            handler: Callable invoked with a list of events
+            max_batch: Deliver as soon as this many events are pending
+            max_delay: Seconds the dispatcher waits for a burst to end
+            coalesce: Whether to collapse bursts with ``coalesce_events``
+        """
+        if isinstance(event_types, EventType):
+            event_types = [event_types]
+        subscription = _BatchSubscription(
+            event_types=frozenset(event_types),
+            handler=handler,
+            max_batch=max(1, max_batch),
+            max_delay=max_delay,
+            coalesce=coalesce,
+        )
+        with self._batch_lock:
+            self._batch_subscribers.append(subscription)
+
+    def unsubscribe_batch(self, handler: Callable[[list[Event]], None]) -> None:
+        """Remove a batch subscriber, delivering anything still pending."""
+        with self._batch_lock:
+            for subscription in list(self._batch_subscribers):
+                if subscription.handler == handler:
+                    self._flush_subscription(subscription)
+                    self._batch_subscribers.remove(subscription)
 
     def publish(self, event: Event) -> None:
         """Publish an event to all subscribers."""
-        # Add to history
+        started = time.perf_counter()
+
+        if self._should_drop_progress(event):
+            self._record_publish(started, coalesced=True)
+            return
+
         self._history.append(event)
-        if len(self._history) > self._history_limit:
-            self._history = self._history[-self._history_limit :]
 
-        # Notify subscribers
-        if event.type in self._subscribers:
-            for handler in self._subscribers[event.type]:
-                try:
-                    handler(event)
-                except Exception:
-                    pass  # Don't let subscriber errors break publishing
+        if self._queue is not None:
+            self._queue.put(event)
+            depth = self._queue.qsize()
+            self.metrics.queue_depth = depth
+            self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, depth)
+        else:
+            self._deliver(event)
+
+        self._record_publish(started)
+
+    @contextmanager
+    def batching(self) -> Iterator["EventBus"]:
+        """Hold batch deliveries until the block exits.
+
+        Regular subscribers are unaffected; batch subscribers receive the
+        whole burst, coalesced, once the outermost block finishes.
+        """
+        with self._batch_lock:
+            self._batching_depth += 1
+        try:
+            yield self
+        finally:
+            with self._batch_lock:
+                self._batching_depth -= 1
+                outermost = self._batching_depth == 0
+            if outermost:
+                self.flush()
+
+    def flush(self) -> None:
+        """Wait for queued events and deliver all pending batches."""
+        if self._queue is None or threading.current_thread() is self._dispatcher:
+            self._flush_batches()
+            return
+
+        request = _FlushRequest()
+        self._queue.put(request)
+        request.done.wait()
+
+    def close(self) -> None:
+        """Stop the dispatcher thread after delivering queued events."""
+        if self._queue is None or self._dispatcher is None:
+            self._flush_batches()
+            return
+
+        self._queue.put(_STOP)
+        self._dispatcher.join()
+        self._dispatcher = None
+        self._queue = None
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get publish latency, delivery and queue depth metrics."""
+        if self._queue is not None:
+            self.metrics.queue_depth = self._queue.qsize()
+        return self.metrics.to_dict()
 
     def get_history(
         self, event_type: EventType | None = None, limit: int = 100
     ) -> list[Event]:
         """Get event history."""
-        history = self._history
+        history = list(self._history)
 
         if event_type:
             history = [e for e in history if e.type == event_type]
@@ -116,6 +377,135 @@ class EventBus:
         """Clear event history."""
         self._history.clear()
 
+    def _should_drop_progress(self, event: Event) -> bool:
+        """Rate limit progress events, always letting the final one through."""
+        if self.progress_interval <= 0 or event.type not in PROGRESS_EVENT_TYPES:
+            return False
+
+        current = event.data.get("current", event.data.get("indexed"))
+        total = event.data.get("total")
+        if current is not None and current == total:
+            return False
+
+        key = (event.type, event.data.get("operation"))
+        now = time.monotonic()
+        last = self._last_progress.get(key)
+        if last is not None and now - last < self.progress_interval:
+            return True
+
+        self._last_progress[key] = now
+        return False
+
+    def _record_publish(self, started: float, coalesced: bool = False) -> None:
+        """Update publish counters."""
+        elapsed = time.perf_counter() - started
+        metrics = self.metrics
+        metrics.published += 1
+        if coalesced:
+            metrics.coalesced += 1
+        metrics.publish_latency_total += elapsed
+        metrics.publish_latency_max = max(metrics.publish_latency_max, elapsed)
+
+    def _deliver(self, event: Event) -> None:
+        """Run regular handlers and buffer the event for batch subscribers."""
+        with self._lock:
+            handlers = list(self._subscribers.get(event.type, ()))
+
+        for handler in handlers:
+            try:
+                handler(event)
+                self.metrics.delivered += 1
+            except Exception:
+                # Don't let subscriber errors break publishing
+                self.metrics.handler_errors += 1
+
+        if not self._batch_subscribers:
+            return
+
+        with self._batch_lock:
+            for subscription in self._batch_subscribers:
+                if event.type not in subscription.event_types:
+                    continue
+                if not subscription.pending:
+                    subscription.first_pending_at = time.monotonic()
+                subscription.pending.append(event)
+
+                if self._queue is None and self._batching_depth == 0:
+                    self._flush_subscription(subscription)
+                elif len(subscription.pending) >= subscription.max_batch:
+                    self._flush_subscription(subscription)
+
+    def _flush_batches(self) -> None:
+        """Deliver pending events to every batch subscriber."""
+        with self._batch_lock:
+            for subscription in self._batch_subscribers:
+                self._flush_subscription(subscription)
+
+    def _flush_subscription(self, subscription: _BatchSubscription) -> None:
+        """Deliver one subscriber's pending events."""
+        if not subscription.pending:
+            return
+
+        events = subscription.pending
+        subscription.pending = []
+        if subscription.coalesce:
+            batch = coalesce_events(events)
+            self.metrics.coalesced += len(events) - len(batch)
+        else:
+            batch = events
+
+        try:
+            subscription.handler(batch)
+            self.metrics.delivered += len(batch)
+        except Exception:
+            self.metrics.handler_errors += 1
+
+    def _next_batch_deadline(self) -> float | None:
+        """Seconds until the oldest pending batch should be delivered."""
+        with self._batch_lock:
+            deadlines = [
+                s.first_pending_at + s.max_delay
+                for s in self._batch_subscribers
+                if s.pending
+            ]
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def _start_dispatcher(self) -> None:
+        """Start the background dispatcher thread."""
+        self._queue = queue.Queue()
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="bibmgr-event-dispatcher", daemon=True
+        )
+        self._dispatcher.start()
+
+    def _dispatch_loop(self) -> None:
+        """Deliver queued events until asked to stop."""
+        assert self._queue is not None
+        event_queue = self._queue
+
+        while True:
+            timeout = None if self._batching_depth else self._next_batch_deadline()
+            try:
+                item = event_queue.get(timeout=timeout)
+            except queue.Empty:
+                if self._batching_depth == 0:
+                    self._flush_batches()
+                continue
+
+            self.metrics.queue_depth = event_queue.qsize()
+
+            if item is _STOP:
+                self._flush_batches()
+                return
+            if isinstance(item, _FlushRequest):
+                self._flush_batches()
+                item.done.set()
+                continue
+
+            self._deliver(item)
+
 
 class EventPublisher:
     """Mixin for classes that publish events."""
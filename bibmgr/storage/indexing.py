@@ -5,8 +5,10 @@ Supports both simple in-memory indexing and advanced Whoosh-based
 search with field-specific queries and relevance scoring.
 """
 
+import heapq
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 
 from bibmgr.core.models import Entry
@@ -152,13 +154,7 @@ class SimpleIndexBackend(IndexBackend):
                         scores[entry_key] = 0
                     scores[entry_key] += sum(field_counts.values())
 
-        results = [
-            SearchResult(entry_key=entry_key, score=score / len(query_tokens))
-            for entry_key, score in scores.items()
-        ]
-
-        results.sort()
-        return results[:limit]
+        return self._top_results(scores, len(query_tokens), limit)
 
     def search_field(
         self, field: str, query: str, limit: int = 100
@@ -180,15 +176,17 @@ class SimpleIndexBackend(IndexBackend):
                         # Use term frequency in the specific field
                         scores[entry_key] += field_counts[field]
 
-        # Convert to results
-        results = []
-        for entry_key, score in scores.items():
-            results.append(
-                SearchResult(entry_key=entry_key, score=score / len(query_tokens))
-            )
+        return self._top_results(scores, len(query_tokens), limit)
 
-        results.sort()
-        return results[:limit]
+    def _top_results(
+        self, scores: dict[str, float], token_count: int, limit: int
+    ) -> list[SearchResult]:
+        """Build results for the best ``limit`` scores only."""
+        top = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [
+            SearchResult(entry_key=entry_key, score=score / token_count)
+            for entry_key, score in top
+        ]
 
     def clear(self) -> None:
         """Clear the entire index."""
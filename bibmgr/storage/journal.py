@@ -0,0 +1,259 @@
+"""Append-only change journal numbered by storage generation.
+
+Every change to an entry bumps the storage generation and appends one
+record to the journal. Consumers that maintain derived data (search
+indexes, snapshots, caches) remember the last generation they processed
+and ask the journal for everything that changed since, instead of
+rescanning the whole library after a restart.
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from bibmgr.storage.events import Event, EventBus, EventType
+
+JOURNALED_EVENTS = (
+    EventType.ENTRY_CREATED,
+    EventType.ENTRY_UPDATED,
+    EventType.ENTRY_DELETED,
+    EventType.ENTRIES_IMPORTED,
+    EventType.ENTRIES_MERGED,
+    EventType.BULK_CREATED,
+    EventType.STORAGE_CLEARED,
+)
+
+# Compact once this many records are behind every consumer
+COMPACT_THRESHOLD = 1000
+
+
+@dataclass
+class JournalChanges:
+    """Net effect of the journal records after some generation."""
+
+    generation: int
+    keys: set[str] = field(default_factory=set)
+    cleared: bool = False
+    # False when compaction already dropped records after the generation
+    complete: bool = True
+
+    def __bool__(self) -> bool:
+        return self.cleared or bool(self.keys)
+
+
+class ChangeJournal:
+    """Append-only log of changed entry keys.
+
+    Records are JSON lines of the form ``{"g": 12, "op": "change", "key":
+    "smith2020"}``; a ``clear`` record marks that storage was emptied.
+    Appends take an exclusive ``flock`` so several processes (CLI and
+    daemon) can share one journal without reusing generation numbers.
+
+    Consumers that replay records report how far they got through
+    ``acknowledge``; once enough records are behind all of them the log
+    is compacted, so it does not grow with the lifetime of the library.
+    Acknowledgements are kept in a ``.consumers`` file next to the log,
+    so a consumer that is not running still holds back compaction.
+    """
+
+    def __init__(self, path: Path, compact_threshold: int = COMPACT_THRESHOLD):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+        self._generation = self._read_last_generation()
+        self._compacted = self._read_first_generation() - 1
+        self.consumers_path = self.path.with_name(self.path.name + ".consumers")
+
+    @property
+    def generation(self) -> int:
+        """Current storage generation (number of the last record)."""
+        return self._generation
+
+    def record(self, keys: Iterable[str]) -> int:
+        """Record that entries changed and return the new generation."""
+        return self._append([("change", key) for key in keys])
+
+    def record_clear(self) -> int:
+        """Record that all storage was cleared."""
+        return self._append([("clear", None)])
+
+    def changes_since(self, generation: int) -> JournalChanges:
+        """Collect keys changed after ``generation``.
+
+        Keys changed before the most recent ``clear`` record are dropped,
+        since the clear already accounts for them. If the log was compacted
+        past ``generation`` the result is marked incomplete.
+        """
+        changes = JournalChanges(generation=generation)
+
+        first = True
+        for record in self._iter_records():
+            if first:
+                changes.complete = record["g"] <= generation + 1
+                first = False
+            if record["g"] <= generation:
+                continue
+            changes.generation = max(changes.generation, record["g"])
+            if record["op"] == "clear":
+                changes.keys.clear()
+                changes.cleared = True
+            else:
+                changes.keys.add(record["key"])
+
+        return changes
+
+    def acknowledge(self, consumer: str, generation: int) -> bool:
+        """Record that ``consumer`` processed every record up to ``generation``.
+
+        Compacts the log up to the oldest generation acknowledged by any
+        consumer, including those in other processes, once at least
+        ``compact_threshold`` records precede it.
+
+        Returns:
+            True if the log was compacted
+        """
+        with self._lock, open(self.path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                consumers = self.consumers()
+                if consumers.get(consumer) != generation:
+                    consumers[consumer] = generation
+                    self._write_consumers(consumers)
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            upto = min(consumers.values())
+            if upto - self._compacted < self.compact_threshold:
+                return False
+        self.compact(upto)
+        return True
+
+    def consumers(self) -> dict[str, int]:
+        """Last generation acknowledged by each consumer."""
+        try:
+            return {
+                str(name): int(generation)
+                for name, generation in json.loads(
+                    self.consumers_path.read_text()
+                ).items()
+            }
+        except (OSError, ValueError, AttributeError, TypeError):
+            return {}
+
+    def compact(self, upto: int) -> None:
+        """Drop records at or below ``upto`` that every consumer has seen."""
+        with self._lock, open(self.path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                lines = [line for line in f if line.strip()]
+                kept = [line for line in lines if self._line_generation(line) > upto]
+                if not kept and lines:
+                    # Keep the newest record so the generation never goes back
+                    kept = lines[-1:]
+                f.seek(0)
+                f.truncate()
+                f.writelines(kept)
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            self._compacted = max(self._compacted, upto)
+
+    def attach(self, event_bus: EventBus) -> None:
+        """Record entry changes published on ``event_bus``."""
+        for event_type in JOURNALED_EVENTS:
+            event_bus.subscribe(event_type, self._handle_event)
+
+    def detach(self, event_bus: EventBus) -> None:
+        """Stop recording events from ``event_bus``."""
+        for event_type in JOURNALED_EVENTS:
+            event_bus.unsubscribe(event_type, self._handle_event)
+
+    def _handle_event(self, event: Event) -> None:
+        """Translate a storage event into journal records."""
+        if event.type == EventType.STORAGE_CLEARED:
+            self.record_clear()
+        elif keys := event.affected_keys:
+            self.record(keys)
+
+    def _append(self, records: list[tuple[str, str | None]]) -> int:
+        """Append records under an exclusive lock."""
+        if not records:
+            return self._generation
+
+        with self._lock, open(self.path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                generation = self._last_generation_in(f)
+                lines = []
+                for op, key in records:
+                    generation += 1
+                    lines.append(json.dumps({"g": generation, "op": op, "key": key}))
+                f.seek(0, os.SEEK_END)
+                f.write("\n".join(lines) + "\n")
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        self._generation = generation
+        return generation
+
+    def _write_consumers(self, consumers: dict[str, int]) -> None:
+        """Replace the consumers file in one rename."""
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(consumers, f, sort_keys=True)
+            os.replace(tmp, self.consumers_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _iter_records(self) -> Iterable[dict]:
+        """Yield parsed records, skipping torn lines."""
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except (json.JSONDecodeError, KeyError):
+                    continue
+
+    def _read_last_generation(self) -> int:
+        """Read the generation of the last record on disk."""
+        if not self.path.exists():
+            return 0
+        with open(self.path) as f:
+            return self._last_generation_in(f)
+
+    def _read_first_generation(self) -> int:
+        """Read the generation of the first record on disk."""
+        for record in self._iter_records():
+            return int(record["g"])
+        return self._generation + 1
+
+    def _last_generation_in(self, f) -> int:
+        """Find the last generation number by reading the file's tail."""
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 4096))
+        for line in reversed(f.read().splitlines()):
+            generation = self._line_generation(line)
+            if generation >= 0:
+                return generation
+        return 0
+
+    @staticmethod
+    def _line_generation(line: str) -> int:
+        """Parse a record's generation, or -1 for a torn line."""
+        try:
+            return int(json.loads(line)["g"])
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return -1
@@ -2,15 +2,42 @@
 
 This module provides utilities for migrating data between different
 storage backends, with progress tracking and error handling.
+
+Backups are incremental: every record, metadata file and note is stored
+once as a compressed blob named by the hash of its content, shared by all
+snapshots that contain it. A snapshot is a manifest mapping keys and file
+paths to blob hashes, so it only writes the blobs that changed since the
+snapshots before it. Every record is still read and hashed, because
+restores, migrations and hand edits change storage without going through
+the change journal.
+
+Entries move between backends in streamed batches: each batch is read
+lazily from the source, written in one target transaction and verified
+by comparing checksums of what was written with what the target reads
+back. A checkpoint written after every batch lets an interrupted
+migration resume after the last stored key, once the checkpointed batch
+has been read back from the target and found intact; otherwise that batch
+is migrated again.
 """
 
+import hashlib
 import json
-from collections.abc import Callable
+import os
+import tempfile
+import zlib
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+import msgspec
+
 from bibmgr.storage.backends.base import BaseBackend
 from bibmgr.storage.events import Event, EventBus, EventType
 from bibmgr.storage.metadata import MetadataStore
@@ -29,6 +56,8 @@ class MigrationStats:
     total_collections: int = 0
     migrated_collections: int = 0
     failed_collections: int = 0
+    mismatched_batches: int = 0
+    resumed_from: str | None = None
     errors: list[str] = field(default_factory=list)
 
     @property
@@ -61,11 +90,291 @@ class MigrationStats:
             "total_collections": self.total_collections,
             "migrated_collections": self.migrated_collections,
             "failed_collections": self.failed_collections,
+            "mismatched_batches": self.mismatched_batches,
+            "resumed_from": self.resumed_from,
             "success_rate": self.success_rate,
             "errors": self.errors,
         }
 
 
+# Bump when the checkpoint layout changes
+CHECKPOINT_VERSION = 2
+
+# Errors kept in a checkpoint; later ones are only counted
+CHECKPOINT_ERROR_SAMPLE = 100
+
+# Backend attributes naming the storage a backend reads and writes
+BACKEND_LOCATIONS = ("data_dir", "db_path", "path")
+
+
+class MigrationCheckpoint(msgspec.Struct):
+    """Progress of a migration, stored after every committed batch.
+
+    ``batch_keys`` and ``batch_digest`` describe the records the last batch
+    wrote, so a resumed run can check they reached the target intact;
+    ``previous`` is the checkpoint before that batch, to go back to if not.
+    ``errors`` holds the first ``error_count`` errors only, up to
+    ``CHECKPOINT_ERROR_SAMPLE``. ``source`` and ``target`` identify the
+    backends, so the checkpoint cannot resume a different migration.
+    """
+
+    version: int = CHECKPOINT_VERSION
+    source: str = ""
+    target: str = ""
+    last_key: str | None = None
+    batch_digest: str = ""
+    batch_keys: list[str] = []
+    batches: int = 0
+    migrated: int = 0
+    failed: int = 0
+    mismatched: int = 0
+    error_count: int = 0
+    errors: list[str] = []
+    previous: "MigrationCheckpoint | None" = None
+
+
+def batch_digest(items: Sequence[tuple[str, Any]]) -> str:
+    """Checksum of the records of a batch, independent of dict ordering."""
+    encoded = msgspec.json.encode(items, order="sorted")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def backend_identity(backend: BaseBackend) -> str:
+    """Backend class and the location of its storage, when it has one."""
+    identity = type(backend).__name__
+    for name in BACKEND_LOCATIONS:
+        location = getattr(backend, name, None)
+        if isinstance(location, (str, Path)):
+            return f"{identity}:{Path(location).resolve()}"
+    return identity
+
+
+def read_records(backend: BaseBackend, keys: Sequence[str]) -> dict[str, Any]:
+    """Records of keys present in a backend, read in bulk when supported."""
+    if hasattr(backend, "read_many"):
+        return backend.read_many(keys)
+    records = {}
+    for key in keys:
+        data = backend.read(key)
+        if data is not None:
+            records[key] = data
+    return records
+
+
+class BatchMigrator:
+    """Copy records between backends in checkpointed, verified batches."""
+
+    def __init__(
+        self,
+        source: BaseBackend,
+        target: BaseBackend,
+        batch_size: int = 100,
+        checkpoint_path: Path | None = None,
+        readers: int = 1,
+        verify: bool = True,
+    ):
+        """Initialize the migrator.
+
+        Args:
+            source: Backend read from
+            target: Backend written to
+            batch_size: Records per read and per target transaction
+            checkpoint_path: File recording progress; a run finding it
+                resumes after its last key, and removes it when complete
+            readers: Threads reading source batches ahead of the writer
+            verify: Read each written batch back and compare checksums
+        """
+        self.source = source
+        self.target = target
+        self.batch_size = max(batch_size, 1)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.readers = readers
+        self.verify = verify
+
+    def run(
+        self,
+        keys: Sequence[str],
+        prepare: Callable[[str, dict[str, Any]], dict[str, Any]] | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        dry_run: bool = False,
+    ) -> MigrationStats:
+        """Migrate the records of keys, in key order.
+
+        Args:
+            keys: Source keys to migrate
+            prepare: Turns a source record into the record written; raising
+                marks the record as failed
+            progress: Called with (processed, total) after every batch
+            dry_run: Read and prepare records without writing them
+
+        Raises:
+            ValueError: If the checkpoint has another version or was written
+                for other backends
+        """
+        stats = MigrationStats(started_at=datetime.now())
+        keys = sorted(keys)
+        stats.total_entries = len(keys)
+
+        checkpoint = self._load_checkpoint()
+        if self.verify and not dry_run and not self._batch_stored(checkpoint):
+            # The last checkpointed batch did not reach the target intact
+            checkpoint = checkpoint.previous or MigrationCheckpoint()
+        start = 0
+        if checkpoint.last_key is not None:
+            start = bisect_right(keys, checkpoint.last_key)
+            stats.resumed_from = checkpoint.last_key
+        stats.migrated_entries = checkpoint.migrated
+        stats.failed_entries = checkpoint.failed
+        stats.mismatched_batches = checkpoint.mismatched
+        stats.errors = list(checkpoint.errors)
+        # Errors of earlier runs counted but not kept in the checkpoint
+        omitted = checkpoint.error_count - len(checkpoint.errors)
+
+        batches = (
+            keys[i : i + self.batch_size]
+            for i in range(start, len(keys), self.batch_size)
+        )
+        processed = start
+        for batch, records in self._read_batches(batches):
+            items = []
+            for key in batch:
+                data = records.get(key)
+                if data is None:
+                    stats.failed_entries += 1
+                    stats.errors.append(f"Entry {key}: Not found in source")
+                    continue
+                try:
+                    items.append((key, prepare(key, data) if prepare else data))
+                except Exception as e:
+                    stats.failed_entries += 1
+                    stats.errors.append(f"Entry {key}: {str(e)}")
+
+            if dry_run:
+                written = items
+                stats.migrated_entries += len(items)
+            else:
+                written = self._write(items, stats)
+            digest = batch_digest(written)
+
+            if self.verify and not dry_run and written:
+                stored = read_records(self.target, [key for key, _ in written])
+                readback = [(key, stored.get(key)) for key, _ in written]
+                if batch_digest(readback) != digest:
+                    stats.mismatched_batches += 1
+                    stats.errors.append(
+                        f"Batch {batch[0]}..{batch[-1]}: checksum mismatch"
+                    )
+
+            if not dry_run:
+                checkpoint = MigrationCheckpoint(
+                    source=backend_identity(self.source),
+                    target=backend_identity(self.target),
+                    last_key=batch[-1],
+                    batch_digest=digest,
+                    batch_keys=[key for key, _ in written],
+                    batches=checkpoint.batches + 1,
+                    migrated=stats.migrated_entries,
+                    failed=stats.failed_entries,
+                    mismatched=stats.mismatched_batches,
+                    error_count=omitted + len(stats.errors),
+                    errors=stats.errors[:CHECKPOINT_ERROR_SAMPLE],
+                    previous=msgspec.structs.replace(checkpoint, previous=None),
+                )
+                self._save_checkpoint(checkpoint)
+
+            processed += len(batch)
+            if progress:
+                progress(processed, len(keys))
+
+        if omitted:
+            stats.errors.append(f"{omitted} more errors before resuming")
+        if self.checkpoint_path and not dry_run:
+            self.checkpoint_path.unlink(missing_ok=True)
+        stats.completed_at = datetime.now()
+        return stats
+
+    def _read_batches(
+        self, batches: Iterator[list[str]]
+    ) -> Iterator[tuple[list[str], dict[str, Any]]]:
+        """Source records of each batch, read ahead by the reader threads."""
+        if self.readers <= 1:
+            for batch in batches:
+                yield batch, read_records(self.source, batch)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.readers) as pool:
+            pending: deque = deque()
+            for batch in batches:
+                pending.append((batch, pool.submit(read_records, self.source, batch)))
+                if len(pending) >= self.readers:
+                    batch, future = pending.popleft()
+                    yield batch, future.result()
+            while pending:
+                batch, future = pending.popleft()
+                yield batch, future.result()
+
+    def _write(
+        self, items: list[tuple[str, dict[str, Any]]], stats: MigrationStats
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Write a batch in one transaction; returns the records stored."""
+        try:
+            if hasattr(self.target, "write_many"):
+                self.target.write_many(items)
+            else:
+                transaction = getattr(self.target, "begin_transaction", nullcontext)
+                with transaction():
+                    for key, data in items:
+                        self.target.write(key, data)
+        except Exception:
+            # The batch was rolled back; isolate the failing records
+            written = []
+            for key, data in items:
+                try:
+                    self.target.write(key, data)
+                    written.append((key, data))
+                    stats.migrated_entries += 1
+                except Exception as e:
+                    stats.failed_entries += 1
+                    stats.errors.append(f"Entry {key}: {str(e)}")
+            return written
+
+        stats.migrated_entries += len(items)
+        return items
+
+    def _batch_stored(self, checkpoint: MigrationCheckpoint) -> bool:
+        """Whether the target still holds the last checkpointed batch."""
+        if not checkpoint.batch_keys:
+            return True
+        stored = read_records(self.target, checkpoint.batch_keys)
+        readback = [(key, stored.get(key)) for key in checkpoint.batch_keys]
+        return batch_digest(readback) == checkpoint.batch_digest
+
+    def _load_checkpoint(self) -> MigrationCheckpoint:
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return MigrationCheckpoint()
+        checkpoint = msgspec.json.decode(
+            self.checkpoint_path.read_bytes(), type=MigrationCheckpoint
+        )
+        if checkpoint.version != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version {checkpoint.version}: "
+                f"{self.checkpoint_path}"
+            )
+        identities = (backend_identity(self.source), backend_identity(self.target))
+        if (checkpoint.source, checkpoint.target) != identities:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to a migration from "
+                f"{checkpoint.source} to {checkpoint.target}"
+            )
+        return checkpoint
+
+    def _save_checkpoint(self, checkpoint: MigrationCheckpoint) -> None:
+        if self.checkpoint_path is None:
+            return
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.checkpoint_path, msgspec.json.encode(checkpoint))
+
+
 class MigrationManager:
     """Manages data migration between storage backends."""
 
@@ -87,37 +396,36 @@ class MigrationManager:
         source_backend: BaseBackend,
         target_backend: BaseBackend,
         batch_size: int = 100,
+        checkpoint_path: Path | None = None,
+        readers: int = 1,
+        verify: bool = True,
     ) -> MigrationStats:
-        """Migrate entries between backends."""
-        stats = MigrationStats(started_at=datetime.now())
+        """Stream entries between backends in validated, verified batches.
 
+        See ``BatchMigrator`` for the checkpoint, reader and verify options.
+        """
         source_repo = EntryRepository(source_backend)
-        target_repo = EntryRepository(target_backend)
-
-        all_keys = source_backend.keys()
-        stats.total_entries = len(all_keys)
-
-        for i in range(0, len(all_keys), batch_size):
-            batch_keys = all_keys[i : i + batch_size]
-
-            for key in batch_keys:
-                try:
-                    entry = source_repo.find(key)
-                    if entry:
-                        target_repo.save(entry)
-                        stats.migrated_entries += 1
-                    else:
-                        stats.failed_entries += 1
-                        stats.errors.append(f"Entry {key}: Not found in source")
-
-                except Exception as e:
-                    stats.failed_entries += 1
-                    stats.errors.append(f"Entry {key}: {str(e)}")
-
-            processed = min(i + batch_size, len(all_keys))
-            self._report_progress(processed, len(all_keys))
-
-        stats.completed_at = datetime.now()
+        context = EntryRepository(target_backend).validation_context()
+
+        def prepare(key: str, data: dict[str, Any]) -> dict[str, Any]:
+            entry = source_repo._convert_to_entry(data)
+            errors = [e for e in context.validate(entry) if e.severity == "error"]
+            if errors:
+                raise ValueError(
+                    f"Validation failed: {', '.join(e.message for e in errors)}"
+                )
+            return entry.to_dict()
+
+        migrator = BatchMigrator(
+            source_backend,
+            target_backend,
+            batch_size=batch_size,
+            checkpoint_path=checkpoint_path,
+            readers=readers,
+            verify=verify,
+        )
+        keys = [k for k in source_backend.keys() if not k.startswith("collection:")]
+        stats = migrator.run(keys, prepare, progress=self._report_progress)
 
         if self.event_bus:
             self.event_bus.publish(
@@ -243,39 +551,154 @@ class MigrationManager:
         return results
 
 
+# Bump when the manifest layout changes
+BACKUP_FORMAT_VERSION = 1
+
+# Records written per transaction when restoring
+RESTORE_BATCH_SIZE = 1000
+
+# Directories of the data dir backed up along with the records
+BACKUP_FILE_DIRS = ("metadata", "notes")
+
+
+class FileRecord(msgspec.Struct, frozen=True):
+    """Blob of a backed up file with the stat it was read at."""
+
+    digest: str
+    size: int
+    mtime_ns: int
+
+
+class BackupManifest(msgspec.Struct):
+    """Contents of one snapshot."""
+
+    version: int = BACKUP_FORMAT_VERSION
+    records: dict[str, str] = {}
+    files: dict[str, FileRecord] = {}
+
+
+_manifest_encoder = msgspec.msgpack.Encoder()
+_manifest_decoder = msgspec.msgpack.Decoder(BackupManifest)
+
+
+class BlobStore:
+    """Compressed blobs addressed by the hash of their content."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:]
+
+    def __contains__(self, digest: str) -> bool:
+        return self.path(digest).exists()
+
+    def put(self, data: bytes, digest: str | None = None) -> int:
+        """Store data unless present; returns the bytes written."""
+        digest = digest or self.digest(data)
+        path = self.path(digest)
+        if path.exists():
+            return 0
+        path.parent.mkdir(exist_ok=True)
+        compressed = zlib.compress(data)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return len(compressed)
+
+    def get(self, digest: str) -> bytes:
+        return zlib.decompress(self.path(digest).read_bytes())
+
+
 class BackupManager:
-    """Manages backups of storage data."""
+    """Manages incremental backups of storage data."""
 
     def __init__(self, data_dir: Path):
         self.data_dir = Path(data_dir)
         self.backup_dir = self.data_dir / "backups"
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self.blobs = BlobStore(self.backup_dir / "objects")
 
     def create_backup(self, backend: BaseBackend, name: str | None = None) -> Path:
-        """Create a backup of the current storage."""
+        """Snapshot the backend records and the metadata and notes files.
+
+        Only blobs missing from earlier snapshots are written. Records that
+        cannot be serialized are skipped and listed in the snapshot metadata.
+        """
         if name is None:
             name = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
 
         backup_path = self.backup_dir / name
         backup_path.mkdir(parents=True, exist_ok=True)
 
+        base = self._latest_backup(exclude=name)
+        previous = self._load_manifest(base) if base else BackupManifest()
+        known = set(previous.records.values())
+
+        manifest = BackupManifest()
+        keys = backend.keys()
+        skipped = []
+        size = added_bytes = 0
+        for key in keys:
+            data = backend.read(key)
+            if data is None:
+                continue
+            try:
+                encoded = msgspec.json.encode(data, order="sorted")
+            except (TypeError, ValueError):
+                skipped.append(key)
+                continue
+            digest = BlobStore.digest(encoded)
+            size += len(encoded)
+            if digest not in known:
+                added_bytes += self.blobs.put(encoded, digest)
+                known.add(digest)
+            manifest.records[key] = digest
+
+        for path in self._data_files():
+            relative = path.relative_to(self.data_dir).as_posix()
+            stat = path.stat()
+            record = previous.files.get(relative)
+            if (
+                record is None
+                or record.size != stat.st_size
+                or record.mtime_ns != stat.st_mtime_ns
+            ):
+                content = path.read_bytes()
+                digest = BlobStore.digest(content)
+                added_bytes += self.blobs.put(content, digest)
+                record = FileRecord(digest, stat.st_size, stat.st_mtime_ns)
+            manifest.files[relative] = record
+            size += record.size
+
+        _write_atomic(
+            backup_path / "manifest.msgpack", _manifest_encoder.encode(manifest)
+        )
+
         metadata = {
             "created_at": datetime.now().isoformat(),
-            "entry_count": len(backend.keys()),
+            "entry_count": len(keys),
             "backend_type": backend.__class__.__name__,
+            "format_version": BACKUP_FORMAT_VERSION,
+            "base": base,
+            "file_count": len(manifest.files),
+            "size": size,
+            "added_bytes": added_bytes,
+            "skipped": skipped,
         }
-
-        with open(backup_path / "metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
-
-        from bibmgr.storage.importers.json import JsonImporter
-        from bibmgr.storage.repository import EntryRepository
-
-        repo = EntryRepository(backend)
-        entries = repo.find_all()
-
-        exporter = JsonImporter()
-        exporter.export_entries(entries, backup_path / "entries.json")
+        _write_atomic(
+            backup_path / "metadata.json", json.dumps(metadata, indent=2).encode()
+        )
 
         return backup_path
 
@@ -290,15 +713,19 @@ class BackupManager:
                     with open(metadata_file) as f:
                         metadata = json.load(f)
 
+                    size = metadata.get("size")
+                    if size is None:
+                        # Full dumps made before snapshots were incremental
+                        size = sum(f.stat().st_size for f in backup_dir.rglob("*"))
+
                     backups.append(
                         {
                             "name": backup_dir.name,
                             "path": str(backup_dir),
                             "created_at": metadata.get("created_at"),
                             "entry_count": metadata.get("entry_count"),
-                            "size": sum(
-                                f.stat().st_size for f in backup_dir.rglob("*")
-                            ),
+                            "size": size,
+                            "added_bytes": metadata.get("added_bytes", size),
                         }
                     )
 
@@ -306,15 +733,79 @@ class BackupManager:
         return backups
 
     def restore_backup(
-        self, backup_name: str, target_backend: BaseBackend
+        self,
+        backup_name: str,
+        target_backend: BaseBackend,
+        target_dir: Path | None = None,
+        batch_size: int = RESTORE_BATCH_SIZE,
     ) -> MigrationStats:
-        """Restore from a backup."""
+        """Restore from a backup.
+
+        Records are streamed from the blob store and written in batches of
+        one transaction each.
+
+        Args:
+            backup_name: Name of the snapshot
+            target_backend: Backend receiving the records
+            target_dir: Data dir receiving the metadata and notes files
+                (files are not restored when None)
+            batch_size: Records written per transaction
+        """
         backup_path = self.backup_dir / backup_name
         if not backup_path.exists():
             raise ValueError(f"Backup not found: {backup_name}")
 
+        if not (backup_path / "manifest.msgpack").exists():
+            return self._restore_full_dump(backup_path, target_backend)
+
+        manifest = self._load_manifest(backup_name)
+        stats = MigrationStats(started_at=datetime.now())
+        for key in manifest.records:
+            if key.startswith("collection:"):
+                stats.total_collections += 1
+            else:
+                stats.total_entries += 1
+
+        records = iter(manifest.records.items())
+        while batch := list(islice(records, batch_size)):
+            items = []
+            for key, digest in batch:
+                try:
+                    items.append((key, msgspec.json.decode(self.blobs.get(digest))))
+                except Exception as e:
+                    self._count_restored(stats, key, e)
+            try:
+                target_backend.write_many(items)
+            except Exception:
+                # Find the failing records one at a time
+                for key, data in items:
+                    try:
+                        target_backend.write(key, data)
+                    except Exception as e:
+                        self._count_restored(stats, key, e)
+                    else:
+                        self._count_restored(stats, key)
+            else:
+                for key, _ in items:
+                    self._count_restored(stats, key)
+
+        if target_dir is not None:
+            for relative, record in manifest.files.items():
+                try:
+                    path = Path(target_dir) / relative
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    _write_atomic(path, self.blobs.get(record.digest))
+                except Exception as e:
+                    stats.errors.append(f"File {relative}: {str(e)}")
+
+        stats.completed_at = datetime.now()
+        return stats
+
+    def _restore_full_dump(
+        self, backup_path: Path, target_backend: BaseBackend
+    ) -> MigrationStats:
+        """Restore a backup written as a single entries.json dump."""
         from bibmgr.storage.importers.json import JsonImporter
-        from bibmgr.storage.repository import EntryRepository
 
         importer = JsonImporter()
         entries, errors = importer.import_file(backup_path / "entries.json")
@@ -336,3 +827,54 @@ class BackupManager:
         stats.completed_at = datetime.now()
 
         return stats
+
+    @staticmethod
+    def _count_restored(
+        stats: MigrationStats, key: str, error: Exception | None = None
+    ) -> None:
+        collection = key.startswith("collection:")
+        if error is None:
+            if collection:
+                stats.migrated_collections += 1
+            else:
+                stats.migrated_entries += 1
+            return
+        if collection:
+            stats.failed_collections += 1
+        else:
+            stats.failed_entries += 1
+        stats.errors.append(f"Record {key}: {str(error)}")
+
+    def _data_files(self) -> Iterator[Path]:
+        """Metadata and notes files of the data dir."""
+        for directory in BACKUP_FILE_DIRS:
+            root = self.data_dir / directory
+            if root.is_dir():
+                yield from sorted(p for p in root.rglob("*.json") if p.is_file())
+
+    def _latest_backup(self, exclude: str) -> str | None:
+        """Name of the newest snapshot other than exclude."""
+        latest = None
+        for backup in self.list_backups():
+            if backup["name"] == exclude:
+                continue
+            if (Path(backup["path"]) / "manifest.msgpack").exists():
+                latest = backup["name"]
+                break
+        return latest
+
+    def _load_manifest(self, name: str) -> BackupManifest:
+        path = self.backup_dir / name / "manifest.msgpack"
+        return _manifest_decoder.decode(path.read_bytes())
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file with data in one rename."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
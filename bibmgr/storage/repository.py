@@ -6,13 +6,22 @@ querying through a fluent builder interface.
 """
 
 from abc import ABC, abstractmethod
-from contextlib import AbstractContextManager, contextmanager
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from enum import Enum
 from typing import Any, Protocol
 
+from bibmgr.core.crossref import CrossRefGraph
 from bibmgr.core.models import Collection, Entry
-from bibmgr.core.validators import ValidatorRegistry
+from bibmgr.core.validators import ValidationContext, ValidatorRegistry
 
+from .backends.base import first_free_key
+from .codec import project, projection_type, upgrade_entry
 from .query import Condition, Operator, Query
+from .snapshot import LibrarySnapshot
+
+# Operators of QueryBuilder filters
+FILTER_OPERATORS = frozenset({"=", "!=", ">", "<", ">=", "<=", "in", "contains"})
 
 
 class StorageBackend(Protocol):
@@ -135,6 +144,8 @@ class EntryRepository(Repository):
     def find(self, key: str) -> Entry | None:
         """Find entry by key, returning None if not found or corrupted."""
         try:
+            if hasattr(self.backend, "read_entry"):
+                return self.backend.read_entry(key)
             data = self.backend.read(key)
             if data is None:
                 return None
@@ -144,12 +155,104 @@ class EntryRepository(Repository):
 
     def find_all(self) -> list[Entry]:
         """Get all entries."""
-        entries = []
-        for key in self.backend.keys():
+        return list(self.iter_entries())
+
+    def iter_entries(self, keys: Iterable[str] | None = None) -> Iterator[Entry]:
+        """Yield entries one at a time, skipping missing or corrupted ones.
+
+        Args:
+            keys: Keys to read in this order (all stored keys when None)
+        """
+        if hasattr(self.backend, "read_entries"):
+            yield from self.backend.read_entries(keys)
+            return
+        for key in self.backend.keys() if keys is None else keys:
             entry = self.find(key)
             if entry:
-                entries.append(entry)
-        return entries
+                yield entry
+
+    def scan(
+        self,
+        fields: Iterable[str],
+        where: Iterable[tuple[str, str, Any]] = (),
+        order_by: Iterable[tuple[str, bool]] = (),
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Any]:
+        """Rows holding only the given fields of the matching entries.
+
+        Rows are structs of ``codec.projection_type(fields)``, with None for
+        unset fields. Backends with a ``scan`` of their own evaluate the
+        whole request; otherwise only the fields needed are decoded and
+        filtered and sorted here. Without ordering, rows come in the order
+        of ``find_all``; missing values sort first.
+
+        Args:
+            fields: Entry fields of each row
+            where: ``QueryBuilder`` filters (field, operator, value)
+            order_by: (field, ascending) pairs, most significant first
+            limit: Return at most this many rows
+            offset: Skip this many rows first
+
+        Raises:
+            ValueError: On unknown fields or operators
+        """
+        fields = tuple(fields)
+        where = list(where)
+        order_by = list(order_by)
+        needed = tuple(
+            dict.fromkeys(
+                [*fields, *(f for f, _, _ in where), *(f for f, _ in order_by)]
+            )
+        )
+        projection_type(needed)
+        unknown = {op for _, op, _ in where} - FILTER_OPERATORS
+        if unknown:
+            raise ValueError(f"Unknown filter operators: {', '.join(sorted(unknown))}")
+
+        if hasattr(self.backend, "scan"):
+            return self.backend.scan(fields, where, order_by, limit, offset)
+
+        if hasattr(self.backend, "read_entries"):
+            rows: Iterable[Any] = self.backend.read_entries(fields=needed)
+        else:
+            rows = (project(entry, needed) for entry in self.iter_entries())
+        matched = [row for row in rows if self._matches_filters(row, where)]
+        for field, ascending in reversed(order_by):
+            matched.sort(key=_ordering(field), reverse=not ascending)
+
+        matched = (
+            matched[offset:] if limit is None else matched[offset : offset + limit]
+        )
+        if needed != fields:
+            matched = [project(row, fields) for row in matched]
+        return matched
+
+    def keys(self) -> list[str]:
+        """Keys of all stored entries, without reading the entries."""
+        return [key for key in self.backend.keys() if not key.startswith("collection:")]
+
+    def keys_with_prefix(self, prefix: str, limit: int | None = None) -> list[str]:
+        """Sorted entry keys starting with prefix, at most limit of them."""
+        if prefix.startswith("collection:"):
+            return []
+        if not hasattr(self.backend, "keys_with_prefix"):
+            keys = sorted(k for k in self.keys() if k.startswith(prefix))
+            return keys[:limit]
+        if "collection:".startswith(prefix):
+            keys = [
+                key
+                for key in self.backend.keys_with_prefix(prefix)
+                if not key.startswith("collection:")
+            ]
+            return keys[:limit]
+        return self.backend.keys_with_prefix(prefix, limit)
+
+    def next_free_key(self, base: str) -> str | None:
+        """First unused key of base followed by a-z, then 2-99."""
+        if hasattr(self.backend, "next_free_key"):
+            return self.backend.next_free_key(base)
+        return first_free_key(base, set(self.keys_with_prefix(base)))
 
     def find_by(self, query: QueryBuilder) -> list[Entry]:
         """Find entries matching query with filtering, ordering, and pagination."""
@@ -172,20 +275,85 @@ class EntryRepository(Repository):
 
         return filtered
 
-    def save(self, entry: Entry, skip_validation: bool = False) -> None:
-        """Save entry with optional validation."""
+    def validation_context(self) -> ValidationContext:
+        """New context sharing validation results with ``save``."""
+        return ValidationContext(self.validator_registry)
+
+    def save(
+        self,
+        entry: Entry,
+        skip_validation: bool = False,
+        context: ValidationContext | None = None,
+    ) -> None:
+        """Save entry with optional validation.
+
+        Args:
+            entry: Entry to store
+            skip_validation: Store the entry without validating it
+            context: Results of validation already done on this write path
+        """
         if not skip_validation:
-            errors = self.validator_registry.validate(entry)
+            if context is None:
+                errors = self.validator_registry.validate(entry)
+            else:
+                errors = context.validate(entry)
             if any(e.severity == "error" for e in errors):
                 raise ValueError(f"Entry validation failed: {errors}")
 
-        data = entry.to_dict()
-        self.backend.write(entry.key, data)
+        if hasattr(self.backend, "write_entries"):
+            self.backend.write_entries([entry])
+            return
+        self.backend.write(entry.key, entry.to_dict())
+
+    def save_many(
+        self,
+        entries: Iterable[Entry],
+        skip_validation: bool = False,
+        context: ValidationContext | None = None,
+    ) -> None:
+        """Validate entries, then write them all in one backend transaction.
+
+        Nothing is written if any entry fails validation.
+        """
+        entries = list(entries)
+        if not skip_validation:
+            context = context or self.validation_context()
+            invalid = [
+                entry.key
+                for entry in entries
+                if any(e.severity == "error" for e in context.validate(entry))
+            ]
+            if invalid:
+                raise ValueError(f"Entry validation failed: {', '.join(invalid)}")
+
+        if hasattr(self.backend, "write_entries"):
+            self.backend.write_entries(entries)
+            return
+        items = [(entry.key, entry.to_dict()) for entry in entries]
+        if hasattr(self.backend, "write_many"):
+            self.backend.write_many(items)
+        else:
+            with self.transaction():
+                for key, data in items:
+                    self.backend.write(key, data)
 
     def delete(self, key: str) -> bool:
         """Delete entry."""
         return self.backend.delete(key)
 
+    def delete_many(self, keys: Iterable[str]) -> list[str]:
+        """Delete entries in one backend transaction and return those deleted."""
+        if hasattr(self.backend, "delete_many"):
+            return self.backend.delete_many(keys)
+        with self.transaction():
+            return [key for key in keys if self.backend.delete(key)]
+
+    def transaction(self) -> AbstractContextManager[None]:
+        """Backend transaction grouping the writes made inside it."""
+        if hasattr(self.backend, "begin_transaction"):
+            return self.backend.begin_transaction()
+        return nullcontext()
+
     def count(self) -> int:
         """Count entries."""
         return len(self.backend.keys())
@@ -330,30 +498,20 @@ class EntryRepository(Repository):
         return entries
 
     def _convert_to_entry(self, data: dict[str, Any]) -> Entry:
-        """Convert raw data to Entry with automatic migration support."""
-        import msgspec
-
-        migrated_data = data.copy()
+        """Convert raw data of any schema version to an Entry."""
+        return upgrade_entry(data)
 
-        if "type" in migrated_data and isinstance(migrated_data["type"], str):
-            migrated_data["type"] = migrated_data["type"].lower()
 
-        if "year" in migrated_data and isinstance(migrated_data["year"], str):
-            try:
-                migrated_data["year"] = int(migrated_data["year"])
-            except ValueError:
-                del migrated_data["year"]
+def _ordering(field: str):
+    """Sort key of a row field placing missing values first."""
 
-        if "keywords" in migrated_data and isinstance(migrated_data["keywords"], str):
-            keywords = migrated_data["keywords"].split(",")
-            migrated_data["keywords"] = tuple(
-                kw.strip() for kw in keywords if kw.strip()
-            )
+    def key(row: Any) -> tuple[bool, Any]:
+        value = getattr(row, field)
+        if isinstance(value, Enum):
+            value = value.value
+        return value is not None, value
 
-        try:
-            return msgspec.convert(migrated_data, Entry)
-        except Exception as e:
-            raise ValueError(f"Failed to convert entry data: {e}") from e
+    return key
 
 
 class CollectionRepository:
@@ -452,6 +610,8 @@ class RepositoryManager:
         self.entries = EntryRepository(backend)
         self.collections = CollectionRepository(backend)
         self.metadata_store = metadata_store
+        self.snapshot: LibrarySnapshot | None = None
+        self.crossrefs: CrossRefGraph | None = None
         self._transaction_depth = 0
 
         if self.metadata_store:
@@ -475,17 +635,20 @@ class RepositoryManager:
     ) -> dict[str, bool]:
         """Import multiple entries."""
         results = {}
+        context = self.entries.validation_context()
 
         with self.transaction():
             for entry in entries:
                 try:
                     if not skip_validation:
-                        errors = self.entries.validator_registry.validate(entry)
+                        errors = context.validate(entry)
                         if any(e.severity == "error" for e in errors):
                             results[entry.key] = False
                             continue
 
-                    self.entries.save(entry, skip_validation=skip_validation)
+                    self.entries.save(
+                        entry, skip_validation=skip_validation, context=context
+                    )
                     results[entry.key] = True
                 except Exception:
                     results[entry.key] = False
@@ -505,31 +668,20 @@ class RepositoryManager:
             return self.entries.find_all()
 
     def get_statistics(self) -> dict[str, Any]:
-        """Get repository statistics."""
-        entries = self.entries.find_all()
-
-        stats = {
-            "total_entries": len(entries),
-            "entries_by_type": {},
-            "entries_by_year": {},
-            "collections": {
-                "total": len(self.collections.find_all()),
-                "smart": len(self.collections.find_smart_collections()),
-            },
+        """Get repository statistics.
+
+        Entry counts are computed over the columnar snapshot, which is
+        reused across calls when one with a change journal is attached.
+        """
+        snapshot = self.snapshot
+        if snapshot is None:
+            snapshot = LibrarySnapshot(self.entries)
+
+        stats = snapshot.statistics()
+        stats["collections"] = {
+            "total": len(self.collections.find_all()),
+            "smart": len(self.collections.find_smart_collections()),
         }
-
-        for entry in entries:
-            type_name = entry.type.value
-            stats["entries_by_type"][type_name] = (
-                stats["entries_by_type"].get(type_name, 0) + 1
-            )
-
-        for entry in entries:
-            if entry.year:
-                stats["entries_by_year"][entry.year] = (
-                    stats["entries_by_year"].get(entry.year, 0) + 1
-                )
-
         return stats
 
     def _setup_metadata_coordination(self):
@@ -0,0 +1,283 @@
+"""Columnar snapshot of the library for analytics and filtering.
+
+The snapshot materializes the entries into a polars DataFrame with one row
+per entry, so statistics, facet counts and filters run as vectorized
+expressions instead of Python loops over ``Entry`` objects. It is built
+from a projection of the few fields it needs, never from full entries.
+
+With a change journal the frame is memoized per storage generation and
+cached on disk as Parquet; a later process reuses the file as long as the
+generation recorded next to it still matches the journal.
+"""
+
+import json
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from bibmgr.core.models import split_names
+from bibmgr.storage.journal import ChangeJournal
+
+# Bump when the columns or their types change
+SNAPSHOT_FORMAT_VERSION = 1
+
+SNAPSHOT_SCHEMA = {
+    "key": pl.String,
+    "type": pl.String,
+    "year": pl.Int32,
+    "authors": pl.List(pl.String),
+    "journal": pl.String,
+    "has_doi": pl.Boolean,
+    "added": pl.Datetime("us"),
+    "modified": pl.Datetime("us"),
+    "tags": pl.List(pl.String),
+    "keywords": pl.List(pl.String),
+}
+
+# Columns holding several values per entry
+LIST_COLUMNS = frozenset({"authors", "tags", "keywords"})
+
+# Entry fields read to build the frame
+SNAPSHOT_FIELDS = (
+    "key",
+    "type",
+    "year",
+    "author",
+    "journal",
+    "doi",
+    "added",
+    "modified",
+    "tags",
+    "keywords",
+)
+
+
+def build_frame(entries: Iterable[Any]) -> pl.DataFrame:
+    """Materialize entries, or rows of SNAPSHOT_FIELDS, into a frame."""
+    columns: dict[str, list[Any]] = {name: [] for name in SNAPSHOT_SCHEMA}
+    for entry in entries:
+        columns["key"].append(entry.key)
+        columns["type"].append(entry.type.value)
+        columns["year"].append(entry.year)
+        columns["authors"].append(list(split_names(entry.author)))
+        columns["journal"].append(entry.journal)
+        columns["has_doi"].append(bool(entry.doi))
+        columns["added"].append(_naive(entry.added))
+        columns["modified"].append(_naive(entry.modified))
+        columns["tags"].append(list(entry.tags or ()))
+        columns["keywords"].append(list(entry.keywords or ()))
+    return pl.DataFrame(columns, schema=SNAPSHOT_SCHEMA)
+
+
+class LibrarySnapshot:
+    """Columnar view of all entries of a repository.
+
+    Without a journal the frame is rebuilt on every access, since nothing
+    tells the snapshot that storage changed.
+    """
+
+    def __init__(
+        self,
+        repository,
+        journal: ChangeJournal | None = None,
+        cache_path: Path | None = None,
+    ):
+        """Initialize the snapshot.
+
+        Args:
+            repository: Entry repository providing ``scan``
+            journal: Change journal whose generation invalidates the frame
+            cache_path: Parquet file caching the frame between processes
+        """
+        self.repository = repository
+        self.journal = journal
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._frame: pl.DataFrame | None = None
+        self._generation: int | None = None
+
+    @property
+    def _state_path(self) -> Path | None:
+        if self.cache_path is None:
+            return None
+        return self.cache_path.with_suffix(".json")
+
+    def frame(self) -> pl.DataFrame:
+        """The snapshot frame for the current storage generation."""
+        if self.journal is None:
+            return build_frame(self.repository.scan(SNAPSHOT_FIELDS))
+
+        generation = self.journal.generation
+        if self._frame is not None and self._generation == generation:
+            return self._frame
+
+        frame = self._load(generation)
+        if frame is None:
+            frame = build_frame(self.repository.scan(SNAPSHOT_FIELDS))
+            self._save(frame, generation)
+
+        self._frame = frame
+        self._generation = generation
+        return frame
+
+    def invalidate(self) -> None:
+        """Forget the memoized frame and the on-disk cache."""
+        self._frame = None
+        self._generation = None
+        if self.cache_path is not None:
+            self.cache_path.unlink(missing_ok=True)
+            self._state_path.unlink(missing_ok=True)
+
+    def statistics(self) -> dict[str, Any]:
+        """Entry totals by type and year.
+
+        Types and years are listed in order of first appearance, matching
+        the order of the repository's unordered ``scan``.
+        """
+        frame = self.frame()
+        by_type = frame.group_by("type", maintain_order=True).len()
+        by_year = (
+            frame.filter(pl.col("year").is_not_null() & (pl.col("year") != 0))
+            .group_by("year", maintain_order=True)
+            .len()
+        )
+        return {
+            "total_entries": frame.height,
+            "entries_by_type": dict(by_type.iter_rows()),
+            "entries_by_year": dict(by_year.iter_rows()),
+        }
+
+    def value_counts(
+        self,
+        column: str,
+        keys: Iterable[str] | None = None,
+        min_count: int = 1,
+        size: int | None = None,
+    ) -> list[tuple[Any, int]]:
+        """Count the values of a column, most frequent first.
+
+        Values of list columns are counted individually; ties are ordered
+        by value.
+
+        Args:
+            column: Snapshot column to count
+            keys: Only count these entries
+            min_count: Drop values occurring fewer times
+            size: Keep at most this many values
+        """
+        frame = self.frame()
+        if keys is not None:
+            frame = frame.filter(pl.col("key").is_in(list(keys)))
+
+        values = frame.select(column)
+        if column in LIST_COLUMNS:
+            values = values.explode(column)
+        counts = (
+            values.drop_nulls()
+            .group_by(column)
+            .len()
+            .filter(pl.col("len") >= min_count)
+            .sort(["len", column], descending=[True, False])
+        )
+        if size is not None:
+            counts = counts.head(size)
+        return list(counts.iter_rows())
+
+    def filter_keys(
+        self,
+        *,
+        types: Iterable[str] | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        author: str | None = None,
+        tags: Iterable[str] | None = None,
+        has_doi: bool | None = None,
+    ) -> list[str]:
+        """Keys of the entries matching all given conditions.
+
+        Args:
+            types: Entry type values to keep
+            year_from: Earliest publication year (inclusive)
+            year_to: Latest publication year (inclusive)
+            author: Case-insensitive substring of any author name
+            tags: Tags that must all be present
+            has_doi: Whether the entry must (or must not) have a DOI
+        """
+        conditions = []
+        if types is not None:
+            conditions.append(pl.col("type").is_in([t.lower() for t in types]))
+        if year_from is not None:
+            conditions.append(pl.col("year") >= year_from)
+        if year_to is not None:
+            conditions.append(pl.col("year") <= year_to)
+        if author:
+            conditions.append(
+                pl.col("authors")
+                .list.eval(
+                    pl.element()
+                    .str.to_lowercase()
+                    .str.contains(author.lower(), literal=True)
+                )
+                .list.any()
+            )
+        for tag in tags or ():
+            conditions.append(pl.col("tags").list.contains(tag))
+        if has_doi is not None:
+            conditions.append(pl.col("has_doi") == has_doi)
+
+        frame = self.frame()
+        if conditions:
+            frame = frame.filter(pl.all_horizontal(conditions))
+        return frame.get_column("key").to_list()
+
+    def _load(self, generation: int) -> pl.DataFrame | None:
+        """Read the cached frame if it was written for ``generation``."""
+        state_path = self._state_path
+        if state_path is None or not self.cache_path.exists():
+            return None
+        try:
+            state = json.loads(state_path.read_text())
+            if (
+                state.get("version") != SNAPSHOT_FORMAT_VERSION
+                or state.get("generation") != generation
+            ):
+                return None
+            frame = pl.read_parquet(self.cache_path)
+        except (OSError, ValueError, pl.exceptions.PolarsError):
+            return None
+        if dict(frame.schema) != SNAPSHOT_SCHEMA:
+            return None
+        return frame
+
+    def _save(self, frame: pl.DataFrame, generation: int) -> None:
+        """Write the frame and its generation atomically."""
+        state_path = self._state_path
+        if state_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The state file goes last, so a crash in between leaves a frame
+        # whose generation no longer matches and is rebuilt
+        state_path.unlink(missing_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+        try:
+            with open(temp_fd, "wb") as f:
+                frame.write_parquet(f)
+            Path(temp_path).replace(self.cache_path)
+        except Exception:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+        state = {"version": SNAPSHOT_FORMAT_VERSION, "generation": generation}
+        temp_state = state_path.with_suffix(".json.tmp")
+        temp_state.write_text(json.dumps(state))
+        temp_state.replace(state_path)
+
+
+def _naive(value):
+    """Drop the timezone so all timestamps share one column type."""
+    if value is not None and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
@@ -579,6 +579,41 @@ class TestExportCommand:
         assert_exit_success(result)
         config = workflow.execute.call_args[1]["config"]
         assert config.format == ExportFormat.JSON
+        assert not config.resolve_crossrefs
+
+    def test_export_resolve_crossrefs(
+        self, cli_runner, populated_repository, tmp_path, repository_manager
+    ):
+        """Test the option filling in fields inherited through crossref."""
+        workflow = Mock()
+        workflow.execute.return_value = create_mock_export_result(exported=3)
+
+        with patch(
+            "bibmgr.cli.commands.import_export.get_repository_manager",
+            return_value=repository_manager,
+        ):
+            with patch(
+                "bibmgr.cli.commands.import_export.get_repository",
+                return_value=populated_repository,
+            ):
+                with patch(
+                    "bibmgr.cli.commands.import_export.get_event_bus",
+                    return_value=Mock(),
+                ):
+                    with patch(
+                        "bibmgr.cli.commands.import_export.ExportWorkflow",
+                        return_value=workflow,
+                    ):
+                        result = cli_runner.invoke(
+                            [
+                                "export",
+                                str(tmp_path / "export.json"),
+                                "--resolve-crossrefs",
+                            ]
+                        )
+
+        assert_exit_success(result)
+        assert workflow.execute.call_args[1]["config"].resolve_crossrefs
 
     def test_export_from_collection(
         self,
@@ -50,6 +50,40 @@ class TestCheckCommand:
             "Info: 1",
         )
 
+    def test_check_includes_crossref_children(self, cli_runner, populated_repository):
+        """Test checking a parent also checks the entries inheriting from it."""
+        from bibmgr.core.crossref import CrossRefGraph
+        from bibmgr.core.fields import EntryType
+        from bibmgr.core.models import Entry
+
+        populated_repository.save(
+            Entry(key="ch", type=EntryType.INBOOK, title="Ch", crossref="doe2024"),
+            skip_validation=True,
+        )
+        manager = Mock(crossrefs=CrossRefGraph(populated_repository.find_all()))
+        handler = Mock()
+        handler.execute.return_value = OperationResult(
+            status=ResultStatus.SUCCESS, message="Batch validation completed"
+        )
+
+        with patch(
+            "bibmgr.cli.commands.quality.get_repository",
+            return_value=populated_repository,
+        ):
+            with patch(
+                "bibmgr.cli.commands.quality.get_repository_manager",
+                return_value=manager,
+            ):
+                with patch(
+                    "bibmgr.cli.commands.quality.get_quality_handler",
+                    return_value=handler,
+                ):
+                    result = cli_runner.invoke(["check", "doe2024"])
+
+        assert_exit_success(result)
+        command = handler.execute.call_args[0][0]
+        assert [entry.key for entry in command.entries] == ["doe2024", "ch"]
+
     def test_check_multiple_entries(self, cli_runner, populated_repository):
         """Test checking multiple entries."""
         handler = Mock()
@@ -635,6 +635,31 @@ class TestSimilarCommand:
         assert_output_contains(result, "No similar entries found")
 
 
+class TestIndexCommand:
+    """Test the 'bib index' command group."""
+
+    def test_rebuild_reports_throughput(self, cli_runner):
+        """Test rebuild passes --jobs through and reports docs/sec."""
+        from bibmgr.search import SearchService
+        from bibmgr.search.indexing import IndexBuildStats
+
+        mock_search_service = Mock(spec=SearchService)
+        mock_search_service.index_all.return_value = 1200
+        mock_search_service.last_build_stats = IndexBuildStats(
+            documents=1200, jobs=4, segments=4, seconds=2.0
+        )
+
+        with patch(
+            "bibmgr.cli.commands.search.get_search_service",
+            return_value=mock_search_service,
+        ):
+            result = cli_runner.invoke(["index", "rebuild", "--jobs", "4"])
+
+        assert_exit_success(result)
+        mock_search_service.index_all.assert_called_once_with(full=True, jobs=4)
+        assert_output_contains(result, "Indexed 1200 entries", "600 docs/sec", "4 jobs")
+
+
 # Test helpers
 def assert_exit_success(result):
     """Assert CLI command exited successfully."""
@@ -6,7 +6,7 @@ and proper ordering constraints according to BibTeX rules.
 
 from typing import Any
 
-from bibmgr.core.crossref import CrossRefResolver
+from bibmgr.core.crossref import CrossRefGraph, CrossRefResolver
 from bibmgr.core.fields import EntryType
 from bibmgr.core.models import Entry
 
@@ -575,3 +575,99 @@ class TestCrossRefOrdering:
         # This is a topological sort problem
         # Expected order: book must come after ch1 and ch2
         # article can be anywhere
+
+
+class TestCrossRefGraph:
+    """Test the incrementally maintained cross-reference graph."""
+
+    def _entries(self) -> list[Entry]:
+        return [
+            Entry(key="ch1", type=EntryType.INBOOK, title="One", crossref="book"),
+            Entry(key="ch2", type=EntryType.INBOOK, title="Two", crossref="book"),
+            Entry(
+                key="book",
+                type=EntryType.BOOK,
+                title="The Book",
+                publisher="Press",
+                year=2020,
+            ),
+            Entry(key="lone", type=EntryType.ARTICLE, title="Lone"),
+        ]
+
+    def test_links_and_affected_children(self) -> None:
+        """A parent change affects exactly the parent and its children."""
+        graph = CrossRefGraph(self._entries())
+
+        assert graph.parent_of("ch1") == "book"
+        assert graph.children_of("book") == ["ch1", "ch2"]
+        assert graph.affected_by(["book"]) == {"book", "ch1", "ch2"}
+        assert graph.affected_by(["ch1", "lone"]) == {"ch1", "lone"}
+
+    def test_parent_update_invalidates_inherited_fields(self) -> None:
+        """Children resolve against the replaced parent."""
+        entries = self._entries()
+        graph = CrossRefGraph(entries)
+        assert graph.resolve(entries[0]).publisher == "Press"
+
+        changed = graph.add(
+            Entry(key="book", type=EntryType.BOOK, title="The Book", publisher="New")
+        )
+
+        assert changed == {"book", "ch1", "ch2"}
+        resolved = graph.resolve_all(entries[:2])
+        assert [e.publisher for e in resolved] == ["New", "New"]
+        assert resolved[0].booktitle == "The Book"
+        assert resolved[0].year is None
+
+    def test_relinking_and_removal(self) -> None:
+        """Changing or removing a crossref updates both directions."""
+        graph = CrossRefGraph(self._entries())
+
+        graph.add(Entry(key="ch1", type=EntryType.INBOOK, title="One"))
+        graph.remove("ch2")
+
+        assert graph.count("book") == 0
+        assert graph.parent_of("ch1") is None
+        assert "ch2" not in graph
+
+    def test_export_order_puts_children_first(self) -> None:
+        """Citing entries precede what they reference; others keep order."""
+        graph = CrossRefGraph(
+            [
+                Entry(key="a", type=EntryType.MISC, crossref="b"),
+                Entry(key="b", type=EntryType.MISC, crossref="c"),
+                Entry(key="c", type=EntryType.MISC, title="Root"),
+                Entry(key="x", type=EntryType.MISC),
+            ]
+        )
+
+        assert graph.export_order(["c", "x", "b", "a"]) == ["a", "b", "c", "x"]
+
+    def test_keeps_only_links_and_inheritable_fields(self) -> None:
+        """Nodes hold the type, title, link and inheritable values only."""
+        from bibmgr.core.crossref import CROSSREF_FIELDS, CrossRefNode
+        from bibmgr.storage.codec import project
+
+        entries = self._entries()
+        graph = CrossRefGraph(project(entry, CROSSREF_FIELDS) for entry in entries)
+
+        node = graph["book"]
+        assert isinstance(node, CrossRefNode)
+        assert node.inherited == {"publisher": "Press", "year": 2020}
+        resolved = graph.resolve(entries[0])
+        assert (resolved.booktitle, resolved.publisher) == ("The Book", "Press")
+
+    def test_loader_runs_on_first_use(self) -> None:
+        """A graph with a loader reads the entries only when needed."""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return self._entries()
+
+        graph = CrossRefGraph(loader=loader)
+        assert not graph.loaded and calls == []
+
+        assert graph.count("book") == 2
+        graph.children_of("book")
+        assert graph.loaded and calls == [1]
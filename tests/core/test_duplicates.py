@@ -6,7 +6,11 @@ and various normalization strategies.
 
 from typing import Any
 
-from bibmgr.core.duplicates import DuplicateDetector
+from bibmgr.core.duplicates import (
+    DuplicateDetector,
+    blocking_row,
+    find_duplicate_groups,
+)
 from bibmgr.core.fields import EntryType
 from bibmgr.core.models import Entry
 
@@ -615,3 +619,33 @@ class TestDuplicateNormalization:
         assert (
             len(duplicates) >= 9
         )  # Should find the duplicates we added (every 50th from 50-450)
+
+
+class TestShardedGrouping:
+    """Test duplicate grouping over blocking rows."""
+
+    def test_groups_match_detector(
+        self, duplicate_entries: list[dict[str, Any]]
+    ) -> None:
+        """Row groups are the detector's groups, in the same order."""
+        entries = [Entry.from_dict(data) for data in duplicate_entries]
+        expected = [
+            [e.key for e in group]
+            for group in DuplicateDetector(entries).find_duplicates()
+        ]
+
+        groups = find_duplicate_groups([blocking_row(e) for e in entries])
+
+        assert [[entries[i].key for i in group] for group in groups] == expected
+
+    def test_parallel_matches_serial(
+        self, duplicate_entries: list[dict[str, Any]]
+    ) -> None:
+        """Sharding blocking keys over workers does not change the groups."""
+        rows = [blocking_row(Entry.from_dict(data)) for data in duplicate_entries]
+
+        serial = find_duplicate_groups(rows)
+        parallel = find_duplicate_groups(rows, jobs=2, chunk_size=2)
+
+        assert parallel == serial
+        assert serial
@@ -299,6 +299,18 @@ class TestEntryComputedProperties:
         for key, value in data.items():
             assert value is not None
 
+    def test_content_hash_tracks_content(
+        self, sample_article_data: dict[str, Any]
+    ) -> None:
+        """content_hash should change exactly when the content changes."""
+        entry = Entry(**sample_article_data)
+        same = msgspec.structs.replace(entry)
+        changed = msgspec.structs.replace(entry, title="Another Title")
+
+        assert entry.content_hash() == same.content_hash()
+        assert entry.content_hash() != changed.content_hash()
+        assert len(entry.content_hash()) == 32
+
 
 class TestEntryValidation:
     """Test Entry validation integration."""
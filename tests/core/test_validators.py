@@ -10,6 +10,7 @@ from typing import Any
 from bibmgr.core.fields import EntryType
 from bibmgr.core.models import Entry
 from bibmgr.core.validators import (
+    AbstractLengthValidator,
     AuthorFormatValidator,
     CrossReferenceValidator,
     DOIValidator,
@@ -19,6 +20,8 @@ from bibmgr.core.validators import (
     ISSNValidator,
     RequiredFieldValidator,
     URLValidator,
+    ValidationCache,
+    ValidationContext,
     ValidatorRegistry,
     get_validator_registry,
 )
@@ -684,6 +687,27 @@ class TestValidatorRegistry:
         registry3 = get_validator_registry(entries)
         assert registry3 is not registry1
 
+    def test_revalidate_reads_affected_entries(self) -> None:
+        """revalidate checks the children of a changed parent via the loader."""
+        from bibmgr.core.crossref import CrossRefGraph
+
+        stored = {
+            "book": Entry(key="book", type=EntryType.ARTICLE, title="Book"),
+            "ch": Entry(key="ch", type=EntryType.INBOOK, title="Ch", crossref="book"),
+        }
+        loads = []
+
+        def load(keys):
+            loads.append(keys)
+            return [stored[key] for key in keys if key in stored]
+
+        registry = ValidatorRegistry(graph=CrossRefGraph(stored.values()))
+        results = registry.revalidate(["book", "gone"], load)
+
+        assert loads == [["book", "ch", "gone"]]
+        assert results["gone"] == []
+        assert any("cannot cross-reference" in e.message for e in results["ch"])
+
     def test_validate_all_entries(
         self, duplicate_entries: list[dict[str, Any]]
     ) -> None:
@@ -699,3 +723,155 @@ class TestValidatorRegistry:
             if key in results:
                 errors = results[key]
                 assert any("Duplicate DOI" in e.message for e in errors)
+
+
+def _batch_entries() -> list[Entry]:
+    """Entries sharing some invalid values and one cross-reference."""
+    return [
+        Entry(
+            key="proc2020",
+            type=EntryType.PROCEEDINGS,
+            title="Proceedings",
+            year=2020,
+        ),
+        Entry(
+            key="paper2020",
+            type=EntryType.INPROCEEDINGS,
+            author="Doe, Jane",
+            title="A Paper",
+            booktitle="Proceedings",
+            year=2020,
+            crossref="proc2020",
+            pages="1-10",
+        ),
+        Entry(
+            key="art1",
+            type=EntryType.ARTICLE,
+            author="Smith, John et al.",
+            title="First",
+            journal="Journal",
+            year=2019,
+            issn="0378-5955",
+            doi="bad-doi",
+        ),
+        Entry(
+            key="art2",
+            type=EntryType.ARTICLE,
+            author="Smith, John et al.",
+            title="Second",
+            journal="Journal",
+            year=2019,
+            issn="0378-5955",
+            doi="bad-doi",
+            isbn="978-0-00-000000-1",
+        ),
+        Entry(
+            key="orphan",
+            type=EntryType.INBOOK,
+            title="Chapter",
+            crossref="missing",
+            url="http://example.com",
+        ),
+    ]
+
+
+class TestBatchValidation:
+    """Test column-wise, parallel and cached batch validation."""
+
+    def test_batch_matches_per_entry_validation(self) -> None:
+        """Batch results equal validating each entry on its own."""
+        entries = _batch_entries()
+        registry = ValidatorRegistry(entries)
+
+        expected = [registry.validate(entry) for entry in entries]
+
+        assert registry.validate_entries(entries) == expected
+
+    def test_shared_values_keep_their_entry_key(self) -> None:
+        """Errors computed once per distinct value name each entry."""
+        entries = _batch_entries()[2:4]
+
+        first, second = DOIValidator().validate_batch(entries)
+
+        assert [e.entry_key for e in first] == ["art1"]
+        assert [e.entry_key for e in second] == ["art2"]
+        assert first[0].message == second[0].message
+
+    def test_parallel_chunks_match_serial(self) -> None:
+        """Chunks validated in worker processes come back in order."""
+        entries = _batch_entries() * 2
+        registry = ValidatorRegistry()
+
+        parallel = registry.validate_entries(entries, jobs=2, chunk_size=2)
+
+        assert parallel == registry.validate_entries(entries)
+
+    def test_incremental_run_reuses_unchanged_results(self, tmp_path) -> None:
+        """Only entries whose content changed are validated again."""
+        path = tmp_path / "validation.msgpack"
+        entries = _batch_entries()
+        expected = ValidatorRegistry(entries).validate_all()
+
+        ValidatorRegistry(entries).validate_all(cache=ValidationCache(path))
+
+        entries[2] = Entry(
+            key="art1", type=EntryType.ARTICLE, title="First", journal="Journal"
+        )
+        cache = ValidationCache(path)
+        results = ValidatorRegistry(entries).validate_all(cache=cache)
+
+        assert (cache.hits, cache.misses) == (4, 1)
+        assert results["orphan"] == expected["orphan"]
+        assert results["art1"] == ValidatorRegistry(entries).validate_all()["art1"]
+
+    def test_cache_ignored_for_other_validators(self, tmp_path) -> None:
+        """Results of a different validator set are not reused."""
+        path = tmp_path / "validation.msgpack"
+        ValidatorRegistry(_batch_entries()).validate_all(cache=ValidationCache(path))
+
+        assert len(ValidationCache(path)) == len(_batch_entries())
+        assert len(ValidationCache(path, [DOIValidator()])) == 0
+
+    def test_cache_ignored_for_other_parameters(self, tmp_path, monkeypatch) -> None:
+        """Changed validator parameters or versions invalidate results."""
+        path = tmp_path / "validation.msgpack"
+        cache = ValidationCache(path, [AbstractLengthValidator(100)])
+        cache.put("digest", [])
+        cache.save()
+
+        assert len(ValidationCache(path, [AbstractLengthValidator(100)])) == 1
+        assert len(ValidationCache(path, [AbstractLengthValidator(200)])) == 0
+
+        monkeypatch.setattr(AbstractLengthValidator, "version", 2)
+        assert len(ValidationCache(path, [AbstractLengthValidator(100)])) == 0
+
+
+class TestValidationContext:
+    """Test validation results shared along a write path."""
+
+    def test_validates_each_content_once(self) -> None:
+        """Equal entries reuse the first result; changed ones are validated."""
+        entries = _batch_entries()
+        registry = ValidatorRegistry()
+        context = ValidationContext(registry)
+
+        first = context.validate(entries[2])
+        copy = Entry.from_dict(entries[2].to_dict())
+
+        assert context.validate(copy) == first == registry.validate(entries[2])
+        assert (context.hits, context.misses) == (1, 1)
+
+        context.validate(entries[3])
+        assert context.misses == 2
+
+    def test_mark_validated(self) -> None:
+        """Entries declared validated are not validated again."""
+        entry = _batch_entries()[2]
+        context = ValidationContext()
+
+        assert not context.is_validated(entry)
+        context.mark_validated(entry)
+
+        assert context.is_validated(entry)
+        assert context.validate(entry) == []
+        assert context.misses == 0
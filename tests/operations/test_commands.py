@@ -68,6 +68,18 @@ class TestCreateCommand:
         # Verify no event was published
         assert event_bus.get_history() == []
 
+    def test_create_validates_once(self, entry_repository, event_bus, minimal_entry):
+        """The handler and the save share one validation of the entry."""
+        from bibmgr.operations.commands.create import CreateCommand, CreateHandler
+
+        context = entry_repository.validation_context()
+        handler = CreateHandler(entry_repository, event_bus)
+
+        result = handler.execute(CreateCommand(entry=minimal_entry), context)
+
+        assert_result_success(result, "created successfully")
+        assert (context.misses, context.hits) == (1, 1)
+
     def test_create_with_force_flag(self, entry_repository, event_bus):
         """Test force create bypasses validation."""
         from bibmgr.operations.commands.create import CreateCommand, CreateHandler
@@ -263,6 +275,28 @@ class TestBulkCreateCommand:
         for entry in entries:
             assert entry_repository.find(entry.key) is None
 
+    def test_bulk_create_atomic_success(self, entry_repository, event_bus):
+        """Atomic bulk create writes every entry in one batch."""
+        from bibmgr.operations.commands.create import BulkCreateHandler, CreateHandler
+
+        entries = [create_entry_with_data(key=f"batch{i}") for i in range(3)]
+
+        create_handler = CreateHandler(entry_repository, event_bus)
+        handler = BulkCreateHandler(entry_repository, event_bus, create_handler)
+
+        results = handler.execute(entries, atomic=True)
+
+        for result in results:
+            assert_result_success(result)
+        assert entry_repository.keys_with_prefix("batch") == [
+            "batch0",
+            "batch1",
+            "batch2",
+        ]
+        assert_events_published(
+            event_bus, [EventType.ENTRY_CREATED] * 3 + [EventType.BULK_CREATED]
+        )
+
     def test_bulk_create_with_progress(
         self, entry_repository, event_bus, progress_reporter
     ):
@@ -884,6 +918,47 @@ class TestMergeCommand:
         assert entry_repository.find("keep2") is not None
         assert entry_repository.find("merged") is not None
 
+    def test_merge_batch_overlapping_groups(self, entry_repository, event_bus):
+        """Test batched merges apply in order and share one write."""
+        from bibmgr.operations.commands.merge import MergeCommand, MergeHandler
+
+        entries = [
+            create_entry_with_data(key=f"batch{i}", title="Batch Paper", year=2020)
+            for i in range(4)
+        ]
+        for entry in entries:
+            entry_repository.save(entry)
+
+        handler = MergeHandler(entry_repository, event_bus)
+        results = handler.execute_batch(
+            [
+                (
+                    MergeCommand(source_keys=["batch0", "batch1"], target_key="batch0"),
+                    entries[:2],
+                ),
+                (
+                    MergeCommand(source_keys=["batch1", "batch2"]),
+                    entries[1:3],
+                ),
+                (
+                    MergeCommand(source_keys=["batch0", "batch3"], target_key="batch0"),
+                    [entries[0], entries[3]],
+                ),
+            ]
+        )
+
+        assert_result_success(results[0])
+        # batch1 was merged away by the first group
+        assert results[1].status.name == "NOT_FOUND"
+        assert results[1].entity_id == "batch1"
+        assert_result_success(results[2])
+
+        assert entry_repository.keys() == ["batch0", "batch2"]
+        merged_events = [
+            e for e in event_bus.get_history() if e.type == EventType.ENTRIES_MERGED
+        ]
+        assert len(merged_events) == 2
+
     def test_merge_preconditions(self):
         """Test merge command precondition validation."""
         from bibmgr.operations.commands.merge import MergeCommand
@@ -0,0 +1,106 @@
+"""Tests for cached and parallel entry rendering."""
+
+from unittest.mock import Mock
+
+import msgspec
+
+from bibmgr.core.models import Entry, EntryType
+from bibmgr.operations.formatters import CitationFormatter
+from bibmgr.operations.workflows.export import (
+    ExportFormat,
+    ExportWorkflow,
+    ExportWorkflowConfig,
+)
+from bibmgr.operations.workflows.rendering import (
+    EntryRenderer,
+    RenderCache,
+    render_bibtex,
+    render_citation,
+)
+
+
+def _entries(count: int = 6) -> list[Entry]:
+    return [
+        Entry(
+            key=f"doe{i}",
+            type=EntryType.ARTICLE,
+            author="Doe, Jane and Roe, Richard",
+            title=f"Paper {i}",
+            journal="Journal",
+            year=2000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+class TestEntryRenderer:
+    """Test rendering through the cache and the process pool."""
+
+    def test_cache_serves_unchanged_entries(self, tmp_path):
+        """A second pass renders only the entries whose content changed."""
+        entries = _entries()
+        with RenderCache(tmp_path / "cache") as cache:
+            first = list(EntryRenderer("citation", "apa", cache=cache).render(entries))
+
+        entries[2] = msgspec.structs.replace(entries[2], title="Changed")
+        with RenderCache(tmp_path / "cache") as cache:
+            renderer = EntryRenderer("citation", "apa", cache=cache)
+            second = list(renderer.render(entries))
+
+            assert (cache.hits, cache.misses, renderer.rendered) == (5, 1, 1)
+        assert first == [render_citation(entry) for entry in _entries()]
+        assert second[2] == render_citation(entries[2])
+
+    def test_cheap_layouts_skip_cache(self, tmp_path):
+        """Plain layouts are rendered without touching the cache."""
+        with RenderCache(tmp_path / "cache") as cache:
+            renderer = EntryRenderer("bibtex", cache=cache)
+            texts = list(renderer.render(_entries()))
+
+            assert (cache.hits, cache.misses, len(cache.store)) == (0, 0, 0)
+        assert texts == [render_bibtex(entry) for entry in _entries()]
+
+    def test_styles_cached_separately(self, tmp_path):
+        """Citation styles do not share cached text."""
+        entry = _entries(1)[0]
+        with RenderCache(tmp_path / "cache") as cache:
+            apa = list(EntryRenderer("citation", "apa", cache=cache).render([entry]))
+            mla = list(EntryRenderer("citation", "mla", cache=cache).render([entry]))
+
+        assert apa == [CitationFormatter("apa").format(entry) + "\n"]
+        assert mla == [CitationFormatter("mla").format(entry) + "\n"]
+
+    def test_process_pool_keeps_order(self):
+        """Cold batches rendered by workers come back in input order."""
+        entries = _entries(7)
+        renderer = EntryRenderer("ris", jobs=2, batch_size=2)
+
+        texts = list(renderer.render(entries))
+
+        assert texts == list(EntryRenderer("ris").render(entries))
+        assert renderer.rendered == 7
+
+
+class TestCachedExport:
+    """Test the render cache in the export workflow."""
+
+    def test_export_reports_hit_rate(self, entry_repository, event_bus, temp_dir):
+        """Re-exporting an unchanged library is served from the cache."""
+        for entry in _entries():
+            entry_repository.save(entry)
+        manager = Mock()
+        manager.entries = entry_repository
+        workflow = ExportWorkflow(manager, event_bus)
+        config = ExportWorkflowConfig(
+            format=ExportFormat.CITATION, render_cache=temp_dir / "cache"
+        )
+
+        workflow.execute(temp_dir / "first.txt", config=config)
+        result = workflow.execute(temp_dir / "second.txt", config=config)
+
+        step = result.steps[-1]
+        assert step.data["render_cache"] == {"hits": 6, "misses": 0, "hit_rate": 1.0}
+        assert "100% from render cache" in step.message
+        assert (temp_dir / "first.txt").read_text() == (
+            temp_dir / "second.txt"
+        ).read_text()
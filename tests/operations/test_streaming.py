@@ -0,0 +1,72 @@
+"""Tests for the streaming export helpers."""
+
+import json
+from functools import partial
+
+import pytest
+
+from bibmgr.core.models import Entry, EntryType
+from bibmgr.operations.workflows.streaming import (
+    external_sort,
+    iter_json_document,
+    sort_key,
+)
+
+
+def _entries() -> list[Entry]:
+    return [
+        Entry(key=f"e{i}", type=EntryType.MISC, title=f"T{i}", year=2000 + i % 3)
+        for i in range(10)
+    ]
+
+
+class TestExternalSort:
+    """Test the spilling merge sort."""
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    @pytest.mark.parametrize("run_size", [3, 100])
+    def test_matches_sorted(self, tmp_path, reverse, run_size):
+        """Spilled and in-memory sorts are stable like ``sorted``."""
+        key = partial(sort_key, field="year")
+        entries = _entries()
+
+        result = list(
+            external_sort(
+                iter(entries), key, reverse=reverse, run_size=run_size, tmp_dir=tmp_path
+            )
+        )
+
+        assert result == sorted(entries, key=key, reverse=reverse)
+
+    def test_run_files_removed(self, tmp_path):
+        """Temporary runs are deleted once the merge finishes."""
+        list(external_sort(_entries(), lambda e: e.key, run_size=2, tmp_dir=tmp_path))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sort_key_missing_values_first(self):
+        """Missing fields sort as empty strings; text ignores case."""
+        entry = Entry(key="a", type=EntryType.MISC, title="Zeta")
+
+        assert sort_key(entry, "journal") == ""
+        assert sort_key(entry, "title") == "zeta"
+
+
+class TestJsonDocument:
+    """Test the chunked JSON encoder."""
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_matches_json_dumps(self, pretty, count):
+        """The chunks join to what json.dumps writes for the whole document."""
+        items = [{"key": f"e{i}", "tags": ["a", "é"]} for i in range(count)]
+
+        def tail(total):
+            return {"total": total, "metadata": {"e0": {"rating": 5}}}
+
+        expected = json.dumps(
+            {"entries": items, **tail(count)},
+            indent=2 if pretty else None,
+            ensure_ascii=False,
+        )
+        assert "".join(iter_json_document(iter(items), tail, pretty)) == expected
@@ -581,6 +581,97 @@ class TestExportWorkflow:
         assert len(data["entries"]) == len(populated_repository.find_all())
         assert data["total"] == len(populated_repository.find_all())
 
+    def test_export_streams_sorted_ndjson_and_csv(
+        self, populated_repository, event_bus, temp_dir
+    ):
+        """Test line-oriented exports of entries sorted through spilled runs."""
+        import csv
+
+        from bibmgr.operations.workflows.export import (
+            ExportFormat,
+            ExportWorkflow,
+            ExportWorkflowConfig,
+        )
+
+        manager = Mock()
+        manager.entries = populated_repository
+        workflow = ExportWorkflow(manager, event_bus)
+        expected = [
+            e.key
+            for e in sorted(
+                populated_repository.find_all(), key=lambda e: str(e.year or "")
+            )
+        ]
+
+        ndjson_file = temp_dir / "export.ndjson"
+        result = workflow.execute(
+            ndjson_file,
+            config=ExportWorkflowConfig(
+                format=ExportFormat.NDJSON,
+                validate=False,
+                sort_by="year",
+                sort_run_size=2,
+            ),
+        )
+        lines = ndjson_file.read_text().splitlines()
+
+        assert result.success
+        assert [json.loads(line)["key"] for line in lines] == expected
+
+        csv_file = temp_dir / "export.csv"
+        workflow.execute(
+            csv_file,
+            config=ExportWorkflowConfig(
+                format=ExportFormat.CSV, validate=False, sort_by="year"
+            ),
+        )
+        with open(csv_file, newline="") as f:
+            assert [row["key"] for row in csv.DictReader(f)] == expected
+
+    def test_export_resolves_crossrefs(self, repository_manager, event_bus, temp_dir):
+        """Test inherited fields filled in for JSON, ordering kept for BibTeX."""
+        from bibmgr.core.fields import EntryType
+        from bibmgr.operations.workflows.export import (
+            ExportFormat,
+            ExportWorkflow,
+            ExportWorkflowConfig,
+        )
+
+        for entry in (
+            Entry(key="proc", type=EntryType.PROCEEDINGS, title="Proc", year=2020),
+            Entry(key="paper", type=EntryType.INPROCEEDINGS, crossref="proc"),
+        ):
+            repository_manager.entries.save(entry, skip_validation=True)
+
+        workflow = ExportWorkflow(repository_manager, event_bus)
+        json_file = temp_dir / "export.json"
+        workflow.execute(
+            json_file,
+            config=ExportWorkflowConfig(
+                format=ExportFormat.JSON,
+                resolve_crossrefs=True,
+                sort_by="key",
+                validate=False,
+            ),
+        )
+        data = json.loads(json_file.read_text())
+        paper = next(e for e in data["entries"] if e["key"] == "paper")
+        assert paper["booktitle"] == "Proc"
+        assert paper["year"] == 2020
+
+        bib_file = temp_dir / "export.bib"
+        workflow.execute(
+            bib_file,
+            config=ExportWorkflowConfig(
+                format=ExportFormat.BIBTEX,
+                resolve_crossrefs=True,
+                sort_by="key",
+                validate=False,
+            ),
+        )
+        content = bib_file.read_text()
+        assert content.index("{paper,") < content.index("{proc,")
+
     def test_export_with_metadata(
         self, populated_repository, metadata_store, event_bus, temp_dir
     ):
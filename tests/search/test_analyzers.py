@@ -4,6 +4,7 @@ import pytest
 
 from bibmgr.search.indexing.analyzers import (
     AnalyzerConfig,
+    AnalyzerManager,
     SynonymExpander,
     TextProcessor,
 )
@@ -399,6 +400,40 @@ class TestTextProcessor:
         assert keyword_result != default_result
 
 
+class TestAnalyzerManager:
+    """Test cached and column-wise field analysis."""
+
+    def test_repeated_values_hit_the_cache(self):
+        """Each (analyzer, text) pair is analyzed once."""
+        manager = AnalyzerManager()
+
+        first = manager.analyze_field("journal", "Physical Review Letters")
+        first.append("mutated")
+        second = manager.analyze_field("journal", "Physical Review Letters")
+
+        assert second == ["physical review letters"]
+        assert manager.cache_info().hits == 1
+        assert manager.cache_info().misses == 1
+
+    def test_analyze_many_matches_single_values(self):
+        """Column analysis returns the same tokens in input order."""
+        manager = AnalyzerManager()
+        titles = ["Running Networks", "Deep Models", "Running Networks"]
+
+        tokens = manager.analyze_many("title", titles)
+
+        assert tokens == [manager.analyze_field("title", t) for t in titles]
+        assert tokens[0] is not tokens[2]
+        assert manager.cache_info().misses == 2
+
+    def test_process_many_preserves_order(self):
+        """Batch processing equals processing each text."""
+        processor = TextProcessor()
+        texts = ["Café Society", "", "CamelCase text", "Café Society"]
+
+        assert processor.process_many(texts) == [processor.process(t) for t in texts]
+
+
 class TestSynonymExpander:
     """Test SynonymExpander class."""
 
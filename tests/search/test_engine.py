@@ -209,6 +209,15 @@ class TestSearchEngine:
         assert all("key" in doc for doc in documents)
         assert search_engine._index_size == 4
 
+    def test_index_entries_analyzes_in_batch(self, search_engine, sample_entries):
+        """Batch indexing goes through the column-wise indexer path."""
+        with patch.object(
+            search_engine.indexer,
+            "index_entry",
+            side_effect=AssertionError("analyzed one entry at a time"),
+        ):
+            search_engine.index_entries(sample_entries)
+
     def test_remove_entry(self, search_engine, mock_backend):
         """Removing entry should work."""
         search_engine._index_size = 5
@@ -244,6 +253,16 @@ class TestSearchEngine:
 
         mock_backend.commit.assert_called_once()
 
+    def test_search_ranks_only_the_page(self, search_engine, sample_entries):
+        """The ranker is asked for no more matches than the page holds."""
+        search_engine._index_size = len(sample_entries)
+        search_engine.ranker = Mock()
+        search_engine.ranker.rank.return_value = []
+
+        search_engine.search("machine learning", limit=5, offset=10)
+
+        assert search_engine.ranker.rank.call_args.kwargs["limit"] == 5
+
     def test_search_basic(self, search_engine, mock_backend, sample_entries):
         """Basic search should work correctly."""
         # Index some entries so the engine knows the collection size
@@ -0,0 +1,142 @@
+"""Tests for change-detecting reindexing with content fingerprints."""
+
+from unittest.mock import Mock
+
+import msgspec
+
+from bibmgr.core.fields import EntryType
+from bibmgr.core.models import Entry
+from bibmgr.search.backends.memory import MemoryBackend
+from bibmgr.search.engine import SearchEngine, SearchService
+from bibmgr.search.indexing import FieldConfiguration, FingerprintStore
+
+
+def _entries(count: int) -> list[Entry]:
+    return [
+        Entry(key=f"e{i}", type=EntryType.MISC, title=f"Paper number {i}")
+        for i in range(count)
+    ]
+
+
+def _service(entries: list[Entry], fingerprint_path=None) -> SearchService:
+    repository = Mock()
+    repository.find_all.side_effect = lambda: list(entries)
+    repository.find.side_effect = lambda key: next(
+        (e for e in entries if e.key == key), None
+    )
+    engine = SearchEngine(
+        MemoryBackend(),
+        enable_query_expansion=False,
+        fingerprint_path=fingerprint_path,
+    )
+    return SearchService(engine, repository=repository)
+
+
+class TestFingerprintStore:
+    """Test the fingerprint diff logic."""
+
+    def test_diff_classifies_keys(self):
+        """Keys are split into added, changed, removed and unchanged."""
+        store = FingerprintStore(None, FieldConfiguration())
+        store.update({"a": "1", "b": "2", "c": "3"})
+
+        diff = store.diff({"a": "1", "b": "changed", "d": "4"})
+
+        assert diff.added == ["d"]
+        assert diff.changed == ["b"]
+        assert diff.removed == ["c"]
+        assert diff.unchanged == 1
+        assert not diff.full_rebuild
+
+    def test_persisted_round_trip(self, temp_index_dir):
+        """Saved fingerprints are reloaded with the same configuration."""
+        path = temp_index_dir / "fingerprints.json"
+        store = FingerprintStore(path, FieldConfiguration())
+        store.update({"a": "1"})
+        store.save()
+
+        reloaded = FingerprintStore(path, FieldConfiguration())
+        assert reloaded.fingerprints == {"a": "1"}
+        assert not reloaded.stale
+
+    def test_save_appends_changes(self, temp_index_dir):
+        """Later saves append to the log instead of rewriting the snapshot."""
+        path = temp_index_dir / "fingerprints.json"
+        store = FingerprintStore(path, FieldConfiguration())
+        store.update({f"e{i}": str(i) for i in range(50)})
+        store.save()
+        snapshot = path.read_text()
+
+        store.update({"e1": "changed"})
+        store.remove("e2")
+        store.save()
+
+        assert path.read_text() == snapshot
+        assert len(store.log_path.read_text().splitlines()) == 2
+        reloaded = FingerprintStore(path, FieldConfiguration())
+        assert reloaded.fingerprints == store.fingerprints
+
+    def test_config_change_marks_stale(self, temp_index_dir):
+        """A different field configuration forces a full rebuild."""
+        path = temp_index_dir / "fingerprints.json"
+        store = FingerprintStore(path, FieldConfiguration())
+        store.update({"a": "1"})
+        store.save()
+
+        changed = FieldConfiguration({"fields": {"title": {"boost": 5.0}}})
+        reloaded = FingerprintStore(path, changed)
+
+        assert reloaded.stale
+        assert reloaded.diff({"a": "1"}).full_rebuild
+
+
+class TestChangeDetectingIndexAll:
+    """Test SearchService.index_all with fingerprints."""
+
+    def test_second_run_skips_unchanged(self):
+        """Unchanged entries are not re-indexed."""
+        entries = _entries(10)
+        service = _service(entries)
+
+        assert service.index_all() == 10
+        assert service.index_all() == 0
+        assert service.last_index_report.unchanged == 10
+
+    def test_only_changes_are_applied(self):
+        """Added, changed and removed entries are the only work done."""
+        entries = _entries(10)
+        service = _service(entries)
+        service.index_all()
+
+        entries[3] = msgspec.structs.replace(entries[3], title="Rewritten title")
+        removed = entries.pop(5)
+        entries.append(Entry(key="new", type=EntryType.MISC, title="Fresh paper"))
+
+        assert service.index_all() == 2
+        report = service.last_index_report
+        assert report.added == ["new"]
+        assert report.changed == ["e3"]
+        assert report.removed == [removed.key]
+        assert report.unchanged == 8
+
+        results = service.search("rewritten", include_entries=False)
+        assert [m.entry_key for m in results.matches] == ["e3"]
+        assert service.engine.backend.get_statistics()["total_documents"] == 10
+
+    def test_fingerprints_survive_restart(self, temp_index_dir):
+        """A new service reuses fingerprints stored next to the index."""
+        path = temp_index_dir / "fingerprints.json"
+        entries = _entries(5)
+        _service(entries, path).index_all()
+
+        restarted = _service(entries, path)
+        assert restarted.index_all() == 0
+
+    def test_full_rebuild(self):
+        """full=True re-indexes everything."""
+        entries = _entries(4)
+        service = _service(entries)
+        service.index_all()
+
+        assert service.index_all(full=True) == 4
+        assert service.last_index_report.full_rebuild
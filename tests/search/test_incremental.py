@@ -0,0 +1,183 @@
+"""Tests for event-driven incremental indexing."""
+
+import msgspec
+import pytest
+
+from bibmgr.core.fields import EntryType
+from bibmgr.core.models import Entry
+from bibmgr.search.backends.memory import MemoryBackend
+from bibmgr.search.engine import SearchEngine, SearchService
+from bibmgr.storage.backends.memory import MemoryBackend as StorageMemoryBackend
+from bibmgr.storage.eventrepository import EventAwareRepositoryManager
+from bibmgr.storage.events import EventBus
+from bibmgr.storage.journal import ChangeJournal
+
+
+@pytest.fixture
+def event_bus():
+    """Synchronous event bus."""
+    return EventBus()
+
+
+@pytest.fixture
+def journal(temp_index_dir, event_bus):
+    """Change journal attached to the bus."""
+    journal = ChangeJournal(temp_index_dir / "changes.log")
+    journal.attach(event_bus)
+    return journal
+
+
+@pytest.fixture
+def manager(event_bus, journal):
+    """Event-aware repository manager over in-memory storage."""
+    return EventAwareRepositoryManager(StorageMemoryBackend(), event_bus)
+
+
+@pytest.fixture
+def service(manager, event_bus, journal, temp_index_dir):
+    """Search service with an attached incremental indexer."""
+    service = SearchService(
+        SearchEngine(MemoryBackend(), enable_query_expansion=False),
+        repository=manager.entries,
+        event_bus=event_bus,
+    )
+    service.attach_incremental_indexer(
+        journal=journal, state_path=temp_index_dir / "indexer.json"
+    )
+    return service
+
+
+def _entry(key: str, title: str) -> Entry:
+    return Entry(key=key, type=EntryType.MISC, title=title)
+
+
+class TestIncrementalIndexer:
+    """Test that index follows storage changes."""
+
+    def test_save_indexes_entry(self, service, manager):
+        """Saving through the repository makes the entry searchable."""
+        manager.entries.save(_entry("a", "Quantum computing"), skip_validation=True)
+
+        results = service.search("quantum", include_entries=False)
+        assert [m.entry_key for m in results.matches] == ["a"]
+
+    def test_update_reindexes_entry(self, service, manager):
+        """Updates replace the indexed document."""
+        entry = _entry("a", "Quantum computing")
+        manager.entries.save(entry, skip_validation=True)
+        manager.entries.save(
+            msgspec.structs.replace(entry, title="Protein folding"),
+            skip_validation=True,
+        )
+
+        assert service.search("quantum", include_entries=False).total == 0
+        assert service.search("protein", include_entries=False).total == 1
+
+    def test_delete_removes_entry(self, service, manager):
+        """Deletes remove the document from the index."""
+        manager.entries.save(_entry("a", "Quantum computing"), skip_validation=True)
+        manager.entries.delete("a")
+
+        assert service.search("quantum", include_entries=False).total == 0
+
+    def test_bulk_import_is_one_batch(self, service, manager, event_bus):
+        """A batched import reaches the backend as one batch."""
+        calls = []
+        original = service.engine.index_entries
+        service.engine.index_entries = lambda entries: (
+            calls.append(len(entries)),
+            original(entries),
+        )
+
+        with event_bus.batching():
+            manager.import_entries(
+                [_entry(f"e{i}", f"Paper {i}") for i in range(20)],
+                skip_validation=True,
+            )
+
+        assert calls == [20]
+        assert service.engine.backend.get_statistics()["total_documents"] == 20
+
+    def test_high_water_mark_persisted(self, service, manager, journal):
+        """The indexed generation is stored after each flush."""
+        manager.entries.save(_entry("a", "Quantum computing"), skip_validation=True)
+
+        assert service.indexer.indexed_generation == journal.generation
+        assert service.indexer.state_path.exists()
+
+    def test_flush_keeps_journal_bounded(self, manager, event_bus, temp_index_dir):
+        """Flushed generations let the journal drop what was indexed."""
+        journal = ChangeJournal(temp_index_dir / "bounded.log", compact_threshold=10)
+        journal.attach(event_bus)
+        service = SearchService(
+            SearchEngine(MemoryBackend(), enable_query_expansion=False),
+            repository=manager.entries,
+            event_bus=event_bus,
+        )
+        service.attach_incremental_indexer(
+            journal=journal, state_path=temp_index_dir / "bounded.json"
+        )
+
+        for i in range(100):
+            manager.entries.save(_entry(f"e{i}", f"Paper {i}"), skip_validation=True)
+
+        lines = journal.path.read_text().splitlines()
+        assert len(lines) < 10
+        assert journal.generation == 100
+        assert service.search("paper", include_entries=False).total == 100
+
+    def test_restart_replays_missed_changes(
+        self, manager, event_bus, journal, temp_index_dir
+    ):
+        """A new indexer only replays changes newer than its mark."""
+        from bibmgr.search.incremental import IncrementalIndexer
+
+        engine = SearchEngine(MemoryBackend(), enable_query_expansion=False)
+        state_path = temp_index_dir / "indexer.json"
+        indexer = IncrementalIndexer(
+            engine, manager.entries, event_bus, journal=journal, state_path=state_path
+        )
+        indexer.attach()
+        manager.entries.save(_entry("a", "First"), skip_validation=True)
+        indexer.detach()
+
+        # Changes made while no indexer is listening
+        manager.entries.save(_entry("b", "Second"), skip_validation=True)
+        manager.entries.delete("a")
+
+        restarted = IncrementalIndexer(
+            engine, manager.entries, event_bus, journal=journal, state_path=state_path
+        )
+        update = restarted.catch_up()
+
+        assert update.indexed == ["b"]
+        assert update.removed == ["a"]
+        assert restarted.indexed_generation == journal.generation
+        assert restarted.catch_up().total == 0
+
+    def test_catch_up_rebuilds_after_compaction(
+        self, manager, event_bus, temp_index_dir
+    ):
+        """Changes compacted away before catch-up force a full rebuild."""
+        from bibmgr.search.incremental import IncrementalIndexer
+
+        journal = ChangeJournal(temp_index_dir / "compacted.log")
+        journal.attach(event_bus)
+        manager.entries.save(_entry("a", "First"), skip_validation=True)
+        manager.entries.save(_entry("b", "Second"), skip_validation=True)
+        journal.compact(journal.generation)
+
+        engine = SearchEngine(MemoryBackend(), enable_query_expansion=False)
+        engine.index_entries([_entry("gone", "Stale")])
+        indexer = IncrementalIndexer(
+            engine,
+            manager.entries,
+            event_bus,
+            journal=journal,
+            state_path=temp_index_dir / "compacted.json",
+        )
+        update = indexer.catch_up()
+
+        assert update.cleared
+        assert sorted(update.indexed) == ["a", "b"]
+        assert indexer.indexed_generation == journal.generation
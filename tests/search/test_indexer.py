@@ -3,6 +3,7 @@
 from datetime import datetime
 from unittest.mock import Mock
 
+import msgspec
 import pytest
 
 from bibmgr.core.fields import EntryType
@@ -379,6 +380,18 @@ class TestEntryIndexer:
         if "title_analyzed" in doc:
             assert doc["title_analyzed"] == "custom tokens"
 
+    def test_index_entries_matches_index_entry(self, indexer, sample_entry):
+        """Column-wise batch analysis builds the same documents."""
+        entries = [sample_entry, msgspec.structs.replace(sample_entry, key="other")]
+
+        batch = indexer.index_entries(entries)
+        single = [indexer.index_entry(entry) for entry in entries]
+
+        for batch_doc, single_doc in zip(batch, single, strict=True):
+            batch_doc.pop("indexed_at", None)
+            single_doc.pop("indexed_at", None)
+            assert batch_doc == single_doc
+
     def test_should_index_field(self, indexer):
         """should_index_field method should check field configuration."""
         assert indexer.should_index_field("title") is True
@@ -0,0 +1,111 @@
+"""Tests for parallel index builds with per-worker segments."""
+
+from unittest.mock import Mock
+
+from bibmgr.core.fields import EntryType
+from bibmgr.core.models import Entry
+from bibmgr.search.backends.base import SearchQuery
+from bibmgr.search.backends.memory import MemoryBackend
+from bibmgr.search.backends.whoosh import WhooshBackend
+from bibmgr.search.engine import SearchEngine, SearchService
+from bibmgr.search.indexing import FieldConfiguration
+from bibmgr.search.indexing.parallel import IndexBuildStats, shard_entries
+
+
+def _entries(count: int) -> list[Entry]:
+    return [
+        Entry(
+            key=f"e{i}",
+            type=EntryType.ARTICLE,
+            title=f"Quantum paper {i}" if i % 2 else f"Classical paper {i}",
+            author="Smith, John and Doe, Jane",
+            year=2000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def _service(backend, entries: list[Entry]) -> SearchService:
+    repository = Mock()
+    repository.find_all.side_effect = lambda: list(entries)
+    engine = SearchEngine(backend, enable_query_expansion=False)
+    return SearchService(engine, repository=repository)
+
+
+def _keys(backend, query: str) -> set[str]:
+    result = backend.search(SearchQuery(query=query, limit=100))
+    return {match.entry_key for match in result.results}
+
+
+class TestSharding:
+    """Test splitting entries between workers."""
+
+    def test_shards_are_contiguous_and_balanced(self):
+        """Every entry lands in exactly one shard of near-equal size."""
+        entries = _entries(10)
+
+        shards = shard_entries(entries, 3)
+
+        assert [len(shard) for shard in shards] == [4, 3, 3]
+        assert [e for shard in shards for e in shard] == entries
+
+    def test_never_more_shards_than_entries(self):
+        """Small inputs do not produce empty shards."""
+        assert len(shard_entries(_entries(2), 8)) == 2
+        assert shard_entries([], 4) == []
+
+    def test_stats_throughput(self):
+        """Throughput is documents over elapsed seconds."""
+        stats = IndexBuildStats(documents=500, jobs=4, segments=4, seconds=2.0)
+
+        assert stats.docs_per_sec == 250.0
+        assert stats.to_dict()["docs_per_sec"] == 250.0
+        assert IndexBuildStats().docs_per_sec == 0.0
+
+
+class TestParallelIndexAll:
+    """Test index_all(jobs=N) against both backends."""
+
+    def test_memory_shards_match_serial_build(self):
+        """Merged memory shards index the same terms as a serial build."""
+        entries = _entries(12)
+        serial = _service(MemoryBackend(), entries)
+        parallel = _service(MemoryBackend(), entries)
+
+        serial.index_all()
+        assert parallel.index_all(jobs=3) == 12
+
+        assert parallel.backend.documents.keys() == serial.backend.documents.keys()
+        assert _keys(parallel.backend, "quantum") == _keys(serial.backend, "quantum")
+        stats = parallel.last_build_stats
+        assert stats.documents == 12
+        assert stats.jobs == 3
+        assert stats.segments == 3
+        assert stats.docs_per_sec > 0
+
+    def test_whoosh_segments_are_merged(self, temp_index_dir):
+        """Worker segments are merged into one searchable Whoosh index."""
+        entries = _entries(8)
+        backend = WhooshBackend(temp_index_dir, FieldConfiguration())
+        service = _service(backend, entries)
+
+        assert service.index_all(jobs=2) == 8
+
+        assert backend.get_statistics()["total_documents"] == 8
+        assert _keys(backend, "quantum") == {"e1", "e3", "e5", "e7"}
+        assert service.engine.fingerprints.fingerprints.keys() == {
+            e.key for e in entries
+        }
+
+    def test_whoosh_merge_replaces_existing_documents(self, temp_index_dir):
+        """Re-merging a key replaces the old document instead of duplicating."""
+        entries = _entries(4)
+        backend = WhooshBackend(temp_index_dir, FieldConfiguration())
+        engine = SearchEngine(backend, enable_query_expansion=False)
+        engine.index_entries(entries)
+        engine.commit()
+
+        engine.index_entries_parallel(entries, jobs=2)
+        engine.commit()
+
+        assert backend.get_statistics()["total_documents"] == 4
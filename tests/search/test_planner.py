@@ -0,0 +1,163 @@
+"""Tests for compiled query plans."""
+
+import pytest
+
+from bibmgr.search.backends.base import SearchQuery
+from bibmgr.search.backends.memory import MemoryBackend
+from bibmgr.search.engine import SearchEngine
+from bibmgr.search.query import PlanCache, QueryParser, QueryPlan
+from bibmgr.search.query.parser import (
+    BooleanOperator,
+    BooleanQuery,
+    FieldQuery,
+    TermQuery,
+)
+
+
+class RecordingBackend(MemoryBackend):
+    """Memory backend recording which leaves run over which candidates."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def evaluate_node(self, node, candidates):
+        self.calls.append((node.query.to_string(), candidates))
+        return super().evaluate_node(node, candidates)
+
+
+@pytest.fixture
+def backend():
+    """Backend with one rare and several common terms."""
+    backend = RecordingBackend()
+    for i in range(20):
+        backend.index(
+            f"doc{i}",
+            {
+                "title": "learning methods" + (" quantum" if i == 3 else ""),
+                "abstract": "deep networks" if i % 2 else "shallow models",
+                "year": 2000 + i,
+            },
+        )
+    return backend
+
+
+def _search(backend, query: str) -> dict[str, float]:
+    parsed = QueryParser().parse(query)
+    result = backend.search(SearchQuery(query=parsed, limit=100))
+    return {match.entry_key: match.score for match in result.results}
+
+
+class TestCompilation:
+    """Test compiling parsed queries into plans."""
+
+    def test_fields_pushed_down_and_groups_flattened(self):
+        """Nested ANDs merge and field restrictions reach the leaves."""
+        query = BooleanQuery(
+            BooleanOperator.AND,
+            [
+                TermQuery("a"),
+                BooleanQuery(
+                    BooleanOperator.AND,
+                    [FieldQuery("title", TermQuery("b")), TermQuery("c")],
+                ),
+            ],
+        )
+
+        plan = QueryPlan.compile(query, ("abstract",))
+
+        assert plan.root.op == "and"
+        assert [(c.terms, c.fields) for c in plan.root.children] == [
+            (("a",), ("abstract",)),
+            (("b",), ("title",)),
+            (("c",), ("abstract",)),
+        ]
+
+    def test_empty_terms_collapse(self):
+        """Empty terms empty an AND and vanish from an OR."""
+        empty_and = BooleanQuery(BooleanOperator.AND, [TermQuery("a"), TermQuery("")])
+        single_or = BooleanQuery(BooleanOperator.OR, [TermQuery(""), TermQuery("a")])
+
+        assert QueryPlan.compile(empty_and).root.op == "empty"
+        assert QueryPlan.compile(single_or).root.op == "term"
+
+    def test_plan_cache_reuses_compiled_plans(self):
+        """Plans are keyed by query and fields."""
+        cache = PlanCache(size=2)
+        parser = QueryParser()
+
+        first = cache.get(parser.parse("a AND b"))
+        assert cache.get(parser.parse("a AND b")) is first
+        assert cache.get(parser.parse("a AND b"), ("title",)) is not first
+        cache.get(parser.parse("c"))
+
+        assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+
+    def test_parser_caches_by_query_string(self):
+        """Repeated query strings return the cached parse."""
+        parser = QueryParser()
+
+        assert parser.parse(" deep AND learning ") is parser.parse("deep AND learning")
+        assert QueryParser(cache_size=0).parse("x") is not QueryParser().parse("x")
+
+    def test_cached_queries_are_immutable(self):
+        """Shared parses and plans cannot be changed by one caller."""
+        import dataclasses
+
+        parser = QueryParser()
+        query = parser.parse("deep AND learning")
+        plan = PlanCache().get(query)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            query.queries[0].term = "shallow"
+        with pytest.raises(AttributeError):
+            query.queries.append(TermQuery("x"))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            plan.root.op = "or"
+        assert parser.parse("deep AND learning").to_string() == "(deep AND learning)"
+
+
+class TestExecution:
+    """Test cost-based execution against the memory backend."""
+
+    def test_and_runs_rarest_child_first(self, backend):
+        """Later AND children only see documents earlier ones matched."""
+        results = _search(backend, "learning AND quantum")
+
+        assert list(results) == ["doc3"]
+        assert backend.calls[0] == ("quantum", None)
+        assert backend.calls[1] == ("learning", {"doc3"})
+
+    def test_empty_branch_short_circuits(self, backend):
+        """A term missing from the index skips its siblings."""
+        assert _search(backend, "learning AND missing AND year:[2000 TO 2005]") == {}
+        assert backend.calls == []
+
+    def test_not_filters_positive_matches(self, backend):
+        """The negative side runs only over the positive matches."""
+        results = _search(backend, "quantum NOT deep")
+
+        assert results == {}
+        assert backend.calls[1] == ("deep", {"doc3"})
+
+    def test_scores_sum_over_children(self, backend):
+        """AND scores add up like the unplanned evaluation did."""
+        both = _search(backend, "learning AND deep")
+        learning = _search(backend, "learning")
+        deep = _search(backend, "deep")
+
+        assert set(both) == {f"doc{i}" for i in range(1, 20, 2)}
+        assert both["doc1"] == pytest.approx(learning["doc1"] + deep["doc1"])
+
+    def test_explain_reports_estimates_and_timings(self, backend):
+        """explain() shows the executed plan with skipped branches."""
+        engine = SearchEngine(backend, enable_query_expansion=False)
+
+        text = engine.explain("quantum AND year:[2000 TO 2001] AND learning")
+        lines = text.splitlines()
+
+        assert lines[0].startswith("AND  (est=1, matches=0")
+        assert lines[1].startswith("  TERM quantum  (est=1, matches=1")
+        assert "ms)" in lines[1]
+        assert "RANGE year:[2000 TO 2001]  (est=20, matches=0" in text
+        assert lines[-1] == "  TERM learning  (est=20, skipped)"
@@ -18,6 +18,7 @@ from bibmgr.search.ranking import (
     TFIDFRanker,
     compute_bm25_score,
     compute_tfidf_score,
+    select_top,
 )
 
 
@@ -200,6 +201,38 @@ class TestBM25Ranking:
         assert ranked[0].score > ranked[1].score
 
 
+class TestTopKSelection:
+    """Test heap-based top-k selection."""
+
+    def test_matches_stable_sort(self):
+        """Selection equals a stable sort truncated to the limit."""
+        items = [("a", 2), ("b", 5), ("c", 2), ("d", 5), ("e", 1)]
+
+        for limit in (0, 1, 3, 10):
+            expected = sorted(items, key=lambda x: x[1], reverse=True)[:limit]
+            assert select_top(items, limit, key=lambda x: x[1]) == expected
+        assert select_top(items, 2, key=lambda x: x[1], reverse=False) == [
+            ("e", 1),
+            ("a", 2),
+        ]
+        assert len(select_top(items, None, key=lambda x: x[1])) == 5
+
+    def test_rankers_return_only_limit(self):
+        """Rankers score every match but return only the best ones."""
+        entries = [
+            Entry(key=f"doc{i}", type=EntryType.ARTICLE, title="learning " * i)
+            for i in range(1, 6)
+        ]
+        matches = [SearchMatch(entry_key=e.key, score=0.0, entry=e) for e in entries]
+        context = ScoringContext(total_docs=100, avg_doc_length=10)
+
+        for ranker in (BM25Ranker(), TFIDFRanker()):
+            full = ranker.rank(list(matches), ["learning"], context)
+            top = ranker.rank(list(matches), ["learning"], context, limit=2)
+
+            assert [m.entry_key for m in top] == [m.entry_key for m in full[:2]]
+
+
 class TestTFIDFRanking:
     """Test TF-IDF ranking algorithm."""
 
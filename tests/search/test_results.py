@@ -468,6 +468,23 @@ class TestSearchResultCollection:
         assert sorted_collection.matches[1].score == 2.0
         assert sorted_collection.matches[2].score == 1.0
 
+    def test_sort_by_with_limit_keeps_top_matches(self):
+        """A limit selects the first matches in order; total is kept."""
+        matches = [
+            SearchMatch("key1", 1.0),
+            SearchMatch("key2", 3.0),
+            SearchMatch("key3", 3.0),
+            SearchMatch("key4", 2.0),
+        ]
+
+        collection = SearchResultCollection(matches=matches, total=40)
+        top = collection.sort_by(SortOrder.RELEVANCE, limit=2)
+        bottom = collection.sort_by(SortOrder.DATE_ASC, limit=1)
+
+        assert [m.entry_key for m in top.matches] == ["key2", "key3"]
+        assert top.total == 40
+        assert len(bottom.matches) == 1
+
     def test_to_dict(self, sample_matches):
         """Convert collection to dictionary."""
         facets = [Facet("year", "Year", [FacetValue("2024", 10)])]
@@ -0,0 +1,190 @@
+"""Tests for the corpus-driven spelling corrector."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from bibmgr.core.fields import EntryType
+from bibmgr.core.models import Entry
+from bibmgr.search.backends.memory import MemoryBackend
+from bibmgr.search.engine import SearchEngine, SearchEngineBuilder, SearchService
+from bibmgr.search.indexing.analyzers import SpellChecker
+from bibmgr.search.indexing.spelling import SymSpellCorrector, edit_distance
+
+
+@pytest.fixture
+def corrector():
+    """Corrector with a small vocabulary."""
+    corrector = SymSpellCorrector()
+    corrector.update_document("a", "Quantum computing with qubits")
+    corrector.update_document("b", "Quantum annealing and quantum chemistry")
+    corrector.update_document("c", "Quantile regression")
+    return corrector
+
+
+def _entries() -> list[Entry]:
+    return [
+        Entry(
+            key="vaswani2017",
+            type=EntryType.INPROCEEDINGS,
+            title="Attention is all you need",
+            author="Vaswani, Ashish",
+            year=2017,
+        ),
+        Entry(
+            key="hochreiter1997",
+            type=EntryType.ARTICLE,
+            title="Long short-term memory",
+            author="Hochreiter, Sepp and Schmidhuber, Jurgen",
+            year=1997,
+        ),
+    ]
+
+
+class TestEditDistance:
+    """Test the bounded edit distance."""
+
+    def test_transposition_counts_once(self):
+        """Swapped neighbours cost a single edit."""
+        assert edit_distance("qauntum", "quantum", 2) == 1
+        assert edit_distance("kitten", "sitting", 3) == 3
+
+    def test_gives_up_past_limit(self):
+        """Distances beyond the limit are reported as limit + 1."""
+        assert edit_distance("abc", "xyzuvw", 1) == 2
+        assert edit_distance("abcdef", "uvwxyz", 2) == 3
+
+
+class TestSymSpellCorrector:
+    """Test suggestions and incremental vocabulary updates."""
+
+    def test_known_words_need_no_suggestion(self, corrector):
+        """Vocabulary terms and short words are accepted as spelled."""
+        assert corrector.check("Quantum")
+        assert corrector.check("ab")
+        assert corrector.suggest("quantum") == []
+
+    def test_suggestions_ranked_by_distance_then_frequency(self, corrector):
+        """Closer terms come first; ties go to the more frequent term."""
+        assert corrector.suggest("quantun", 1) == ["quantum"]
+        assert corrector.suggest("qubts") == ["qubits"]
+        assert corrector.suggest("quanti") == ["quantum", "quantile"]
+
+    def test_removing_documents_forgets_their_terms(self, corrector):
+        """Terms vanish once no document contributes them."""
+        corrector.remove_document("c")
+
+        assert not corrector.check("quantile")
+        assert corrector.suggest("quanti") == ["quantum"]
+
+        corrector.remove_document("b")
+        assert corrector.terms["quantum"] == 1
+        assert "annealing" not in corrector.terms
+
+    def test_correct_query(self, corrector):
+        """Misspelled words are replaced; field terms are left alone."""
+        corrected, corrections = corrector.correct_query("quantun title:qubts")
+
+        assert corrected == "quantum title:qubts"
+        assert corrections == ["quantun -> quantum"]
+
+    def test_save_and_load_round_trip(self, corrector, tmp_path):
+        """The vocabulary and delete index survive a reload."""
+        corrector.path = tmp_path / "spelling.msgpack"
+        corrector.save()
+
+        loaded = SymSpellCorrector(tmp_path / "spelling.msgpack")
+
+        assert loaded.terms == corrector.terms
+        assert loaded.suggest("quantun") == ["quantum"]
+
+    def test_save_appends_changed_documents(self, corrector, tmp_path):
+        """Later saves log changed documents instead of rewriting the state."""
+        corrector.path = tmp_path / "spelling.msgpack"
+        corrector.save()
+        snapshot = corrector.path.read_bytes()
+
+        corrector.update_document("c", "Topological qubits")
+        corrector.remove_document("a")
+        corrector.save()
+
+        assert corrector.path.read_bytes() == snapshot
+        assert len(corrector.log_path.read_text().splitlines()) == 2
+        loaded = SymSpellCorrector(corrector.path)
+        assert loaded.terms == corrector.terms
+        assert loaded.documents == corrector.documents
+
+    def test_state_is_read_on_first_use(self, corrector, tmp_path):
+        """Constructing a corrector does not read its file."""
+        corrector.path = tmp_path / "spelling.msgpack"
+        corrector.save()
+
+        loaded = SymSpellCorrector(corrector.path)
+        corrector.path.unlink()
+
+        assert len(loaded) == 0
+
+    def test_load_ignores_other_settings(self, corrector, tmp_path):
+        """State built with another edit distance is discarded."""
+        corrector.path = tmp_path / "spelling.msgpack"
+        corrector.save()
+
+        loaded = SymSpellCorrector(tmp_path / "spelling.msgpack", max_edit_distance=1)
+
+        assert len(loaded) == 0
+
+
+class TestEngineIntegration:
+    """Test the corrector learning from the search index."""
+
+    def test_indexing_feeds_vocabulary(self):
+        """Author names and title words become correctable terms."""
+        engine = SearchEngine(MemoryBackend())
+        engine.index_entries(_entries())
+
+        assert engine.spell_checker.suggest("schmidhuber") == []
+        assert engine.spell_checker.suggest("schmidhubr") == ["schmidhuber"]
+        assert engine.query_expander.spell_checker is engine.spell_checker
+
+        engine.remove_entry("hochreiter1997")
+        assert not engine.spell_checker.check("schmidhuber")
+
+        engine.clear_index()
+        assert len(engine.spell_checker) == 0
+
+    def test_commit_persists_and_index_all_backfills(self, tmp_path):
+        """A lost vocabulary file is rebuilt even when entries are unchanged."""
+        path = tmp_path / "spelling.msgpack"
+        repository = Mock()
+        repository.find_all.return_value = _entries()
+        engine = SearchEngine(MemoryBackend(), spelling_path=path)
+        service = SearchService(engine, repository=repository)
+
+        service.index_all()
+        assert path.exists()
+
+        path.unlink()
+        engine.spell_checker.clear()
+        assert service.index_all() == 0
+        assert engine.spell_checker.check("vaswani")
+        assert path.exists()
+
+    def test_builder_selects_spell_checker(self):
+        """Built-in spell checkers are chosen by name."""
+        symspell = (
+            SearchEngineBuilder()
+            .with_backend(MemoryBackend())
+            .with_spell_checker("symspell")
+            .build()
+        )
+        enchant = (
+            SearchEngineBuilder()
+            .with_backend(MemoryBackend())
+            .with_spell_checker("enchant")
+            .build()
+        )
+
+        assert isinstance(symspell.query_expander.spell_checker, SymSpellCorrector)
+        assert isinstance(enchant.query_expander.spell_checker, SpellChecker)
+        with pytest.raises(ValueError):
+            SearchEngineBuilder().with_spell_checker("aspell")
@@ -0,0 +1,183 @@
+"""Tests for the SQLite FTS5 search backend."""
+
+import pytest
+
+from bibmgr.search.backends.base import QueryError, SearchQuery
+from bibmgr.search.backends.sqlite_fts import SQLiteFTSBackend
+from bibmgr.search.engine import SearchEngine
+from bibmgr.search.indexing import FieldConfiguration
+from bibmgr.search.query import QueryParser
+from bibmgr.search.query.parser import FieldQuery, RangeQuery, TermQuery
+from bibmgr.storage.backends.sqlite import SQLiteBackend
+
+ENTRIES = [
+    {
+        "key": "smith2020",
+        "type": "article",
+        "title": "Machine learning methods",
+        "author": "Smith, John",
+        "abstract": "We compare learning algorithms for protein folding.",
+        "journal": "Nature",
+        "keywords": ["ml", "biology"],
+        "year": 2020,
+    },
+    {
+        "key": "doe2018",
+        "type": "book",
+        "title": "Deep learning",
+        "author": "Doe, Jane",
+        "keywords": ["ml"],
+        "year": 2018,
+    },
+    {
+        "key": "smith2022",
+        "type": "article",
+        "title": "Quantum computing",
+        "author": "Smith, Anna",
+        "journal": "Science",
+        "year": 2022,
+    },
+]
+
+
+@pytest.fixture
+def storage(temp_index_dir):
+    """SQLite storage holding the sample entries."""
+    backend = SQLiteBackend(temp_index_dir / "library.db")
+    for data in ENTRIES:
+        backend.write(data["key"], data)
+    yield backend
+    backend.close()
+
+
+@pytest.fixture
+def fts_backend(storage):
+    """FTS5 search backend over the sample storage."""
+    return SQLiteFTSBackend(storage)
+
+
+def _keys(backend: SQLiteFTSBackend, query: str, **kwargs) -> list[str]:
+    parsed = QueryParser().parse(query)
+    result = backend.search(SearchQuery(query=parsed, **kwargs))
+    return [match.entry_key for match in result.results]
+
+
+class TestQueryTranslation:
+    """Test translation of parsed queries to FTS5 and SQL."""
+
+    def test_terms_and_column_filters(self, fts_backend):
+        """Plain terms search all columns; field queries filter columns."""
+        assert set(_keys(fts_backend, "smith")) == {"smith2020", "smith2022"}
+        assert _keys(fts_backend, "title:quantum") == ["smith2022"]
+        assert _keys(fts_backend, "title:smith") == []
+
+    def test_query_fields_restrict_columns(self, fts_backend):
+        """Searched fields become an FTS5 column filter on the whole query."""
+        assert set(_keys(fts_backend, "learning")) == {"smith2020", "doe2018"}
+        assert _keys(fts_backend, "folding", fields=["abstract"]) == ["smith2020"]
+        assert _keys(fts_backend, "folding", fields=["title", "author"]) == []
+        assert _keys(fts_backend, "smith OR quantum", fields=["title"]) == ["smith2022"]
+        assert _keys(fts_backend, "smith", fields=["year"]) == []
+
+    def test_phrase_and_near(self, fts_backend):
+        """Phrases match exactly; sloppy phrases become NEAR groups."""
+        assert _keys(fts_backend, '"learning methods"') == ["smith2020"]
+        assert _keys(fts_backend, '"machine methods"') == []
+        assert _keys(fts_backend, '"machine methods"~2') == ["smith2020"]
+
+    def test_prefix_wildcard_and_fuzzy(self, fts_backend):
+        """Prefixes use FTS5 prefix queries; other patterns expand terms."""
+        assert set(_keys(fts_backend, "learn*")) == {"smith2020", "doe2018"}
+        assert _keys(fts_backend, "qu?ntum") == ["smith2022"]
+        assert _keys(fts_backend, "quantom~1") == ["smith2022"]
+        assert _keys(fts_backend, "zzz*") == []
+
+    def test_boolean_operators(self, fts_backend):
+        """AND, OR and NOT combine FTS and SQL predicates."""
+        assert _keys(fts_backend, "learning AND smith") == ["smith2020"]
+        assert _keys(fts_backend, "learning NOT deep") == ["smith2020"]
+        assert _keys(fts_backend, "NOT learning") == ["smith2022"]
+        assert set(_keys(fts_backend, "year:2018 OR quantum")) == {
+            "doe2018",
+            "smith2022",
+        }
+
+    def test_stored_field_predicates(self, fts_backend):
+        """Ranges and non-text fields run against the stored JSON."""
+        assert set(_keys(fts_backend, "year:[2019 TO 2023]")) == {
+            "smith2020",
+            "smith2022",
+        }
+        assert _keys(fts_backend, "smith AND year:{2020 TO *]") == ["smith2022"]
+        assert set(_keys(fts_backend, "type:article")) == {"smith2020", "smith2022"}
+        assert _keys(fts_backend, "learning", filters={"type": "book"}) == ["doe2018"]
+
+    def test_quotes_neutralize_fts_syntax(self, fts_backend):
+        """User input cannot inject FTS5 operators."""
+        query = SearchQuery(query=TermQuery('deep" OR "quantum'))
+
+        assert fts_backend.search(query).results == []
+
+    def test_unsupported_stored_field_query(self, fts_backend):
+        """Queries that cannot run on a stored field raise QueryError."""
+        query = FieldQuery("publisher", RangeQuery("year", 2000, 2001))
+
+        with pytest.raises(QueryError):
+            fts_backend.search(SearchQuery(query=query))
+
+
+class TestRankingAndResults:
+    """Test ranking, highlighting, facets and suggestions."""
+
+    def test_bm25_uses_field_boosts(self, storage):
+        """Title matches outrank abstract matches when titles are boosted."""
+        config = FieldConfiguration()
+        config.fields["title"].boost = 10.0
+        config.fields["abstract"].boost = 0.1
+        backend = SQLiteFTSBackend(storage, config)
+
+        assert _keys(backend, "learning") == ["doe2018", "smith2020"]
+
+    def test_highlights_and_snippets(self, fts_backend):
+        """Matches are highlighted; abstracts are reduced to snippets."""
+        parsed = QueryParser().parse("learning")
+        result = fts_backend.search(SearchQuery(query=parsed, highlight=True))
+
+        by_key = {match.entry_key: match.highlights for match in result.results}
+        assert by_key["doe2018"] == {"title": ["Deep <mark>learning</mark>"]}
+        assert "<mark>learning</mark>" in by_key["smith2020"]["abstract"][0]
+
+    def test_facets_group_matching_entries(self, fts_backend):
+        """Facets count scalar and list values over all matches."""
+        parsed = QueryParser().parse("learning")
+        result = fts_backend.search(
+            SearchQuery(query=parsed, limit=1, facet_fields=["entry_type", "keywords"])
+        )
+
+        assert result.total == 2
+        assert len(result.results) == 1
+        assert dict(result.facets["entry_type"]) == {"article": 1, "book": 1}
+        assert dict(result.facets["keywords"]) == {"ml": 2, "biology": 1}
+
+    def test_suggest_from_vocabulary(self, fts_backend):
+        """Suggestions come from the FTS5 vocabulary of a column."""
+        assert fts_backend.suggest("qu", "title", 5) == ["quantum"]
+        assert "smith" in fts_backend.suggest("sm", "any", 5)
+
+    def test_storage_writes_are_searchable(self, storage, fts_backend):
+        """Entries written to storage are found without indexing."""
+        storage.write(
+            "new2024", {"key": "new2024", "type": "misc", "title": "Graph theory"}
+        )
+        assert _keys(fts_backend, "graph") == ["new2024"]
+
+        storage.delete("new2024")
+        assert _keys(fts_backend, "graph") == []
+
+    def test_engine_integration(self, storage, fts_backend):
+        """SearchEngine runs queries through the FTS backend."""
+        engine = SearchEngine(fts_backend, enable_query_expansion=False)
+
+        results = engine.search("journal:nature")
+
+        assert [match.entry_key for match in results.matches] == ["smith2020"]
@@ -68,6 +68,55 @@ class BackendContract:
         assert len(keys) == 3
         assert set(keys) == {"key1", "key2", "key3"}
 
+    def test_keys_with_prefix(self, backend):
+        """keys_with_prefix() returns matching keys in sorted order."""
+        backend.initialize()
+
+        for key in ["smith2024b", "jones2020", "smith2024", "smith2024a", "smithy"]:
+            backend.write(key, {"key": key})
+        backend.delete("smith2024b")
+
+        assert backend.keys_with_prefix("smith2024") == ["smith2024", "smith2024a"]
+        assert backend.keys_with_prefix("smith", limit=2) == [
+            "smith2024",
+            "smith2024a",
+        ]
+        assert backend.keys_with_prefix("") == [
+            "jones2020",
+            "smith2024",
+            "smith2024a",
+            "smithy",
+        ]
+        assert backend.keys_with_prefix("zz") == []
+
+    def test_next_free_key(self, backend):
+        """next_free_key() skips taken suffixes, letters before numbers."""
+        backend.initialize()
+
+        assert backend.next_free_key("knuth1984") == "knuth1984a"
+
+        for suffix in "abc":
+            backend.write(f"knuth1984{suffix}", {"value": suffix})
+        assert backend.next_free_key("knuth1984") == "knuth1984d"
+
+        for suffix in "defghijklmnopqrstuvwxyz":
+            backend.write(f"knuth1984{suffix}", {"value": suffix})
+        assert backend.next_free_key("knuth1984") == "knuth19842"
+
+    def test_write_many_and_delete_many(self, backend):
+        """Batched writes and deletes report what changed."""
+        backend.initialize()
+
+        backend.write_many((f"key{i}", {"value": i}) for i in range(5))
+
+        assert backend.read("key3") == {"value": 3}
+        assert backend.delete_many(["key1", "missing", "key4"]) == ["key1", "key4"]
+        assert sorted(backend.keys()) == ["key0", "key2", "key3"]
+        assert backend.read_many(["key3", "missing", "key0"]) == {
+            "key3": {"value": 3},
+            "key0": {"value": 0},
+        }
+
     def test_clear_removes_all_data(self, backend):
         """clear() removes all stored data."""
         backend.initialize()
@@ -158,6 +207,137 @@ class TestFileSystemBackend(BackendContract):
         assert (temp_dir / "entries").is_dir()
         assert (temp_dir / "index.json").exists()
 
+    def test_key_index_persists(self, backend, temp_dir):
+        """The sorted key index is rebuilt from index.json on reopen."""
+        from bibmgr.storage.backends import FileSystemBackend
+
+        backend.write("beta", {"data": 2})
+        backend.write("alpha", {"data": 1})
+        backend.write("gamma", {"data": 3})
+        backend.delete("gamma")
+
+        reopened = FileSystemBackend(temp_dir)
+
+        assert reopened.keys() == ["alpha", "beta"]
+        assert reopened.keys_with_prefix("al") == ["alpha"]
+
+    def test_failed_write_leaves_no_key(self, backend, monkeypatch):
+        """A write that fails does not list its key."""
+        import bibmgr.storage.backends.filesystem as filesystem
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(filesystem.json, "dump", fail)
+        with pytest.raises(OSError):
+            backend.write("broken", {"data": 1})
+
+        assert backend.keys() == []
+        assert backend.exists("broken") is False
+
+    def test_transaction_commits_one_batch(self, backend, temp_dir):
+        """Staged changes are visible inside and persisted after commit."""
+        from bibmgr.storage.backends import FileSystemBackend
+
+        backend.write("old", {"value": "old"})
+
+        with backend.begin_transaction():
+            backend.write("new", {"value": "new"})
+            backend.delete("old")
+            assert backend.read("new") == {"value": "new"}
+            assert backend.exists("old") is False
+            assert not (temp_dir / "entries" / "new.json").exists()
+
+        reopened = FileSystemBackend(temp_dir)
+        assert reopened.keys() == ["new"]
+        assert reopened.read("new") == {"value": "new"}
+        assert list((temp_dir / "batches").iterdir()) == []
+
+    def test_batch_log_removed_after_sync(self, backend, temp_dir, monkeypatch):
+        """A commit syncs only its log; a checkpoint syncs files, then drops it."""
+        from bibmgr.storage.backends import filesystem
+
+        steps = []
+        fsync = filesystem.os.fsync
+        monkeypatch.setattr(
+            filesystem.os, "fsync", lambda fd: (steps.append("file"), fsync(fd))
+        )
+        monkeypatch.setattr(
+            filesystem, "_fsync_directory", lambda path: steps.append(path.name)
+        )
+        rmtree = filesystem.shutil.rmtree
+        monkeypatch.setattr(
+            filesystem.shutil,
+            "rmtree",
+            lambda path, **kwargs: (steps.append("rmtree"), rmtree(path, **kwargs)),
+        )
+
+        with backend.begin_transaction():
+            for i in range(200):
+                backend.write(f"k{i}", {"value": i})
+
+        assert steps == ["file", "batches"]
+        assert len(list((temp_dir / "batches").iterdir())) == 1
+
+        steps.clear()
+        backend.close()
+
+        assert steps == ["file"] * 201 + ["entries", temp_dir.name, "rmtree"]
+        assert list((temp_dir / "batches").iterdir()) == []
+
+    def test_batch_logs_replay_after_crash(self, backend, temp_dir):
+        """Logs left without a checkpoint are replayed and retired on startup."""
+        from bibmgr.storage.backends import FileSystemBackend
+
+        with backend.begin_transaction():
+            backend.write("a", {"value": 1})
+        with backend.begin_transaction():
+            backend.write("a", {"value": 2})
+            backend.write("b", {"value": 3})
+        assert len(list((temp_dir / "batches").iterdir())) == 1
+
+        reopened = FileSystemBackend(temp_dir)
+
+        assert reopened.read("a") == {"value": 2}
+        assert reopened.read("b") == {"value": 3}
+        assert list((temp_dir / "batches").iterdir()) == []
+
+    def test_transaction_rollback(self, backend):
+        """An exception discards every staged change."""
+        backend.write("existing", {"value": "original"})
+
+        with pytest.raises(RuntimeError):
+            with backend.begin_transaction():
+                backend.write("new", {"value": "new"})
+                backend.write("existing", {"value": "modified"})
+                backend.clear()
+                raise RuntimeError("Rollback")
+
+        assert backend.keys() == ["existing"]
+        assert backend.read("existing") == {"value": "original"}
+        assert backend.read("new") is None
+
+    def test_recovers_committed_batch(self, backend, temp_dir, monkeypatch):
+        """A batch committed before a crash is replayed on startup."""
+        from bibmgr.storage.backends import FileSystemBackend
+
+        def crash(self, path):
+            raise SystemExit("crash after commit")
+
+        monkeypatch.setattr(FileSystemBackend, "_apply_batch", crash)
+        with pytest.raises(SystemExit):
+            with backend.begin_transaction():
+                backend.write("a", {"value": 1})
+                backend.write("b", {"value": 2})
+        monkeypatch.undo()
+
+        (temp_dir / "batches" / "partial.tmp").mkdir()
+        reopened = FileSystemBackend(temp_dir)
+
+        assert reopened.keys() == ["a", "b"]
+        assert reopened.read("b") == {"value": 2}
+        assert list((temp_dir / "batches").iterdir()) == []
+
     def test_atomic_writes(self, backend, temp_dir):
         """Writes are atomic (no partial writes on failure)."""
         backend.initialize()
@@ -231,6 +411,109 @@ class TestFileSystemBackend(BackendContract):
         assert "valid" in keys
         # corrupt key might still be in index
 
+    def test_full_scan_reads_pack(self, backend, sample_entries):
+        """Scans decode from the pack, reading changed keys around it."""
+        from bibmgr.storage.backends.packed import PackedSegment
+
+        for entry in sample_entries:
+            backend.write(entry.key, entry.to_dict())
+        backend.write("collection:1", {"name": "Reading list"})
+
+        assert list(backend.read_entries()) == sorted(
+            sample_entries, key=lambda e: e.key
+        )
+        with PackedSegment(backend.pack_file) as segment:
+            assert segment.keys() == backend.keys()
+
+        backend.write("knuth1984", {"key": "knuth1984", "type": "book", "year": 1986})
+        rows = list(backend.read_entries(fields=["key", "year"]))
+        assert rows[1].key == "knuth1984" and rows[1].year == 1986
+        assert not hasattr(rows[1], "title")
+
+    def test_writes_overlay_pack_until_threshold(self, backend):
+        """Changed keys are read around the pack until it is worth rewriting."""
+        for i in range(30):
+            backend.write(f"e{i:02}", {"key": f"e{i:02}", "type": "misc"})
+        list(backend.read_entries())
+        inode = backend.pack_file.stat().st_ino
+
+        backend.write("e01", {"key": "e01", "type": "misc", "title": "Changed"})
+        backend.delete("e02")
+        entries = {e.key: e for e in backend.read_entries()}
+        assert entries["e01"].title == "Changed"
+        assert "e02" not in entries
+        assert list(backend.read_entries(["e02"])) == []
+        assert backend.pack_file.stat().st_ino == inode
+
+        for i in range(3, 6):
+            backend.write(f"e{i:02}", {"key": f"e{i:02}", "type": "book"})
+        assert len(list(backend.read_entries())) == 29
+        assert backend.pack_file.stat().st_ino != inode
+        assert backend.pack_log.read_text() == ""
+
+    def test_scan_reads_files_edited_by_hand(self, backend):
+        """Entry files changed outside the backend are not served from the pack."""
+        import json
+        import os
+
+        for i in range(30):
+            backend.write(f"e{i:02}", {"key": f"e{i:02}", "type": "misc"})
+        list(backend.read_entries())
+        built = backend.pack_log.stat().st_mtime_ns
+
+        path = backend._get_path("e01")
+        path.write_text(json.dumps({"key": "e01", "type": "misc", "title": "Edited"}))
+        os.utime(path, ns=(built + 10**9, built + 10**9))
+        backend._get_path("e02").unlink()
+        backend._read_cache.cache_clear()
+
+        entries = {e.key: e for e in backend.read_entries()}
+        assert entries["e01"].title == "Edited"
+        assert "e02" not in entries
+        assert [e.title for e in backend.read_entries(["e01"])] == ["Edited"]
+        assert backend.read("e01")["title"] == "Edited"
+
+    def test_scan_in_transaction_reads_staged(self, backend, sample_entry):
+        """Staged writes are visible to scans inside the transaction."""
+        backend.write(sample_entry.key, sample_entry.to_dict())
+        list(backend.read_entries())
+
+        with backend.begin_transaction():
+            backend.write("staged", {"key": "staged", "type": "misc"})
+            assert [e.key for e in backend.read_entries()] == ["knuth1984", "staged"]
+
+
+class TestPackedSegment:
+    """Test the memory-mapped record segment."""
+
+    def test_write_and_map(self, temp_dir):
+        """Records come back as slices of the mapping."""
+        from bibmgr.storage.backends.packed import PackedSegment
+
+        path = temp_dir / "test.pack"
+        PackedSegment.write(path, [("a", b"first"), ("b", b""), ("c", b"3")], (1, 2))
+
+        with PackedSegment(path) as segment:
+            assert segment.source == (1, 2)
+            assert len(segment) == 3 and "b" in segment and "z" not in segment
+            assert isinstance(segment.get("a"), memoryview)
+            assert bytes(segment.get("a")) == b"first"
+            assert bytes(segment.get("b")) == b""
+            assert segment.get("z") is None
+
+    def test_rejects_unordered_and_invalid(self, temp_dir):
+        """Out-of-order records and foreign files are refused."""
+        from bibmgr.storage.backends.packed import PackedSegment
+
+        path = temp_dir / "test.pack"
+        with pytest.raises(ValueError, match="key order"):
+            PackedSegment.write(path, [("b", b"1"), ("a", b"2")], ())
+        assert not path.exists()
+
+        path.write_bytes(b"not a segment at all")
+        with pytest.raises(ValueError, match="Not a packed segment"):
+            PackedSegment(path)
+
 
 class TestMemoryBackend(BackendContract):
     """Test in-memory backend implementation."""
@@ -355,6 +638,34 @@ class TestSQLiteBackend(BackendContract):
         results = backend.search("Smith")
         assert results == ["entry1"]
 
+    def test_upgrades_fts_columns(self, temp_dir):
+        """Older FTS tables are recreated with all columns and backfilled."""
+        from bibmgr.storage.backends import SQLiteBackend
+
+        db_path = temp_dir / "old.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.executescript("""
+            CREATE TABLE entries (
+                key TEXT PRIMARY KEY,
+                type TEXT NOT NULL,
+                data TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE VIRTUAL TABLE entries_fts USING fts5(key UNINDEXED, title);
+        """)
+        conn.execute(
+            "INSERT INTO entries (key, type, data) VALUES (?, ?, ?)",
+            ("old", "article", '{"title": "Old", "journal": "Nature"}'),
+        )
+        conn.commit()
+        conn.close()
+
+        backend = SQLiteBackend(db_path)
+
+        assert backend.search("nature") == ["old"]
+        backend.close()
+
     def test_query_entries(self, backend):
         """SQLite backend supports structured queries."""
         backend.initialize()
@@ -439,6 +750,94 @@ class TestSQLiteBackend(BackendContract):
         assert all(r == "success" for r in results)
         assert len(backend.keys()) == 15  # 3 threads × 5 writes
 
+    def test_reads_do_not_wait_for_open_transaction(self, backend):
+        """Readers see committed data while another thread holds the writer."""
+        backend.write("committed", {"type": "misc"})
+        started = threading.Event()
+        release = threading.Event()
+        own_writes = []
+
+        def hold_transaction():
+            with backend.begin_transaction():
+                backend.write("pending", {"type": "misc"})
+                # Reads inside the transaction see its own writes
+                own_writes.append(backend.exists("pending"))
+                started.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_transaction)
+        holder.start()
+        started.wait(5)
+
+        seen = {}
+        reader = threading.Thread(
+            target=lambda: seen.update(
+                committed=backend.read("committed"), keys=backend.keys()
+            )
+        )
+        reader.start()
+        reader.join(timeout=2)
+        finished = not reader.is_alive()
+        release.set()
+        holder.join()
+
+        assert finished
+        assert own_writes == [True]
+        assert seen == {"committed": {"type": "misc"}, "keys": ["committed"]}
+        assert backend.keys() == ["committed", "pending"]
+
+    def test_reader_pool(self, backend):
+        """Parallel reads share a bounded pool of read-only connections."""
+        from bibmgr.storage.backends.sqlite import READER_POOL_SIZE
+
+        backend.write_many((f"key{i}", {"value": i}) for i in range(20))
+
+        def read_all():
+            for i in range(20):
+                assert backend.read(f"key{i}") == {"value": i}
+
+        threads = [threading.Thread(target=read_all) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = backend.connection_statistics()
+        assert 1 <= stats["readers_open"] <= READER_POOL_SIZE
+        assert stats["reader_acquisitions"] >= 160
+        assert stats["reader_wait_seconds"] >= 0.0
+        assert stats["writer_acquisitions"] >= 1
+
+        with backend.reader() as connection:
+            assert connection.execute("PRAGMA temp_store").fetchone()[0] == 2
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                connection.execute("DELETE FROM entries")
+
+    def test_entries_stored_as_tagged_records(self, backend, sample_entry):
+        """Entries round-trip through tagged records next to legacy rows."""
+        backend.write_entries([sample_entry])
+        backend.write("legacy", {"key": "legacy", "type": "MISC", "year": "1999"})
+
+        assert backend.read_entry(sample_entry.key) == sample_entry
+        record = backend.read(sample_entry.key)
+        assert record["title"] == "The TeXbook"
+        assert "_schema" not in record and "address" not in record
+        assert backend.read_entry("legacy").year == 1999
+        assert backend.read_entry("missing") is None
+        assert backend.search("TeXbook") == [sample_entry.key]
+
+    def test_write_many_joins_outer_transaction(self, backend):
+        """A batch inside a transaction rolls back with it."""
+        backend.write("kept", {"type": "misc"})
+
+        with pytest.raises(RuntimeError):
+            with backend.begin_transaction():
+                backend.write_many([("a", {"type": "misc"}), ("b", {"type": "misc"})])
+                backend.write("c", {"type": "misc"})
+                raise RuntimeError("Rollback")
+
+        assert backend.keys() == ["kept"]
+
     def test_statistics(self, backend):
         """SQLite backend provides statistics efficiently."""
         backend.initialize()
@@ -618,3 +1017,35 @@ class TestCachedBackend:
 
         cache_info = backend._read_cache.cache_info()
         assert cache_info.currsize == 3
+
+
+class TestSortedKeyIndex:
+    """Test the buffered sorted key index."""
+
+    def test_buffered_changes_read_in_order(self):
+        """Adds and removals since the last read show up sorted."""
+        from bibmgr.storage.backends.base import SortedKeyIndex
+
+        index = SortedKeyIndex(["b", "d"])
+        for key in ["e", "a", "c", "a"]:
+            index.add(key)
+        index.discard("d")
+        index.discard("c")
+        index.add("d")
+
+        assert "c" not in index
+        assert "e" in index
+        assert list(index) == ["a", "b", "d", "e"]
+        assert index.with_prefix("") == ["a", "b", "d", "e"]
+        assert len(index) == 4
+
+    def test_bulk_add_sorts_once(self):
+        """Keys added one by one are merged in a single sort."""
+        from bibmgr.storage.backends.base import SortedKeyIndex
+
+        keys = [f"key{i:05d}" for i in range(2000)]
+        index = SortedKeyIndex()
+        index.update(reversed(keys))
+
+        assert index.with_prefix("key0000", limit=3) == keys[:3]
+        assert list(index) == keys
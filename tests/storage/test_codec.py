@@ -0,0 +1,51 @@
+"""Tests for the stored entry codec."""
+
+import json
+
+import pytest
+
+
+class TestEntryCodec:
+    """Test version-tagged encoding and legacy upgrades."""
+
+    def test_round_trip(self, sample_entry):
+        """Tagged records decode back to an equal entry."""
+        from bibmgr.storage.codec import decode_entry, encode_entry
+
+        data = encode_entry(sample_entry)
+
+        assert data.startswith(b'{"_schema":1,')
+        assert decode_entry(data) == sample_entry
+
+    def test_legacy_record_upgraded(self):
+        """Untagged records get the old normalizations applied."""
+        from bibmgr.core.models import EntryType
+        from bibmgr.storage.codec import decode_entry
+
+        legacy = json.dumps(
+            {"key": "k", "type": "ARTICLE", "year": "2020", "keywords": "a, b,"},
+            indent=2,
+            sort_keys=True,
+        )
+        entry = decode_entry(legacy)
+
+        assert entry.type == EntryType.ARTICLE
+        assert entry.year == 2020
+        assert entry.keywords == ("a", "b")
+
+    def test_newer_version_rejected(self):
+        """Records from a newer schema are not guessed at."""
+        from bibmgr.storage.codec import SCHEMA_VERSION, decode_entry
+
+        record = json.dumps({"_schema": SCHEMA_VERSION + 1, "key": "k", "type": "misc"})
+        with pytest.raises(ValueError, match="schema version"):
+            decode_entry(record)
+
+    def test_invalid_record(self):
+        """Malformed records raise ValueError."""
+        from bibmgr.storage.codec import decode_entry
+
+        with pytest.raises(ValueError):
+            decode_entry(b"not json")
+        with pytest.raises(ValueError):
+            decode_entry(b'{"_schema":1,"type":"misc"}')
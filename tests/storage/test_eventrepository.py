@@ -489,6 +489,81 @@ class TestEventIntegrationScenarios:
 
         assert "cached" not in cache
 
+    def test_crossref_graph_follows_entry_events(self, temp_dir):
+        """Test the cross-reference graph staying current once loaded."""
+        from bibmgr.storage.backends import FileSystemBackend
+        from bibmgr.storage.eventrepository import EventAwareRepositoryManager
+        from bibmgr.storage.events import EventBus
+
+        backend = FileSystemBackend(temp_dir / "storage")
+        manager = EventAwareRepositoryManager(backend, EventBus())
+        book = Entry(key="book", type=EntryType.BOOK, title="Book", publisher="P")
+        manager.entries.save(book, skip_validation=True)
+
+        assert manager.crossrefs.count("book") == 0
+        assert manager.crossrefs.loaded
+
+        chapter = Entry(key="ch", type=EntryType.INBOOK, title="Ch", crossref="book")
+        manager.entries.save(chapter, skip_validation=True)
+        assert manager.crossrefs.children_of("book") == ["ch"]
+        assert manager.crossrefs.resolve(chapter).publisher == "P"
+
+        manager.entries.delete("ch")
+        assert manager.crossrefs.count("book") == 0
+        assert "ch" not in manager.crossrefs
+
+    def test_parent_edit_revalidates_children(self, temp_dir):
+        """Test children being validated again when their parent changes."""
+        from bibmgr.storage.backends import FileSystemBackend
+        from bibmgr.storage.eventrepository import EventAwareRepositoryManager
+        from bibmgr.storage.events import EventBus
+
+        backend = FileSystemBackend(temp_dir / "storage")
+        manager = EventAwareRepositoryManager(backend, EventBus())
+        book = Entry(key="book", type=EntryType.BOOK, title="Book", publisher="P")
+        chapter = Entry(key="ch", type=EntryType.INBOOK, title="Ch", crossref="book")
+        manager.entries.save_many([book, chapter], skip_validation=True)
+        assert manager.crossrefs.children_of("book") == ["ch"]
+        assert "ch" not in manager.validation_issues
+
+        manager.entries.save(
+            Entry(key="book", type=EntryType.MISC, title="Book"), skip_validation=True
+        )
+        assert any(
+            "cannot cross-reference" in e.message
+            for e in manager.validation_issues["ch"]
+        )
+
+        manager.entries.delete("book")
+        assert any("non-existent" in e.message for e in manager.validation_issues["ch"])
+        assert "book" not in manager.validation_issues
+
+    def test_transaction_events_wait_for_commit(self, temp_dir):
+        """Test events of a transaction being published only if it commits."""
+        from bibmgr.storage.backends import FileSystemBackend
+        from bibmgr.storage.eventrepository import EventAwareRepositoryManager
+        from bibmgr.storage.events import EventBus, EventType
+
+        bus = EventBus()
+        manager = EventAwareRepositoryManager(FileSystemBackend(temp_dir / "s"), bus)
+        seen = []
+        bus.subscribe(EventType.ENTRY_CREATED, lambda e: seen.append(e.data))
+        bus.subscribe(EventType.ENTRY_DELETED, lambda e: seen.append(e.data))
+        entry = Entry(key="a", type=EntryType.MISC, title="A")
+
+        with manager.entries.transaction():
+            manager.entries.save_many([entry], skip_validation=True)
+            assert seen == []
+        assert [data["entry_key"] for data in seen] == ["a"]
+
+        seen.clear()
+        with pytest.raises(RuntimeError):
+            with manager.transaction():
+                manager.entries.delete_many(["a"])
+                raise RuntimeError("abort")
+        assert seen == []
+        assert manager.entries.exists("a")
+
     def test_event_driven_ui_updates(self, temp_dir):
         """Test using events for UI update notifications."""
         from bibmgr.storage.backends import FileSystemBackend
@@ -535,3 +535,164 @@ class TestEventIntegration:
 
         thread_ids = {e.data["thread"] for e in all_events}
         assert thread_ids == {0, 1, 2}
+
+
+class TestEventBusBatching:
+    """Test batched, coalesced and asynchronous dispatch."""
+
+    def _created(self, key):
+        from bibmgr.storage.events import Event, EventType
+
+        return Event(
+            type=EventType.ENTRY_CREATED,
+            timestamp=datetime.now(),
+            data={"entry_key": key},
+        )
+
+    def test_history_is_bounded_ring_buffer(self):
+        """History keeps only the most recent events."""
+        from bibmgr.storage.events import EventBus
+
+        bus = EventBus(history_limit=3)
+        for i in range(5):
+            bus.publish(self._created(f"e{i}"))
+
+        keys = [e.entry_key for e in bus.get_history()]
+        assert keys == ["e2", "e3", "e4"]
+
+    def test_coalesce_created_events(self):
+        """Runs of ENTRY_CREATED collapse into one ENTRIES_IMPORTED."""
+        from bibmgr.storage.events import EventType, coalesce_events
+
+        events = [self._created(f"e{i}") for i in range(4)]
+        coalesced = coalesce_events(events)
+
+        assert len(coalesced) == 1
+        assert coalesced[0].type == EventType.ENTRIES_IMPORTED
+        assert coalesced[0].data["entry_keys"] == ["e0", "e1", "e2", "e3"]
+        assert coalesced[0].data["count"] == 4
+
+    def test_coalesce_keeps_latest_progress(self):
+        """Consecutive progress events keep only the latest."""
+        from bibmgr.storage.events import Event, EventType, coalesce_events
+
+        events = [
+            Event(
+                type=EventType.PROGRESS,
+                timestamp=datetime.now(),
+                data={"operation": "import", "current": i, "total": 3},
+            )
+            for i in range(1, 4)
+        ]
+
+        coalesced = coalesce_events(events)
+        assert len(coalesced) == 1
+        assert coalesced[0].data["current"] == 3
+
+    def test_batch_subscriber_inside_batching_block(self):
+        """Batch subscribers receive one coalesced burst per block."""
+        from bibmgr.storage.events import EventBus, EventType
+
+        bus = EventBus()
+        batches = []
+        single = []
+        bus.subscribe_batch(EventType.ENTRY_CREATED, batches.append)
+        bus.subscribe(EventType.ENTRY_CREATED, single.append)
+
+        with bus.batching():
+            for i in range(10):
+                bus.publish(self._created(f"e{i}"))
+            assert batches == []
+
+        assert len(single) == 10
+        assert len(batches) == 1
+        assert batches[0][0].type == EventType.ENTRIES_IMPORTED
+        assert batches[0][0].data["count"] == 10
+
+    def test_batch_subscriber_without_batching_block(self):
+        """Outside a batching block, synchronous batches have one event."""
+        from bibmgr.storage.events import EventBus, EventType
+
+        bus = EventBus()
+        batches = []
+        bus.subscribe_batch(EventType.ENTRY_CREATED, batches.append)
+
+        bus.publish(self._created("a"))
+        bus.publish(self._created("b"))
+
+        assert [len(b) for b in batches] == [1, 1]
+
+    def test_async_dispatch_delivers_off_thread(self):
+        """Async dispatch runs handlers on the dispatcher thread."""
+        from bibmgr.storage.events import EventBus, EventType
+
+        bus = EventBus(async_dispatch=True)
+        threads = []
+        bus.subscribe(
+            EventType.ENTRY_CREATED,
+            lambda e: threads.append(threading.current_thread()),
+        )
+
+        try:
+            for i in range(5):
+                bus.publish(self._created(f"e{i}"))
+            bus.flush()
+        finally:
+            bus.close()
+
+        assert len(threads) == 5
+        assert all(t is not threading.current_thread() for t in threads)
+
+    def test_async_batches_are_coalesced(self):
+        """Async batch subscribers get bursts coalesced."""
+        from bibmgr.storage.events import EventBus, EventType
+
+        bus = EventBus(async_dispatch=True)
+        batches = []
+        bus.subscribe_batch(EventType.ENTRY_CREATED, batches.append, max_delay=1.0)
+
+        try:
+            for i in range(50):
+                bus.publish(self._created(f"e{i}"))
+            bus.flush()
+        finally:
+            bus.close()
+
+        delivered = sum(e.data.get("count", 1) for batch in batches for e in batch)
+        assert delivered == 50
+        assert len(batches) < 50
+
+    def test_progress_rate_limiting(self):
+        """Progress events are dropped within the interval except the last."""
+        from bibmgr.storage.events import Event, EventBus, EventType
+
+        bus = EventBus(progress_interval=60.0)
+        received = []
+        bus.subscribe(EventType.PROGRESS, received.append)
+
+        for i in range(1, 101):
+            bus.publish(
+                Event(
+                    type=EventType.PROGRESS,
+                    timestamp=datetime.now(),
+                    data={"operation": "import", "current": i, "total": 100},
+                )
+            )
+
+        assert [e.data["current"] for e in received] == [1, 100]
+        assert bus.metrics.coalesced == 98
+
+    def test_metrics(self):
+        """Metrics report publish counts, latency and queue depth."""
+        from bibmgr.storage.events import EventBus, EventType
+
+        bus = EventBus()
+        bus.subscribe(EventType.ENTRY_CREATED, lambda e: None)
+        for i in range(3):
+            bus.publish(self._created(f"e{i}"))
+
+        metrics = bus.get_metrics()
+        assert metrics["published"] == 3
+        assert metrics["delivered"] == 3
+        assert metrics["avg_publish_latency_ms"] >= 0
+        assert metrics["queue_depth"] == 0
@@ -218,6 +218,20 @@ class TestSimpleIndexBackend(IndexBackendContract):
 
         return SimpleIndexBackend()
 
+    def test_search_returns_best_scores_first(self, backend):
+        """Only the best ``limit`` results are returned, best first."""
+        for i in range(1, 6):
+            backend.index_entry(
+                Entry(key=f"e{i}", type=EntryType.MISC, title="graph " * i)
+            )
+
+        results = backend.search("graph", limit=2)
+
+        assert [r.entry_key for r in results] == ["e5", "e4"]
+        assert [r.entry_key for r in backend.search_field("title", "graph", 1)] == [
+            "e5"
+        ]
+
     def test_tokenization(self, backend):
         """Test tokenization logic."""
         tokens = backend._tokenize("Hello, World! Test-case 123.")
@@ -0,0 +1,124 @@
+"""Tests for the storage change journal."""
+
+from datetime import datetime
+
+from bibmgr.core.models import Entry, EntryType
+
+
+class TestChangeJournal:
+    """Test generation numbering and change replay."""
+
+    def test_record_bumps_generation(self, temp_dir):
+        """Each recorded key gets its own generation."""
+        from bibmgr.storage.journal import ChangeJournal
+
+        journal = ChangeJournal(temp_dir / "changes.log")
+        assert journal.generation == 0
+
+        assert journal.record(["a", "b"]) == 2
+        assert journal.record(["c"]) == 3
+        assert journal.generation == 3
+
+    def test_generation_survives_reopen(self, temp_dir):
+        """A new journal instance continues numbering from disk."""
+        from bibmgr.storage.journal import ChangeJournal
+
+        path = temp_dir / "changes.log"
+        ChangeJournal(path).record(["a", "b", "c"])
+
+        reopened = ChangeJournal(path)
+        assert reopened.generation == 3
+        assert reopened.record(["d"]) == 4
+
+    def test_changes_since(self, temp_dir):
+        """Only keys changed after the given generation are returned."""
+        from bibmgr.storage.journal import ChangeJournal
+
+        journal = ChangeJournal(temp_dir / "changes.log")
+        journal.record(["a", "b"])
+        journal.record(["c", "a"])
+
+        changes = journal.changes_since(2)
+        assert changes.keys == {"a", "c"}
+        assert changes.generation == 4
+        assert not changes.cleared
+
+    def test_clear_drops_earlier_keys(self, temp_dir):
+        """A clear record supersedes keys recorded before it."""
+        from bibmgr.storage.journal import ChangeJournal
+
+        journal = ChangeJournal(temp_dir / "changes.log")
+        journal.record(["a"])
+        journal.record_clear()
+        journal.record(["b"])
+
+        changes = journal.changes_since(0)
+        assert changes.cleared
+        assert changes.keys == {"b"}
+
+    def test_compact_keeps_generation(self, temp_dir):
+        """Compaction never moves the generation backwards."""
+        from bibmgr.storage.journal import ChangeJournal
+
+        path = temp_dir / "changes.log"
+        journal = ChangeJournal(path)
+        journal.record(["a", "b", "c"])
+
+        journal.compact(3)
+
+        assert ChangeJournal(path).generation == 3
+        assert not journal.changes_since(3)
+
+    def test_acknowledge_compacts_behind_slowest_consumer(self, temp_dir):
+        """Records are dropped only once every consumer has seen them."""
+        from bibmgr.storage.journal import ChangeJournal
+
+        journal = ChangeJournal(temp_dir / "changes.log", compact_threshold=3)
+        journal.record(["a", "b", "c", "d", "e"])
+
+        assert not journal.acknowledge("cache", 2)
+        assert not journal.acknowledge("index", 5)
+        assert journal.acknowledge("cache", 4)
+
+        assert journal.changes_since(0).keys == {"e"}
+        assert journal.generation == 5
+
+    def test_acknowledgements_persist_across_processes(self, temp_dir):
+        """A consumer acknowledged elsewhere still holds back compaction."""
+        from bibmgr.storage.journal import ChangeJournal
+
+        path = temp_dir / "changes.log"
+        ChangeJournal(path).acknowledge("cache", 0)
+
+        journal = ChangeJournal(path, compact_threshold=3)
+        journal.record(["a", "b", "c", "d", "e"])
+
+        assert not journal.acknowledge("index", 5)
+        assert journal.changes_since(0).keys == {"a", "b", "c", "d", "e"}
+        assert ChangeJournal(path).consumers() == {"cache": 0, "index": 5}
+
+    def test_attach_records_repository_events(self, temp_dir):
+        """Events published by event-aware repositories are journaled."""
+        from bibmgr.storage.backends.memory import MemoryBackend
+        from bibmgr.storage.eventrepository import EventAwareRepositoryManager
+        from bibmgr.storage.events import Event, EventBus, EventType
+        from bibmgr.storage.journal import ChangeJournal
+
+        bus = EventBus()
+        journal = ChangeJournal(temp_dir / "changes.log")
+        journal.attach(bus)
+        manager = EventAwareRepositoryManager(MemoryBackend(), bus)
+
+        manager.entries.save(
+            Entry(key="x", type=EntryType.MISC, title="X"), skip_validation=True
+        )
+        manager.entries.delete("x")
+        bus.publish(
+            Event(
+                type=EventType.ENTRIES_MERGED,
+                timestamp=datetime.now(),
+                data={"source_keys": ["m1", "m2"], "target_key": "m1"},
+            )
+        )
+
+        assert journal.changes_since(0).keys == {"x", "m1", "m2"}
@@ -131,6 +131,25 @@ class TestEntryRepository:
             mock_backend.data[entry.key] = entry.to_dict()
             assert repo.count() == i + 1
 
+    def test_key_prefix_lookup_skips_collections(self, mock_backend):
+        """Prefix lookups and free keys cover entry keys only."""
+        from bibmgr.storage.backends import MemoryBackend
+        from bibmgr.storage.repository import EntryRepository
+
+        for backend in [mock_backend, MemoryBackend()]:
+            for key in ["codd1970", "codd1970a", "collection:abc", "date1975"]:
+                backend.write(key, {"key": key})
+            repo = EntryRepository(backend)
+
+            assert repo.keys_with_prefix("co") == ["codd1970", "codd1970a"]
+            assert repo.keys_with_prefix("", limit=3) == [
+                "codd1970",
+                "codd1970a",
+                "date1975",
+            ]
+            assert repo.keys_with_prefix("collection:") == []
+            assert repo.next_free_key("codd1970") == "codd1970b"
+
 
 class TestQueryMethods:
     """Test repository query methods."""
@@ -339,6 +358,59 @@ class TestQueryBuilder:
         assert results[0].key == all_results[2].key
 
 
+class TestScan:
+    """Test projected scans on every backend."""
+
+    @pytest.fixture(params=["memory", "filesystem", "sqlite"])
+    def repo(self, request, temp_dir, sample_entries):
+        from bibmgr.storage.backends import (
+            FileSystemBackend,
+            MemoryBackend,
+            SQLiteBackend,
+        )
+        from bibmgr.storage.repository import EntryRepository
+
+        backend = {
+            "memory": MemoryBackend,
+            "filesystem": lambda: FileSystemBackend(temp_dir / "fs"),
+            "sqlite": lambda: SQLiteBackend(temp_dir / "test.db"),
+        }[request.param]()
+        repo = EntryRepository(backend)
+        repo.save_many(sample_entries, skip_validation=True)
+        backend.write("collection:1", {"name": "Reading list"})
+        return repo
+
+    def test_rows_hold_requested_fields(self, repo):
+        """Rows carry the projection only, collections are skipped."""
+        rows = repo.scan(["key", "year"], order_by=[("key", True)])
+
+        assert [(row.key, row.year) for row in rows][:2] == [
+            ("dijkstra1968", 1968),
+            ("knuth1984", 1984),
+        ]
+        assert len(rows) == 5
+        assert not hasattr(rows[0], "title")
+
+    def test_filters_order_and_page(self, repo):
+        """Filters and ordering may use fields outside the projection."""
+        rows = repo.scan(
+            ["key"],
+            where=[("type", "=", EntryType.ARTICLE), ("year", ">", 1940)],
+            order_by=[("year", False)],
+            offset=1,
+            limit=2,
+        )
+
+        assert [row.key for row in rows] == ["turing1950", "shannon1948"]
+
+    def test_unknown_field_rejected(self, repo):
+        """Only entry fields can be projected."""
+        with pytest.raises(ValueError, match="Unknown entry fields"):
+            repo.scan(["key", "data) FROM entries; --"])
+        with pytest.raises(ValueError, match="operators"):
+            repo.scan(["key"], where=[("year", "~", 1)])
+
+
 class TestCollectionRepository:
     """Test collection repository functionality."""
 
@@ -0,0 +1,153 @@
+"""Tests for the columnar library snapshot."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from bibmgr.core.models import Entry, EntryType
+from bibmgr.search.backends.base import SearchMatch
+from bibmgr.search.facets import FacetAggregator
+from bibmgr.storage.backends.memory import MemoryBackend
+from bibmgr.storage.codec import project
+from bibmgr.storage.journal import ChangeJournal
+from bibmgr.storage.repository import RepositoryManager
+from bibmgr.storage.snapshot import LibrarySnapshot
+
+
+def _entries() -> list[Entry]:
+    return [
+        Entry(
+            key="turing1950",
+            type=EntryType.ARTICLE,
+            author="Alan M. Turing",
+            title="Computing Machinery and Intelligence",
+            journal="Mind",
+            year=1950,
+            doi="10.1093/mind/LIX.236.433",
+            tags=("ai", "classic"),
+        ),
+        Entry(
+            key="knuth1984",
+            type=EntryType.BOOK,
+            author="Donald E. Knuth",
+            title="The TeXbook",
+            publisher="Addison-Wesley",
+            year=1984,
+            tags=("tex",),
+        ),
+        Entry(
+            key="mccarthy1960",
+            type=EntryType.ARTICLE,
+            author="John McCarthy and Alan M. Turing",
+            title="Recursive Functions of Symbolic Expressions",
+            journal="Communications of the ACM",
+            year=1960,
+            tags=("ai",),
+        ),
+    ]
+
+
+@pytest.fixture
+def repository():
+    """Repository mock counting full scans."""
+    repository = Mock()
+    repository.scan.side_effect = lambda fields: [
+        project(entry, tuple(fields)) for entry in _entries()
+    ]
+    return repository
+
+
+class TestLibrarySnapshot:
+    """Test vectorized statistics, counts and filters."""
+
+    def test_statistics(self, repository):
+        """Totals by type and year keep first-appearance order."""
+        stats = LibrarySnapshot(repository).statistics()
+
+        assert stats["total_entries"] == 3
+        assert list(stats["entries_by_type"].items()) == [("article", 2), ("book", 1)]
+        assert stats["entries_by_year"] == {1950: 1, 1984: 1, 1960: 1}
+
+    def test_value_counts_explode_list_columns(self, repository):
+        """Each author and tag of an entry is counted once."""
+        snapshot = LibrarySnapshot(repository)
+
+        assert snapshot.value_counts("authors")[0] == ("Alan M. Turing", 2)
+        assert snapshot.value_counts("tags", size=2) == [("ai", 2), ("classic", 1)]
+        assert snapshot.value_counts("tags", keys=["knuth1984"]) == [("tex", 1)]
+        assert snapshot.value_counts("tags", min_count=2) == [("ai", 2)]
+
+    def test_filter_keys(self, repository):
+        """All conditions must hold."""
+        snapshot = LibrarySnapshot(repository)
+
+        assert snapshot.filter_keys(types=["Article"], year_from=1955) == [
+            "mccarthy1960"
+        ]
+        assert snapshot.filter_keys(author="turing", tags=["classic"]) == ["turing1950"]
+        assert snapshot.filter_keys(has_doi=False) == ["knuth1984", "mccarthy1960"]
+
+    def test_frame_memoized_per_generation(self, repository, tmp_path):
+        """The repository is scanned again only after the journal moves."""
+        journal = ChangeJournal(tmp_path / "changes.log")
+        snapshot = LibrarySnapshot(repository, journal=journal)
+
+        snapshot.frame()
+        snapshot.frame()
+        assert repository.scan.call_count == 1
+
+        journal.record(["knuth1984"])
+        snapshot.frame()
+        assert repository.scan.call_count == 2
+
+    def test_parquet_cache_shared_between_instances(self, repository, tmp_path):
+        """A new process reuses the cached frame of the same generation."""
+        journal = ChangeJournal(tmp_path / "changes.log")
+        cache_path = tmp_path / "snapshot.parquet"
+        LibrarySnapshot(repository, journal=journal, cache_path=cache_path).frame()
+
+        reloaded = LibrarySnapshot(repository, journal=journal, cache_path=cache_path)
+        assert reloaded.statistics()["total_entries"] == 3
+        assert repository.scan.call_count == 1
+
+        journal.record(["turing1950"])
+        stale = LibrarySnapshot(repository, journal=journal, cache_path=cache_path)
+        stale.frame()
+        assert repository.scan.call_count == 2
+
+
+class TestSnapshotConsumers:
+    """Test statistics and facets computed over the snapshot."""
+
+    def test_repository_statistics(self, tmp_path):
+        """get_statistics reports the same totals with a cached snapshot."""
+        manager = RepositoryManager(MemoryBackend())
+        for entry in _entries():
+            manager.entries.save(entry, skip_validation=True)
+        expected = manager.get_statistics()
+
+        manager.snapshot = LibrarySnapshot(
+            manager.entries,
+            journal=ChangeJournal(tmp_path / "changes.log"),
+            cache_path=tmp_path / "snapshot.parquet",
+        )
+
+        assert manager.get_statistics() == expected
+        assert expected["entries_by_type"] == {"article": 2, "book": 1}
+
+    def test_facets_counted_over_matched_keys(self, repository):
+        """Snapshot facets agree with facets built from the entries."""
+        entries = _entries()
+        matches = [
+            SearchMatch(entry_key=entry.key, score=1.0, entry=entry)
+            for entry in entries[::2]
+        ]
+        vectorized = FacetAggregator(snapshot=LibrarySnapshot(repository))
+        plain = FacetAggregator()
+
+        for field_name in ("entry_type", "author", "journal", "year"):
+            facet = vectorized.aggregate_facet(matches, field_name)
+            expected = plain.aggregate_facet(matches, field_name)
+            assert [(v.value, v.count) for v in facet.values] == [
+                (v.value, v.count) for v in expected.values
+            ]